@@ -555,7 +555,9 @@ def compare_analyses():
     if not analysis_id_1 or not analysis_id_2:
         raise ValidationError("Two analysis IDs required for comparison")
     
-    comparison = AnalysisRepository.compare_analyses(analysis_id_1, analysis_id_2)
+    comparison = AnalysisRepository.compare_analyses(
+        analysis_id_1, analysis_id_2, include_issues=data.get('include_issues', True)
+    )
     
     return jsonify({
         'success': True,
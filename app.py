@@ -103,9 +103,17 @@ except Exception as e:
     _capture_startup_error(e, "core.py import failed")
     raise
 
+# Shared chunked, memoized file hashing (hash once at upload)
+import file_hashing
+
+# Memory-budgeted storage for session review results (spills to disk)
+from session_store import SessionResultStore, SessionData
+
 # Import scan history for tracking
 try:
-    from scan_history import get_scan_history_db
+    from scan_history import (
+        get_scan_history_db, get_scan_history_maintenance, SearchUnavailableError
+    )
     SCAN_HISTORY_AVAILABLE = True
 except ImportError:
     SCAN_HISTORY_AVAILABLE = False
@@ -263,7 +271,7 @@ except Exception as e:
 # Import Job Manager (v3.0.32 Thread 8)
 try:
     from job_manager import (
-        get_job_manager, JobManager, Job, JobPhase, JobStatus,
+        get_job_manager, JobManager, Job, JobPhase, JobStatus, QueueFullError,
         create_review_job, get_job_status, get_job_result
     )
     JOB_MANAGER_AVAILABLE = True
@@ -382,9 +390,15 @@ class SessionManager:
 
     v3.0.116 (BUG-M03): Added automatic background cleanup to prevent memory growth.
     Sessions are cleaned up every hour by default, removing sessions older than 24 hours.
+
+    review_results and filtered_issues live in a SessionResultStore with a
+    global memory budget (TWR_SESSION_MEMORY_MB): the least recently used
+    sessions' results are compressed to temp/session_store and read back
+    when accessed. Session data is a SessionData dict, so access is unchanged.
     """
 
-    _sessions: Dict[str, Dict] = {}
+    _sessions: Dict[str, SessionData] = {}
+    _store = SessionResultStore(spill_dir=config.temp_dir / 'session_store')
     _lock = threading.Lock()
     _cleanup_thread: Optional[threading.Thread] = None
     _cleanup_running = False
@@ -395,15 +409,18 @@ class SessionManager:
     def create(cls, session_id: str = None) -> str:
         """Create a new session."""
         session_id = session_id or str(uuid.uuid4())
+        cls._store.discard(session_id)
+        data = SessionData(
+            cls._store, session_id,
+            created=datetime.now().isoformat(),
+            current_file=None,
+            original_filename=None,
+            file_hash=None,
+            review_job_id=None,
+            selected_issues=set(),
+        )
         with cls._lock:
-            cls._sessions[session_id] = {
-                'created': datetime.now().isoformat(),
-                'current_file': None,
-                'original_filename': None,
-                'review_results': None,
-                'filtered_issues': [],
-                'selected_issues': set(),
-            }
+            cls._sessions[session_id] = data
         return session_id
 
     @classmethod
@@ -416,14 +433,18 @@ class SessionManager:
     def update(cls, session_id: str, **kwargs):
         """Update session data."""
         with cls._lock:
-            if session_id in cls._sessions:
-                cls._sessions[session_id].update(kwargs)
+            data = cls._sessions.get(session_id)
+        # Outside the lock: storing review results may measure or spill them
+        if data is not None:
+            data.update(kwargs)
 
     @classmethod
     def delete(cls, session_id: str):
         """Delete a session."""
         with cls._lock:
-            cls._sessions.pop(session_id, None)
+            data = cls._sessions.pop(session_id, None)
+        if data is not None:
+            data.discard_stored()
 
     @classmethod
     def cleanup_old(cls, max_age_hours: int = None):
@@ -440,8 +461,9 @@ class SessionManager:
                         to_delete.append(sid)
                 except (KeyError, ValueError):
                     to_delete.append(sid)
-            for sid in to_delete:
-                del cls._sessions[sid]
+            expired = [cls._sessions.pop(sid) for sid in to_delete]
+        for data in expired:
+            data.discard_stored()
         return len(to_delete)
 
     @classmethod
@@ -450,6 +472,13 @@ class SessionManager:
         with cls._lock:
             return len(cls._sessions)
 
+    @classmethod
+    def memory_stats(cls) -> Dict[str, Any]:
+        """Session count plus the result store's budget and usage (bytes)."""
+        stats = cls._store.stats()
+        stats['sessions'] = cls.get_session_count()
+        return stats
+
     @classmethod
     def start_auto_cleanup(cls, interval_seconds: int = 3600, max_age_hours: int = 24):
         """
@@ -493,6 +522,15 @@ class SessionManager:
         logger.info("SessionManager auto-cleanup stopped")
 
 
+def _release_job_results(session_id: str, values: Dict[str, Any]):
+    """Session results left memory: stop finished review jobs pinning them."""
+    results = values.get('review_results')
+    if JOB_MANAGER_AVAILABLE and isinstance(results, dict):
+        get_job_manager().release_result(results)
+
+
+SessionManager._store.add_release_listener(_release_job_results)
+
 # v3.0.35: Expose SessionManager to blueprints via Flask config
 app.config['SESSION_MANAGER'] = SessionManager
 
@@ -1278,10 +1316,10 @@ def upload():
     unique_name = f"{uuid.uuid4().hex[:8]}_{original_name}"
     filepath = config.temp_dir / unique_name
     
-    # Save file
-    file.save(str(filepath))
+    # Save file, hashing it in the same pass; the digest is reused by
+    # review, scan history and caches
+    file_hash, file_size = file_hashing.save_stream(file.stream, filepath)
     
-    file_size = filepath.stat().st_size
     logger.info("File uploaded",
                file_name=original_name,
                size=file_size,
@@ -1293,7 +1331,9 @@ def upload():
         SessionManager.update(g.session_id,
                              current_file=str(filepath),
                              original_filename=original_name,
+                             file_hash=file_hash,
                              review_results=None,
+                             review_job_id=None,
                              filtered_issues=[],
                              selected_issues=set())
     
@@ -1358,7 +1398,9 @@ def dev_load_test_file():
             SessionManager.update(g.session_id,
                                  current_file=str(test_file),
                                  original_filename='nasa_test.docx',
-                                 review_results=None)
+                                 file_hash=None,
+                                 review_results=None,
+                                 review_job_id=None)
 
         return jsonify({'success': True, 'data': doc_info})
     except Exception as e:
@@ -1430,26 +1472,18 @@ def upload_batch():
         filepath = config.temp_dir / unique_name
 
         try:
-            # v3.0.116 (BUG-M02): Stream file to disk instead of loading entirely into memory
-            # Use chunked writing to handle large files more efficiently
-            file_size = 0
-            with open(filepath, 'wb') as f:
-                while True:
-                    chunk = file.stream.read(8192)  # 8KB chunks
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    file_size += len(chunk)
-
-                    # Check total batch size limit while streaming
-                    if results['total_size'] + file_size > MAX_BATCH_TOTAL_SIZE:
-                        # Clean up partial file
-                        f.close()
-                        filepath.unlink(missing_ok=True)
-                        raise ValidationError(
-                            f"Batch total size exceeds {MAX_BATCH_TOTAL_SIZE // (1024*1024)}MB limit.",
-                            field='files[]'
-                        )
+            # v3.0.116 (BUG-M02): Stream file to disk instead of loading entirely into memory.
+            # Hashed while streaming so review_batch's scan history lookup is a cache hit;
+            # the partial file is removed if the batch size limit is hit.
+            try:
+                _, file_size = file_hashing.save_stream(
+                    file.stream, filepath,
+                    max_size=MAX_BATCH_TOTAL_SIZE - results['total_size'])
+            except ValueError:
+                raise ValidationError(
+                    f"Batch total size exceeds {MAX_BATCH_TOTAL_SIZE // (1024*1024)}MB limit.",
+                    field='files[]'
+                )
 
             results['total_size'] += file_size
 
@@ -1493,6 +1527,10 @@ def upload_batch():
     })
 
 
+# How long a batch response waits for its queued scan history writes
+BATCH_SCAN_HISTORY_WAIT_SECONDS = 30
+
+
 @app.route('/api/review/batch', methods=['POST'])
 @require_csrf
 @handle_api_errors
@@ -1522,6 +1560,7 @@ def review_batch():
     }
     
     engine = TechWriterReviewEngine()
+    scan_writes = []  # (doc_entry, ScanWrite) awaited before responding
     
     for filepath in filepaths:
         filepath = Path(filepath)
@@ -1581,23 +1620,23 @@ def review_batch():
                 'word_count': word_count,
                 'score': doc_results.get('score', 0),
                 'grade': doc_results.get('grade', 'N/A'),
-                'scan_id': None  # Will be set if scan history records successfully
+                'scan_id': None,  # Set once scan history records it
+                'scan_history': None
             }
 
-            # Record in scan history
+            # Record in scan history on the background writer, overlapping
+            # with the review of the next document
             if SCAN_HISTORY_AVAILABLE:
                 try:
-                    db = get_scan_history_db()
-                    scan_record = db.record_scan(
+                    doc_entry['scan_history'] = 'pending'
+                    scan_writes.append((doc_entry, get_scan_history_db().record_scan_async(
                         filename=filepath.name,
                         filepath=str(filepath),
                         results=doc_results,
                         options=options
-                    )
-                    # Get scan_id if returned
-                    if scan_record and isinstance(scan_record, dict):
-                        doc_entry['scan_id'] = scan_record.get('scan_id')
+                    )))
                 except Exception as e:
+                    doc_entry['scan_history'] = 'failed'
                     logger.warning(f"Failed to record batch scan: {e}")
 
             results['documents'].append(doc_entry)
@@ -1612,6 +1651,17 @@ def review_batch():
                 'traceback': tb_str if config.debug else None  # Only include traceback in debug mode
             })
     
+    # Report each document's scan_id: the writes overlapped with the reviews,
+    # so this mostly waits for the last document's
+    deadline = time.time() + BATCH_SCAN_HISTORY_WAIT_SECONDS
+    for doc_entry, write in scan_writes:
+        scan_record = write.wait(max(0.0, deadline - time.time()))
+        if scan_record:
+            doc_entry['scan_id'] = scan_record.get('scan_id')
+            doc_entry['scan_history'] = 'recorded'
+        elif write.done:
+            doc_entry['scan_history'] = 'failed'
+    
     return jsonify({
         'success': True,
         'data': results
@@ -1661,6 +1711,7 @@ def review_single():
         session_data = SessionManager.get(g.session_id) or {}
         session_data['current_file'] = str(filepath)
         session_data['original_filename'] = original_filename
+        session_data['file_hash'] = None
         SessionManager.set(g.session_id, session_data)
     except Exception as e:
         # Log but don't fail - session update is non-critical
@@ -1706,7 +1757,8 @@ def review():
                 filename=original_filename,
                 filepath=str(filepath),
                 results=results,
-                options=options
+                options=options,
+                file_hash=session_data.get('file_hash')
             )
             if scan_info:
                 logger.info(f"Scan recorded: scan_id={scan_info.get('scan_id')}, "
@@ -1722,6 +1774,7 @@ def review():
     # Update session with results
     SessionManager.update(g.session_id,
                          review_results=results,
+                         review_job_id=None,
                          filtered_issues=results.get('issues', []),
                          selected_issues=set())
     
@@ -1741,6 +1794,8 @@ def review():
         'full_text': results.get('full_text', ''),
         # v3.0.95: Hyperlink validation results for status panel (BUG-004 fix)
         'hyperlink_results': results.get('hyperlink_results'),
+        # Deferred hyperlink sub-job state ({'status': 'pending', 'job_id': ...})
+        'hyperlink_validation': results.get('hyperlink_validation'),
         # v3.0.113: Add document counts at top level for frontend display
         'word_count': results.get('word_count', 0),
         'paragraph_count': results.get('paragraph_count', 0),
@@ -1841,7 +1896,8 @@ def review():
 # JOB-BASED REVIEW (v3.0.39 Batch I)
 # =============================================================================
 
-def _run_review_job(job_id: str, session_id: str, filepath: str, original_filename: str, options: dict):
+def _run_review_job(job_id: str, session_id: str, filepath: str, original_filename: str, options: dict,
+                    file_hash: str = None):
     """
     Background worker function for job-based document review.
     
@@ -1853,6 +1909,7 @@ def _run_review_job(job_id: str, session_id: str, filepath: str, original_filena
         filepath: Path to the document
         original_filename: Original filename for logging
         options: Review options
+        file_hash: SHA-256 computed at upload, passed to scan history
     """
     if not JOB_MANAGER_AVAILABLE:
         logger.error("Job manager not available in worker")
@@ -1889,11 +1946,15 @@ def _run_review_job(job_id: str, session_id: str, filepath: str, original_filena
         return job.is_cancelled if job else True
     
     try:
-        # Run the review with progress callback
+        # Run the review with progress callback. Live hyperlink probes are
+        # split off into a sub-job so the textual review is not held up by
+        # the slowest URL.
         engine = TechWriterReviewEngine()
+        review_options = dict(options or {})
+        review_options.setdefault('defer_hyperlink_validation', True)
         results = engine.review_document(
             str(filepath), 
-            options,
+            review_options,
             progress_callback=progress_callback,
             cancellation_check=cancellation_check
         )
@@ -1903,19 +1964,22 @@ def _run_review_job(job_id: str, session_id: str, filepath: str, original_filena
             logger.info(f"Review job {job_id} was cancelled")
             return
         
-        # Record in scan history
+        # Record in scan history on the background writer; scan_info is
+        # published into the finished job once it has been written. Reviews
+        # with deferred link checks are recorded by the hyperlink sub-job,
+        # once the link issues are merged.
+        scan_history = None
         if SCAN_HISTORY_AVAILABLE:
-            try:
-                db = get_scan_history_db()
-                scan_info = db.record_scan(
-                    filename=original_filename,
-                    filepath=str(filepath),
-                    results=results,
-                    options=options
-                )
-                results['scan_info'] = scan_info
-            except Exception as e:
-                logger.error(f"Scan history error for {original_filename}: {e}")
+            results['scan_info'] = {'pending': True}
+            job.metadata['scan_history'] = 'pending'
+            scan_history = {
+                'filename': original_filename,
+                'filepath': str(filepath),
+                'options': options,
+                'file_hash': file_hash
+            }
+            if (results.get('hyperlink_validation') or {}).get('status') != 'pending':
+                _record_review_scan(job_id, results, scan_history)
         
         # Auto-extract Statement Forge if available (v3.0.49: support both layouts)
         if STATEMENT_FORGE_AVAILABLE and results.get('full_text'):
@@ -1944,9 +2008,23 @@ def _run_review_job(job_id: str, session_id: str, filepath: str, original_filena
                 logger.warning(f"Statement Forge auto-extract failed: {e}")
                 results['statement_forge_summary'] = {'available': False, 'error': str(e)}
         
+        # Register the hyperlink sub-job before publishing, so the stored
+        # result already carries its job ID
+        hyperlink_job_id = None
+        if (results.get('hyperlink_validation') or {}).get('status') == 'pending':
+            hyperlink_job_id = manager.create_job('hyperlink_validation', metadata={
+                'parent_job_id': job_id,
+                'session_id': session_id,
+                'filename': original_filename
+            })
+            results['hyperlink_validation']['job_id'] = hyperlink_job_id
+            job.metadata['hyperlink_job_id'] = hyperlink_job_id
+            job.metadata['hyperlink_validation'] = 'pending'
+        
         # Update session with results
         SessionManager.update(session_id,
                              review_results=results,
+                             review_job_id=job_id,
                              filtered_issues=results.get('issues', []),
                              selected_issues=set())
         
@@ -1954,11 +2032,190 @@ def _run_review_job(job_id: str, session_id: str, filepath: str, original_filena
         manager.complete_job(job_id, result=results)
         logger.info(f"Review job {job_id} completed: {len(results.get('issues', []))} issues")
         
+        if hyperlink_job_id:
+            # Follow-up of an admitted review: never refused for a full queue
+            manager.submit(hyperlink_job_id, _run_hyperlink_subjob,
+                           hyperlink_job_id, job_id, session_id, engine, results,
+                           scan_history, bypass_limit=True)
+        
     except Exception as e:
         logger.error(f"Review job {job_id} failed: {e}", exc_info=True)
         manager.fail_job(job_id, str(e))
 
 
+# Serializes swapping a review job's published result (scan history writer
+# callback vs. hyperlink sub-job merge), so neither overwrites the other
+_review_result_lock = threading.Lock()
+
+
+def _record_review_scan(job_id: str, results: dict, scan_history: dict):
+    """
+    Queue a review job's results on the scan history writer.
+    
+    scan_history holds record_scan's filename, filepath, options and
+    file_hash. Once written, scan_info is published into the job (see
+    _publish_scan_info); if queuing fails, the job's 'scan_history'
+    metadata becomes 'failed'.
+    """
+    try:
+        get_scan_history_db().record_scan_async(
+            results=results,
+            callback=lambda scan_info, error: _publish_scan_info(
+                job_id, results, scan_info, error),
+            **scan_history
+        )
+    except Exception as e:
+        results.pop('scan_info', None)
+        job = get_job_manager().get_job(job_id)
+        if job:
+            job.metadata['scan_history'] = 'failed'
+        logger.error(f"Scan history error for {scan_history.get('filename')}: {e}")
+
+
+def _publish_scan_info(job_id: str, results: dict,
+                       scan_info: Optional[dict], error: Optional[str]):
+    """
+    Scan history writer callback for a review job.
+    
+    Puts scan_info into the review results, into the job's current result
+    (a hyperlink-merged copy once that sub-job has finished) and into the
+    session's copy if the session store reloaded it from disk, and bumps
+    the job's 'result_revision' so polling clients re-fetch it. Job metadata
+    'scan_history' becomes 'recorded' or 'failed'; 'scan_info' carries the
+    same data for clients that only poll job status.
+    """
+    if error:
+        logger.error(f"Scan history error for job {job_id}: {error}")
+    manager = get_job_manager()
+    with _review_result_lock:
+        published = [results]
+        job = manager.get_job(job_id)
+        if job and isinstance(job.result, dict) and job.result is not results:
+            published.append(job.result)
+        session_data = SessionManager.get(job.metadata.get('session_id')) if job else None
+        if session_data and session_data.get('review_job_id') == job_id:
+            session_results = session_data.get('review_results')
+            if isinstance(session_results, dict) and all(
+                    session_results is not target for target in published):
+                published.insert(0, session_results)
+        for target in published:
+            if scan_info:
+                target['scan_info'] = scan_info
+            else:
+                target.pop('scan_info', None)
+        if job:
+            # A result released to the session store is not pinned again
+            result = job.result if job.metadata.get('result_released') else published[-1]
+            manager.update_job_result(job_id, result, metadata={
+                'scan_history': 'recorded' if scan_info else 'failed',
+                'scan_info': scan_info,
+                'result_revision': job.metadata.get('result_revision', 0) + 1
+            })
+
+
+def _review_job_result(job, session_data: Optional[dict], result: dict):
+    """
+    Result to store on a finished review job when a follow-up updates it.
+    
+    As in _publish_scan_info, a result released to the session store is not
+    pinned again, and neither is one for a session that has since moved on
+    to another review: the job keeps its current result and callers only
+    update its metadata.
+    """
+    if (job.metadata.get('result_released') or not session_data
+            or session_data.get('review_job_id') != job.job_id):
+        return job.result
+    return result
+
+
+def _run_hyperlink_subjob(sub_job_id: str, parent_job_id: str, session_id: str,
+                          engine, results: dict, scan_history: Optional[dict] = None):
+    """
+    Background worker for hyperlink validation split off from a review job.
+    
+    Probes the links the review deferred, then swaps a merged copy of the
+    results into the session and the parent job. The parent job's metadata
+    ('hyperlink_validation', 'result_revision') tells polling clients to
+    re-fetch the review result. The review's scan history record is
+    written here, from the merged results (or the original ones if
+    validation fails), so it holds the issues the user sees.
+    
+    Args:
+        sub_job_id: The hyperlink_validation job ID to update
+        parent_job_id: The review job whose result is merged into
+        session_id: Session holding the review results
+        engine: The TechWriterReviewEngine that ran the review
+        results: The review results published by the parent job
+        scan_history: record_scan arguments for the review, or None to
+            leave scan history alone (see _record_review_scan)
+    """
+    manager = get_job_manager()
+    manager.start_job(sub_job_id)
+    manager.update_phase(sub_job_id, JobPhase.CHECKING, 'Validating hyperlinks...')
+    
+    def progress_callback(completed: int, total: int):
+        manager.update_phase_progress(
+            sub_job_id, (completed / max(1, total)) * 100,
+            f'Validated {completed}/{total} hyperlinks'
+        )
+    
+    try:
+        merged = engine.complete_deferred_hyperlink_validation(
+            results, progress_callback=progress_callback
+        )
+        
+        with _review_result_lock:
+            # scan_info may have been published since merged was copied
+            if 'scan_info' in results:
+                merged['scan_info'] = results['scan_info']
+            
+            session_data = SessionManager.get(session_id)
+            
+            # Before the session swap, which releases the old results from jobs
+            parent = manager.get_job(parent_job_id)
+            if parent:
+                manager.update_job_result(
+                    parent_job_id, _review_job_result(parent, session_data, merged),
+                    metadata={
+                        'hyperlink_validation': 'complete',
+                        'result_revision': parent.metadata.get('result_revision', 0) + 1
+                    })
+            
+            # Only replace the session's results if they are still this review's
+            # (possibly reloaded from disk, so no longer the same object)
+            if session_data and (session_data.get('review_job_id') == parent_job_id
+                                 or session_data.get('review_results') is results):
+                SessionManager.update(session_id,
+                                     review_results=merged,
+                                     filtered_issues=merged.get('issues', []))
+        
+        if scan_history:
+            _record_review_scan(parent_job_id, merged, scan_history)
+        
+        hyperlink_validation = merged.get('hyperlink_validation') or {}
+        manager.complete_job(sub_job_id, result={
+            'parent_job_id': parent_job_id,
+            'hyperlink_results': merged.get('hyperlink_results'),
+            'new_issues': hyperlink_validation.get('new_issues', 0),
+            'issue_count': merged.get('issue_count', 0)
+        })
+        logger.info(f"Hyperlink sub-job {sub_job_id} merged "
+                    f"{hyperlink_validation.get('new_issues', 0)} issues into {parent_job_id}")
+        
+    except Exception as e:
+        logger.error(f"Hyperlink sub-job {sub_job_id} failed: {e}", exc_info=True)
+        with _review_result_lock:
+            parent = manager.get_job(parent_job_id)
+            if parent:
+                manager.update_job_result(
+                    parent_job_id,
+                    _review_job_result(parent, SessionManager.get(session_id), results),
+                    metadata={'hyperlink_validation': 'failed'})
+        if scan_history:
+            _record_review_scan(parent_job_id, results, scan_history)
+        manager.fail_job(sub_job_id, str(e))
+
+
 @app.route('/api/review/start', methods=['POST'])
 @require_csrf
 @handle_api_errors
@@ -1968,15 +2225,22 @@ def review_start():
     
     v3.0.39: New endpoint for job-based review with real progress polling.
     
-    Returns job_id immediately. Client polls /api/job/<job_id> for progress.
+    Returns job_id immediately. Client follows progress on the event stream
+    /api/job/<job_id>/events, or polls /api/job/<job_id>.
     When status is 'complete', result is available via /api/job/<job_id>?include_result=true
     or session contains review_results.
     
+    Reviews run on the job manager's worker pool; while waiting, the job is
+    'pending' with a queue_position. When the queue is full the request is
+    refused with 429 and a Retry-After header.
+    
     Request body:
         options: Review options (which checkers to run)
     
     Returns:
         job_id: Unique job identifier for polling
+        queue_position: Position in the worker queue (1 = next)
+        events_url: Server-sent event stream of the job's progress
     """
     if not JOB_MANAGER_AVAILABLE:
         raise ProcessingError("Job manager not available", stage='review_start')
@@ -2002,22 +2266,30 @@ def review_start():
         'options': options
     })
     
-    logger.info(f"Created review job {job_id} for {original_filename}")
+    try:
+        queue_position = manager.submit(
+            job_id, _run_review_job,
+            job_id, g.session_id, filepath, original_filename, options,
+            session_data.get('file_hash')
+        )
+    except QueueFullError as e:
+        logger.warning(f"Review queue full, refusing {original_filename}: {e}")
+        response, status = api_error_response(
+            'QUEUE_FULL', 'The server is busy with other reviews. Please try again shortly.',
+            429, details={'retry_after': e.retry_after, 'queued': e.queued}
+        )
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, status
     
-    # Start worker thread
-    worker = threading.Thread(
-        target=_run_review_job,
-        args=(job_id, g.session_id, filepath, original_filename, options),
-        daemon=True,
-        name=f"review-worker-{job_id}"
-    )
-    worker.start()
+    logger.info(f"Queued review job {job_id} for {original_filename} (position {queue_position})")
     
     return jsonify({
         'success': True,
         'job_id': job_id,
+        'queue_position': queue_position,
         'message': 'Review started',
-        'poll_url': f'/api/job/{job_id}'
+        'poll_url': f'/api/job/{job_id}',
+        'events_url': f'/api/job/{job_id}/events'
     })
 
 
@@ -2054,14 +2326,24 @@ def review_result(job_id):
             'job': job.to_dict()
         }), 400
     
-    if not job.result:
+    results = job.result
+    if results is None and job.metadata.get('result_released'):
+        # The session store holds the results (possibly on disk)
+        session_data = SessionManager.get(job.metadata.get('session_id'))
+        if not session_data or session_data.get('review_job_id') != job_id:
+            return jsonify({
+                'success': False,
+                'error': 'Results were replaced by a newer review'
+            }), 410
+        results = session_data.get('review_results')
+    
+    if not results:
         return jsonify({
             'success': False,
             'error': 'Job complete but no result available'
         }), 500
     
     # Format response same as /api/review
-    results = job.result
     # v3.0.113: Extract document counts for Fix Assistant display
     doc_info = results.get('document_info', {})
     response_data = {
@@ -2871,13 +3153,16 @@ def health():
     """
     Liveness check with diagnostic info (v2.9.4.2 enhanced).
     
-    Returns basic health + error counts for quick status assessment.
+    Returns basic health + error counts for quick status assessment, and
+    session result memory usage (bytes resident vs. budget, spilled to disk).
     """
     health_data = {
         'status': 'healthy',
         'version': VERSION,
         'uptime_seconds': round(time.time() - _APP_START_TIME, 1),
-        'timestamp': datetime.now(timezone.utc).isoformat() + 'Z'
+        'timestamp': datetime.now(timezone.utc).isoformat() + 'Z',
+        # Session results held in memory vs. the budget, and spilled to disk
+        'memory': SessionManager.memory_stats()
     }
     
     # Add diagnostic info if available
@@ -3538,6 +3823,8 @@ def job_manager_status():
         available: Whether job manager is available
         version: Module version
         active_jobs: Count of running jobs
+        scheduler: Worker pool size and queued/running jobs by type
+        event_subscribers: Open job event subscriptions
     """
     if not JOB_MANAGER_AVAILABLE:
         return jsonify({
@@ -3553,6 +3840,8 @@ def job_manager_status():
         'available': True,
         'version': '1.0.0',
         'active_jobs': len(running),
+        'scheduler': manager.scheduler_stats(),
+        'event_subscribers': manager.subscriber_count(),
         'timestamp': datetime.now(timezone.utc).isoformat() + 'Z'
     })
 
@@ -3592,6 +3881,139 @@ def get_job(job_id):
     })
 
 
+# Server-sent job events: each open stream holds a server thread, so their
+# number is capped; clients that are refused fall back to polling
+EVENT_STREAM_MAX_CLIENTS = 16
+EVENT_STREAM_KEEPALIVE_SECONDS = 15
+# Streams are recycled periodically; EventSource reconnects on its own
+EVENT_STREAM_MAX_SECONDS = 300
+EVENT_STREAM_RETRY_MS = 2000
+_event_stream_slots = threading.BoundedSemaphore(EVENT_STREAM_MAX_CLIENTS)
+
+_TERMINAL_JOB_STATUSES = ('complete', 'failed', 'cancelled')
+
+
+def _format_job_event(job_data: Dict[str, Any]) -> str:
+    """One SSE message: 'progress' while a job runs, its final status after."""
+    status = job_data['status']
+    event = status if status in _TERMINAL_JOB_STATUSES else 'progress'
+    return f"event: {event}\ndata: {json.dumps(job_data)}\n\n"
+
+
+def _job_event_response(subscription, job_ids, close_when_done: bool) -> Response:
+    """
+    Stream job snapshots as server-sent events.
+    
+    Sends the current state of job_ids, then the latest state of every job
+    the subscription reports as changed (coalesced by the subscription to
+    its minimum interval). A per-job stream ends once all its jobs are
+    finished; every stream ends after EVENT_STREAM_MAX_SECONDS.
+    """
+    manager = get_job_manager()
+    
+    def generate():
+        deadline = time.monotonic() + EVENT_STREAM_MAX_SECONDS
+        yield f"retry: {EVENT_STREAM_RETRY_MS}\n\n"
+        pending = list(job_ids)
+        unfinished = set(job_ids)
+        while True:
+            for job_id in pending:
+                job = manager.get_job(job_id)
+                if job is None:
+                    unfinished.discard(job_id)
+                    continue
+                job_data = job.to_dict()
+                if job_data['status'] in _TERMINAL_JOB_STATUSES:
+                    unfinished.discard(job_id)
+                yield _format_job_event(job_data)
+            if close_when_done and not unfinished:
+                return
+            if time.monotonic() >= deadline:
+                return
+            pending = subscription.next_changes(EVENT_STREAM_KEEPALIVE_SECONDS)
+            if not pending:
+                yield ": keepalive\n\n"
+    
+    released = []
+    
+    def release():
+        # Called by the WSGI server when the client disconnects or the stream ends
+        if not released:
+            released.append(True)
+            subscription.close()
+            _event_stream_slots.release()
+    
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    response.call_on_close(release)
+    return response
+
+
+def _event_stream_busy():
+    response, status = api_error_response(
+        'STREAMS_BUSY', 'Too many open event streams; poll for progress instead.', 503
+    )
+    response.headers['Retry-After'] = str(EVENT_STREAM_KEEPALIVE_SECONDS)
+    return response, status
+
+
+@app.route('/api/job/events', methods=['GET'])
+@handle_api_errors
+def session_job_events():
+    """
+    Server-sent event stream of every job started by this session.
+    
+    Sends the state of the session's pending and running jobs, then each
+    job's latest state whenever it changes (at most a few times a second).
+    Events are named 'progress', 'complete', 'failed' or 'cancelled' and
+    carry the same job data as /api/job/<job_id>. Polling that endpoint
+    remains the fallback; 503 is returned when too many streams are open.
+    """
+    if not JOB_MANAGER_AVAILABLE:
+        raise ProcessingError("Job manager not available", stage='job_events')
+    
+    if not _event_stream_slots.acquire(blocking=False):
+        return _event_stream_busy()
+    
+    manager = get_job_manager()
+    subscription = manager.subscribe(session_id=g.session_id)
+    active = [
+        j['job_id'] for j in manager.list_jobs(session_id=g.session_id, limit=100)
+        if j['status'] not in _TERMINAL_JOB_STATUSES
+    ]
+    return _job_event_response(subscription, active, close_when_done=False)
+
+
+@app.route('/api/job/<job_id>/events', methods=['GET'])
+@handle_api_errors
+def job_events(job_id):
+    """
+    Server-sent event stream of one job's progress.
+    
+    Same events as /api/job/events; the stream closes after the job's
+    'complete', 'failed' or 'cancelled' event.
+    
+    Args:
+        job_id: Job identifier
+    """
+    if not JOB_MANAGER_AVAILABLE:
+        raise ProcessingError("Job manager not available", stage='job_events')
+    
+    manager = get_job_manager()
+    if not manager.get_job(job_id):
+        return jsonify({
+            'success': False,
+            'error': f'Job not found: {job_id}'
+        }), 404
+    
+    if not _event_stream_slots.acquire(blocking=False):
+        return _event_stream_busy()
+    
+    subscription = manager.subscribe(job_ids=[job_id])
+    return _job_event_response(subscription, [job_id], close_when_done=True)
+
+
 @app.route('/api/job/<job_id>/cancel', methods=['POST'])
 @require_csrf
 @handle_api_errors
@@ -3869,6 +4291,100 @@ def api_scan_history_clear():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/scan-history/search', methods=['GET'])
+@handle_api_errors
+def api_scan_history_search():
+    """
+    Full-text search over past scans' issues and document paragraphs.
+    
+    Query params:
+        q: Search text ("quoted phrases", words, prefix*)
+        type: issues, paragraphs or all (default)
+        document_id, filename: Only this document
+        since, until: Scan date range (ISO dates, inclusive)
+        category, severity: Issue filters (comma-separated)
+        latest_only: 'true' for issues from each document's latest scan only
+        limit, offset: Paging (per result type)
+    
+    Returns:
+        JSON with ranked issue and/or paragraph hits; 503 with code
+        SEARCH_UNAVAILABLE if SQLite has no FTS5
+    """
+    if not SCAN_HISTORY_AVAILABLE:
+        return jsonify({'success': False, 'error': 'Scan history not available'})
+    
+    text = request.args.get('q', '').strip()
+    if not text:
+        raise ValidationError("q parameter required")
+    document_id = request.args.get('document_id')
+    try:
+        document_id = int(document_id) if document_id else None
+        limit = int(request.args.get('limit', 50))
+        offset = int(request.args.get('offset', 0))
+    except ValueError:
+        raise ValidationError("document_id, limit and offset must be integers")
+    
+    try:
+        results = get_scan_history_db().search(
+            text,
+            kind=request.args.get('type', 'all'),
+            document_id=document_id,
+            filename=request.args.get('filename') or None,
+            since=request.args.get('since') or None,
+            until=request.args.get('until') or None,
+            category=request.args.get('category') or None,
+            severity=request.args.get('severity') or None,
+            latest_only=request.args.get('latest_only', 'false').lower() == 'true',
+            limit=limit,
+            offset=offset
+        )
+    except ValueError as e:
+        raise ValidationError(str(e))
+    except SearchUnavailableError as e:
+        return api_error_response('SEARCH_UNAVAILABLE', str(e), 503)
+    
+    return jsonify({
+        'success': True,
+        'data': results
+    })
+
+
+@app.route('/api/scan-history/maintenance', methods=['GET'])
+@handle_api_errors
+def api_scan_history_maintenance_status():
+    """Get the scan history retention policy and its last maintenance report."""
+    if not SCAN_HISTORY_AVAILABLE:
+        return jsonify({'success': False, 'error': 'Scan history not available'})
+    
+    return jsonify({
+        'success': True,
+        'data': get_scan_history_maintenance().status()
+    })
+
+
+@app.route('/api/scan-history/maintenance', methods=['POST'])
+@require_csrf
+@handle_api_errors
+def api_scan_history_maintenance_run():
+    """
+    Start applying the scan history retention policy in the background.
+    
+    The run reduces old scans to summaries, drops orphaned roles and
+    reclaims the freed space. Returns at once with 'started' (False if a
+    run is already in progress) and the maintenance status; poll
+    GET /api/scan-history/maintenance for the report (last_report).
+    """
+    if not SCAN_HISTORY_AVAILABLE:
+        return jsonify({'success': False, 'error': 'Scan history not available'})
+    
+    maintenance = get_scan_history_maintenance()
+    started = maintenance.run_in_background()
+    return jsonify({
+        'success': True,
+        'data': dict(maintenance.status(), started=started)
+    })
+
+
 @app.route('/api/scan-history/<scan_id>/recall', methods=['POST'])
 @require_csrf
 @handle_api_errors
@@ -4112,21 +4628,11 @@ def get_role_graph():
     
     db = get_scan_history_db()
     
-    # Get session and file hash for caching
-    session_id = session.get('session_id', 'default')
-    sess_data = SessionManager.get(session_id)
-    file_hash = ''
-    if sess_data and sess_data.get('current_file'):
-        import hashlib
-        try:
-            with open(sess_data['current_file'], 'rb') as f:
-                file_hash = hashlib.md5(f.read()[:10000]).hexdigest()  # Hash first 10KB
-        except Exception:
-            pass
-    
-    if use_cache and file_hash:
+    # The graph covers the whole scan history, so the cache is shared across
+    # sessions and invalidated by scan history's generation counter
+    if use_cache:
         from scan_history import get_cached_graph
-        graph_data = get_cached_graph(session_id, file_hash, db, max_nodes, min_weight)
+        graph_data = get_cached_graph(db, max_nodes, min_weight)
     else:
         graph_data = db.get_role_graph_data(max_nodes, min_weight)
     
@@ -4906,7 +5412,12 @@ def cleanup_temp_files(max_age_hours: int = 24):
 @require_csrf
 @handle_api_errors
 def learner_record():
-    """Record a review decision for pattern learning."""
+    """
+    Record a review decision for pattern learning.
+    
+    Accepts either a single decision (fix, decision, note, document_id) or
+    {'decisions': [...]} of such objects, recorded in one transaction.
+    """
     if not FIX_ASSISTANT_V2_AVAILABLE or not decision_learner:
         return jsonify({'success': False, 'error': 'Fix Assistant v2 not available'}), 503
     
@@ -4914,6 +5425,22 @@ def learner_record():
     if not data:
         return jsonify({'success': False, 'error': 'No data provided'}), 400
     
+    # Normalize decision values: accept -> accepted, reject -> rejected
+    decision_map = {'accept': 'accepted', 'reject': 'rejected'}
+    
+    if 'decisions' in data:
+        entries = data.get('decisions') or []
+        if not isinstance(entries, list):
+            return jsonify({'success': False, 'error': 'decisions must be a list'}), 400
+        decisions = [{
+            'fix': entry.get('fix', {}),
+            'decision': decision_map.get(entry.get('decision'), entry.get('decision')),
+            'note': entry.get('note', ''),
+            'document_id': entry.get('document_id', data.get('document_id'))
+        } for entry in entries if isinstance(entry, dict)]
+        recorded = decision_learner.record_decisions(decisions)
+        return jsonify({'success': recorded == len(entries) and recorded > 0, 'recorded': recorded})
+    
     fix = data.get('fix', {})
     decision = data.get('decision')
     note = data.get('note', '')
@@ -4922,8 +5449,6 @@ def learner_record():
     if not decision:
         return jsonify({'success': False, 'error': 'Decision required'}), 400
     
-    # Normalize decision values: accept -> accepted, reject -> rejected
-    decision_map = {'accept': 'accepted', 'reject': 'rejected'}
     normalized_decision = decision_map.get(decision, decision)
     
     result = decision_learner.record_decision(
@@ -4939,7 +5464,12 @@ def learner_record():
 @app.route('/api/learner/predict', methods=['POST'])
 @handle_api_errors
 def learner_predict():
-    """Get prediction for a fix based on learned patterns."""
+    """
+    Get prediction for a fix based on learned patterns.
+    
+    With {'fixes': [...]} instead of {'fix': ...}, returns
+    {'predictions': [...]} in the same order.
+    """
     if not FIX_ASSISTANT_V2_AVAILABLE or not decision_learner:
         return api_error_response('SERVICE_UNAVAILABLE', 'Fix Assistant v2 not available', 503)
     
@@ -4947,6 +5477,13 @@ def learner_predict():
     if not data:
         return api_error_response('NO_DATA', 'No data provided', 400)
     
+    if 'fixes' in data:
+        fixes = data.get('fixes') or []
+        if not isinstance(fixes, list):
+            return api_error_response('INVALID_DATA', 'fixes must be a list', 400)
+        fixes = [fix if isinstance(fix, dict) else {} for fix in fixes]
+        return jsonify({'predictions': decision_learner.get_predictions(fixes)})
+    
     fix = data.get('fix', {})
     prediction = decision_learner.get_prediction(fix)
     
@@ -5178,6 +5715,20 @@ def main():
 
     # v3.0.116 (BUG-M03): Start automatic session cleanup to prevent memory growth
     SessionManager.start_auto_cleanup(interval_seconds=3600, max_age_hours=24)
+
+    # Scan history retention: summarize old scans, reclaim space
+    if SCAN_HISTORY_AVAILABLE:
+        get_scan_history_maintenance().start()
+
+    # Resume hyperlink validation jobs interrupted by the previous shutdown
+    if HYPERLINK_VALIDATOR_AVAILABLE:
+        try:
+            from hyperlink_validator.validator import StandaloneHyperlinkValidator
+            resumed = StandaloneHyperlinkValidator.resume_interrupted_jobs()
+            if resumed:
+                logger.info(f"Resumed {len(resumed)} interrupted hyperlink validation job(s)")
+        except Exception as e:
+            logger.warning(f"Could not resume hyperlink validation jobs: {e}")
     
     # Parse command line arguments
     use_debug = '--debug' in sys.argv and os.environ.get('TWR_ENV') != 'production'
@@ -5222,7 +5773,9 @@ def main():
         try:
             from waitress import serve
             logger.info("Starting with Waitress WSGI server")
-            serve(app, host=config.host, port=config.port, threads=4)
+            # Extra threads for open job event streams
+            serve(app, host=config.host, port=config.port,
+                  threads=4 + EVENT_STREAM_MAX_CLIENTS)
         except ImportError:
             logger.warning("Waitress not available, using Flask with threading")
             app.run(host=config.host, port=config.port, debug=False, threaded=True)
@@ -745,6 +745,10 @@ class ComprehensiveHyperlinkChecker(BaseChecker):
         
         # Validation results cache for reporting
         self._validation_results: List[ValidationResult] = []
+        
+        # Web links whose network validation was deferred by check()
+        self._defer_network = False
+        self._deferred_links: List[HyperlinkInfo] = []
     
     def set_validation_mode(self, mode: ValidationMode):
         """F19a: Set the validation mode."""
@@ -754,6 +758,32 @@ class ComprehensiveHyperlinkChecker(BaseChecker):
         """Get detailed validation results for all checked URLs."""
         return self._validation_results
     
+    @property
+    def deferred_link_count(self) -> int:
+        """Number of web links awaiting validate_deferred()."""
+        return len(self._deferred_links)
+    
+    def validate_deferred(self, progress_callback=None) -> List[Dict]:
+        """
+        Run the network validation that check() deferred.
+        
+        Args:
+            progress_callback: Optional callback(completed, total) after each link
+        
+        Returns:
+            List of issue dictionaries for the deferred links
+        """
+        links, self._deferred_links = self._deferred_links, []
+        issues = []
+        for i, link_info in enumerate(links, 1):
+            issues.extend(self._validate_url_advanced(link_info))
+            if progress_callback:
+                try:
+                    progress_callback(i, len(links))
+                except Exception:
+                    pass
+        return issues
+    
     def check(self, paragraphs: List[Tuple[int, str]], **kwargs) -> List[Dict]:
         """
         Comprehensive hyperlink and cross-reference check.
@@ -768,6 +798,8 @@ class ComprehensiveHyperlinkChecker(BaseChecker):
                 - tables: Table information
                 - figures: Figure information
                 - validation_mode: Override validation mode
+                - defer_network_validation: In connected mode, queue web URLs
+                  for validate_deferred() instead of probing them here
         
         Returns:
             List of issue dictionaries
@@ -788,6 +820,8 @@ class ComprehensiveHyperlinkChecker(BaseChecker):
         
         # Clear validation results cache
         self._validation_results = []
+        self._deferred_links = []
+        self._defer_network = bool(kwargs.get('defer_network_validation', False))
         
         # Set base path for relative link resolution
         if filepath and os.path.exists(filepath) and not self.base_path:
@@ -1207,6 +1241,10 @@ class ComprehensiveHyperlinkChecker(BaseChecker):
             
             # F19: Advanced validation only in connected mode
             if self.validation_mode == ValidationMode.CONNECTED:
+                if self._defer_network:
+                    # Probed later by validate_deferred(), which records the result
+                    self._deferred_links.append(link_info)
+                    return issues
                 # Note: _validate_url_advanced appends its own results
                 advanced_issues = self._validate_url_advanced(link_info)
                 issues.extend(advanced_issues)
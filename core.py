@@ -10,6 +10,7 @@ Version is read from version.json via config_logging module.
 """
 
 import re
+import time
 import zipfile
 from typing import List, Dict, Tuple, Optional, Callable
 from pathlib import Path
@@ -384,6 +385,8 @@ class TechWriterReviewEngine:
         self.readability: ReadabilityMetrics = ReadabilityMetrics()
         self.readability_calc = ReadabilityCalculator()
         self.checkers = {}
+        # Document a review deferred link probes for, until they are merged
+        self._deferred_extractor = None
         self._init_checkers()
     
     def _init_checkers(self):
@@ -707,6 +710,7 @@ class TechWriterReviewEngine:
         """
         options = options or {}
         self.issues = []
+        self._deferred_extractor = None
         
         # Helper to report progress
         def report_progress(phase: str, progress: float, message: str):
@@ -912,6 +916,8 @@ class TechWriterReviewEngine:
             'page_map': getattr(extractor, 'page_map', {}),
             # v3.0.109: Pass hyperlink validation mode to checkers
             'validation_mode': 'connected' if hyperlink_validation_mode == 'validator' else 'restricted',
+            # Network link probes run later via complete_deferred_hyperlink_validation()
+            'defer_network_validation': bool(options.get('defer_hyperlink_validation', False)),
         }
         _log(f" [v3.0.109] Passing validation_mode='{common_kwargs['validation_mode']}' to checkers")
         
@@ -1045,32 +1051,15 @@ class TechWriterReviewEngine:
             _log(f" NLP checks complete: {nlp_checker_count} checkers, {len(nlp_metrics)} metrics")
 
         # v3.0.95: Capture hyperlink validation results if hyperlink checker was run
-        hyperlink_results = None
-        try:
-            hyperlink_checker = self.checkers.get('hyperlinks')
-            if hyperlink_checker and hasattr(hyperlink_checker, 'get_validation_results'):
-                validation_results = hyperlink_checker.get_validation_results()
-                if validation_results:
-                    hyperlink_results = {
-                        'total': len(validation_results),
-                        'valid': sum(1 for r in validation_results if r.is_valid),
-                        'invalid': sum(1 for r in validation_results if not r.is_valid),
-                        'links': [
-                            {
-                                'url': r.url,
-                                'link_text': r.link_text,
-                                'is_valid': r.is_valid,
-                                'status_code': r.status_code,
-                                'error': r.error_message,
-                                'link_type': r.link_type.value if hasattr(r.link_type, 'value') else str(r.link_type),
-                                'response_time_ms': r.response_time_ms
-                            }
-                            for r in validation_results[:100]  # Limit to 100 for UI performance
-                        ]
-                    }
-                    _log(f" Captured {hyperlink_results['total']} hyperlink validation results")
-        except Exception as e:
-            _log(f" Error capturing hyperlink results: {e}")
+        hyperlink_results = self._capture_hyperlink_results()
+        hyperlink_validation = None
+        hyperlink_checker = self.checkers.get('hyperlinks')
+        if getattr(hyperlink_checker, 'deferred_link_count', 0):
+            hyperlink_validation = {
+                'status': 'pending',
+                'pending_links': hyperlink_checker.deferred_link_count,
+            }
+            self._deferred_extractor = extractor
         
         # Check for cancellation before postprocessing
         if is_cancelled():
@@ -1086,23 +1075,13 @@ class TechWriterReviewEngine:
         self._assign_issue_ids()
         
         # v3.0.94: Enhance issues with rich context (page, section, full sentence)
-        try:
-            from context_utils import ContextBuilder, enhance_issue_context
-            context_builder = ContextBuilder(
-                paragraphs=filtered_paragraphs,
-                page_map=getattr(extractor, 'page_map', {}),
-                headings=extractor.headings,
-                full_text=extractor.full_text
-            )
-            for issue in self.issues:
-                try:
-                    enhance_issue_context(issue, context_builder)
-                except Exception as ctx_err:
-                    _log(f" Context enhancement error for issue: {ctx_err}")
-        except ImportError:
-            _log(" context_utils not available, skipping context enhancement")
-        except Exception as e:
-            _log(f" Context enhancement error: {e}")
+        self._enhance_issue_context(
+            self.issues,
+            paragraphs=filtered_paragraphs,
+            page_map=getattr(extractor, 'page_map', {}),
+            headings=extractor.headings,
+            full_text=extractor.full_text
+        )
         
         report_progress('postprocessing', 30, 'Calculating metrics...')
         
@@ -1191,6 +1170,7 @@ class TechWriterReviewEngine:
             'enhanced_stats': enhanced_stats,  # v2.9.2: Dashboard supercharge data
             'acronym_metrics': acronym_metrics,  # v3.0.33: Acronym checker transparency metrics
             'hyperlink_results': hyperlink_results,  # v3.0.95: Hyperlink validation results
+            'hyperlink_validation': hyperlink_validation,  # Deferred link probes (None if not deferred)
             'nlp_metrics': nlp_metrics if nlp_metrics else None,  # v3.1.0: NLP checker metrics
             # v3.0.106: Add paragraph data for Fix Assistant v2 Document Viewer
             'paragraphs': filtered_paragraphs,  # List of (idx, text) tuples
@@ -1200,6 +1180,123 @@ class TechWriterReviewEngine:
             'full_text': extractor.full_text,
         }
     
+    def _capture_hyperlink_results(self) -> Optional[Dict]:
+        """Summarize the hyperlink checker's validation results for the UI."""
+        try:
+            hyperlink_checker = self.checkers.get('hyperlinks')
+            if hyperlink_checker and hasattr(hyperlink_checker, 'get_validation_results'):
+                validation_results = hyperlink_checker.get_validation_results()
+                if validation_results:
+                    hyperlink_results = {
+                        'total': len(validation_results),
+                        'valid': sum(1 for r in validation_results if r.is_valid),
+                        'invalid': sum(1 for r in validation_results if not r.is_valid),
+                        'links': [
+                            {
+                                'url': r.url,
+                                'link_text': r.link_text,
+                                'is_valid': r.is_valid,
+                                'status_code': r.status_code,
+                                'error': r.error_message,
+                                'link_type': r.link_type.value if hasattr(r.link_type, 'value') else str(r.link_type),
+                                'response_time_ms': r.response_time_ms
+                            }
+                            for r in validation_results[:100]  # Limit to 100 for UI performance
+                        ]
+                    }
+                    _log(f" Captured {hyperlink_results['total']} hyperlink validation results")
+                    return hyperlink_results
+        except Exception as e:
+            _log(f" Error capturing hyperlink results: {e}")
+        return None
+    
+    def _enhance_issue_context(self, issues: List[Dict], paragraphs, page_map: Dict,
+                               headings, full_text: str):
+        """Add page, section and full-sentence context to issues in place."""
+        try:
+            from context_utils import ContextBuilder, enhance_issue_context
+            context_builder = ContextBuilder(
+                paragraphs=paragraphs,
+                page_map=page_map,
+                headings=headings,
+                full_text=full_text
+            )
+            for issue in issues:
+                try:
+                    enhance_issue_context(issue, context_builder)
+                except Exception as ctx_err:
+                    _log(f" Context enhancement error for issue: {ctx_err}")
+        except ImportError:
+            _log(" context_utils not available, skipping context enhancement")
+        except Exception as e:
+            _log(f" Context enhancement error: {e}")
+    
+    def complete_deferred_hyperlink_validation(self, results: Dict,
+                                               progress_callback: Callable = None) -> Dict:
+        """
+        Run hyperlink network validation deferred by review_document().
+        
+        review_document(options={'defer_hyperlink_validation': True}) returns
+        as soon as the textual checks finish, with
+        results['hyperlink_validation']['status'] == 'pending'. Call this on
+        the same engine afterwards (typically from a background thread).
+        
+        Args:
+            results: Dict returned by review_document()
+            progress_callback: Optional callback(completed, total) per link
+        
+        Returns:
+            A new results dict with hyperlink issues merged in (with the same
+            context enhancement as review_document) and issue counts, score,
+            grade, enhanced_stats and hyperlink_results recalculated. The
+            input dict is not modified, so it can keep being served meanwhile.
+        """
+        hyperlink_checker = self.checkers.get('hyperlinks')
+        if not getattr(hyperlink_checker, 'deferred_link_count', 0):
+            return results
+        
+        started = time.time()
+        new_issues = hyperlink_checker.validate_deferred(progress_callback)
+        self._enhance_issue_context(
+            new_issues,
+            paragraphs=results.get('paragraphs') or [],
+            page_map=results.get('page_map') or {},
+            headings=results.get('headings') or [],
+            full_text=results.get('full_text') or ''
+        )
+        
+        self.issues = self._deduplicate_issues(list(results.get('issues', [])) + new_issues)
+        self._assign_issue_ids()
+        score = self._calculate_score()
+        
+        extractor, self._deferred_extractor = self._deferred_extractor, None
+        enhanced_stats = results.get('enhanced_stats')
+        if extractor is not None:
+            try:
+                enhanced_stats = self._calculate_enhanced_stats(extractor)
+            except Exception as e:
+                _log(f" Error recalculating enhanced stats: {e}")
+        
+        merged = dict(results)
+        merged.update({
+            'issues': self.issues,
+            'issue_count': len(self.issues),
+            'score': score,
+            'grade': self._calculate_grade(score),
+            'by_severity': self._count_by_severity(),
+            'by_category': self._count_by_category(),
+            'enhanced_stats': enhanced_stats,
+            'hyperlink_results': self._capture_hyperlink_results(),
+            'hyperlink_validation': dict(
+                results.get('hyperlink_validation') or {},
+                status='complete',
+                pending_links=0,
+                new_issues=len(new_issues),
+                duration_seconds=round(time.time() - started, 2),
+            ),
+        })
+        return merged
+    
     def _calculate_score(self) -> int:
         """
         Calculate document quality score.
@@ -20,11 +20,16 @@ from typing import Dict, List, Optional, Any
 from contextlib import contextmanager
 import threading
 
+from file_hashing import file_hash as shared_file_hash
+
 # Thread-local storage for connections
 _local = threading.local()
 
 DATABASE_PATH = Path(__file__).parent / 'data' / 'techwriter.db'
-DATABASE_VERSION = 1
+DATABASE_VERSION = 3
+
+# Days of history averaged into each point of a trend's rolling score
+TREND_ROLLING_DAYS = 7
 
 
 def get_connection() -> sqlite3.Connection:
@@ -98,6 +103,7 @@ def init_database():
                 paragraph_index INTEGER,
                 start_offset INTEGER,
                 end_offset INTEGER,
+                issue_hash TEXT,
                 FOREIGN KEY (analysis_id) REFERENCES analysis_history(id)
             )
         """)
@@ -169,11 +175,16 @@ def init_database():
             )
         """)
         
+        _migrate_issue_hashes(conn)
+        
         # Create indexes
         conn.execute("CREATE INDEX IF NOT EXISTS idx_doc_hash ON documents(file_hash)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_analysis_doc ON analysis_history(document_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_analysis_doc_date ON analysis_history(document_id, analyzed_at)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_issues_analysis ON issues(analysis_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_issues_analysis_hash ON issues(analysis_id, issue_hash)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_baseline_doc ON issue_baselines(document_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_baseline_doc_hash ON issue_baselines(document_id, issue_hash)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_roles_doc ON roles(document_id)")
         
         # Set version
@@ -181,13 +192,31 @@ def init_database():
                     ('db_version', str(DATABASE_VERSION)))
 
 
+def _migrate_issue_hashes(conn: sqlite3.Connection):
+    """
+    Add issues.issue_hash (version 2) and fill it in for existing rows.
+    
+    Version 2 hashed NULL columns as 'None'; databases older than version 3
+    have every row re-hashed from the stored columns.
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(issues)")}
+    if 'issue_hash' not in columns:
+        conn.execute("ALTER TABLE issues ADD COLUMN issue_hash TEXT")
+    row = conn.execute("SELECT value FROM configurations WHERE key = 'db_version'").fetchone()
+    try:
+        stored_version = int(row[0]) if row else 0
+    except (TypeError, ValueError):
+        stored_version = 0
+    conn.create_function('stored_issue_hash', 3, stored_issue_hash, deterministic=True)
+    conn.execute(f"""
+        UPDATE issues SET issue_hash = stored_issue_hash(category, message, flagged_text)
+        {'' if stored_version < 3 else 'WHERE issue_hash IS NULL'}
+    """)
+
+
 def compute_file_hash(filepath: str) -> str:
-    """Compute SHA-256 hash of file."""
-    h = hashlib.sha256()
-    with open(filepath, 'rb') as f:
-        while chunk := f.read(8192):
-            h.update(chunk)
-    return h.hexdigest()
+    """Compute SHA-256 hash of file (shared, memoized by path/size/mtime)."""
+    return shared_file_hash(filepath)
 
 
 def compute_issue_hash(issue: Dict) -> str:
@@ -196,13 +225,33 @@ def compute_issue_hash(issue: Dict) -> str:
     return hashlib.md5(key.encode()).hexdigest()
 
 
+def _stored_flagged_text(issue: Dict) -> Optional[str]:
+    """The flagged_text column value for an issue dict."""
+    return issue.get('flagged_text', issue.get('text', ''))
+
+
+def stored_issue_hash(category: Optional[str], message: Optional[str],
+                      flagged_text: Optional[str]) -> str:
+    """
+    issues.issue_hash for the stored column values (NULL hashes as '').
+    
+    Used both when saving an analysis and by the SQL backfill, so a row
+    hashes the same however it was written.
+    """
+    return compute_issue_hash({
+        'category': category or '',
+        'message': message or '',
+        'flagged_text': flagged_text or '',
+    })
+
+
 class DocumentRepository:
     """Repository for document-related database operations."""
     
     @staticmethod
-    def get_or_create(filename: str, filepath: str) -> int:
-        """Get existing document or create new one."""
-        file_hash = compute_file_hash(filepath)
+    def get_or_create(filename: str, filepath: str, file_hash: Optional[str] = None) -> int:
+        """Get existing document or create new one (file_hash: SHA-256 if already known)."""
+        file_hash = file_hash or compute_file_hash(filepath)
         file_size = Path(filepath).stat().st_size
         
         with get_db() as conn:
@@ -307,52 +356,78 @@ class AnalysisRepository:
             analysis_id = cursor.lastrowid
             
             # Save individual issues
-            for issue in results.get('issues', []):
-                conn.execute("""
-                    INSERT INTO issues 
-                    (analysis_id, category, severity, message, flagged_text,
-                     suggestion, paragraph_index, start_offset, end_offset)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    analysis_id,
-                    issue.get('category'),
-                    issue.get('severity'),
-                    issue.get('message'),
-                    issue.get('flagged_text', issue.get('text', '')),
-                    issue.get('suggestion'),
-                    issue.get('paragraph_index'),
-                    issue.get('start_offset'),
-                    issue.get('end_offset')
-                ))
+            conn.executemany("""
+                INSERT INTO issues 
+                (analysis_id, category, severity, message, flagged_text,
+                 suggestion, paragraph_index, start_offset, end_offset, issue_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(
+                analysis_id,
+                issue.get('category'),
+                issue.get('severity'),
+                issue.get('message'),
+                _stored_flagged_text(issue),
+                issue.get('suggestion'),
+                issue.get('paragraph_index'),
+                issue.get('start_offset'),
+                issue.get('end_offset'),
+                stored_issue_hash(issue.get('category'), issue.get('message'),
+                                  _stored_flagged_text(issue))
+            ) for issue in results.get('issues', [])])
             
             return analysis_id
     
     @staticmethod
-    def get_trends(doc_id: int, days: int = 30) -> Dict:
-        """Get trend data for document."""
+    def get_trends(doc_id: int, days: int = 30, rolling_days: int = TREND_ROLLING_DAYS) -> Dict:
+        """
+        Get trend data for document.
+        
+        One row per day with analyses, plus window aggregates over the days:
+        a rolling average score over the last rolling_days points and the
+        change in score and issue count from the previous point.
+        """
         with get_db() as conn:
             rows = conn.execute("""
-                SELECT DATE(analyzed_at) as date, 
-                       AVG(score) as avg_score,
-                       AVG(issue_count) as avg_issues,
-                       COUNT(*) as analysis_count
-                FROM analysis_history
-                WHERE document_id = ?
-                  AND analyzed_at >= datetime('now', ?)
-                GROUP BY DATE(analyzed_at)
+                WITH daily AS (
+                    SELECT DATE(analyzed_at) as date,
+                           AVG(score) as avg_score,
+                           AVG(issue_count) as avg_issues,
+                           COUNT(*) as analysis_count
+                    FROM analysis_history
+                    WHERE document_id = ?
+                      AND analyzed_at >= datetime('now', ?)
+                    GROUP BY DATE(analyzed_at)
+                )
+                SELECT date, avg_score, avg_issues, analysis_count,
+                       AVG(avg_score) OVER (
+                           ORDER BY date ROWS BETWEEN ? PRECEDING AND CURRENT ROW
+                       ) as rolling_score,
+                       avg_score - LAG(avg_score) OVER (ORDER BY date) as score_change,
+                       avg_issues - LAG(avg_issues) OVER (ORDER BY date) as issue_change
+                FROM daily
                 ORDER BY date
-            """, (doc_id, f'-{days} days')).fetchall()
+            """, (doc_id, f'-{days} days', max(rolling_days - 1, 0))).fetchall()
             
             return {
                 'dates': [row['date'] for row in rows],
                 'scores': [row['avg_score'] for row in rows],
                 'issues': [row['avg_issues'] for row in rows],
-                'counts': [row['analysis_count'] for row in rows]
+                'counts': [row['analysis_count'] for row in rows],
+                'rolling_scores': [row['rolling_score'] for row in rows],
+                'score_changes': [row['score_change'] for row in rows],
+                'issue_changes': [row['issue_change'] for row in rows]
             }
     
     @staticmethod
-    def compare_analyses(analysis_id_1: int, analysis_id_2: int) -> Dict:
-        """Compare two analyses."""
+    def compare_analyses(analysis_id_1: int, analysis_id_2: int,
+                         include_issues: bool = True) -> Dict:
+        """
+        Compare two analyses.
+        
+        Issues are matched by issue hash in SQL. With include_issues=False
+        only the new/resolved/unchanged counts are returned (no issue rows
+        leave the database).
+        """
         with get_db() as conn:
             # Get both analyses
             a1 = conn.execute(
@@ -367,30 +442,45 @@ class AnalysisRepository:
             if not a1 or not a2:
                 return {}
             
-            # Get issues for both
-            issues_1 = set()
-            for row in conn.execute(
-                "SELECT category, message, flagged_text FROM issues WHERE analysis_id = ?",
-                (analysis_id_1,)
-            ):
-                issues_1.add((row['category'], row['message'], row['flagged_text']))
+            matched = """
+                SELECT MIN(id) as first_id, category, message, flagged_text,
+                       MAX(analysis_id = ?) as in_1, MAX(analysis_id = ?) as in_2
+                FROM issues
+                WHERE analysis_id IN (?, ?)
+                GROUP BY issue_hash
+            """
+            params = (analysis_id_1, analysis_id_2, analysis_id_1, analysis_id_2)
             
-            issues_2 = set()
-            for row in conn.execute(
-                "SELECT category, message, flagged_text FROM issues WHERE analysis_id = ?",
-                (analysis_id_2,)
-            ):
-                issues_2.add((row['category'], row['message'], row['flagged_text']))
+            counts = conn.execute(f"""
+                SELECT COALESCE(SUM(in_2 AND NOT in_1), 0) as new_count,
+                       COALESCE(SUM(in_1 AND NOT in_2), 0) as resolved_count,
+                       COALESCE(SUM(in_1 AND in_2), 0) as unchanged_count
+                FROM ({matched})
+            """, params).fetchone()
             
-            return {
+            comparison = {
                 'analysis_1': dict(a1),
                 'analysis_2': dict(a2),
-                'new_issues': list(issues_2 - issues_1),
-                'resolved_issues': list(issues_1 - issues_2),
-                'unchanged_issues': list(issues_1 & issues_2),
+                'new_count': counts['new_count'],
+                'resolved_count': counts['resolved_count'],
+                'unchanged_count': counts['unchanged_count'],
                 'score_change': (a2['score'] or 0) - (a1['score'] or 0),
                 'issue_count_change': (a2['issue_count'] or 0) - (a1['issue_count'] or 0)
             }
+            
+            if include_issues:
+                groups = {'new_issues': [], 'resolved_issues': [], 'unchanged_issues': []}
+                for row in conn.execute(f"{matched} ORDER BY first_id", params):
+                    if row['in_1'] and row['in_2']:
+                        group = 'unchanged_issues'
+                    elif row['in_2']:
+                        group = 'new_issues'
+                    else:
+                        group = 'resolved_issues'
+                    groups[group].append((row['category'], row['message'], row['flagged_text']))
+                comparison.update(groups)
+            
+            return comparison
 
 
 class BaselineRepository:
@@ -455,18 +545,28 @@ class BaselineRepository:
     
     @staticmethod
     def filter_baselined(doc_id: int, issues: List[Dict]) -> List[Dict]:
-        """Filter out baselined issues."""
+        """
+        Filter out baselined issues.
+        
+        The issue hashes are checked in one set-membership query against the
+        (document_id, issue_hash) index rather than loading every baseline.
+        """
+        if not issues:
+            return []
+        hashes = [compute_issue_hash(issue) for issue in issues]
+        
         with get_db() as conn:
-            baselined = set()
-            for row in conn.execute(
-                "SELECT issue_hash FROM issue_baselines WHERE document_id = ?",
-                (doc_id,)
-            ):
-                baselined.add(row['issue_hash'])
+            baselined = {
+                row['issue_hash'] for row in conn.execute("""
+                    SELECT issue_hash FROM issue_baselines
+                    WHERE document_id = ?
+                      AND issue_hash IN (SELECT value FROM json_each(?))
+                """, (doc_id, json.dumps(sorted(set(hashes)))))
+            }
             
             return [
-                issue for issue in issues 
-                if compute_issue_hash(issue) not in baselined
+                issue for issue, issue_hash in zip(issues, hashes)
+                if issue_hash not in baselined
             ]
 
 
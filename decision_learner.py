@@ -57,6 +57,9 @@ class DecisionLearner:
         self.db_path = db_path
         self._local = threading.local()
         self._lock = threading.Lock()
+        # Lazily loaded caches for predictions (see _load_patterns)
+        self._pattern_counts: Optional[Dict[str, tuple]] = None
+        self._dictionary_terms: Optional[set] = None
         self._init_database()
         logger.info(f"[DecisionLearner] Initialized with database: {db_path}")
     
@@ -165,83 +168,134 @@ class DecisionLearner:
         Returns:
             True if recorded successfully
         """
-        if decision not in ('accepted', 'rejected'):
-            logger.warning(f"[DecisionLearner] Invalid decision: {decision}")
-            return False
+        recorded = self.record_decisions([{
+            'fix': fix, 'decision': decision, 'note': note, 'document_id': document_id
+        }])
+        return recorded == 1
+    
+    def record_decisions(self, decisions: List[Dict[str, Any]]) -> int:
+        """
+        Record many user decisions in one transaction.
+        
+        Args:
+            decisions: Dicts with fix, decision ('accepted' or 'rejected'),
+                and optional note and document_id
+            
+        Returns:
+            Number of decisions recorded (invalid entries are skipped; 0 on a
+            database error, in which case nothing is recorded)
+        """
+        rows = []
+        deltas: Dict[str, List] = {}
+        for entry in decisions:
+            fix = entry.get('fix') or {}
+            decision = entry.get('decision')
+            if decision not in ('accepted', 'rejected'):
+                logger.warning(f"[DecisionLearner] Invalid decision: {decision}")
+                continue
+            
+            pattern_key = make_pattern_key(fix)
+            category = fix.get('category', 'Other')
+            original = fix.get('flagged_text', '')
+            suggestion = fix.get('suggestion', '')
+            rows.append((pattern_key, category, original, suggestion, decision,
+                         entry.get('note', ''), entry.get('document_id')))
+            
+            delta = deltas.setdefault(pattern_key, [category, original, suggestion, 0, 0])
+            delta[3 if decision == 'accepted' else 4] += 1
         
-        pattern_key = make_pattern_key(fix)
-        category = fix.get('category', 'Other')
-        original = fix.get('flagged_text', '')
-        suggestion = fix.get('suggestion', '')
+        if not rows:
+            return 0
         
+        now = datetime.now().isoformat()
         try:
             with self._lock:
+                counts = self._load_patterns()
                 with self._db_cursor() as cursor:
-                    # Record individual decision
-                    cursor.execute('''
+                    cursor.executemany('''
                         INSERT INTO decisions 
                         (pattern_key, category, original_text, suggestion_text, decision, reviewer_note, document_id)
                         VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (pattern_key, category, original, suggestion, decision, note, document_id))
-                    
-                    # Update aggregated pattern
-                    cursor.execute('SELECT * FROM patterns WHERE pattern_key = ?', (pattern_key,))
-                    existing = cursor.fetchone()
+                    ''', rows)
                     
-                    now = datetime.now().isoformat()
-                    
-                    if existing:
-                        accept_count = existing['accept_count'] + (1 if decision == 'accepted' else 0)
-                        reject_count = existing['reject_count'] + (1 if decision == 'rejected' else 0)
-                        
-                        cursor.execute('''
-                            UPDATE patterns 
-                            SET accept_count = ?, reject_count = ?, last_seen = ?
-                            WHERE pattern_key = ?
-                        ''', (accept_count, reject_count, now, pattern_key))
-                    else:
-                        accept_count = 1 if decision == 'accepted' else 0
-                        reject_count = 1 if decision == 'rejected' else 0
-                        
-                        cursor.execute('''
-                            INSERT INTO patterns 
-                            (pattern_key, category, original_text, suggestion_text, accept_count, reject_count, last_seen)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ''', (pattern_key, category, original, suggestion, accept_count, reject_count, now))
+                    # Update aggregated patterns
+                    cursor.executemany('''
+                        INSERT INTO patterns 
+                        (pattern_key, category, original_text, suggestion_text, accept_count, reject_count, last_seen)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(pattern_key) DO UPDATE SET
+                            accept_count = accept_count + excluded.accept_count,
+                            reject_count = reject_count + excluded.reject_count,
+                            last_seen = excluded.last_seen
+                    ''', [(key, *delta, now) for key, delta in deltas.items()])
                     
-                    # Update prediction
-                    self._update_prediction(cursor, pattern_key, accept_count, reject_count)
+                    updated = {}
+                    for key, delta in deltas.items():
+                        accept_count, reject_count = counts.get(key, (0, 0))
+                        updated[key] = (accept_count + delta[3], reject_count + delta[4])
                     
-            logger.info(f"[DecisionLearner] Recorded {decision} for pattern: {pattern_key}")
-            return True
+                    # Update predictions
+                    predictions = []
+                    for key, (accept_count, reject_count) in updated.items():
+                        predicted_action, confidence = self._predict(accept_count, reject_count)
+                        predictions.append((predicted_action, confidence, key))
+                    cursor.executemany('''
+                        UPDATE patterns SET predicted_action = ?, confidence = ?
+                        WHERE pattern_key = ?
+                    ''', predictions)
+                counts.update(updated)
+            
+            if len(rows) == 1:
+                logger.info(f"[DecisionLearner] Recorded {rows[0][4]} for pattern: {rows[0][0]}")
+            else:
+                logger.info(f"[DecisionLearner] Recorded {len(rows)} decisions for {len(deltas)} patterns")
+            return len(rows)
             
         except sqlite3.Error as e:
             logger.error(f"[DecisionLearner] Failed to record decision: {e}")
-            return False
+            return 0
     
-    def _update_prediction(self, cursor, pattern_key: str, accept_count: int, reject_count: int) -> None:
-        """Update the predicted action and confidence for a pattern."""
+    def _predict(self, accept_count: int, reject_count: int):
+        """Predicted action and confidence for a pattern's decision counts."""
         total = accept_count + reject_count
         
         if total < self.MIN_DECISIONS:
-            predicted_action = None
-            confidence = 0.0
-        else:
-            accept_ratio = accept_count / total
-            if accept_ratio >= self.ACCEPT_THRESHOLD:
-                predicted_action = 'accept'
-                confidence = accept_ratio
-            elif accept_ratio <= self.REJECT_THRESHOLD:
-                predicted_action = 'reject'
-                confidence = 1 - accept_ratio
-            else:
-                predicted_action = None
-                confidence = 0.5
+            return None, 0.0
+        accept_ratio = accept_count / total
+        if accept_ratio >= self.ACCEPT_THRESHOLD:
+            return 'accept', accept_ratio
+        if accept_ratio <= self.REJECT_THRESHOLD:
+            return 'reject', 1 - accept_ratio
+        return None, 0.5
+    
+    def _load_patterns(self) -> Dict[str, tuple]:
+        """
+        Get the in-memory map of pattern_key -> (accept_count, reject_count).
         
-        cursor.execute('''
-            UPDATE patterns SET predicted_action = ?, confidence = ?
-            WHERE pattern_key = ?
-        ''', (predicted_action, confidence, pattern_key))
+        Loaded from the database on first use and then kept in step by this
+        instance's writes (callers that modify it must hold self._lock).
+        Raises sqlite3.Error if it cannot be loaded.
+        """
+        if self._pattern_counts is None:
+            with self._db_cursor() as cursor:
+                cursor.execute('SELECT pattern_key, accept_count, reject_count FROM patterns')
+                self._pattern_counts = {
+                    row['pattern_key']: (row['accept_count'], row['reject_count'])
+                    for row in cursor.fetchall()
+                }
+        return self._pattern_counts
+    
+    def _load_dictionary_terms(self) -> set:
+        """Get the lowercased custom dictionary terms (loaded like _load_patterns)."""
+        if self._dictionary_terms is None:
+            with self._db_cursor() as cursor:
+                cursor.execute('SELECT term FROM user_dictionary')
+                self._dictionary_terms = {row['term'].strip().lower() for row in cursor.fetchall()}
+        return self._dictionary_terms
+    
+    def _invalidate_cache(self) -> None:
+        self._pattern_counts = None
+        self._dictionary_terms = None
     
     def get_prediction(self, fix: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -250,10 +304,39 @@ class DecisionLearner:
         Returns:
             Dict with prediction, confidence, reason, and history
         """
+        return self.get_predictions([fix])[0]
+    
+    def get_predictions(self, fixes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Get predictions for many fixes at once.
+        
+        Served from the in-memory pattern map, so a whole review's fixes
+        cost at most one load query rather than two queries per fix.
+        
+        Returns:
+            One prediction dict per fix, in order (see get_prediction)
+        """
+        try:
+            with self._lock:
+                counts = self._load_patterns()
+                dictionary = self._load_dictionary_terms()
+        except sqlite3.Error as e:
+            logger.error(f"[DecisionLearner] Prediction error: {e}")
+            return [{
+                'prediction': None,
+                'confidence': 0.0,
+                'reason': 'Database error',
+                'history': None
+            } for _ in fixes]
+        
+        return [self._prediction_for(fix, counts, dictionary) for fix in fixes]
+    
+    def _prediction_for(self, fix: Dict[str, Any], counts: Dict[str, tuple],
+                        dictionary: set) -> Dict[str, Any]:
         flagged_text = fix.get('flagged_text', '')
         
         # Check custom dictionary first
-        if self.is_in_dictionary(flagged_text):
+        if flagged_text and flagged_text.strip().lower() in dictionary:
             return {
                 'prediction': 'reject',
                 'confidence': 1.0,
@@ -261,71 +344,45 @@ class DecisionLearner:
                 'history': None
             }
         
-        pattern_key = make_pattern_key(fix)
-        
-        try:
-            with self._db_cursor() as cursor:
-                cursor.execute('SELECT * FROM patterns WHERE pattern_key = ?', (pattern_key,))
-                pattern = cursor.fetchone()
-                
-                if not pattern:
-                    return {
-                        'prediction': None,
-                        'confidence': 0.0,
-                        'reason': 'No history for this pattern',
-                        'history': None
-                    }
-                
-                accept_count = pattern['accept_count']
-                reject_count = pattern['reject_count']
-                total = accept_count + reject_count
-                
-                history = {
-                    'accepted': accept_count,
-                    'rejected': reject_count,
-                    'total': total
-                }
-                
-                if total < self.MIN_DECISIONS:
-                    return {
-                        'prediction': None,
-                        'confidence': 0.0,
-                        'reason': f'Not enough history (need {self.MIN_DECISIONS}+ decisions)',
-                        'history': history
-                    }
-                
-                accept_ratio = accept_count / total
-                
-                if accept_ratio >= self.ACCEPT_THRESHOLD:
-                    return {
-                        'prediction': 'accept',
-                        'confidence': round(accept_ratio, 2),
-                        'reason': f"You accepted this {accept_count} of {total} times",
-                        'history': history
-                    }
-                elif accept_ratio <= self.REJECT_THRESHOLD:
-                    return {
-                        'prediction': 'reject',
-                        'confidence': round(1 - accept_ratio, 2),
-                        'reason': f"You rejected this {reject_count} of {total} times",
-                        'history': history
-                    }
-                else:
-                    return {
-                        'prediction': None,
-                        'confidence': 0.5,
-                        'reason': f"Mixed history ({accept_count} accepted, {reject_count} rejected)",
-                        'history': history
-                    }
-                    
-        except sqlite3.Error as e:
-            logger.error(f"[DecisionLearner] Prediction error: {e}")
+        pattern = counts.get(make_pattern_key(fix))
+        if not pattern:
             return {
                 'prediction': None,
                 'confidence': 0.0,
-                'reason': 'Database error',
+                'reason': 'No history for this pattern',
                 'history': None
             }
+        
+        accept_count, reject_count = pattern
+        total = accept_count + reject_count
+        
+        history = {
+            'accepted': accept_count,
+            'rejected': reject_count,
+            'total': total
+        }
+        
+        if total < self.MIN_DECISIONS:
+            return {
+                'prediction': None,
+                'confidence': 0.0,
+                'reason': f'Not enough history (need {self.MIN_DECISIONS}+ decisions)',
+                'history': history
+            }
+        
+        predicted_action, confidence = self._predict(accept_count, reject_count)
+        if predicted_action == 'accept':
+            reason = f"You accepted this {accept_count} of {total} times"
+        elif predicted_action == 'reject':
+            reason = f"You rejected this {reject_count} of {total} times"
+        else:
+            reason = f"Mixed history ({accept_count} accepted, {reject_count} rejected)"
+        return {
+            'prediction': predicted_action,
+            'confidence': round(confidence, 2),
+            'reason': reason,
+            'history': history
+        }
     
     def get_all_patterns(self) -> List[Dict[str, Any]]:
         """Get all learned patterns with statistics."""
@@ -366,6 +423,8 @@ class DecisionLearner:
                         INSERT OR REPLACE INTO user_dictionary (term, category, notes)
                         VALUES (?, ?, ?)
                     ''', (term, category, notes))
+                if self._dictionary_terms is not None:
+                    self._dictionary_terms.add(term.lower())
             logger.info(f"[DecisionLearner] Added to dictionary: {term}")
             return True
         except sqlite3.Error as e:
@@ -378,6 +437,8 @@ class DecisionLearner:
             with self._lock:
                 with self._db_cursor() as cursor:
                     cursor.execute('DELETE FROM user_dictionary WHERE term = ?', (term,))
+                    # Other entries may differ from term only in case
+                    self._dictionary_terms = None
                     if cursor.rowcount > 0:
                         logger.info(f"[DecisionLearner] Removed from dictionary: {term}")
                         return True
@@ -418,6 +479,7 @@ class DecisionLearner:
                 with self._db_cursor() as cursor:
                     cursor.execute('DELETE FROM decisions')
                     cursor.execute('DELETE FROM patterns')
+                self._pattern_counts = {}
             logger.info("[DecisionLearner] All patterns cleared")
             return True
         except sqlite3.Error as e:
@@ -477,6 +539,7 @@ class DecisionLearner:
                             INSERT OR REPLACE INTO user_dictionary (term, category, notes)
                             VALUES (?, ?, ?)
                         ''', (d['term'], d.get('category', 'custom'), d.get('notes', '')))
+                self._invalidate_cache()
             
             logger.info(f"[DecisionLearner] Imported {len(data.get('patterns', []))} patterns, "
                        f"{len(data.get('dictionary', []))} dictionary terms")
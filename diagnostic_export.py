@@ -42,6 +42,8 @@ from collections import deque
 import threading
 import logging
 
+from file_hashing import file_hash
+
 # Load version from central config
 try:
     from config_logging import VERSION
@@ -1353,8 +1355,7 @@ class AITroubleshootPackage:
             file_path = app_dir / file
             if file_path.exists():
                 try:
-                    with open(file_path, 'rb') as f:
-                        checksum = hashlib.md5(f.read()).hexdigest()
+                    checksum = file_hash(file_path, 'md5')
                     # Also get file size for reference
                     size = file_path.stat().st_size
                     self.file_checksums[file] = {
@@ -27,6 +27,9 @@ except ImportError:
     class ProcessingError(Exception):
         pass
 
+# Shared pooled WAL connections
+from sqlite_pool import connect as db_connect
+
 # Import differ
 from .differ import DocumentDiffer
 from .models import IssueComparison
@@ -197,44 +200,42 @@ def _get_db_path():
     return db_path
 
 
-def _get_scan_with_results(scan_id: int) -> dict:
+def _get_scan_with_results(scan_id: int, include_results: bool = True) -> dict:
     """
-    Fetch scan data including results_json.
+    Fetch scan data including the recorded results.
 
     Args:
         scan_id: Scan ID to fetch
+        include_results: False to skip loading results (scan row only)
 
     Returns:
         Dict with scan data and parsed results, or None if not found
     """
+    from scan_history import load_scan_results
+
     db_path = _get_db_path()
 
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
-    cursor.execute('''
-        SELECT s.id, s.document_id, s.scan_time, s.score, s.grade,
-               s.issue_count, s.word_count, s.results_json,
-               d.filename
-        FROM scans s
-        JOIN documents d ON s.document_id = d.id
-        WHERE s.id = ?
-    ''', (scan_id,))
-
-    row = cursor.fetchone()
-    conn.close()
-
-    if not row:
-        return None
+    try:
+        cursor.execute('''
+            SELECT s.id, s.document_id, s.scan_time, s.score, s.grade,
+                   s.issue_count, s.word_count, d.filename
+            FROM scans s
+            JOIN documents d ON s.document_id = d.id
+            WHERE s.id = ?
+        ''', (scan_id,))
+
+        row = cursor.fetchone()
+        if not row:
+            return None
 
-    # Parse results_json
-    results = {}
-    if row['results_json']:
-        try:
-            results = json.loads(row['results_json'])
-        except json.JSONDecodeError:
-            pass
+        # Reassemble issues, document text and the compressed remainder
+        results = (load_scan_results(conn.cursor(), scan_id) or {}) if include_results else {}
+    finally:
+        conn.close()
 
     return {
         'id': row['id'],
@@ -261,7 +262,7 @@ def _get_scans_for_document(doc_id: int) -> list:
     """
     db_path = _get_db_path()
 
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -289,7 +290,7 @@ def _get_document_by_id(doc_id: int) -> dict:
     """Get document info by ID."""
     db_path = _get_db_path()
 
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -316,7 +317,7 @@ def _get_documents_with_multiple_scans() -> list:
     """Get all documents that have more than one scan."""
     db_path = _get_db_path()
 
-    conn = sqlite3.connect(db_path)
+    conn = db_connect(db_path)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -519,38 +520,31 @@ def compare_issues(old_scan_id: int, new_scan_id: int):
             }
         }
     """
+    from scan_history import load_issues_by_fingerprint
+
     # Fetch scan data
-    old_scan = _get_scan_with_results(old_scan_id)
-    new_scan = _get_scan_with_results(new_scan_id)
+    old_scan = _get_scan_with_results(old_scan_id, include_results=False)
+    new_scan = _get_scan_with_results(new_scan_id, include_results=False)
 
     if not old_scan:
         raise ValidationError(f"Old scan {old_scan_id} not found")
     if not new_scan:
         raise ValidationError(f"New scan {new_scan_id} not found")
 
-    # Extract issues
-    old_issues = old_scan['results'].get('issues', [])
-    new_issues = new_scan['results'].get('issues', [])
-
-    # Create fingerprints for matching
-    def fingerprint(issue):
-        """Create a fingerprint for issue matching."""
-        return (
-            issue.get('category', ''),
-            issue.get('message', '')[:50],
-            issue.get('paragraph_index', 0)
-        )
-
-    old_fps = {fingerprint(i): i for i in old_issues}
-    new_fps = {fingerprint(i): i for i in new_issues}
-
-    old_keys = set(old_fps.keys())
-    new_keys = set(new_fps.keys())
-
-    # Categorize issues
-    fixed = [old_fps[k] for k in (old_keys - new_keys)]
-    new_only = [new_fps[k] for k in (new_keys - old_keys)]
-    unchanged = [old_fps[k] for k in (old_keys & new_keys)]
+    # Match issues through the fingerprints stored with each scan
+    conn = db_connect(_get_db_path())
+    try:
+        cursor = conn.cursor()
+        fixed = load_issues_by_fingerprint(cursor, old_scan_id, new_scan_id, shared=False)
+        new_only = load_issues_by_fingerprint(cursor, new_scan_id, old_scan_id, shared=False)
+        unchanged = load_issues_by_fingerprint(cursor, old_scan_id, new_scan_id, shared=True)
+        issue_counts = dict(cursor.execute('''
+            SELECT scan_id, COUNT(*) FROM scan_issues
+            WHERE scan_id IN (?, ?)
+            GROUP BY scan_id
+        ''', (old_scan_id, new_scan_id)).fetchall())
+    finally:
+        conn.close()
 
     comparison = IssueComparison(
         fixed=fixed,
@@ -558,8 +552,8 @@ def compare_issues(old_scan_id: int, new_scan_id: int):
         unchanged=unchanged,
         old_score=old_scan['score'],
         new_score=new_scan['score'],
-        old_issue_count=len(old_issues),
-        new_issue_count=len(new_issues)
+        old_issue_count=issue_counts.get(old_scan_id, 0),
+        new_issue_count=issue_counts.get(new_scan_id, 0)
     )
 
     logger.info(
@@ -586,7 +580,7 @@ def health_check():
 
     if db_exists:
         try:
-            conn = sqlite3.connect(db_path)
+            conn = db_connect(db_path)
             cursor = conn.cursor()
 
             # Count documents
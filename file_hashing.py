@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+TechWriterReview - Shared File Hashing
+======================================
+One place to hash files (uploads, scan history, the analysis database,
+update packages).
+
+Files are read in fixed-size chunks, so a large upload is never held in
+memory, and digests are memoized by (path, size, mtime, algorithm): once an
+upload is hashed - ideally while it is being written to disk, see
+save_stream() - review, scan history and caches reuse the digest instead of
+reading the file again. A file that is modified gets a new size or mtime
+and is hashed afresh.
+
+Usage:
+    from file_hashing import file_hash, save_stream
+
+    digest, size = save_stream(upload.stream, path)   # write + hash in one pass
+    ...
+    file_hash(path)   # cache hit: no file read
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+__version__ = "1.0.0"
+
+DEFAULT_ALGORITHM = 'sha256'
+CHUNK_SIZE = 1024 * 1024
+MAX_CACHE_ENTRIES = 1024
+
+
+def _file_key(path: str, algorithm: str) -> Optional[Tuple[str, int, int, str]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), st.st_size, st.st_mtime_ns, algorithm
+
+
+class FileHashService:
+    """
+    Chunked file hashing with a bounded LRU memo of recent digests.
+    """
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE, max_entries: int = MAX_CACHE_ENTRIES):
+        self.chunk_size = chunk_size
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[tuple, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _remember_key(self, key: tuple, digest: str):
+        with self._lock:
+            self._cache[key] = digest
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def hash_file(self, path, algorithm: str = DEFAULT_ALGORITHM,
+                  use_cache: bool = True) -> str:
+        """
+        Get the hex digest of a file's contents.
+
+        Args:
+            path: File to hash
+            algorithm: Any hashlib algorithm name
+            use_cache: False to always read the file (e.g. verifying a copy)
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = str(path)
+        key = _file_key(path, algorithm)
+        if key is None:
+            raise FileNotFoundError(path)
+        if use_cache:
+            with self._lock:
+                digest = self._cache.get(key)
+                if digest is not None:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return digest
+                self.misses += 1
+
+        h = hashlib.new(algorithm)
+        with open(path, 'rb') as f:
+            while chunk := f.read(self.chunk_size):
+                h.update(chunk)
+        digest = h.hexdigest()
+        # Only trust the digest if the file did not change while it was read
+        if _file_key(path, algorithm) == key:
+            self._remember_key(key, digest)
+        return digest
+
+    def remember(self, path, digest: str, algorithm: str = DEFAULT_ALGORITHM):
+        """Record a digest computed elsewhere for the file as it is now."""
+        key = _file_key(str(path), algorithm)
+        if key is not None:
+            self._remember_key(key, digest)
+
+    def save_stream(self, stream: BinaryIO, path, algorithm: str = DEFAULT_ALGORITHM,
+                    max_size: Optional[int] = None) -> Tuple[str, int]:
+        """
+        Copy a stream to path, hashing it on the way.
+
+        Returns:
+            (hex digest, bytes written)
+
+        Raises:
+            ValueError: If max_size is exceeded (the partial file is removed)
+        """
+        path = str(path)
+        h = hashlib.new(algorithm)
+        size = 0
+        try:
+            with open(path, 'wb') as f:
+                while chunk := stream.read(self.chunk_size):
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise ValueError(f"File exceeds {max_size} bytes")
+                    h.update(chunk)
+                    f.write(chunk)
+        except ValueError:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            raise
+        digest = h.hexdigest()
+        self.remember(path, digest, algorithm)
+        return digest, size
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'entries': len(self._cache), 'hits': self.hits, 'misses': self.misses}
+
+
+_service: Optional[FileHashService] = None
+_service_lock = threading.Lock()
+
+
+def get_file_hash_service() -> FileHashService:
+    """Get the process-wide hashing service."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = FileHashService()
+    return _service
+
+
+def file_hash(path, algorithm: str = DEFAULT_ALGORITHM, use_cache: bool = True) -> str:
+    """Hex digest of a file (memoized; see FileHashService.hash_file)."""
+    return get_file_hash_service().hash_file(path, algorithm, use_cache)
+
+
+def save_stream(stream: BinaryIO, path, algorithm: str = DEFAULT_ALGORITHM,
+                max_size: Optional[int] = None) -> Tuple[str, int]:
+    """Write a stream to path and hash it in the same pass."""
+    return get_file_hash_service().save_stream(stream, path, algorithm, max_size)
+
+
+def remember_file_hash(path, digest: str, algorithm: str = DEFAULT_ALGORITHM):
+    """Seed the memo with a digest computed elsewhere."""
+    get_file_hash_service().remember(path, digest, algorithm)
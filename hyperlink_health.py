@@ -21,10 +21,12 @@ Version: reads from version.json (module v1.0)
 import os
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Set, Tuple
-from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Optional, Any, Set, Tuple, Callable
+from dataclasses import dataclass, field, asdict, fields, replace
 from enum import Enum
 import re
 
@@ -282,6 +284,15 @@ class HyperlinkHealthValidator:
         r'^#[\w-]+$',
     )
     
+    SHARE_ROOT_PATTERN = re.compile(
+        r'^(\\\\[^\\/]+\\[^\\/]+)',
+    )
+    
+    # Fields that describe where a link sits rather than how it validated
+    _LOCATION_FIELDS = frozenset(
+        ('id', 'display_text', 'paragraph_index', 'context', 'document_path')
+    )
+    
     def __init__(
         self,
         mode: HealthMode = HealthMode.OFFLINE,
@@ -291,6 +302,9 @@ class HyperlinkHealthValidator:
         max_redirects: int = 10,
         check_ssl: bool = True,
         ssl_warning_days: int = 30,
+        max_workers: int = 8,
+        network_path_timeout: float = 5.0,
+        file_path_timeout: float = 2.0,
     ):
         """
         Initialize the hyperlink health validator.
@@ -303,6 +317,10 @@ class HyperlinkHealthValidator:
             max_redirects: Maximum number of redirects to follow
             check_ssl: Whether to validate SSL certificates
             ssl_warning_days: Days before SSL expiry to warn
+            max_workers: Web URL pool size for validate_batch (UNC and
+                file path pools get half each)
+            network_path_timeout: Per-check timeout for UNC paths in validate_batch
+            file_path_timeout: Per-check timeout for file paths in validate_batch
         """
         self.mode = mode
         self.base_path = base_path
@@ -311,11 +329,20 @@ class HyperlinkHealthValidator:
         self.max_redirects = max_redirects
         self.check_ssl = check_ssl
         self.ssl_warning_days = ssl_warning_days
+        self.max_workers = max(1, max_workers)
+        self.network_path_timeout = network_path_timeout
+        self.file_path_timeout = file_path_timeout
         
         # Results storage
         self._links: List[LinkStatusRecord] = []
         self._link_counter = 0
         
+        # Per-server caches shared by validate_link and validate_batch workers
+        self._cache_lock = threading.Lock()
+        self._share_cache: Dict[str, bool] = {}       # \\server\share -> reachable
+        self._dns_cache: Dict[str, bool] = {}         # host -> resolved
+        self._ssl_cache: Dict[str, LinkStatusRecord] = {}  # host -> SSL check outcome
+        
         # Check if requests library is available for VALIDATOR mode
         self._requests_available = False
         if mode == HealthMode.VALIDATOR:
@@ -373,10 +400,21 @@ class HyperlinkHealthValidator:
         Returns:
             LinkStatusRecord with validation results
         """
+        record = self._new_record(target, display_text, paragraph_index, context, document_path)
+        self._validate_record(record)
+        return record
+    
+    def _new_record(
+        self,
+        target: str,
+        display_text: str,
+        paragraph_index: int,
+        context: str,
+        document_path: str,
+    ) -> LinkStatusRecord:
+        """Create, classify and register a record (not yet validated)."""
         self._link_counter += 1
-        start_time = time.time()
         
-        # Create record
         record = LinkStatusRecord(
             id=f"link_{self._link_counter}",
             target=target,
@@ -387,10 +425,16 @@ class HyperlinkHealthValidator:
             validation_mode=self.mode.value,
             validated_at=datetime.now().isoformat(),
         )
+        record.link_type = self.classify_link(target).value
+        self._links.append(record)
         
-        # Classify link type
-        link_type = self.classify_link(target)
-        record.link_type = link_type.value
+        return record
+    
+    def _validate_record(self, record: LinkStatusRecord) -> LinkStatusRecord:
+        """Run the type-specific checks for an already classified record."""
+        start_time = time.time()
+        target = record.target
+        link_type = LinkType(record.link_type)
         
         # Validate based on type
         if link_type == LinkType.EMPTY:
@@ -427,7 +471,6 @@ class HyperlinkHealthValidator:
             })
         
         record.validation_time_ms = round((time.time() - start_time) * 1000, 2)
-        self._links.append(record)
         
         return record
     
@@ -498,7 +541,17 @@ class HyperlinkHealthValidator:
         
         # In VALIDATOR mode, try to check if accessible
         try:
-            if os.path.exists(target):
+            share_root = self._share_root(target)
+            if share_root and not self._share_reachable(share_root):
+                record.file_exists = False
+                record.status = LinkStatus.NOT_FOUND.value
+                record.status_message = f"Network share not accessible: {share_root}"
+                record.issues.append({
+                    'severity': 'high',
+                    'message': f'Network path not accessible: {target[:50]}',
+                    'rule_id': 'HH021'
+                })
+            elif os.path.exists(target):
                 record.file_exists = True
                 record.status = LinkStatus.VALID.value
                 record.status_message = "Network path accessible"
@@ -520,6 +573,21 @@ class HyperlinkHealthValidator:
                 'rule_id': 'HH022'
             })
     
+    def _share_root(self, target: str) -> Optional[str]:
+        """Get the \\\\server\\share root of a UNC path (None if it has no share part)."""
+        match = self.SHARE_ROOT_PATTERN.match(target)
+        return match.group(1) if match else None
+    
+    def _share_reachable(self, share_root: str) -> bool:
+        """Check (once per validator) whether a UNC share root is reachable."""
+        with self._cache_lock:
+            if share_root in self._share_cache:
+                return self._share_cache[share_root]
+        reachable = os.path.exists(share_root)
+        with self._cache_lock:
+            self._share_cache.setdefault(share_root, reachable)
+            return self._share_cache[share_root]
+    
     def _validate_mailto(self, record: LinkStatusRecord):
         """Validate mailto link."""
         target = record.target
@@ -636,12 +704,19 @@ class HyperlinkHealthValidator:
         try:
             # DNS resolution check
             import socket
-            try:
-                socket.setdefaulttimeout(self.timeout)
-                ips = socket.gethostbyname_ex(parsed.netloc)[2]
-                record.dns_resolved = True
-            except socket.gaierror as e:
-                record.dns_resolved = False
+            with self._cache_lock:
+                resolved = self._dns_cache.get(parsed.netloc)
+            if resolved is None:
+                try:
+                    socket.setdefaulttimeout(self.timeout)
+                    socket.gethostbyname_ex(parsed.netloc)
+                    resolved = True
+                except socket.gaierror:
+                    resolved = False
+                with self._cache_lock:
+                    self._dns_cache[parsed.netloc] = resolved
+            record.dns_resolved = resolved
+            if not resolved:
                 record.status = LinkStatus.DNS_FAILED.value
                 record.status_message = f"DNS resolution failed: {parsed.netloc}"
                 record.issues.append({
@@ -651,9 +726,9 @@ class HyperlinkHealthValidator:
                 })
                 return
             
-            # SSL check for HTTPS
+            # SSL check for HTTPS (once per host)
             if parsed.scheme.lower() == 'https' and self.check_ssl:
-                self._check_ssl(record, parsed.netloc)
+                self._check_ssl_cached(record, parsed.netloc)
             
             # HTTP request
             response = requests.head(
@@ -715,6 +790,24 @@ class HyperlinkHealthValidator:
                 'rule_id': 'HH054'
             })
     
+    def _check_ssl_cached(self, record: LinkStatusRecord, hostname: str):
+        """Apply the SSL check outcome for a host, checking it only once."""
+        with self._cache_lock:
+            outcome = self._ssl_cache.get(hostname)
+        if outcome is None:
+            outcome = LinkStatusRecord(status=record.status)
+            self._check_ssl(outcome, hostname)
+            with self._cache_lock:
+                outcome = self._ssl_cache.setdefault(hostname, outcome)
+        
+        record.ssl_valid = outcome.ssl_valid
+        record.ssl_expires = outcome.ssl_expires
+        record.ssl_warning = outcome.ssl_warning
+        record.issues.extend(dict(issue) for issue in outcome.issues)
+        if outcome.status == LinkStatus.SSL_ERROR.value:
+            record.status = outcome.status
+            record.status_message = outcome.status_message
+    
     def _check_ssl(self, record: LinkStatusRecord, hostname: str):
         """Check SSL certificate validity."""
         import ssl
@@ -990,24 +1083,65 @@ class HyperlinkHealthValidator:
         """
         Validate a batch of hyperlinks.
         
+        Links are classified first, then validated concurrently by type:
+        web URLs, UNC paths and file paths each get their own thread pool,
+        and UNC/file checks are bounded by network_path_timeout and
+        file_path_timeout (an unreachable share can block os.path.exists
+        for a long time). Each distinct UNC share root is probed once and
+        duplicate targets are validated once. Format-only checks run inline.
+        
         Args:
             links: List of link dictionaries with 'target', 'display_text', etc.
             document_path: Source document path
             
         Returns:
-            List of LinkStatusRecord results
+            List of LinkStatusRecord results (in input order)
         """
-        results = []
-        
-        for link in links:
-            record = self.validate_link(
+        results = [
+            self._new_record(
                 target=link.get('target', ''),
                 display_text=link.get('display_text', ''),
                 paragraph_index=link.get('paragraph_index', 0),
                 context=link.get('context', ''),
                 document_path=document_path,
             )
-            results.append(record)
+            for link in links
+        ]
+        
+        # Group distinct targets by type; duplicates copy the first outcome
+        first_by_target: Dict[Tuple[str, str], LinkStatusRecord] = {}
+        duplicates: List[Tuple[LinkStatusRecord, LinkStatusRecord]] = []
+        by_type: Dict[str, List[LinkStatusRecord]] = {}
+        for record in results:
+            key = (record.link_type, record.target)
+            if key in first_by_target:
+                duplicates.append((record, first_by_target[key]))
+                continue
+            first_by_target[key] = record
+            by_type.setdefault(record.link_type, []).append(record)
+        
+        web = by_type.pop(LinkType.WEB_URL.value, [])
+        unc = by_type.pop(LinkType.NETWORK_PATH.value, [])
+        files = by_type.pop(LinkType.FILE_PATH.value, [])
+        
+        for group in by_type.values():
+            for record in group:
+                self._validate_record(record)
+        
+        side_pool_size = max(1, self.max_workers // 2)
+        pools = [
+            threading.Thread(target=self._validate_pooled, args=(web, self.max_workers, None)),
+            threading.Thread(target=self._validate_network_paths, args=(unc, side_pool_size)),
+            threading.Thread(target=self._validate_pooled,
+                             args=(files, side_pool_size, self.file_path_timeout)),
+        ]
+        for thread in pools:
+            thread.start()
+        for thread in pools:
+            thread.join()
+        
+        for record, source in duplicates:
+            self._copy_outcome(source, record)
         
         # v3.0.33 Chunk B: Use PS1 validator for web URLs when in PS1_VALIDATOR mode
         if self.mode == HealthMode.PS1_VALIDATOR:
@@ -1015,6 +1149,78 @@ class HyperlinkHealthValidator:
         
         return results
     
+    def _validate_network_paths(self, records: List[LinkStatusRecord], pool_size: int):
+        """Probe each UNC share root once (bounded), then validate paths on reachable shares."""
+        if not records:
+            return
+        if self.mode == HealthMode.OFFLINE:
+            for record in records:
+                self._validate_record(record)
+            return
+        
+        roots = sorted({root for root in map(self._share_root, (r.target for r in records)) if root})
+        with self._cache_lock:
+            unknown = [root for root in roots if root not in self._share_cache]
+        probes = _run_bounded(
+            [lambda root=root: self._share_reachable(root) for root in unknown],
+            pool_size, self.network_path_timeout
+        )
+        for root, (finished, _) in zip(unknown, probes):
+            if not finished:
+                # Treat a share that does not answer in time as unreachable
+                with self._cache_lock:
+                    self._share_cache.setdefault(root, False)
+        
+        self._validate_pooled(records, pool_size, self.network_path_timeout)
+    
+    def _validate_pooled(
+        self,
+        records: List[LinkStatusRecord],
+        pool_size: int,
+        check_timeout: Optional[float],
+    ):
+        """
+        Validate records on a thread pool.
+        
+        Workers validate a scratch copy, so a check that overruns
+        check_timeout cannot overwrite the TIMEOUT result recorded for it.
+        """
+        if not records:
+            return
+        if len(records) == 1 and check_timeout is None:
+            self._validate_record(records[0])
+            return
+        
+        outcomes = _run_bounded(
+            [lambda r=record: self._validate_record(replace(r, issues=[])) for record in records],
+            pool_size, check_timeout
+        )
+        for record, (finished, outcome) in zip(records, outcomes):
+            if isinstance(outcome, Exception):
+                record.status = LinkStatus.WARNING.value
+                record.status_message = f"Validation error: {outcome}"
+            elif finished:
+                self._copy_outcome(outcome, record)
+            else:
+                record.status = LinkStatus.TIMEOUT.value
+                record.status_message = f"Path check timed out ({check_timeout}s)"
+                record.validation_time_ms = round(check_timeout * 1000, 2)
+                record.issues.append({
+                    'severity': 'medium',
+                    'message': f'Path check timed out: {record.target[:50]}',
+                    'rule_id': 'HH023'
+                })
+    
+    def _copy_outcome(self, source: LinkStatusRecord, target: LinkStatusRecord):
+        """Copy validation results (not identity/location) from one record to another."""
+        for f in fields(LinkStatusRecord):
+            if f.name in self._LOCATION_FIELDS:
+                continue
+            value = getattr(source, f.name)
+            if f.name == 'issues':
+                value = [dict(issue) for issue in value]
+            setattr(target, f.name, value)
+    
     def generate_report(
         self,
         document_path: str = "",
@@ -1046,6 +1252,59 @@ class HyperlinkHealthValidator:
         """Reset validator state for new document."""
         self._links = []
         self._link_counter = 0
+        with self._cache_lock:
+            self._share_cache.clear()
+            self._dns_cache.clear()
+            self._ssl_cache.clear()
+
+
+def _run_bounded(
+    tasks: List[Callable[[], Any]],
+    pool_size: int,
+    task_timeout: Optional[float],
+) -> List[Tuple[bool, Any]]:
+    """
+    Run tasks on a thread pool, giving each at most task_timeout seconds
+    once it has started.
+    
+    Returns (finished, result) per task in input order; (False, None) for
+    tasks that overran. A task that raised returns its exception as the
+    result. Overrunning threads are abandoned rather than waited for, since
+    blocking filesystem calls cannot be interrupted.
+    """
+    if not tasks:
+        return []
+    
+    started: Dict[int, float] = {}
+    
+    def run(index: int, task: Callable[[], Any]) -> Any:
+        started[index] = time.monotonic()
+        try:
+            return task()
+        except Exception as e:
+            return e
+    
+    executor = ThreadPoolExecutor(max_workers=min(pool_size, len(tasks)))
+    futures = {executor.submit(run, i, task): i for i, task in enumerate(tasks)}
+    outcomes: List[Tuple[bool, Any]] = [(False, None)] * len(tasks)
+    pending = set(futures)
+    
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=0.05 if task_timeout else None,
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                outcomes[futures[future]] = (True, future.result())
+            if task_timeout:
+                now = time.monotonic()
+                for future in list(pending):
+                    start = started.get(futures[future])
+                    if start is not None and now - start > task_timeout:
+                        pending.discard(future)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return outcomes
 
 
 # =============================================================================
@@ -37,6 +37,7 @@ from .models import (
     ScanDepth,
     LinkType,
     ExclusionRule,
+    ExclusionIndex,
     # Validation functions
     classify_link_type,
     validate_url_format,
@@ -123,6 +124,7 @@ __all__ = [
     'ScanDepth',
     'LinkType',
     'ExclusionRule',
+    'ExclusionIndex',
     # Validation functions
     'classify_link_type',
     'validate_url_format',
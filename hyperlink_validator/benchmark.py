@@ -0,0 +1,555 @@
+"""
+Hyperlink Validator Benchmark Harness
+=====================================
+Measures validator throughput without touching the real internet.
+
+A local stand-in server (MockLinkServer) answers for every host in a URL
+list with configurable latency, status-code mix, redirects, soft-404 pages
+and per-host rate limits. run_benchmark() replays the list against it for
+each validation mode and reports URLs/sec, tail latency and request
+amplification (server requests per URL validated).
+
+Routing:
+- proxy (default): the server is configured as the validator's HTTP proxy,
+  so every URL keeps its real host name (per-host backoff, latency history
+  and rate limits behave as they would live). https:// URLs are replayed as
+  http:// because a proxy cannot terminate TLS for arbitrary hosts.
+- direct: URLs are rewritten to http(s)://127.0.0.1:<port>/_vhost/<host>/...
+  Use this with https=True to exercise TLS; the validator then sees a
+  single host.
+
+Each mode runs against a throwaway HyperlinkValidatorStorage, so latency
+history and checkpoints never leak into scan_history.db.
+
+Usage:
+    python -m hyperlink_validator.benchmark test_urls_400.txt \\
+        --latency-ms 40 --status-mix 200=85,404=8,503=2,0=1 --rate-limit 5
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Benchmark modes: name -> (validator mode, extra options). Thorough mode
+# keeps soft-404 and suspicious-URL checks but skips DNS and certificate
+# probes, which would go to the real hosts rather than the stand-in server.
+BENCHMARK_MODES: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    'offline': ('offline', {}),
+    'quick': ('validator', {'scan_depth': 'quick'}),
+    'standard': ('validator', {'scan_depth': 'standard'}),
+    'thorough': ('validator', {'scan_depth': 'thorough', 'check_dns': False, 'check_ssl': False}),
+}
+
+# Status code 0 in a status mix means "drop the connection without replying"
+DROP_CONNECTION = 0
+
+VHOST_PREFIX = '/_vhost/'
+REDIRECT_MARKER = '_moved=1'
+
+SOFT_404_BODY = (
+    b'<html><head><title>Page Not Found</title></head>'
+    b'<body><h1>Sorry, the page you requested could not be found.</h1></body></html>'
+)
+OK_BODY = b'<html><head><title>Welcome</title></head><body><p>Mock page.</p></body></html>'
+
+_PROXY_ENV_VARS = ('http_proxy', 'https_proxy', 'all_proxy', 'no_proxy')
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+@dataclass
+class MockServerConfig:
+    """
+    Behaviour of the stand-in server.
+
+    Every URL gets a fixed outcome (seeded by host and path), so repeated
+    runs and different modes see the same site.
+
+    Attributes:
+        latency_ms: Base response delay
+        latency_jitter_ms: Uniform random extra delay per request
+        slow_host_ratio: Fraction of hosts that respond with slow_latency_ms instead
+        slow_latency_ms: Base delay for slow hosts
+        status_mix: Weighted status codes for normal pages (0 drops the connection)
+        redirect_ratio: Fraction of URLs that answer 301 to a working page
+        soft_404_ratio: Fraction of URLs that answer 200 with an error page
+        rate_limit_per_host: Requests per second per host before 429 (0 = unlimited)
+        retry_after: Retry-After seconds sent with 429 responses
+        seed: Seed for the per-URL outcome
+    """
+    latency_ms: float = 20.0
+    latency_jitter_ms: float = 10.0
+    slow_host_ratio: float = 0.05
+    slow_latency_ms: float = 400.0
+    status_mix: Dict[int, float] = field(default_factory=lambda: {200: 90, 404: 6, 500: 2, 403: 2})
+    redirect_ratio: float = 0.05
+    soft_404_ratio: float = 0.03
+    rate_limit_per_host: float = 0.0
+    retry_after: int = 1
+    seed: int = 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def parse_status_mix(text: str) -> Dict[int, float]:
+    """Parse "200=85,404=10,0=5" into {200: 85.0, 404: 10.0, 0: 5.0}."""
+    mix = {}
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        code, _, weight = part.partition('=')
+        mix[int(code)] = float(weight or 1)
+    if not mix:
+        raise ValueError('status mix is empty')
+    return mix
+
+
+# =============================================================================
+# MOCK SERVER
+# =============================================================================
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """Answers HEAD/GET for any virtual host according to the server config."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        self._serve(include_body=False)
+
+    def do_GET(self):
+        self._serve(include_body=True)
+
+    def log_message(self, *args):
+        pass
+
+    def _serve(self, include_body: bool):
+        server: 'MockLinkServer' = self.server.mock
+        vhost, path, location_prefix = self._split_target()
+        server.count_request(self.command, vhost)
+
+        status, body, headers = server.respond(vhost, path)
+        time.sleep(server.delay_for(vhost))
+
+        if status == DROP_CONNECTION:
+            self.close_connection = True
+            return
+        if status == 301:
+            headers['Location'] = f'{location_prefix}{path}{"&" if "?" in path else "?"}{REDIRECT_MARKER}'
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def _split_target(self) -> Tuple[str, str, str]:
+        """Get (virtual host, path, prefix for same-host Location headers)."""
+        if self.path.startswith(('http://', 'https://')):
+            parts = urlsplit(self.path)
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+            return parts.netloc.lower(), path, f'{parts.scheme}://{parts.netloc}'
+        if self.path.startswith(VHOST_PREFIX):
+            host, _, rest = self.path[len(VHOST_PREFIX):].partition('/')
+            return host.lower(), '/' + rest, f'{VHOST_PREFIX}{host}'
+        return (self.headers.get('Host') or '').lower(), self.path, ''
+
+
+class MockLinkServer:
+    """
+    Local HTTP/HTTPS stand-in for the sites in a URL list.
+
+    Run as a context manager; base_url is available once started. Request
+    counts (total, per method, per host) accumulate until reset_stats().
+
+    Args:
+        config: Server behaviour
+        https: Serve TLS (certfile/keyfile, or a throwaway self-signed
+            certificate for 127.0.0.1 generated with openssl)
+    """
+
+    def __init__(self, config: Optional[MockServerConfig] = None, https: bool = False,
+                 certfile: Optional[str] = None, keyfile: Optional[str] = None):
+        self.config = config or MockServerConfig()
+        self.https = https
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self._cert_dir: Optional[str] = None
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._recent: Dict[str, Deque[float]] = defaultdict(deque)
+        self.reset_stats()
+
+    # ----- lifecycle -----
+
+    @property
+    def base_url(self) -> str:
+        scheme = 'https' if self.https else 'http'
+        return f'{scheme}://127.0.0.1:{self._httpd.server_port}'
+
+    def start(self) -> 'MockLinkServer':
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), _MockHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        if self.https:
+            if not self.certfile:
+                self.certfile, self.keyfile = self._make_self_signed_cert()
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.certfile, self.keyfile)
+            self._httpd.socket = context.wrap_socket(self._httpd.socket, server_side=True)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._cert_dir:
+            shutil.rmtree(self._cert_dir, ignore_errors=True)
+            self._cert_dir = None
+
+    def __enter__(self) -> 'MockLinkServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _make_self_signed_cert(self) -> Tuple[str, str]:
+        if not shutil.which('openssl'):
+            raise RuntimeError('HTTPS benchmark needs openssl or an explicit certfile/keyfile')
+        self._cert_dir = tempfile.mkdtemp(prefix='twr_bench_')
+        certfile = os.path.join(self._cert_dir, 'cert.pem')
+        keyfile = os.path.join(self._cert_dir, 'key.pem')
+        subprocess.run([
+            'openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+            '-keyout', keyfile, '-out', certfile, '-subj', '/CN=localhost',
+            '-addext', 'subjectAltName=DNS:localhost,IP:127.0.0.1',
+        ], check=True, capture_output=True)
+        return certfile, keyfile
+
+    # ----- behaviour -----
+
+    def _rng(self, *parts: str) -> random.Random:
+        return random.Random(':'.join((str(self.config.seed),) + parts))
+
+    def respond(self, vhost: str, path: str) -> Tuple[int, bytes, Dict[str, str]]:
+        """Decide (status, body, extra headers) for a request."""
+        config = self.config
+        if config.rate_limit_per_host and not self._admit(vhost):
+            return 429, b'', {'Retry-After': str(config.retry_after)}
+
+        if REDIRECT_MARKER in path:
+            return 200, OK_BODY, {}
+
+        roll = self._rng(vhost, path).random()
+        if roll < config.redirect_ratio:
+            return 301, b'', {}
+        if roll < config.redirect_ratio + config.soft_404_ratio:
+            return 200, SOFT_404_BODY, {}
+
+        codes = list(config.status_mix)
+        status = self._rng('status', vhost, path).choices(
+            codes, weights=[config.status_mix[c] for c in codes])[0]
+        if status == 503:
+            return status, b'', {'Retry-After': str(config.retry_after)}
+        return status, OK_BODY if status < 400 else b'', {}
+
+    def delay_for(self, vhost: str) -> float:
+        """Response delay in seconds for one request to a host."""
+        config = self.config
+        slow = self._rng('slow', vhost).random() < config.slow_host_ratio
+        base = config.slow_latency_ms if slow else config.latency_ms
+        return (base + random.random() * config.latency_jitter_ms) / 1000.0
+
+    def _admit(self, vhost: str) -> bool:
+        """Sliding one-second window per host."""
+        now = time.monotonic()
+        with self._lock:
+            recent = self._recent[vhost]
+            while recent and now - recent[0] >= 1.0:
+                recent.popleft()
+            if len(recent) >= self.config.rate_limit_per_host:
+                return False
+            recent.append(now)
+            return True
+
+    # ----- stats -----
+
+    def count_request(self, method: str, vhost: str):
+        with self._lock:
+            self.request_count += 1
+            self.requests_by_method[method] += 1
+            self.requests_by_host[vhost] += 1
+
+    def reset_stats(self):
+        with self._lock:
+            self.request_count = 0
+            self.requests_by_method: Counter = Counter()
+            self.requests_by_host: Counter = Counter()
+            self._recent.clear()
+
+
+# =============================================================================
+# REPLAY
+# =============================================================================
+
+def load_url_file(path: str) -> List[str]:
+    """Read a URL list (one per line, # comments) such as test_urls_400.txt."""
+    from .models import parse_url_list
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_url_list(f.read())
+
+
+def route_urls(urls: List[str], server: MockLinkServer,
+               routing: str = 'proxy') -> Tuple[List[str], int]:
+    """
+    Rewrite URLs so they reach the stand-in server.
+
+    Returns:
+        (rewritten URLs, number of https:// URLs downgraded to http://)
+    """
+    routed = []
+    downgraded = 0
+    for url in urls:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.netloc:
+            routed.append(url)
+            continue
+        if routing == 'direct':
+            tail = parts.path or '/'
+            if parts.query:
+                tail += '?' + parts.query
+            routed.append(f'{server.base_url}{VHOST_PREFIX}{parts.netloc}{tail}')
+        elif parts.scheme == 'https':
+            routed.append('http' + url[len('https'):])
+            downgraded += 1
+        else:
+            routed.append(url)
+    return routed, downgraded
+
+
+@contextmanager
+def _isolated_environment(ca_bundle: Optional[str] = None):
+    """Drop proxy env vars, trust the mock CA and use a throwaway validator storage."""
+    from . import storage as hv_storage
+
+    saved_env = {k: os.environ.pop(k) for k in list(os.environ)
+                 if k.lower() in _PROXY_ENV_VARS}
+    saved_ca = os.environ.get('REQUESTS_CA_BUNDLE')
+    if ca_bundle:
+        os.environ['REQUESTS_CA_BUNDLE'] = ca_bundle
+    saved_storage = hv_storage._storage_instance
+    tmp = tempfile.mkdtemp(prefix='twr_bench_db_')
+    try:
+        hv_storage._storage_instance = hv_storage.HyperlinkValidatorStorage(
+            os.path.join(tmp, 'benchmark.db'))
+        yield
+    finally:
+        hv_storage._storage_instance = saved_storage
+        shutil.rmtree(tmp, ignore_errors=True)
+        if ca_bundle:
+            if saved_ca is None:
+                os.environ.pop('REQUESTS_CA_BUNDLE', None)
+            else:
+                os.environ['REQUESTS_CA_BUNDLE'] = saved_ca
+        os.environ.update(saved_env)
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = -(-len(ordered) * pct // 100)
+    return round(ordered[int(min(max(rank, 1), len(ordered))) - 1], 1)
+
+
+def run_benchmark(
+    urls: List[str],
+    modes: Optional[List[str]] = None,
+    config: Optional[MockServerConfig] = None,
+    routing: str = 'proxy',
+    https: bool = False,
+    timeout: int = 10,
+    retries: int = 1,
+    options: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Replay a URL list against a fresh stand-in server for each mode.
+
+    Args:
+        urls: URLs to replay (any hosts; nothing leaves the machine)
+        modes: Names from BENCHMARK_MODES (default: all)
+        config: Stand-in server behaviour
+        routing: 'proxy' or 'direct' (see module docstring)
+        https: Serve TLS (implies direct routing)
+        timeout: Validator timeout (seconds)
+        retries: Validator retries
+        options: Extra validator options applied to every mode
+
+    Returns:
+        Dict with the server config and one report per mode
+    """
+    from .validator import StandaloneHyperlinkValidator
+
+    modes = modes or list(BENCHMARK_MODES)
+    unknown = [m for m in modes if m not in BENCHMARK_MODES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark mode(s): {', '.join(unknown)}")
+    if https:
+        routing = 'direct'
+
+    reports = []
+    with MockLinkServer(config, https=https) as server:
+        routed, downgraded = route_urls(urls, server, routing)
+        for name in modes:
+            mode, mode_options = BENCHMARK_MODES[name]
+            opts = dict(options or {})
+            opts.update(mode_options)
+            if routing == 'proxy':
+                opts['proxy'] = server.base_url
+
+            server.reset_stats()
+            with _isolated_environment(server.certfile if https else None):
+                validator = StandaloneHyperlinkValidator(
+                    timeout=timeout, retries=retries, use_windows_auth=False)
+                started = time.perf_counter()
+                run = validator.validate_urls_sync(routed, mode=mode, options=opts)
+                wall = time.perf_counter() - started
+
+            results = run.results or []
+            latencies = [r.response_time_ms for r in results if r.response_time_ms]
+            reports.append({
+                'mode': name,
+                'status': run.status,
+                'urls': len(routed),
+                'wall_seconds': round(wall, 3),
+                'urls_per_second': round(len(routed) / wall, 2) if wall else None,
+                'latency_ms': {
+                    'p50': _percentile(latencies, 50),
+                    'p90': _percentile(latencies, 90),
+                    'p99': _percentile(latencies, 99),
+                    'max': round(max(latencies), 1) if latencies else None,
+                },
+                'server_requests': server.request_count,
+                'requests_by_method': dict(server.requests_by_method),
+                'amplification': round(server.request_count / len(routed), 3) if routed else 0.0,
+                'statuses': dict(Counter(r.status for r in results)),
+            })
+            logger.info(f"Benchmark {name}: {reports[-1]['urls_per_second']} URLs/s, "
+                        f"amplification {reports[-1]['amplification']}")
+
+    return {
+        'routing': routing,
+        'https': https,
+        'https_downgraded': downgraded,
+        'timeout': timeout,
+        'retries': retries,
+        'server': (config or MockServerConfig()).to_dict(),
+        'modes': reports,
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a run_benchmark() report as a plain-text table."""
+    header = f"{'mode':<10} {'urls':>5} {'urls/s':>8} {'p50 ms':>8} {'p90 ms':>8} " \
+             f"{'p99 ms':>8} {'requests':>8} {'amplif.':>7}"
+    lines = [header, '-' * len(header)]
+    for m in report['modes']:
+        lat = m['latency_ms']
+        fmt = lambda v: '-' if v is None else f'{v:.1f}'  # noqa: E731
+        lines.append(
+            f"{m['mode']:<10} {m['urls']:>5} {fmt(m['urls_per_second']):>8} {fmt(lat['p50']):>8} "
+            f"{fmt(lat['p90']):>8} {fmt(lat['p99']):>8} {m['server_requests']:>8} "
+            f"{m['amplification']:>7.2f}"
+        )
+    if report.get('https_downgraded'):
+        lines.append(f"({report['https_downgraded']} https URLs replayed over http in proxy routing)")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the hyperlink validator against a local stand-in server.')
+    parser.add_argument('url_file', help='URL list, e.g. test_urls_400.txt')
+    parser.add_argument('--modes', default=','.join(BENCHMARK_MODES),
+                        help='Comma-separated modes (default: all)')
+    parser.add_argument('--limit', type=int, default=0, help='Only replay the first N URLs')
+    parser.add_argument('--routing', choices=('proxy', 'direct'), default='proxy')
+    parser.add_argument('--https', action='store_true', help='Serve TLS (uses direct routing)')
+    parser.add_argument('--latency-ms', type=float, default=MockServerConfig.latency_ms)
+    parser.add_argument('--jitter-ms', type=float, default=MockServerConfig.latency_jitter_ms)
+    parser.add_argument('--slow-host-ratio', type=float, default=MockServerConfig.slow_host_ratio)
+    parser.add_argument('--slow-latency-ms', type=float, default=MockServerConfig.slow_latency_ms)
+    parser.add_argument('--status-mix', default=None,
+                        help='Weighted status codes, e.g. 200=85,404=10,503=3,0=2 (0 drops the connection)')
+    parser.add_argument('--redirect-ratio', type=float, default=MockServerConfig.redirect_ratio)
+    parser.add_argument('--soft-404-ratio', type=float, default=MockServerConfig.soft_404_ratio)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='Requests/second per host (0 = off)')
+    parser.add_argument('--timeout', type=int, default=10)
+    parser.add_argument('--retries', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', dest='json_path', help='Also write the full report to this file')
+    args = parser.parse_args(argv)
+
+    config = MockServerConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.jitter_ms,
+        slow_host_ratio=args.slow_host_ratio,
+        slow_latency_ms=args.slow_latency_ms,
+        redirect_ratio=args.redirect_ratio,
+        soft_404_ratio=args.soft_404_ratio,
+        rate_limit_per_host=args.rate_limit,
+        seed=args.seed,
+    )
+    if args.status_mix:
+        config.status_mix = parse_status_mix(args.status_mix)
+
+    urls = load_url_file(args.url_file)
+    if args.limit:
+        urls = urls[:args.limit]
+
+    report = run_benchmark(
+        urls,
+        modes=[m.strip() for m in args.modes.split(',') if m.strip()],
+        config=config,
+        routing=args.routing,
+        https=args.https,
+        timeout=args.timeout,
+        retries=args.retries,
+    )
+    print(format_report(report))
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -15,14 +15,19 @@ Optional: xlrd for legacy .xls files (not included by default)
 
 import re
 import os
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Callable
 from enum import Enum
 
 # Try to import openpyxl for .xlsx files
 try:
     import openpyxl
     from openpyxl.utils import get_column_letter
+    from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
@@ -34,6 +39,13 @@ try:
 except ImportError:
     XLRD_AVAILABLE = False
 
+# .xlsx files at least this large are extracted in streaming mode by default
+STREAMING_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Range hyperlinks covering more cells than this (or an unbounded range such
+# as A:A) are recorded on their top-left cell only instead of per cell
+MAX_HYPERLINK_RANGE_CELLS = 10000
+
 
 class LinkSource(Enum):
     """Source type for extracted links."""
@@ -155,7 +167,9 @@ class ExcelExtractor:
 
     def __init__(self, extract_from_values: bool = True,
                  extract_from_formulas: bool = True,
-                 extract_from_comments: bool = False):
+                 extract_from_comments: bool = False,
+                 streaming: Optional[bool] = None,
+                 parallel_sheets: int = 1):
         """
         Initialize the Excel extractor.
 
@@ -163,10 +177,17 @@ class ExcelExtractor:
             extract_from_values: Also scan cell values for URLs/emails
             extract_from_formulas: Extract links from HYPERLINK() formulas
             extract_from_comments: Also scan cell comments for URLs
+            streaming: Read .xlsx sheets row by row in read-only mode.
+                       None (default) enables it for files of at least
+                       STREAMING_THRESHOLD_BYTES. Ignored when scanning
+                       comments, which read-only mode does not expose.
+            parallel_sheets: Number of sheets to stream concurrently
         """
         self.extract_from_values = extract_from_values
         self.extract_from_formulas = extract_from_formulas
         self.extract_from_comments = extract_from_comments
+        self.streaming = streaming
+        self.parallel_sheets = max(1, int(parallel_sheets or 1))
 
     def extract(self, file_path: str) -> ExcelExtractionResult:
         """
@@ -205,25 +226,37 @@ class ExcelExtractor:
 
     def _extract_xlsx(self, file_path: str, result: ExcelExtractionResult) -> None:
         """Extract hyperlinks from .xlsx file using openpyxl."""
+        streaming = self.streaming
+        if streaming is None:
+            try:
+                streaming = os.path.getsize(file_path) >= STREAMING_THRESHOLD_BYTES
+            except OSError:
+                streaming = False
+        # Read-only cells carry no comments, so comment scanning needs the full load
+        if streaming and not self.extract_from_comments:
+            self._extract_xlsx_streaming(file_path, result)
+            return
+
         try:
             wb = openpyxl.load_workbook(file_path, data_only=False)
 
             for sheet_name in wb.sheetnames:
                 ws = wb[sheet_name]
                 sheet_summary = SheetSummary(name=sheet_name)
+                linked_cells = set()
 
-                # Process hyperlink objects
-                if hasattr(ws, 'hyperlinks'):
-                    for hyperlink in ws.hyperlinks:
-                        if hyperlink.target:
-                            cell = ws[hyperlink.ref]
+                # Process hyperlink objects (openpyxl binds them to cells on load)
+                for row in ws.iter_rows():
+                    for cell in row:
+                        hyperlink = cell.hyperlink
+                        if hyperlink and hyperlink.target:
                             display_text = str(cell.value) if cell.value else hyperlink.target
 
                             link = ExtractedExcelLink(
                                 url=hyperlink.target,
                                 display_text=display_text,
                                 sheet_name=sheet_name,
-                                cell_address=hyperlink.ref,
+                                cell_address=cell.coordinate,
                                 row=cell.row,
                                 column=cell.column,
                                 source=LinkSource.HYPERLINK_OBJECT,
@@ -231,95 +264,21 @@ class ExcelExtractor:
                                 context=self._get_cell_context(ws, cell.row, cell.column)
                             )
                             result.links.append(link)
+                            linked_cells.add(cell.coordinate)
                             sheet_summary.hyperlink_objects += 1
 
-                # Process cells for formulas and values
+                # Process cells for formulas, values and comments
                 for row in ws.iter_rows():
                     for cell in row:
-                        # Check for HYPERLINK formula
-                        if self.extract_from_formulas and cell.value:
-                            cell_value = str(cell.value)
-                            if cell_value.startswith('=HYPERLINK'):
-                                match = self.HYPERLINK_FORMULA_PATTERN.match(cell_value)
-                                if match:
-                                    url = match.group(1)
-                                    display = match.group(2) if match.group(2) else url
-
-                                    link = ExtractedExcelLink(
-                                        url=url,
-                                        display_text=display,
-                                        sheet_name=sheet_name,
-                                        cell_address=cell.coordinate,
-                                        row=cell.row,
-                                        column=cell.column,
-                                        source=LinkSource.HYPERLINK_FORMULA,
-                                        context=self._get_cell_context(ws, cell.row, cell.column)
-                                    )
-                                    result.links.append(link)
-                                    sheet_summary.formula_links += 1
-
-                        # Check cell values for URLs/emails
-                        if self.extract_from_values and cell.value and not str(cell.value).startswith('='):
-                            cell_text = str(cell.value)
-
-                            # Skip if this cell already has a hyperlink object
-                            has_hyperlink = any(
-                                link.cell_address == cell.coordinate and
-                                link.sheet_name == sheet_name and
-                                link.source == LinkSource.HYPERLINK_OBJECT
-                                for link in result.links
-                            )
-
-                            if not has_hyperlink:
-                                # Find URLs
-                                for url_match in self.URL_PATTERN.finditer(cell_text):
-                                    url = url_match.group()
-                                    link = ExtractedExcelLink(
-                                        url=url,
-                                        display_text=cell_text[:100],
-                                        sheet_name=sheet_name,
-                                        cell_address=cell.coordinate,
-                                        row=cell.row,
-                                        column=cell.column,
-                                        source=LinkSource.CELL_VALUE,
-                                        context=self._get_cell_context(ws, cell.row, cell.column)
-                                    )
-                                    result.links.append(link)
-                                    sheet_summary.cell_value_links += 1
-
-                                # Find emails (only if no URL found in this cell)
-                                if not self.URL_PATTERN.search(cell_text):
-                                    for email_match in self.EMAIL_PATTERN.finditer(cell_text):
-                                        email = email_match.group()
-                                        link = ExtractedExcelLink(
-                                            url=f"mailto:{email}",
-                                            display_text=email,
-                                            sheet_name=sheet_name,
-                                            cell_address=cell.coordinate,
-                                            row=cell.row,
-                                            column=cell.column,
-                                            source=LinkSource.CELL_VALUE,
-                                            context=self._get_cell_context(ws, cell.row, cell.column)
-                                        )
-                                        result.links.append(link)
-                                        sheet_summary.cell_value_links += 1
-
-                        # Check comments
-                        if self.extract_from_comments and cell.comment:
-                            comment_text = str(cell.comment.text)
-                            for url_match in self.URL_PATTERN.finditer(comment_text):
-                                url = url_match.group()
-                                link = ExtractedExcelLink(
-                                    url=url,
-                                    display_text=f"[Comment] {url}",
-                                    sheet_name=sheet_name,
-                                    cell_address=cell.coordinate,
-                                    row=cell.row,
-                                    column=cell.column,
-                                    source=LinkSource.COMMENT,
-                                    context=comment_text[:200]
-                                )
-                                result.links.append(link)
+                        if cell.value is None and not cell.comment:
+                            continue
+                        self._scan_cell(
+                            result.links, sheet_summary, sheet_name,
+                            cell.coordinate, cell.row, cell.column, cell.value,
+                            has_hyperlink=cell.coordinate in linked_cells,
+                            comment=cell.comment,
+                            context=lambda c=cell: self._get_cell_context(ws, c.row, c.column)
+                        )
 
                 sheet_summary.total_links = (
                     sheet_summary.hyperlink_objects +
@@ -335,6 +294,203 @@ class ExcelExtractor:
         except Exception as e:
             result.errors.append(f"Error reading Excel file: {str(e)}")
 
+    def _extract_xlsx_streaming(self, file_path: str, result: ExcelExtractionResult) -> None:
+        """
+        Extract hyperlinks from .xlsx file row by row.
+
+        Sheets are read with openpyxl in read-only mode and hyperlink objects
+        come from read_xlsx_hyperlinks(), so only the current row is held in
+        memory. Context for a link is taken from that row instead of
+        re-reading neighbouring cells. With parallel_sheets > 1 each sheet is
+        read on its own worker (each with its own read-only workbook handle);
+        results are merged in workbook sheet order.
+        """
+        try:
+            hyperlinks = read_xlsx_hyperlinks(file_path)
+            wb = openpyxl.load_workbook(file_path, read_only=True, data_only=False)
+            sheet_names = wb.sheetnames
+            wb.close()
+
+            if self.parallel_sheets > 1 and len(sheet_names) > 1:
+                with ThreadPoolExecutor(max_workers=min(self.parallel_sheets, len(sheet_names))) as pool:
+                    sheet_results = list(pool.map(
+                        lambda name: self._extract_sheet_streaming(
+                            file_path, name, hyperlinks.get(name, {})),
+                        sheet_names
+                    ))
+            else:
+                sheet_results = [
+                    self._extract_sheet_streaming(file_path, name, hyperlinks.get(name, {}))
+                    for name in sheet_names
+                ]
+
+            for links, sheet_summary in sheet_results:
+                result.links.extend(links)
+                result.sheet_summaries.append(sheet_summary)
+                result.sheets_processed += 1
+
+            result.total_links = len(result.links)
+
+        except Exception as e:
+            result.errors.append(f"Error reading Excel file: {str(e)}")
+
+    def _extract_sheet_streaming(
+        self,
+        file_path: str,
+        sheet_name: str,
+        sheet_links: Dict[str, Tuple[str, Optional[str]]]
+    ) -> Tuple[List[ExtractedExcelLink], SheetSummary]:
+        """Stream one worksheet. Returns its links (hyperlink objects first) and summary."""
+        sheet_summary = SheetSummary(name=sheet_name)
+        hyperlink_links: Dict[str, ExtractedExcelLink] = {}
+        other_links: List[ExtractedExcelLink] = []
+
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=False)
+        try:
+            ws = wb[sheet_name]
+            for row_idx, row in enumerate(ws.iter_rows(values_only=True), start=1):
+                for col_idx, value in enumerate(row, start=1):
+                    coordinate = None
+                    if sheet_links:
+                        coordinate = f"{get_column_letter(col_idx)}{row_idx}"
+                        link_info = sheet_links.get(coordinate)
+                        if link_info:
+                            hyperlink_links[coordinate] = ExtractedExcelLink(
+                                url=link_info[0],
+                                display_text=str(value) if value else link_info[0],
+                                sheet_name=sheet_name,
+                                cell_address=coordinate,
+                                row=row_idx,
+                                column=col_idx,
+                                source=LinkSource.HYPERLINK_OBJECT,
+                                tooltip=link_info[1],
+                                context=self._row_context(row, col_idx)
+                            )
+                    if value is None:
+                        continue
+                    self._scan_cell(
+                        other_links, sheet_summary, sheet_name,
+                        coordinate or f"{get_column_letter(col_idx)}{row_idx}",
+                        row_idx, col_idx, value,
+                        has_hyperlink=coordinate in hyperlink_links if coordinate else False,
+                        context=lambda r=row, c=col_idx: self._row_context(r, c)
+                    )
+        finally:
+            wb.close()
+
+        # Emit hyperlink objects in the sheet's own order, including links on
+        # cells that hold no value (read-only mode never yields those).
+        links = []
+        for coordinate, (target, tooltip) in sheet_links.items():
+            link = hyperlink_links.get(coordinate)
+            if link is None:
+                col_letters, row_number = coordinate_from_string(coordinate)
+                link = ExtractedExcelLink(
+                    url=target,
+                    display_text=target,
+                    sheet_name=sheet_name,
+                    cell_address=coordinate,
+                    row=row_number,
+                    column=column_index_from_string(col_letters),
+                    source=LinkSource.HYPERLINK_OBJECT,
+                    tooltip=tooltip
+                )
+            links.append(link)
+        sheet_summary.hyperlink_objects = len(links)
+        links.extend(other_links)
+
+        sheet_summary.total_links = (
+            sheet_summary.hyperlink_objects +
+            sheet_summary.formula_links +
+            sheet_summary.cell_value_links
+        )
+        return links, sheet_summary
+
+    def _scan_cell(
+        self,
+        links: List[ExtractedExcelLink],
+        sheet_summary: SheetSummary,
+        sheet_name: str,
+        coordinate: str,
+        row: int,
+        column: int,
+        value: Any,
+        has_hyperlink: bool,
+        context: Callable[[], Optional[str]],
+        comment=None
+    ) -> None:
+        """Collect HYPERLINK() formula, cell value and comment links from one cell."""
+        # Check for HYPERLINK formula
+        if self.extract_from_formulas and value:
+            cell_value = str(value)
+            if cell_value.startswith('=HYPERLINK'):
+                match = self.HYPERLINK_FORMULA_PATTERN.match(cell_value)
+                if match:
+                    url = match.group(1)
+                    display = match.group(2) if match.group(2) else url
+
+                    links.append(ExtractedExcelLink(
+                        url=url,
+                        display_text=display,
+                        sheet_name=sheet_name,
+                        cell_address=coordinate,
+                        row=row,
+                        column=column,
+                        source=LinkSource.HYPERLINK_FORMULA,
+                        context=context()
+                    ))
+                    sheet_summary.formula_links += 1
+
+        # Check cell values for URLs/emails (skip cells with a hyperlink object)
+        if self.extract_from_values and value and not str(value).startswith('=') and not has_hyperlink:
+            cell_text = str(value)
+
+            # Find URLs
+            for url_match in self.URL_PATTERN.finditer(cell_text):
+                links.append(ExtractedExcelLink(
+                    url=url_match.group(),
+                    display_text=cell_text[:100],
+                    sheet_name=sheet_name,
+                    cell_address=coordinate,
+                    row=row,
+                    column=column,
+                    source=LinkSource.CELL_VALUE,
+                    context=context()
+                ))
+                sheet_summary.cell_value_links += 1
+
+            # Find emails (only if no URL found in this cell)
+            if not self.URL_PATTERN.search(cell_text):
+                for email_match in self.EMAIL_PATTERN.finditer(cell_text):
+                    email = email_match.group()
+                    links.append(ExtractedExcelLink(
+                        url=f"mailto:{email}",
+                        display_text=email,
+                        sheet_name=sheet_name,
+                        cell_address=coordinate,
+                        row=row,
+                        column=column,
+                        source=LinkSource.CELL_VALUE,
+                        context=context()
+                    ))
+                    sheet_summary.cell_value_links += 1
+
+        # Check comments
+        if self.extract_from_comments and comment:
+            comment_text = str(comment.text)
+            for url_match in self.URL_PATTERN.finditer(comment_text):
+                url = url_match.group()
+                links.append(ExtractedExcelLink(
+                    url=url,
+                    display_text=f"[Comment] {url}",
+                    sheet_name=sheet_name,
+                    cell_address=coordinate,
+                    row=row,
+                    column=column,
+                    source=LinkSource.COMMENT,
+                    context=comment_text[:200]
+                ))
+
     def _extract_xls(self, file_path: str, result: ExcelExtractionResult) -> None:
         """Extract hyperlinks from legacy .xls file using xlrd."""
         try:
@@ -417,6 +573,19 @@ class ExcelExtractor:
         except Exception as e:
             result.errors.append(f"Error reading legacy Excel file: {str(e)}")
 
+    @staticmethod
+    def _row_context(row_values: tuple, col: int, context_size: int = 1) -> Optional[str]:
+        """Same as _get_cell_context, using an already-read row of values."""
+        context_parts = []
+        for c_offset in range(-context_size, context_size + 1):
+            adj_col = col + c_offset
+            if c_offset == 0 or adj_col < 1 or adj_col > len(row_values):
+                continue
+            value = row_values[adj_col - 1]
+            if value:
+                context_parts.append(str(value)[:50])
+        return " | ".join(context_parts) if context_parts else None
+
     def _get_cell_context(self, ws, row: int, col: int, context_size: int = 1) -> str:
         """Get surrounding cell values for context."""
         context_parts = []
@@ -437,6 +606,100 @@ class ExcelExtractor:
         return " | ".join(context_parts) if context_parts else None
 
 
+def _zip_target_path(base_dir: str, target: str) -> str:
+    """Resolve a relationship Target against the part directory it belongs to."""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+def _read_relationships(zf: zipfile.ZipFile, rels_path: str) -> Dict[str, Tuple[str, str]]:
+    """Read a .rels part into {rId: (target, target_mode)}."""
+    if rels_path not in zf.namelist():
+        return {}
+    rels = {}
+    root = ET.fromstring(zf.read(rels_path))
+    for rel in root:
+        if rel.tag.endswith('}Relationship'):
+            rels[rel.get('Id')] = (rel.get('Target', ''), rel.get('TargetMode', ''))
+    return rels
+
+
+def read_xlsx_hyperlinks(file_path: str) -> Dict[str, Dict[str, Tuple[str, Optional[str]]]]:
+    """
+    Read cell hyperlinks straight from the .xlsx package.
+
+    openpyxl's read-only mode does not expose cell hyperlinks, so streaming
+    readers use this instead. Each worksheet part is parsed incrementally
+    and only its <hyperlinks> block is kept, so memory stays proportional to
+    the number of links rather than the number of cells.
+
+    Args:
+        file_path: Path to an .xlsx file
+
+    Returns:
+        {sheet_name: {cell_coordinate: (target, tooltip)}} for external
+        hyperlinks. Range hyperlinks (e.g. A1:B2) are expanded per cell;
+        unbounded or very large ranges are kept on their top-left cell.
+    """
+    from openpyxl.utils.cell import range_boundaries
+
+    links: Dict[str, Dict[str, Tuple[str, Optional[str]]]] = {}
+
+    with zipfile.ZipFile(file_path) as zf:
+        workbook_rels = _read_relationships(zf, 'xl/_rels/workbook.xml.rels')
+        workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+
+        for sheet in workbook.iter():
+            if not sheet.tag.endswith('}sheet'):
+                continue
+            name = sheet.get('name')
+            r_id = next((v for k, v in sheet.attrib.items() if k.endswith('}id')), None)
+            if not r_id or r_id not in workbook_rels:
+                continue
+
+            sheet_path = _zip_target_path('xl', workbook_rels[r_id][0])
+            if sheet_path not in zf.namelist():
+                continue
+            sheet_dir, sheet_file = posixpath.split(sheet_path)
+            sheet_rels = _read_relationships(
+                zf, posixpath.join(sheet_dir, '_rels', sheet_file + '.rels'))
+
+            sheet_links: Dict[str, Tuple[str, Optional[str]]] = {}
+            sheet_data = None
+            with zf.open(sheet_path) as fh:
+                for event, elem in ET.iterparse(fh, events=('start', 'end')):
+                    tag = elem.tag
+                    if event == 'start':
+                        if tag.endswith('}sheetData'):
+                            sheet_data = elem
+                        continue
+                    if tag.endswith('}hyperlink'):
+                        link_id = next((v for k, v in elem.attrib.items() if k.endswith('}id')), None)
+                        target = sheet_rels.get(link_id, ('', ''))[0] if link_id else ''
+                        ref = elem.get('ref')
+                        if target and ref:
+                            tooltip = elem.get('tooltip')
+                            try:
+                                min_col, min_row, max_col, max_row = range_boundaries(ref)
+                            except (ValueError, TypeError):
+                                continue
+                            if None in (min_col, min_row, max_col, max_row) or (
+                                    (max_col - min_col + 1) * (max_row - min_row + 1)
+                                    > MAX_HYPERLINK_RANGE_CELLS):
+                                anchor = f"{get_column_letter(min_col or 1)}{min_row or 1}"
+                                sheet_links.setdefault(anchor, (target, tooltip))
+                                continue
+                            for row in range(min_row, max_row + 1):
+                                for col in range(min_col, max_col + 1):
+                                    sheet_links[f"{get_column_letter(col)}{row}"] = (target, tooltip)
+                    elif tag.endswith('}row') and sheet_data is not None:
+                        sheet_data.clear()  # Cell data is not needed here
+            links[name] = sheet_links
+
+    return links
+
+
 def get_column_letter_xlrd(col_num: int) -> str:
     """Convert column number to letter (for xlrd compatibility)."""
     result = ""
@@ -13,6 +13,11 @@ Exclusion Handling:
 Highlighted Export (v3.0.110):
 - export_highlighted_docx: Creates DOCX with broken links highlighted in red
 - export_highlighted_excel: Creates Excel with rows containing broken links in red
+
+Both highlighted exports build a _ResultIndex once (canonical URL -> result,
+plus a single trie-shaped regex over all broken URL variants) so lookups do
+not rescan the result list per hyperlink. Large workbooks are highlighted in
+streaming mode (read-only in, write-only out) to keep memory bounded.
 """
 
 import csv
@@ -24,6 +29,7 @@ import zipfile
 import copy
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from itertools import chain, islice
 from typing import List, Optional, Any, Dict, Set, Tuple
 
 from .models import ValidationResult, ValidationSummary, ValidationRun
@@ -41,13 +47,18 @@ except ImportError:
 
 # Check for openpyxl availability
 try:
-    from openpyxl import load_workbook
+    from openpyxl import load_workbook, Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import PatternFill, Font, Border, Side
     from openpyxl.comments import Comment
+    from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+# Workbooks at least this large are highlighted in streaming mode
+STREAMING_EXCEL_THRESHOLD_BYTES = 10 * 1024 * 1024
+
 
 def _apply_exclusion_display(result: ValidationResult) -> ValidationResult:
     """
@@ -564,12 +575,91 @@ def _get_broken_urls(results: List[ValidationResult]) -> Set[str]:
     return broken_urls
 
 
-def _get_result_for_url(url: str, results: List[ValidationResult]) -> Optional[ValidationResult]:
-    """Get the validation result for a specific URL."""
-    for result in results:
-        if result.url == url or result.url.rstrip('/') == url.rstrip('/'):
-            return result
-    return None
+def _literal_trie_pattern(words: Set[str]) -> str:
+    """
+    Build a regex alternation for a set of literal strings, factored as a trie.
+
+    Shared prefixes (e.g. "https://www.") are matched once, so searching text
+    costs roughly the same regardless of how many URLs are in the set. Longer
+    matches are preferred over their prefixes.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def render(node: Dict[str, Any]) -> str:
+        # Collapse single-child chains iteratively to keep recursion shallow
+        out = []
+        while len(node) == 1 and '' not in node:
+            (ch, node), = node.items()
+            out.append(re.escape(ch))
+        branches = [re.escape(ch) + render(child)
+                    for ch, child in sorted(node.items()) if ch != '']
+        if branches:
+            group = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            if '' in node:
+                group = ('(?:' + group + ')?') if len(branches) == 1 else group + '?'
+            out.append(group)
+        return ''.join(out)
+
+    return render(trie)
+
+
+class _ResultIndex:
+    """
+    Lookup structure built once per highlighted export.
+
+    - get(url): result for a URL, matching with or without trailing slash
+    - is_broken(url): URL (or its trailing-slash variant) failed validation
+    - find_broken_in(text): first broken URL variant contained in text
+    """
+
+    def __init__(self, results: List[ValidationResult]):
+        self.broken_urls = _get_broken_urls(results)
+        self._by_url: Dict[str, ValidationResult] = {}
+        for result in results:
+            self._by_url.setdefault(result.url.rstrip('/'), result)
+
+        self._pattern = None
+        if self.broken_urls:
+            try:
+                self._pattern = re.compile(_literal_trie_pattern(self.broken_urls))
+            except (re.error, RecursionError):
+                # Pathologically deep tries: fall back to a flat alternation
+                self._pattern = re.compile('|'.join(
+                    re.escape(u) for u in sorted(self.broken_urls, key=len, reverse=True)))
+
+    def __bool__(self) -> bool:
+        return bool(self.broken_urls)
+
+    def get(self, url: str) -> Optional[ValidationResult]:
+        return self._by_url.get(url.rstrip('/'))
+
+    def is_broken(self, url: str) -> bool:
+        return url in self.broken_urls or url.rstrip('/') in self.broken_urls
+
+    def find_broken_in(self, text: str) -> Optional[str]:
+        if not text or self._pattern is None:
+            return None
+        match = self._pattern.search(text)
+        return match.group(0) if match else None
+
+    def broken_urls_for_cell(self, cell_value: str, target: Optional[str]) -> List[str]:
+        """Broken URLs referenced by a spreadsheet cell's text or hyperlink target."""
+        found = []
+        if cell_value:
+            if cell_value in self.broken_urls:
+                found.append(cell_value)
+            else:
+                url = self.find_broken_in(cell_value)
+                if url:
+                    found.append(url)
+        if target and self.is_broken(target):
+            found.append(target)
+        return found
 
 
 def export_highlighted_docx(
@@ -600,9 +690,9 @@ def export_highlighted_docx(
     if not os.path.exists(source_path):
         return False, f"Source file not found: {source_path}", b''
 
-    broken_urls = _get_broken_urls(results)
+    index = _ResultIndex(results)
 
-    if not broken_urls:
+    if not index:
         return False, "No broken links found to highlight.", b''
 
     try:
@@ -612,25 +702,25 @@ def export_highlighted_docx(
 
         # Process all paragraphs
         for para in doc.paragraphs:
-            highlighted_count += _highlight_broken_links_in_paragraph(para, broken_urls, results)
+            highlighted_count += _highlight_broken_links_in_paragraph(para, index)
 
         # Process tables
         for table in doc.tables:
             for row in table.rows:
                 for cell in row.cells:
                     for para in cell.paragraphs:
-                        highlighted_count += _highlight_broken_links_in_paragraph(para, broken_urls, results)
+                        highlighted_count += _highlight_broken_links_in_paragraph(para, index)
 
         # Process headers and footers
         for section in doc.sections:
             for header in [section.header, section.first_page_header, section.even_page_header]:
                 if header:
                     for para in header.paragraphs:
-                        highlighted_count += _highlight_broken_links_in_paragraph(para, broken_urls, results)
+                        highlighted_count += _highlight_broken_links_in_paragraph(para, index)
             for footer in [section.footer, section.first_page_footer, section.even_page_footer]:
                 if footer:
                     for para in footer.paragraphs:
-                        highlighted_count += _highlight_broken_links_in_paragraph(para, broken_urls, results)
+                        highlighted_count += _highlight_broken_links_in_paragraph(para, index)
 
         # Save to bytes buffer
         buffer = io.BytesIO()
@@ -649,11 +739,7 @@ def export_highlighted_docx(
         return False, f"Error processing DOCX: {str(e)}", b''
 
 
-def _highlight_broken_links_in_paragraph(
-    para,
-    broken_urls: Set[str],
-    results: List[ValidationResult]
-) -> int:
+def _highlight_broken_links_in_paragraph(para, index: _ResultIndex) -> int:
     """
     Highlight broken hyperlinks in a paragraph.
 
@@ -683,7 +769,7 @@ def _highlight_broken_links_in_paragraph(
                         url = rel.target_ref if hasattr(rel, 'target_ref') else str(rel._target)
 
                         # Check if this URL is broken
-                        if url in broken_urls or url.rstrip('/') in broken_urls:
+                        if index.is_broken(url):
                             # Highlight all runs within this hyperlink
                             runs = hyperlink.findall('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}r')
                             for run in runs:
@@ -695,12 +781,9 @@ def _highlight_broken_links_in_paragraph(
 
         # Also check for URLs in plain text (not hyperlinked)
         for run in para.runs:
-            if run.text:
-                for url in broken_urls:
-                    if url in run.text:
-                        _apply_broken_link_formatting_to_run(run)
-                        highlighted += 1
-                        break
+            if run.text and index.find_broken_in(run.text):
+                _apply_broken_link_formatting_to_run(run)
+                highlighted += 1
 
     except Exception:
         pass
@@ -750,7 +833,8 @@ def export_highlighted_excel(
     source_path: str,
     results: List[ValidationResult],
     output_path: Optional[str] = None,
-    link_column: Optional[int] = None
+    link_column: Optional[int] = None,
+    streaming: Optional[bool] = None
 ) -> Tuple[bool, str, bytes]:
     """
     Create a copy of an Excel file with rows containing broken links highlighted.
@@ -766,6 +850,12 @@ def export_highlighted_excel(
         output_path: Optional path for output file (if None, returns bytes)
         link_column: Optional column index (1-based) containing URLs.
                      If None, will auto-detect.
+        streaming: Read the source row by row and write a write-only copy,
+                   keeping memory bounded. Cell values, formulas, styles and
+                   hyperlinks are preserved; sheet-level layout (merged
+                   cells, column widths, charts, images) is not.
+                   None (default) enables it for files of at least
+                   STREAMING_EXCEL_THRESHOLD_BYTES.
 
     Returns:
         Tuple of (success: bool, message: str, file_bytes: bytes)
@@ -776,11 +866,20 @@ def export_highlighted_excel(
     if not os.path.exists(source_path):
         return False, f"Source file not found: {source_path}", b''
 
-    broken_urls = _get_broken_urls(results)
+    index = _ResultIndex(results)
 
-    if not broken_urls:
+    if not index:
         return False, "No broken links found to highlight.", b''
 
+    if streaming is None:
+        streaming = os.path.getsize(source_path) >= STREAMING_EXCEL_THRESHOLD_BYTES
+
+    if streaming:
+        try:
+            return _export_highlighted_excel_streaming(source_path, index, output_path, link_column)
+        except Exception as e:
+            return False, f"Error processing Excel: {str(e)}", b''
+
     try:
         # Load workbook
         wb = load_workbook(source_path)
@@ -810,20 +909,12 @@ def export_highlighted_excel(
                     if col_idx <= len(row):
                         cell = row[col_idx - 1]
                         cell_value = str(cell.value) if cell.value else ''
+                        target = cell.hyperlink.target if cell.hyperlink else None
 
-                        # Check if cell contains a broken URL
-                        for url in broken_urls:
-                            if url in cell_value or cell_value in broken_urls:
-                                row_has_broken_link = True
-                                broken_cells.append((cell, url))
-                                break
-
-                        # Also check hyperlink target
-                        if cell.hyperlink and cell.hyperlink.target:
-                            target = cell.hyperlink.target
-                            if target in broken_urls or target.rstrip('/') in broken_urls:
-                                row_has_broken_link = True
-                                broken_cells.append((cell, target))
+                        # Check cell text and hyperlink target for broken URLs
+                        for url in index.broken_urls_for_cell(cell_value, target):
+                            row_has_broken_link = True
+                            broken_cells.append((cell, url))
 
                 # Highlight the entire row if it has a broken link
                 if row_has_broken_link:
@@ -839,12 +930,9 @@ def export_highlighted_excel(
                         cell.font = red_font
 
                         # Add comment with error details
-                        result = _get_result_for_url(url, results)
-                        if result:
-                            comment_text = f"BROKEN LINK\nStatus: {result.status}\nMessage: {result.message}"
-                            if result.status_code:
-                                comment_text += f"\nHTTP Code: {result.status_code}"
-                            cell.comment = Comment(comment_text, "Hyperlink Validator")
+                        comment = _broken_link_comment(index.get(url))
+                        if comment:
+                            cell.comment = comment
 
         # Save to bytes buffer
         buffer = io.BytesIO()
@@ -865,6 +953,148 @@ def export_highlighted_excel(
         return False, f"Error processing Excel: {str(e)}", b''
 
 
+def _broken_link_comment(result: Optional[ValidationResult]) -> Optional['Comment']:
+    """Build the cell comment describing a broken link's validation result."""
+    if not result:
+        return None
+    comment_text = f"BROKEN LINK\nStatus: {result.status}\nMessage: {result.message}"
+    if result.status_code:
+        comment_text += f"\nHTTP Code: {result.status_code}"
+    return Comment(comment_text, "Hyperlink Validator")
+
+
+def _export_highlighted_excel_streaming(
+    source_path: str,
+    index: _ResultIndex,
+    output_path: Optional[str],
+    link_column: Optional[int]
+) -> Tuple[bool, str, bytes]:
+    """
+    Streaming variant of export_highlighted_excel.
+
+    Reads the source in read-only mode (hyperlinks come from
+    read_xlsx_hyperlinks since read-only cells do not carry them) and writes
+    every row to a write-only workbook, so only one row is in memory at a time.
+    """
+    from .excel_extractor import read_xlsx_hyperlinks
+
+    red_fill = PatternFill(start_color='FFCCCC', end_color='FFCCCC', fill_type='solid')
+    red_font = Font(color='CC0000', bold=True)
+    error_fill = PatternFill(start_color='FF6666', end_color='FF6666', fill_type='solid')
+
+    hyperlinks = read_xlsx_hyperlinks(source_path)
+    wb_in = load_workbook(source_path, read_only=True, data_only=False)
+    wb_out = Workbook(write_only=True)
+    highlighted_count = 0
+
+    try:
+        for sheet_name in wb_in.sheetnames:
+            ws_in = wb_in[sheet_name]
+            ws_out = wb_out.create_sheet(title=sheet_name)
+            sheet_links = hyperlinks.get(sheet_name, {})
+
+            rows = ws_in.iter_rows()
+            sample = list(islice(rows, 20))
+            if link_column is not None:
+                url_columns = [link_column]
+            else:
+                url_columns = _find_url_columns_in_rows(sample, sheet_links)
+
+            for row_idx, row in enumerate(chain(sample, rows), start=1):
+                broken_cells = {}
+                if row_idx >= 2:  # Skip header
+                    for col_idx in url_columns:
+                        if col_idx <= len(row):
+                            value = row[col_idx - 1].value
+                            link = sheet_links.get(f"{get_column_letter(col_idx)}{row_idx}")
+                            urls = index.broken_urls_for_cell(
+                                str(value) if value else '', link[0] if link else None)
+                            if urls:
+                                broken_cells[col_idx] = urls[0]
+
+                if broken_cells:
+                    highlighted_count += 1
+
+                out_row = []
+                for col_idx, cell in enumerate(row, start=1):
+                    out_cell = WriteOnlyCell(ws_out, value=cell.value)
+                    if getattr(cell, 'has_style', False):
+                        out_cell.font = copy.copy(cell.font)
+                        out_cell.fill = copy.copy(cell.fill)
+                        out_cell.border = copy.copy(cell.border)
+                        out_cell.alignment = copy.copy(cell.alignment)
+                        out_cell.number_format = cell.number_format
+                        out_cell.protection = copy.copy(cell.protection)
+                    link = sheet_links.get(f"{get_column_letter(col_idx)}{row_idx}")
+                    if link:
+                        out_cell.hyperlink = link[0]
+                    if broken_cells:
+                        if col_idx in broken_cells:
+                            out_cell.fill = error_fill
+                            out_cell.font = red_font
+                            comment = _broken_link_comment(index.get(broken_cells[col_idx]))
+                            if comment:
+                                out_cell.comment = comment
+                        else:
+                            out_cell.fill = red_fill
+                    out_row.append(out_cell)
+                ws_out.append(out_row)
+    finally:
+        wb_in.close()
+
+    buffer = io.BytesIO()
+    wb_out.save(buffer)
+    file_bytes = buffer.getvalue()
+
+    if output_path:
+        with open(output_path, 'wb') as f:
+            f.write(file_bytes)
+
+    return True, f"Highlighted {highlighted_count} row(s) with broken links.", file_bytes
+
+
+def _find_url_columns_in_rows(rows: List[tuple], sheet_links: Dict[str, tuple]) -> List[int]:
+    """
+    Streaming counterpart of _find_url_columns.
+
+    Works from the first rows of a sheet plus its hyperlink map instead of
+    random access to the worksheet. Returns 1-based column indices.
+    """
+    url_patterns = ['url', 'link', 'hyperlink', 'website', 'web', 'href']
+    url_regex = re.compile(r'https?://|www\.|mailto:', re.IGNORECASE)
+
+    def has_link(col_idx: int, row_idx: int) -> bool:
+        return f"{get_column_letter(col_idx)}{row_idx}" in sheet_links
+
+    # Check header row
+    url_columns = []
+    if rows:
+        for col_idx, cell in enumerate(rows[0], start=1):
+            if cell.value and any(p in str(cell.value).lower() for p in url_patterns):
+                url_columns.append(col_idx)
+
+    # If no headers matched, scan sampled rows for URL-like content
+    if not url_columns:
+        candidates: Dict[int, int] = {}
+        for row_idx, row in enumerate(rows, start=1):
+            for col_idx, cell in enumerate(row, start=1):
+                if cell.value and (url_regex.search(str(cell.value)) or has_link(col_idx, row_idx)):
+                    candidates[col_idx] = candidates.get(col_idx, 0) + 1
+        url_columns = [col for col, count in candidates.items() if count >= 2]
+
+    # If still nothing, use columns with hyperlinks in rows 2-100
+    if not url_columns:
+        from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+        cols = set()
+        for coordinate in sheet_links:
+            letters, row_idx = coordinate_from_string(coordinate)
+            if 2 <= row_idx <= 100:
+                cols.add(column_index_from_string(letters))
+        url_columns = sorted(cols)
+
+    return url_columns
+
+
 def _find_url_columns(ws) -> List[int]:
     """
     Auto-detect columns that likely contain URLs.
@@ -8,10 +8,11 @@ from the rest of the validation system.
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable, Iterable, Tuple
 from datetime import datetime
 from enum import Enum
 import json
+import re
 
 
 class ValidationStatus(Enum):
@@ -117,6 +118,171 @@ class ExclusionRule:
         return cls(**valid_fields)
 
 
+# Patterns with back-references cannot be safely folded into a combined
+# alternation (group numbers shift), so they are always checked individually.
+_BACKREF_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+_TRIE_END = ''  # Trie key marking "a rule ends here" (never a real character)
+
+
+class ExclusionIndex:
+    """
+    Compiled lookup structure for a list of exclusion rules.
+
+    Built once per rule set and then queried per URL:
+    - exact rules: hash map lookup
+    - prefix rules: character trie walked along the URL
+    - suffix rules: character trie walked along the reversed URL
+    - contains rules: one combined alternation of the escaped substrings
+    - regex rules: one combined alternation of the user patterns
+    The combined alternations act as prefilters; only when one of them hits
+    are the individual rules of that kind checked in order.
+
+    When several rules match, the rule that appears first in the input list
+    wins, so results are identical to a linear scan with ExclusionRule.matches().
+
+    Args:
+        rules: Rule objects (ExclusionRule, StoredExclusion, ...)
+        case_sensitive: Compare exact/prefix/suffix/contains patterns verbatim
+                        instead of case-folded. Regex rules always use IGNORECASE.
+        key: Optional callable returning (pattern, match_type) for a rule;
+             defaults to the rule's ``pattern`` and ``match_type`` attributes.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Any],
+        case_sensitive: bool = False,
+        key: Optional[Callable[[Any], Tuple[str, str]]] = None
+    ):
+        self.rules = list(rules)
+        self.case_sensitive = case_sensitive
+
+        self._exact: Dict[str, int] = {}
+        self._prefix_trie: Dict[str, Any] = {}
+        self._suffix_trie: Dict[str, Any] = {}
+        # (ordinal, match_type, needle-or-compiled-regex) in rule order
+        self._scan_rules: List[Tuple[int, str, Any]] = []
+        self._always_check: set = set()
+        self._contains_re = None
+        self._regex_re = None
+
+        contains_alternation = []
+        regex_alternation = []
+        for ordinal, rule in enumerate(self.rules):
+            if key:
+                pattern, match_type = key(rule)
+            else:
+                pattern, match_type = rule.pattern, rule.match_type
+            pattern = pattern or ''
+
+            if match_type == 'regex':
+                try:
+                    compiled = re.compile(pattern, re.IGNORECASE)
+                except re.error:
+                    continue  # Invalid regex never matches
+                self._scan_rules.append((ordinal, 'regex', compiled))
+                if _BACKREF_RE.search(pattern):
+                    self._always_check.add(ordinal)
+                else:
+                    regex_alternation.append(f'(?:{pattern})')
+                continue
+
+            needle = self._fold(pattern)
+            if match_type == 'exact':
+                self._exact.setdefault(needle, ordinal)
+            elif match_type == 'prefix':
+                self._insert(self._prefix_trie, needle, ordinal)
+            elif match_type == 'suffix':
+                self._insert(self._suffix_trie, needle[::-1], ordinal)
+            elif match_type == 'contains':
+                self._scan_rules.append((ordinal, 'contains', needle))
+                contains_alternation.append(re.escape(needle))
+
+        if contains_alternation:
+            self._contains_re = re.compile('|'.join(contains_alternation))
+        if regex_alternation:
+            try:
+                self._regex_re = re.compile('|'.join(regex_alternation), re.IGNORECASE)
+            except re.error:
+                # Patterns that only compile standalone (e.g. inline global
+                # flags): fall back to checking every regex rule
+                self._always_check.update(
+                    o for o, kind, _ in self._scan_rules if kind == 'regex'
+                )
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    @staticmethod
+    def _insert(trie: Dict[str, Any], text: str, ordinal: int):
+        node = trie
+        for ch in text:
+            node = node.setdefault(ch, {})
+        if _TRIE_END not in node:
+            node[_TRIE_END] = ordinal
+
+    @staticmethod
+    def _walk(trie: Dict[str, Any], text: str, best: int) -> int:
+        """Return the lowest ordinal of any trie entry that prefixes text."""
+        node = trie
+        if _TRIE_END in node:
+            best = min(best, node[_TRIE_END])
+        for ch in text:
+            node = node.get(ch)
+            if node is None:
+                break
+            if _TRIE_END in node:
+                best = min(best, node[_TRIE_END])
+        return best
+
+    def match_index(self, url: str) -> Optional[int]:
+        """Return the position of the first matching rule, or None."""
+        if not self.rules:
+            return None
+
+        no_match = len(self.rules)
+        folded = self._fold(url)
+
+        best = self._exact.get(folded, no_match)
+        if self._prefix_trie:
+            best = self._walk(self._prefix_trie, folded, best)
+        if self._suffix_trie:
+            best = self._walk(self._suffix_trie, folded[::-1], best)
+
+        if self._scan_rules:
+            contains_hit = (
+                self._contains_re is not None
+                and self._contains_re.search(folded) is not None
+            )
+            regex_hit = (
+                self._regex_re is not None
+                and self._regex_re.search(url) is not None
+            )
+            for ordinal, match_type, matcher in self._scan_rules:
+                if ordinal >= best:
+                    break
+                if match_type == 'contains':
+                    if contains_hit and matcher in folded:
+                        best = ordinal
+                        break
+                elif not regex_hit and ordinal not in self._always_check:
+                    continue
+                elif matcher.search(url):
+                    best = ordinal
+                    break
+
+        return best if best < no_match else None
+
+    def match(self, url: str) -> Optional[Any]:
+        """Return the first rule matching the URL, or None."""
+        ordinal = self.match_index(url)
+        return self.rules[ordinal] if ordinal is not None else None
+
+
 @dataclass
 class ValidationRequest:
     """
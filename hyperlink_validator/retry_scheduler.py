@@ -0,0 +1,185 @@
+"""
+Hyperlink Validator Retry Scheduler
+===================================
+Deferred retry queue for transient URL failures.
+
+Instead of sleeping in-line between attempts, a URL that fails with a
+retryable error (timeout, connection reset, 429/503) is re-enqueued with a
+not-before timestamp and the validator moves on to the next URL. Backoff is
+tracked per host, so a host that is rate limiting or timing out holds back
+all of its URLs, not just the one that failed.
+
+When only deferred URLs remain, the scheduler waits for the earliest one
+(the final retry sweep).
+
+Usage:
+    backoff = HostBackoff()
+    scheduler = RetryScheduler(urls, backoff=backoff)
+    for index, retry_state in scheduler:
+        ...
+        if should_retry:
+            scheduler.defer(index, new_state, backoff.record_failure(host))
+"""
+
+import heapq
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an HTTP Retry-After header into seconds.
+
+    Accepts delta-seconds ("120") or an HTTP-date. Returns None when the
+    header is missing or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def host_of(url: str) -> str:
+    """Get the lower-cased host (netloc) used as the backoff key for a URL."""
+    try:
+        return urlparse(url).netloc.lower()
+    except Exception:
+        return ''
+
+
+class HostBackoff:
+    """
+    Per-host exponential backoff state.
+
+    Each retryable failure doubles the host's delay (base_delay, 2x, 4x ...,
+    capped at max_delay) plus a little jitter. A server-supplied Retry-After
+    takes precedence, capped at max_retry_after. Any definitive response from
+    the host resets its state.
+
+    Args:
+        base_delay: Delay after the first failure (seconds)
+        max_delay: Upper bound for computed exponential delays (seconds)
+        max_retry_after: Upper bound for honoured Retry-After values (seconds)
+    """
+
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 60.0,
+                 max_retry_after: float = 120.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self._failures: Dict[str, int] = {}
+        self._not_before: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record_failure(self, host: str, retry_after: Optional[float] = None) -> float:
+        """
+        Record a retryable failure for a host.
+
+        Returns:
+            Delay in seconds before the host should be contacted again
+        """
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if retry_after is not None:
+                delay = min(retry_after, self.max_retry_after)
+            else:
+                delay = min(self.base_delay * (2 ** (failures - 1)), self.max_delay)
+                delay += random.random() * 0.1
+            self._not_before[host] = max(self._not_before.get(host, 0.0),
+                                         time.monotonic() + delay)
+            return delay
+
+    def record_success(self, host: str):
+        """Clear backoff state after the host gave a definitive answer."""
+        with self._lock:
+            self._failures.pop(host, None)
+            self._not_before.pop(host, None)
+
+    def not_before(self, host: str) -> float:
+        """Monotonic time before which the host should not be contacted (0 if none)."""
+        with self._lock:
+            return self._not_before.get(host, 0.0)
+
+    def failures(self, host: str) -> int:
+        """Number of consecutive retryable failures recorded for a host."""
+        with self._lock:
+            return self._failures.get(host, 0)
+
+
+class RetryScheduler:
+    """
+    Iterator over URL indices that interleaves fresh URLs with deferred retries.
+
+    Yields (index, retry_state) pairs. retry_state is None on the first
+    attempt, otherwise whatever was passed to defer(). Fresh URLs whose host is
+    currently backing off are deferred until the host's not-before time.
+
+    Args:
+        urls: URLs being validated (only used to look up hosts)
+        backoff: Shared per-host backoff state
+    """
+
+    def __init__(self, urls: List[str], backoff: Optional[HostBackoff] = None):
+        self.urls = urls
+        self.backoff = backoff or HostBackoff()
+        self._fresh: Deque[int] = deque(range(len(urls)))
+        self._deferred: List[Tuple[float, int, int, Any]] = []
+        self._seq = 0
+        self.deferred_count = 0  # Total number of deferrals (for stats/logging)
+
+    def defer(self, index: int, retry_state: Any, delay: float):
+        """Re-enqueue a URL to be retried no earlier than `delay` seconds from now."""
+        self._push(index, retry_state, time.monotonic() + max(0.0, delay))
+        self.deferred_count += 1
+
+    def _push(self, index: int, retry_state: Any, not_before: float):
+        heapq.heappush(self._deferred, (not_before, self._seq, index, retry_state))
+        self._seq += 1
+
+    def __len__(self) -> int:
+        return len(self._fresh) + len(self._deferred)
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        while self._fresh or self._deferred:
+            now = time.monotonic()
+
+            if self._deferred and (self._deferred[0][0] <= now or not self._fresh):
+                not_before, _, index, retry_state = heapq.heappop(self._deferred)
+                # Honour the host's current backoff, which may have grown
+                # since this retry was queued.
+                host_wait = self.backoff.not_before(host_of(self.urls[index]))
+                not_before = max(not_before, host_wait)
+                if not_before > now:
+                    if self._fresh or (self._deferred and self._deferred[0][0] < not_before):
+                        self._push(index, retry_state, not_before)
+                        continue
+                    # Final retry sweep: nothing else is runnable, wait it out
+                    time.sleep(not_before - now)
+                yield index, retry_state
+                continue
+
+            index = self._fresh.popleft()
+            host_wait = self.backoff.not_before(host_of(self.urls[index]))
+            if host_wait > now:
+                self._push(index, None, host_wait)
+                continue
+            yield index, None
@@ -6,6 +6,7 @@ API endpoints for standalone hyperlink validation.
 Endpoints:
 - POST /api/hyperlink-validator/validate - Start validation job
 - GET  /api/hyperlink-validator/job/<job_id> - Poll job status/results
+- GET  /api/hyperlink-validator/job/<job_id>/results - Fetch partial results incrementally
 - POST /api/hyperlink-validator/cancel/<job_id> - Cancel running job
 - GET  /api/hyperlink-validator/history - List validation runs
 - GET  /api/hyperlink-validator/export/<job_id> - Export results
@@ -43,7 +44,8 @@ from .validator import (
     validate_urls,
     validate_any_link,
     validate_docx_links,
-    DOCX_EXTRACTION_AVAILABLE
+    DOCX_EXTRACTION_AVAILABLE,
+    QueueFullError
 )
 
 # Check for Excel extraction support
@@ -122,6 +124,19 @@ def handle_hv_errors(f):
                     'correlation_id': getattr(g, 'correlation_id', 'unknown')
                 }
             }), 404
+        except QueueFullError as e:
+            logger.warning(f"Validation queue full in {f.__name__}: {e}")
+            response = jsonify({
+                'success': False,
+                'error': {
+                    'code': 'QUEUE_FULL',
+                    'message': 'Too many validation jobs are waiting. Please try again shortly.',
+                    'details': {'retry_after': e.retry_after},
+                    'correlation_id': getattr(g, 'correlation_id', 'unknown')
+                }
+            })
+            response.headers['Retry-After'] = str(e.retry_after)
+            return response, 429
         except json.JSONDecodeError as e:
             logger.warning(f"Invalid JSON in {f.__name__}: {e}")
             return jsonify({
@@ -353,7 +368,8 @@ def get_job_status(job_id: str):
     Get status and optionally results of a validation job.
 
     Query params:
-        include_results: bool - Include full results (default: false for running, true for complete)
+        include_results: bool - Include results (default: false). For a running
+                         job this returns the results validated so far.
 
     Returns:
         JSON with job status, progress, and optionally results
@@ -377,15 +393,60 @@ def get_job_status(job_id: str):
         'job': status
     }
 
-    # Include results for completed jobs
-    if status['status'] == 'complete' and include_results:
-        run = validator.get_job_results(job_id)
-        if run and run.results:
-            response['job']['results'] = [r.to_dict() for r in run.results]
+    # Include results for completed jobs, or the partial results of a running one
+    if include_results:
+        if status['status'] == 'complete':
+            run = validator.get_job_results(job_id)
+            if run and run.results:
+                response['job']['results'] = [r.to_dict() for r in run.results]
+        else:
+            partial = validator.get_partial_results(job_id)
+            if partial:
+                response['job']['results'] = partial['results']
+                response['job']['results_partial'] = True
 
     return jsonify(response)
 
 
+@hv_blueprint.route('/job/<job_id>/results', methods=['GET'])
+@handle_hv_errors
+def get_job_partial_results(job_id: str):
+    """
+    Get results a validation job has produced so far.
+
+    Works while the job is running and for jobs restored from a checkpoint.
+
+    Query params:
+        offset: int - Number of results already received (default: 0);
+                only results after this point are returned
+
+    Returns:
+        JSON with status, completed_count, total_count and new results
+    """
+    try:
+        offset = int(request.args.get('offset', 0))
+    except ValueError:
+        raise ValidationError("offset must be an integer")
+
+    validator = StandaloneHyperlinkValidator()
+    partial = validator.get_partial_results(job_id, offset=offset)
+
+    if partial is None:
+        return jsonify({
+            'success': False,
+            'error': {
+                'code': 'JOB_NOT_FOUND',
+                'message': f'Job {job_id} not found'
+            }
+        }), 404
+
+    return jsonify({
+        'success': True,
+        **partial,
+        'next_offset': offset + len(partial['results'])
+    })
+
+
 @hv_blueprint.route('/cancel/<job_id>', methods=['POST'])
 @handle_hv_errors
 def cancel_job(job_id: str):
@@ -9,11 +9,40 @@ Uses SQLite database (shared with scan_history.db) for persistence.
 import sqlite3
 import json
 import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from collections import deque
+from typing import Deque, List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 
+from .models import ExclusionIndex
+
+# Shared pooled WAL connections
+from sqlite_pool import connect as db_connect
+
+
+# Buffered exclusion hit counts are written once this many hits are pending
+# or this many seconds have passed since the last flush, whichever is first.
+HIT_FLUSH_THRESHOLD = 50
+HIT_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Per-host latency model: how many recent response times are kept, how many
+# are needed before timeouts adapt, and how adapted timeouts are bounded.
+LATENCY_WINDOW = 50
+LATENCY_MIN_SAMPLES = 5
+LATENCY_TIMEOUT_MULTIPLIER = 4.0
+MIN_ADAPTIVE_CONNECT_TIMEOUT = 3.0
+MIN_ADAPTIVE_READ_TIMEOUT = 5.0
+MAX_ADAPTIVE_CONNECT_TIMEOUT = 30.0
+MAX_ADAPTIVE_READ_TIMEOUT = 120.0
+
+# A host unreachable this many times in a row is failed fast until the
+# cooldown since its last failure has passed; then one probe is let through.
+FAIL_FAST_THRESHOLD = 3
+FAIL_FAST_COOLDOWN_SECONDS = 600.0
+
 
 # =============================================================================
 # DATA CLASSES
@@ -124,6 +153,139 @@ class LinkScanRecord:
         )
 
 
+# =============================================================================
+# LATENCY MODEL
+# =============================================================================
+
+class DomainLatencyModel:
+    """
+    Rolling per-host latency and reachability history.
+
+    Keeps the most recent response times for each host and derives per-host
+    (connect, read) timeouts from their 95th percentile, so fast hosts fail
+    quickly and slow ones get the patience they need. Hosts with too few
+    samples keep the caller's default timeouts.
+
+    A host that was unreachable (timeout, DNS or connection failure)
+    fail_fast_threshold times with no response since is failed fast until
+    fail_fast_cooldown seconds have passed since its last failure.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW,
+                 min_samples: int = LATENCY_MIN_SAMPLES,
+                 fail_fast_threshold: int = FAIL_FAST_THRESHOLD,
+                 fail_fast_cooldown: float = FAIL_FAST_COOLDOWN_SECONDS):
+        self.window = window
+        self.min_samples = min_samples
+        self.fail_fast_threshold = fail_fast_threshold
+        self.fail_fast_cooldown = fail_fast_cooldown
+        self._samples: Dict[str, Deque[float]] = {}
+        self._failures: Dict[str, int] = {}
+        self._last_failure: Dict[str, float] = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    def load(self, host: str, samples: List[float], failures: int = 0,
+             last_failure: Optional[float] = None):
+        """Seed a host's state from storage (does not mark it dirty)."""
+        with self._lock:
+            self._samples[host] = deque(samples, maxlen=self.window)
+            self._failures[host] = failures or 0
+            if last_failure:
+                self._last_failure[host] = last_failure
+
+    def record_latency(self, host: str, response_time_ms: float):
+        """Record a response from a host; clears its unreachable streak."""
+        if not host:
+            return
+        with self._lock:
+            samples = self._samples.get(host)
+            if samples is None:
+                samples = self._samples[host] = deque(maxlen=self.window)
+            samples.append(round(float(response_time_ms), 1))
+            self._failures[host] = 0
+            self._dirty.add(host)
+
+    def record_unreachable(self, host: str):
+        """Record that a host could not be reached at all."""
+        if not host:
+            return
+        with self._lock:
+            self._failures[host] = self._failures.get(host, 0) + 1
+            self._last_failure[host] = time.time()
+            self._samples.setdefault(host, deque(maxlen=self.window))
+            self._dirty.add(host)
+
+    def percentile(self, host: str, pct: float) -> Optional[float]:
+        """Nearest-rank percentile of a host's recent response times (ms)."""
+        with self._lock:
+            samples = sorted(self._samples.get(host) or ())
+        if not samples:
+            return None
+        rank = -(-len(samples) * pct // 100)  # ceil without float error
+        return samples[int(min(max(rank, 1), len(samples))) - 1]
+
+    def sample_count(self, host: str) -> int:
+        """Number of response times currently held for a host."""
+        with self._lock:
+            return len(self._samples.get(host) or ())
+
+    def recent_failures(self, host: str) -> int:
+        """Unreachable checks recorded for a host since its last response."""
+        with self._lock:
+            return self._failures.get(host, 0)
+
+    def should_fail_fast(self, host: str) -> bool:
+        """True while a repeatedly unreachable host is in its cooldown."""
+        with self._lock:
+            if self._failures.get(host, 0) < self.fail_fast_threshold:
+                return False
+            last_failure = self._last_failure.get(host, 0.0)
+        return time.time() - last_failure < self.fail_fast_cooldown
+
+    def timeouts_for(self, host: str, connect_timeout: float,
+                     read_timeout: float) -> Tuple[float, float]:
+        """
+        Get the (connect, read) timeouts to use for a host.
+
+        The given defaults are returned until the host has min_samples
+        responses. After that both follow the host's p95 response time
+        times LATENCY_TIMEOUT_MULTIPLIER, clamped to the adaptive bounds
+        (which widen to include the defaults).
+        """
+        if self.sample_count(host) < self.min_samples:
+            return connect_timeout, read_timeout
+        expected = self.percentile(host, 95) / 1000.0 * LATENCY_TIMEOUT_MULTIPLIER
+        connect = min(max(expected, min(MIN_ADAPTIVE_CONNECT_TIMEOUT, connect_timeout)),
+                      max(MAX_ADAPTIVE_CONNECT_TIMEOUT, connect_timeout))
+        read = min(max(expected, min(MIN_ADAPTIVE_READ_TIMEOUT, read_timeout)),
+                   max(MAX_ADAPTIVE_READ_TIMEOUT, read_timeout))
+        return round(connect, 2), round(read, 2)
+
+    def drain_dirty(self) -> List[tuple]:
+        """Take (host, samples, failures, last_failure) for hosts changed since the last drain."""
+        with self._lock:
+            rows = [
+                (host, list(self._samples.get(host) or ()), self._failures.get(host, 0),
+                 self._last_failure.get(host))
+                for host in self._dirty
+            ]
+            self._dirty = set()
+        return rows
+
+    def stats(self, host: str) -> Dict[str, Any]:
+        """Summary of a host's latency history."""
+        return {
+            'host': host,
+            'samples': self.sample_count(host),
+            'p50_ms': self.percentile(host, 50),
+            'p90_ms': self.percentile(host, 90),
+            'p95_ms': self.percentile(host, 95),
+            'recent_failures': self.recent_failures(host),
+            'fail_fast': self.should_fail_fast(host),
+        }
+
+
 # =============================================================================
 # STORAGE CLASS
 # =============================================================================
@@ -135,6 +297,7 @@ class HyperlinkValidatorStorage:
     Stores:
     - URL exclusion rules
     - Scan history with results
+    - Per-host latency history (adaptive timeouts)
     - Statistics
     """
 
@@ -146,17 +309,34 @@ class HyperlinkValidatorStorage:
             db_path = str(app_dir / "scan_history.db")
 
         self.db_path = db_path
+
+        # Compiled exclusion index, rebuilt lazily when the generation moves.
+        # Every add/update/delete bumps _exclusion_generation.
+        self._exclusion_lock = threading.Lock()
+        self._exclusion_generation = 0
+        self._exclusion_index: Optional[ExclusionIndex] = None
+        self._exclusion_index_generation = -1
+
+        # Pending hit counts: exclusion_id -> (hits, last_hit timestamp)
+        self._pending_hits: Dict[int, List[Any]] = {}
+        self._pending_hit_total = 0
+        self._last_hit_flush = time.monotonic()
+
+        # Per-host latency model, loaded on first use and flushed after runs
+        self._latency_model: Optional[DomainLatencyModel] = None
+        self._latency_lock = threading.Lock()
+
         self._init_tables()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
     def _init_tables(self):
         """Initialize hyperlink validator tables."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         # Exclusions table
@@ -214,6 +394,50 @@ class HyperlinkValidatorStorage:
             ON link_scan_history(scan_time DESC)
         ''')
 
+        # Validation job checkpoints (resumable async runs)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS validation_checkpoints (
+                job_id TEXT PRIMARY KEY,
+                run_id TEXT,
+                mode TEXT DEFAULT 'validator',
+                status TEXT DEFAULT 'pending',
+                urls_json TEXT NOT NULL,
+                options_json TEXT,
+                total_urls INTEGER DEFAULT 0,
+                completed_urls INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS validation_checkpoint_results (
+                job_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                result_json TEXT NOT NULL,
+                PRIMARY KEY (job_id, position)
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_checkpoint_results_seq
+            ON validation_checkpoint_results(job_id, seq)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_checkpoint_status
+            ON validation_checkpoints(status)
+        ''')
+
+        # Rolling per-host latency samples (JSON list of ms, oldest first)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS domain_latency (
+                host TEXT PRIMARY KEY,
+                samples_json TEXT NOT NULL DEFAULT '[]',
+                recent_failures INTEGER DEFAULT 0,
+                last_failure REAL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
         conn.commit()
         conn.close()
 
@@ -234,7 +458,7 @@ class HyperlinkValidatorStorage:
 
         Returns the exclusion ID if successful, None if duplicate.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         try:
@@ -245,6 +469,7 @@ class HyperlinkValidatorStorage:
             ''', (pattern, match_type, reason, int(treat_as_valid), created_by))
 
             conn.commit()
+            self._invalidate_exclusions()
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             # Duplicate pattern/match_type combination
@@ -262,7 +487,7 @@ class HyperlinkValidatorStorage:
         is_active: bool = None
     ) -> bool:
         """Update an existing exclusion rule."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         updates = []
@@ -298,11 +523,13 @@ class HyperlinkValidatorStorage:
         conn.commit()
         success = cursor.rowcount > 0
         conn.close()
+        if success:
+            self._invalidate_exclusions()
         return success
 
     def delete_exclusion(self, exclusion_id: int) -> bool:
         """Delete an exclusion rule."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute('DELETE FROM hyperlink_exclusions WHERE id = ?', (exclusion_id,))
@@ -310,11 +537,18 @@ class HyperlinkValidatorStorage:
         conn.commit()
         success = cursor.rowcount > 0
         conn.close()
+        if success:
+            with self._exclusion_lock:
+                pending = self._pending_hits.pop(exclusion_id, None)
+                if pending:
+                    self._pending_hit_total -= pending[0]
+            self._invalidate_exclusions()
         return success
 
     def get_exclusion(self, exclusion_id: int) -> Optional[StoredExclusion]:
         """Get a single exclusion by ID."""
-        conn = sqlite3.connect(self.db_path)
+        self.flush_exclusion_hits()
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -333,7 +567,8 @@ class HyperlinkValidatorStorage:
 
     def get_all_exclusions(self, active_only: bool = True) -> List[StoredExclusion]:
         """Get all exclusion rules."""
-        conn = sqlite3.connect(self.db_path)
+        self.flush_exclusion_hits()
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         if active_only:
@@ -358,51 +593,113 @@ class HyperlinkValidatorStorage:
         return [StoredExclusion.from_row(row) for row in rows]
 
     def increment_exclusion_hit(self, exclusion_id: int):
-        """Increment hit count for an exclusion."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """
+        Increment hit count for an exclusion.
 
-        cursor.execute('''
-            UPDATE hyperlink_exclusions
-            SET hit_count = hit_count + 1,
-                last_hit = CURRENT_TIMESTAMP
-            WHERE id = ?
-        ''', (exclusion_id,))
+        Hits are buffered in memory and written in one batch once
+        HIT_FLUSH_THRESHOLD hits are pending or HIT_FLUSH_INTERVAL_SECONDS
+        have elapsed. Reads of exclusion rows flush first, so hit counts
+        returned by this class are always current.
+        """
+        now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        with self._exclusion_lock:
+            pending = self._pending_hits.setdefault(exclusion_id, [0, now])
+            pending[0] += 1
+            pending[1] = now
+            self._pending_hit_total += 1
+            due = (
+                self._pending_hit_total >= HIT_FLUSH_THRESHOLD
+                or time.monotonic() - self._last_hit_flush >= HIT_FLUSH_INTERVAL_SECONDS
+            )
+        if due:
+            self.flush_exclusion_hits()
 
-        conn.commit()
-        conn.close()
+    def flush_exclusion_hits(self) -> int:
+        """
+        Write buffered exclusion hit counts in a single transaction.
+
+        Returns the number of exclusions updated.
+        """
+        with self._exclusion_lock:
+            self._last_hit_flush = time.monotonic()
+            if not self._pending_hits:
+                return 0
+            batch = [(hits, last_hit, exc_id)
+                     for exc_id, (hits, last_hit) in self._pending_hits.items()]
+            self._pending_hits = {}
+            self._pending_hit_total = 0
+
+        conn = db_connect(self.db_path)
+        try:
+            conn.executemany('''
+                UPDATE hyperlink_exclusions
+                SET hit_count = hit_count + ?,
+                    last_hit = ?
+                WHERE id = ?
+            ''', batch)
+            conn.commit()
+        finally:
+            conn.close()
+        return len(batch)
+
+    def _invalidate_exclusions(self):
+        """Mark the compiled exclusion index stale after a rule change."""
+        with self._exclusion_lock:
+            self._exclusion_generation += 1
+
+    @property
+    def exclusion_generation(self) -> int:
+        """Counter bumped on every exclusion add, update or delete."""
+        return self._exclusion_generation
+
+    def get_exclusion_index(self) -> ExclusionIndex:
+        """
+        Get the compiled index of active exclusions.
+
+        The index is built once and reused until an exclusion is added,
+        updated or deleted through this storage instance.
+        """
+        with self._exclusion_lock:
+            generation = self._exclusion_generation
+            if (self._exclusion_index is not None
+                    and self._exclusion_index_generation == generation):
+                return self._exclusion_index
 
-    def find_matching_exclusion(self, url: str) -> Optional[StoredExclusion]:
-        """Find the first exclusion that matches a URL."""
         exclusions = self.get_all_exclusions(active_only=True)
+        # Stored rules keep their historical semantics: case-sensitive
+        # comparisons, and 'suffix' also accepts the pattern anywhere in the URL.
+        index = ExclusionIndex(
+            exclusions,
+            case_sensitive=True,
+            key=lambda exc: (
+                exc.pattern,
+                'contains' if exc.match_type == 'suffix' else exc.match_type
+            )
+        )
 
-        for exc in exclusions:
-            if self._matches_pattern(url, exc.pattern, exc.match_type):
-                return exc
-        return None
+        with self._exclusion_lock:
+            # Only publish if no rule changed while we were loading
+            if self._exclusion_generation == generation:
+                self._exclusion_index = index
+                self._exclusion_index_generation = generation
+        return index
 
-    def _matches_pattern(self, url: str, pattern: str, match_type: str) -> bool:
-        """Check if URL matches an exclusion pattern."""
-        import re
-
-        if match_type == 'exact':
-            return url == pattern
-        elif match_type == 'prefix':
-            return url.startswith(pattern)
-        elif match_type == 'suffix':
-            return url.endswith(pattern) or pattern in url
-        elif match_type == 'contains':
-            return pattern in url
-        elif match_type == 'regex':
-            try:
-                return bool(re.search(pattern, url, re.IGNORECASE))
-            except:
-                return False
-        return False
+    def find_matching_exclusion(self, url: str, record_hit: bool = True) -> Optional[StoredExclusion]:
+        """
+        Find the first exclusion that matches a URL.
+
+        Uses the compiled exclusion index; matches are counted through the
+        buffered hit counter unless record_hit is False.
+        """
+        exc = self.get_exclusion_index().match(url)
+        if exc is not None and record_hit and exc.id is not None:
+            self.increment_exclusion_hit(exc.id)
+        return exc
 
     def get_exclusion_stats(self) -> Dict[str, Any]:
         """Get exclusion statistics."""
-        conn = sqlite3.connect(self.db_path)
+        self.flush_exclusion_hits()
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -444,7 +741,7 @@ class HyperlinkValidatorStorage:
 
         Returns the scan ID.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         results_json = json.dumps(results) if results else ""
@@ -480,7 +777,7 @@ class HyperlinkValidatorStorage:
 
     def get_scan(self, scan_id: int) -> Optional[LinkScanRecord]:
         """Get a single scan record by ID."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -500,7 +797,7 @@ class HyperlinkValidatorStorage:
 
     def get_scan_results(self, scan_id: int) -> List[Dict]:
         """Get detailed results for a scan."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -519,7 +816,7 @@ class HyperlinkValidatorStorage:
 
     def get_recent_scans(self, limit: int = 20) -> List[LinkScanRecord]:
         """Get recent scan history."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -542,7 +839,7 @@ class HyperlinkValidatorStorage:
         end_date: str = None
     ) -> List[LinkScanRecord]:
         """Get scans within a date range."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         if end_date:
@@ -571,7 +868,7 @@ class HyperlinkValidatorStorage:
 
     def delete_scan(self, scan_id: int) -> bool:
         """Delete a scan record."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute('DELETE FROM link_scan_history WHERE id = ?', (scan_id,))
@@ -583,7 +880,7 @@ class HyperlinkValidatorStorage:
 
     def get_scan_stats(self) -> Dict[str, Any]:
         """Get overall scan statistics."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -620,8 +917,14 @@ class HyperlinkValidatorStorage:
         }
 
     def clear_old_scans(self, days_to_keep: int = 90) -> int:
-        """Clear scan history older than specified days."""
-        conn = sqlite3.connect(self.db_path)
+        """
+        Clear scan history older than specified days.
+
+        Finished validation checkpoints older than the cutoff are removed too;
+        interrupted ones are kept so they can still be resumed. Latency
+        history for hosts not seen since the cutoff is dropped.
+        """
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -630,11 +933,270 @@ class HyperlinkValidatorStorage:
         ''', (f'-{days_to_keep}',))
 
         deleted = cursor.rowcount
+
+        cursor.execute('''
+            DELETE FROM validation_checkpoint_results
+            WHERE job_id IN (
+                SELECT job_id FROM validation_checkpoints
+                WHERE status NOT IN ('pending', 'running')
+                  AND updated_at < datetime('now', ? || ' days')
+            )
+        ''', (f'-{days_to_keep}',))
+        cursor.execute('''
+            DELETE FROM validation_checkpoints
+            WHERE status NOT IN ('pending', 'running')
+              AND updated_at < datetime('now', ? || ' days')
+        ''', (f'-{days_to_keep}',))
+        cursor.execute('''
+            DELETE FROM domain_latency
+            WHERE updated_at < datetime('now', ? || ' days')
+        ''', (f'-{days_to_keep}',))
+
         conn.commit()
         conn.close()
 
         return deleted
 
+    # =========================================================================
+    # LATENCY MODEL METHODS
+    # =========================================================================
+
+    def get_latency_model(self) -> DomainLatencyModel:
+        """
+        Get the per-host latency model, loading it from the database once.
+
+        Observations recorded on the model stay in memory until
+        flush_latency_model() is called.
+        """
+        with self._latency_lock:
+            if self._latency_model is not None:
+                return self._latency_model
+
+            model = DomainLatencyModel()
+            conn = db_connect(self.db_path)
+            try:
+                rows = conn.execute('''
+                    SELECT host, samples_json, recent_failures, last_failure
+                    FROM domain_latency
+                ''').fetchall()
+            finally:
+                conn.close()
+            for host, samples_json, failures, last_failure in rows:
+                try:
+                    samples = json.loads(samples_json) if samples_json else []
+                except ValueError:
+                    samples = []
+                model.load(host, samples, failures, last_failure)
+
+            self._latency_model = model
+            return model
+
+    def flush_latency_model(self) -> int:
+        """
+        Write hosts whose latency history changed in a single transaction.
+
+        Returns the number of hosts written.
+        """
+        with self._latency_lock:
+            model = self._latency_model
+        if model is None:
+            return 0
+        rows = model.drain_dirty()
+        if not rows:
+            return 0
+
+        conn = db_connect(self.db_path)
+        try:
+            conn.executemany('''
+                INSERT OR REPLACE INTO domain_latency
+                (host, samples_json, recent_failures, last_failure, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', [
+                (host, json.dumps(samples), failures, last_failure)
+                for host, samples, failures, last_failure in rows
+            ])
+            conn.commit()
+        finally:
+            conn.close()
+        return len(rows)
+
+    # =========================================================================
+    # VALIDATION CHECKPOINT METHODS
+    # =========================================================================
+
+    def create_checkpoint(
+        self,
+        job_id: str,
+        run_id: str,
+        mode: str,
+        urls: List[str],
+        options: Dict[str, Any] = None
+    ):
+        """Create (or reset) the checkpoint record for a validation job."""
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('DELETE FROM validation_checkpoint_results WHERE job_id = ?', (job_id,))
+        cursor.execute('''
+            INSERT OR REPLACE INTO validation_checkpoints
+            (job_id, run_id, mode, status, urls_json, options_json, total_urls, completed_urls)
+            VALUES (?, ?, ?, 'pending', ?, ?, ?, 0)
+        ''', (job_id, run_id, mode, json.dumps(urls), json.dumps(options or {}), len(urls)))
+
+        conn.commit()
+        conn.close()
+
+    def save_checkpoint_results(self, job_id: str, results: List[tuple]) -> int:
+        """
+        Append a batch of validated results to a job checkpoint.
+
+        Args:
+            job_id: Validation job ID
+            results: List of (position, result_dict) where position is the
+                     URL's index in the job's original URL list
+
+        Returns:
+            Number of results now stored for the job
+        """
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT COALESCE(MAX(seq), -1) FROM validation_checkpoint_results WHERE job_id = ?
+        ''', (job_id,))
+        next_seq = cursor.fetchone()[0] + 1
+
+        cursor.executemany('''
+            INSERT OR REPLACE INTO validation_checkpoint_results
+            (job_id, position, seq, result_json)
+            VALUES (?, ?, ?, ?)
+        ''', [
+            (job_id, position, next_seq + i, json.dumps(result))
+            for i, (position, result) in enumerate(results)
+        ])
+
+        cursor.execute('''
+            UPDATE validation_checkpoints
+            SET status = CASE WHEN status = 'cancelled' THEN status ELSE 'running' END,
+                completed_urls = (SELECT COUNT(*) FROM validation_checkpoint_results WHERE job_id = ?),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE job_id = ?
+        ''', (job_id, job_id))
+
+        cursor.execute('SELECT completed_urls FROM validation_checkpoints WHERE job_id = ?', (job_id,))
+        row = cursor.fetchone()
+
+        conn.commit()
+        conn.close()
+        return row[0] if row else 0
+
+    def get_checkpoint(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a checkpoint record (without results) by job ID."""
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT job_id, run_id, mode, status, urls_json, options_json,
+                   total_urls, completed_urls, created_at, updated_at
+            FROM validation_checkpoints
+            WHERE job_id = ?
+        ''', (job_id,))
+
+        row = cursor.fetchone()
+        conn.close()
+
+        return self._checkpoint_from_row(row) if row else None
+
+    def get_checkpoint_results(
+        self,
+        job_id: str,
+        offset: int = 0,
+        limit: int = None
+    ) -> List[tuple]:
+        """
+        Get stored results for a job in the order they were validated.
+
+        Returns:
+            List of (position, result_dict)
+        """
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT position, result_json
+            FROM validation_checkpoint_results
+            WHERE job_id = ?
+            ORDER BY seq
+            LIMIT ? OFFSET ?
+        ''', (job_id, limit if limit is not None else -1, offset))
+
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [(row[0], json.loads(row[1])) for row in rows]
+
+    def set_checkpoint_status(self, job_id: str, status: str) -> bool:
+        """Update checkpoint status (pending, running, complete, failed, cancelled)."""
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            UPDATE validation_checkpoints
+            SET status = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE job_id = ?
+        ''', (status, job_id))
+
+        conn.commit()
+        success = cursor.rowcount > 0
+        conn.close()
+        return success
+
+    def get_interrupted_checkpoints(self) -> List[Dict[str, Any]]:
+        """Get checkpoints for jobs that were still pending or running."""
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT job_id, run_id, mode, status, urls_json, options_json,
+                   total_urls, completed_urls, created_at, updated_at
+            FROM validation_checkpoints
+            WHERE status IN ('pending', 'running')
+            ORDER BY created_at
+        ''')
+
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [self._checkpoint_from_row(row) for row in rows]
+
+    def delete_checkpoint(self, job_id: str) -> bool:
+        """Delete a checkpoint and its stored results."""
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('DELETE FROM validation_checkpoint_results WHERE job_id = ?', (job_id,))
+        cursor.execute('DELETE FROM validation_checkpoints WHERE job_id = ?', (job_id,))
+
+        conn.commit()
+        success = cursor.rowcount > 0
+        conn.close()
+        return success
+
+    @staticmethod
+    def _checkpoint_from_row(row: tuple) -> Dict[str, Any]:
+        return {
+            'job_id': row[0],
+            'run_id': row[1],
+            'mode': row[2],
+            'status': row[3],
+            'urls': json.loads(row[4]) if row[4] else [],
+            'options': json.loads(row[5]) if row[5] else {},
+            'total_urls': row[6],
+            'completed_urls': row[7],
+            'created_at': row[8],
+            'updated_at': row[9]
+        }
+
 
 # =============================================================================
 # SINGLETON INSTANCE
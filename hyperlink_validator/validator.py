@@ -43,6 +43,7 @@ from .models import (
     ScanDepth,
     LinkType,
     ExclusionRule,
+    ExclusionIndex,
     parse_url_list,
     validate_url_format,
     categorize_domain,
@@ -58,6 +59,8 @@ from .models import (
     parse_cross_reference
 )
 
+from .retry_scheduler import HostBackoff, RetryScheduler, parse_retry_after, host_of
+
 # Import DOCX extractor
 try:
     from .docx_extractor import DocxExtractor, extract_docx_links, get_urls_from_docx
@@ -107,9 +110,12 @@ except ImportError:
 # Try to import JobManager
 JobManager = None
 try:
-    from job_manager import JobManager, JobPhase, JobStatus
+    from job_manager import JobManager, JobPhase, JobStatus, QueueFullError
 except ImportError:
     # Create minimal stub if not available
+    class QueueFullError(Exception):
+        retry_after = 1
+
     class JobPhase:
         CHECKING = "checking"
         COMPLETE = "complete"
@@ -120,6 +126,26 @@ except ImportError:
         COMPLETE = "complete"
 
 
+# Checkpointed results are written once this many are pending or this many
+# seconds have passed since the last write.
+CHECKPOINT_BATCH_SIZE = 25
+CHECKPOINT_INTERVAL_SECONDS = 2.0
+
+# Validation jobs run at once / allowed to wait before new ones are refused
+VALIDATION_WORKERS = 2
+VALIDATION_QUEUE_LIMIT = 16
+
+
+def _get_storage():
+    """Get the storage used for job checkpoints and latency history, or None if unavailable."""
+    try:
+        from .storage import get_storage
+        return get_storage()
+    except Exception as e:
+        logger.debug(f"Validator storage unavailable: {e}")
+        return None
+
+
 class StandaloneHyperlinkValidator:
     """
     Main validator orchestrator for standalone URL validation.
@@ -198,6 +224,10 @@ class StandaloneHyperlinkValidator:
         self.follow_redirects = follow_redirects
         self.batch_size = batch_size
         self.progress_callback = progress_callback
+        # Optional callback(index, result) fired as each URL finishes
+        self.result_callback: Optional[Callable[[int, ValidationResult], None]] = None
+        # Optional callback() -> bool checked before each URL; True stops the run
+        self.cancellation_check: Optional[Callable[[], bool]] = None
 
         # Client certificate authentication (CAC/PIV/PKI)
         self.client_cert = client_cert
@@ -207,7 +237,10 @@ class StandaloneHyperlinkValidator:
 
         # Initialize job manager if available
         if JobManager and StandaloneHyperlinkValidator._job_manager is None:
-            StandaloneHyperlinkValidator._job_manager = JobManager(max_jobs=50, job_ttl=3600)
+            StandaloneHyperlinkValidator._job_manager = JobManager(
+                max_jobs=50, job_ttl=3600,
+                workers=VALIDATION_WORKERS, queue_limit=VALIDATION_QUEUE_LIMIT
+            )
 
     @classmethod
     def get_capabilities(cls) -> Dict[str, Any]:
@@ -234,7 +267,8 @@ class StandaloneHyperlinkValidator:
                         'Client Certificate auth (CAC/PIV/PKI)',
                         'Custom CA bundle support',
                         'Proxy server support',
-                        'Automatic retry with exponential backoff',
+                        'Deferred retry with per-host backoff (honours Retry-After)',
+                        'Adaptive per-host timeouts from latency history',
                         'Government site compatibility',
                         'SSL certificate validation',
                         'Redirect chain tracking',
@@ -364,6 +398,10 @@ class StandaloneHyperlinkValidator:
         """
         Start asynchronous validation job.
 
+        Results are checkpointed to HyperlinkValidatorStorage as they arrive,
+        so partial results can be fetched while the job runs and an
+        interrupted job can be resumed with resume_interrupted_jobs().
+
         Args:
             urls: List of URLs to validate
             mode: Validation mode
@@ -371,6 +409,9 @@ class StandaloneHyperlinkValidator:
 
         Returns:
             Job ID for tracking progress
+
+        Raises:
+            QueueFullError: Too many validation jobs are already waiting
         """
         import uuid
 
@@ -403,23 +444,127 @@ class StandaloneHyperlinkValidator:
         with self._lock:
             self._validation_runs[job_id] = run
 
-        # Start worker thread
-        worker = threading.Thread(
-            target=self._run_validation_job,
-            args=(job_id, urls, mode, options or {}),
-            daemon=True,
-            name=f"hv-worker-{job_id}"
-        )
-        worker.start()
+        storage = _get_storage()
+        if storage:
+            try:
+                storage.create_checkpoint(job_id, run.run_id, mode, urls, options or {})
+            except Exception as e:
+                logger.warning(f"Could not create checkpoint for job {job_id}: {e}")
+
+        try:
+            self._start_worker(job_id, urls, mode, options or {})
+        except QueueFullError:
+            with self._lock:
+                self._validation_runs.pop(job_id, None)
+            if storage:
+                try:
+                    storage.delete_checkpoint(job_id)
+                except Exception:
+                    pass
+            raise
 
         return job_id
 
+    def _start_worker(
+        self,
+        job_id: str,
+        urls: List[str],
+        mode: str,
+        options: Dict[str, Any],
+        completed: Optional[List[tuple]] = None,
+        bypass_limit: bool = False
+    ):
+        """Queue a validation job on the job manager's worker pool."""
+        self._job_manager.submit(
+            job_id, self._run_validation_job,
+            job_id, urls, mode, options, completed,
+            bypass_limit=bypass_limit
+        )
+
+    @classmethod
+    def resume_interrupted_jobs(cls) -> List[str]:
+        """
+        Resume validation jobs that were interrupted by a server restart.
+
+        Each job keeps its original job ID; URLs that already have a
+        checkpointed result are not probed again.
+
+        Returns:
+            List of resumed job IDs
+        """
+        storage = _get_storage()
+        if not storage:
+            return []
+
+        try:
+            checkpoints = storage.get_interrupted_checkpoints()
+        except Exception as e:
+            logger.warning(f"Could not load validation checkpoints: {e}")
+            return []
+
+        resumed = []
+        for checkpoint in checkpoints:
+            job_id = checkpoint['job_id']
+            urls = checkpoint['urls']
+            mode = checkpoint['mode']
+            options = checkpoint['options']
+
+            with cls._lock:
+                if job_id in cls._validation_runs:
+                    continue  # Already running in this process
+
+            client_cert = options.get('client_cert')
+            if isinstance(client_cert, list):
+                client_cert = tuple(client_cert)
+            validator = cls(
+                timeout=options.get('timeout', 10),
+                retries=options.get('retries', 3),
+                follow_redirects=options.get('follow_redirects', True),
+                client_cert=client_cert,
+                ca_bundle=options.get('ca_bundle'),
+                proxy=options.get('proxy'),
+                verify_ssl=options.get('verify_ssl', True)
+            )
+            if not validator._job_manager:
+                break
+
+            completed = storage.get_checkpoint_results(job_id)
+            validator._job_manager.create_job(
+                'hyperlink_validation',
+                metadata={
+                    'url_count': len(urls),
+                    'mode': mode,
+                    'options': options,
+                    'resumed': True,
+                    'resumed_from': len(completed)
+                },
+                job_id=job_id
+            )
+            run = ValidationRun(
+                run_id=checkpoint['run_id'] or job_id,
+                job_id=job_id,
+                mode=mode,
+                status='pending',
+                request=ValidationRequest(urls=urls, mode=mode)
+            )
+            with cls._lock:
+                cls._validation_runs[job_id] = run
+
+            logger.info(f"Resuming validation job {job_id}: "
+                        f"{len(completed)}/{len(urls)} URLs already checked")
+            # Admitted before the restart, so not refused for a full queue
+            validator._start_worker(job_id, urls, mode, options, completed, bypass_limit=True)
+            resumed.append(job_id)
+
+        return resumed
+
     def _run_validation_job(
         self,
         job_id: str,
         urls: List[str],
         mode: str,
-        options: Dict[str, Any]
+        options: Dict[str, Any],
+        completed: Optional[List[tuple]] = None
     ):
         """
         Worker thread for async validation.
@@ -429,8 +574,32 @@ class StandaloneHyperlinkValidator:
             urls: URLs to validate
             mode: Validation mode
             options: Validation options
+            completed: (position, result_dict) pairs restored from a
+                       checkpoint; those URLs are not validated again
         """
         start_time = time.time()
+        storage = _get_storage()
+
+        # Results keyed by position in `urls`
+        results_by_position: Dict[int, ValidationResult] = {}
+        for position, result_dict in completed or []:
+            results_by_position[position] = ValidationResult.from_dict(result_dict)
+        remaining = [pos for pos in range(len(urls)) if pos not in results_by_position]
+
+        pending_checkpoint: List[tuple] = []
+        last_flush = time.time()
+
+        def flush_checkpoint():
+            nonlocal last_flush
+            last_flush = time.time()
+            if not storage or not pending_checkpoint:
+                return
+            batch = list(pending_checkpoint)
+            pending_checkpoint.clear()
+            try:
+                storage.save_checkpoint_results(job_id, batch)
+            except Exception as e:
+                logger.warning(f"Checkpoint write failed for job {job_id}: {e}")
 
         try:
             # Start job
@@ -438,36 +607,75 @@ class StandaloneHyperlinkValidator:
                 self._job_manager.start_job(job_id)
                 self._job_manager.update_phase(job_id, JobPhase.CHECKING, "Starting URL validation")
 
-            # Update run status
+            # Update run status; restored results are visible immediately
             with self._lock:
                 if job_id in self._validation_runs:
-                    self._validation_runs[job_id].status = 'running'
+                    run = self._validation_runs[job_id]
+                    run.status = 'running'
+                    run.results = [results_by_position[p] for p in sorted(results_by_position)]
 
             # Create progress callback for job manager updates
             total_urls = len(urls)
+            already_done = total_urls - len(remaining)
 
-            def update_progress(completed: int, current_url: str = ''):
+            def update_progress(done: int, current_url: str = ''):
                 if self._job_manager:
-                    progress = (completed / total_urls * 100) if total_urls > 0 else 100
+                    completed_count = already_done + done
+                    progress = (completed_count / total_urls * 100) if total_urls > 0 else 100
                     self._job_manager.update_phase_progress(
                         job_id, progress,
                         f"Validating: {current_url[:50]}..." if current_url else None
                     )
 
-            # Store original callback
+            def record_result(index: int, result: ValidationResult):
+                position = remaining[index]
+                results_by_position[position] = result
+                with self._lock:
+                    run = self._validation_runs.get(job_id)
+                    if run:
+                        run.results.append(result)
+                pending_checkpoint.append((position, result.to_dict()))
+                if (len(pending_checkpoint) >= CHECKPOINT_BATCH_SIZE
+                        or time.time() - last_flush >= CHECKPOINT_INTERVAL_SECONDS):
+                    flush_checkpoint()
+
+            def is_cancelled() -> bool:
+                with self._lock:
+                    run = self._validation_runs.get(job_id)
+                    if run is not None and run.status == 'cancelled':
+                        return True
+                job = self._job_manager.get_job(job_id) if self._job_manager else None
+                return bool(job and job.is_cancelled)
+
+            # Store original callbacks
             original_callback = self.progress_callback
+            original_result_callback = self.result_callback
+            original_cancellation_check = self.cancellation_check
             self.progress_callback = lambda c, t, u: update_progress(c, u)
+            self.result_callback = record_result
+            self.cancellation_check = is_cancelled
 
+            remaining_urls = [urls[pos] for pos in remaining]
             try:
                 # Route to appropriate validator
                 # Two modes: 'offline' (format only) or 'validator' (full HTTP with Windows auth)
-                if mode == 'offline':
-                    results = self._validate_offline(urls)
-                else:  # 'validator' - default
-                    results = self._validate_with_requests(urls, options)
+                if remaining_urls and mode == 'offline':
+                    self._validate_offline(remaining_urls)
+                elif remaining_urls:  # 'validator' - default
+                    self._validate_with_requests(remaining_urls, options)
             finally:
                 self.progress_callback = original_callback
+                self.result_callback = original_result_callback
+                self.cancellation_check = original_cancellation_check
+                flush_checkpoint()
+
+            # cancel_job already marked the run, job and checkpoint 'cancelled'
+            if is_cancelled():
+                logger.info(f"Validation job {job_id} cancelled after "
+                            f"{len(results_by_position)}/{total_urls} URLs")
+                return
 
+            results = [results_by_position[p] for p in sorted(results_by_position)]
             total_time = time.time() - start_time
 
             # Complete job
@@ -476,10 +684,17 @@ class StandaloneHyperlinkValidator:
                     run = self._validation_runs[job_id]
                     run.complete(results, total_time)
 
+            if storage:
+                try:
+                    storage.set_checkpoint_status(job_id, 'complete')
+                except Exception as e:
+                    logger.warning(f"Could not finalize checkpoint for job {job_id}: {e}")
+
             if self._job_manager:
                 self._job_manager.complete_job(job_id, {
                     'run_id': self._validation_runs.get(job_id, {}).run_id if job_id in self._validation_runs else job_id,
                     'results_count': len(results),
+                    'resumed_from': already_done,
                     'total_time': total_time
                 })
 
@@ -490,9 +705,58 @@ class StandaloneHyperlinkValidator:
                 if job_id in self._validation_runs:
                     self._validation_runs[job_id].fail(str(e))
 
+            if storage:
+                try:
+                    storage.set_checkpoint_status(job_id, 'failed')
+                except Exception:
+                    pass
+
             if self._job_manager:
                 self._job_manager.fail_job(job_id, str(e))
 
+    def get_partial_results(self, job_id: str, offset: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Get results produced so far by a validation job.
+
+        Results are returned in the order they were validated, so a client
+        can poll with offset=<number already received> to fetch only new ones.
+        Falls back to the persisted checkpoint when the run is not in memory.
+
+        Args:
+            job_id: Job ID
+            offset: Number of results the caller already has
+
+        Returns:
+            Dict with status, counts and results, or None if the job is unknown
+        """
+        offset = max(0, offset)
+        with self._lock:
+            run = self._validation_runs.get(job_id)
+            if run:
+                return {
+                    'job_id': job_id,
+                    'status': run.status,
+                    'completed_count': len(run.results),
+                    'total_count': len(run.request.urls) if run.request else len(run.results),
+                    'offset': offset,
+                    'results': [r.to_dict() for r in run.results[offset:]]
+                }
+
+        storage = _get_storage()
+        if not storage:
+            return None
+        checkpoint = storage.get_checkpoint(job_id)
+        if not checkpoint:
+            return None
+        return {
+            'job_id': job_id,
+            'status': checkpoint['status'],
+            'completed_count': checkpoint['completed_urls'],
+            'total_count': checkpoint['total_urls'],
+            'offset': offset,
+            'results': [r for _, r in storage.get_checkpoint_results(job_id, offset=offset)]
+        }
+
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         Get status of a validation job.
@@ -515,7 +779,9 @@ class StandaloneHyperlinkValidator:
             'status': run.status,
             'mode': run.mode,
             'created_at': run.created_at,
-            'completed_at': run.completed_at
+            'completed_at': run.completed_at,
+            'completed_count': len(run.results),
+            'total_count': len(run.request.urls) if run.request else len(run.results)
         }
 
         # Add job manager info if available
@@ -563,6 +829,13 @@ class StandaloneHyperlinkValidator:
             if run and run.status == 'running':
                 run.cancel()
 
+        storage = _get_storage()
+        if run and storage:
+            try:
+                storage.set_checkpoint_status(job_id, 'cancelled')
+            except Exception:
+                pass
+
         if self._job_manager:
             job = self._job_manager.get_job(job_id)
             if job:
@@ -575,6 +848,23 @@ class StandaloneHyperlinkValidator:
     # VALIDATION METHODS
     # =========================================================================
 
+    def _is_cancelled(self) -> bool:
+        """Whether cancellation_check asks the running validation to stop."""
+        return bool(self.cancellation_check and self.cancellation_check())
+
+    def _report_result(self, index: int, total: int, url: str, result: ValidationResult,
+                       completed: Optional[int] = None):
+        """
+        Notify result and progress callbacks once a URL has been validated.
+
+        `completed` is the number of finished URLs when results can arrive
+        out of order (deferred retries); defaults to index + 1.
+        """
+        if self.result_callback:
+            self.result_callback(index, result)
+        if self.progress_callback:
+            self.progress_callback(completed if completed is not None else index + 1, total, url)
+
     def _validate_offline(self, urls: List[str]) -> List[ValidationResult]:
         """
         Validate URLs in offline mode (format only).
@@ -588,6 +878,8 @@ class StandaloneHyperlinkValidator:
         results = []
 
         for i, url in enumerate(urls):
+            if self._is_cancelled():
+                break
             is_valid, error = validate_url_format(url)
 
             if is_valid:
@@ -608,8 +900,7 @@ class StandaloneHyperlinkValidator:
             results.append(result)
 
             # Progress callback
-            if self.progress_callback:
-                self.progress_callback(i + 1, len(urls), url)
+            self._report_result(i, len(urls), url, result)
 
         return results
 
@@ -626,7 +917,10 @@ class StandaloneHyperlinkValidator:
         - Client certificate authentication (CAC/PIV/PKI)
         - Custom CA bundle support for federal PKI
         - Proxy server support for enterprise networks
-        - Robust retry logic with exponential backoff
+        - Deferred retries with per-host exponential backoff (no in-line
+          sleeps: other URLs keep flowing while a failed URL waits)
+        - Per-host timeouts from each host's rolling latency percentiles,
+          and fail-fast for hosts that were repeatedly unreachable
         - Handling of auth challenges and redirects
         - SSL certificate verification
         - Configurable timeouts for slow government servers
@@ -638,6 +932,10 @@ class StandaloneHyperlinkValidator:
                 - ca_bundle: Path to custom CA bundle
                 - proxy: Proxy server URL
                 - verify_ssl: Whether to verify SSL (default True)
+                - adaptive_timeouts: Use the stored per-host latency
+                  model (default True)
+                - stored_exclusions: Also apply the active exclusions
+                  saved in storage, counting their hits (default True)
 
         Returns:
             List of ValidationResult objects
@@ -647,7 +945,7 @@ class StandaloneHyperlinkValidator:
             logger.warning("requests library not available, falling back to offline mode")
             return self._validate_offline(urls)
 
-        results = []
+        results_by_index: Dict[int, ValidationResult] = {}
         timeout = options.get('timeout', self.timeout)
         retries = options.get('retries', self.retries)
         follow_redirects = options.get('follow_redirects', self.follow_redirects)
@@ -679,6 +977,7 @@ class StandaloneHyperlinkValidator:
                 exclusions.append(ExclusionRule.from_dict(exc))
             elif isinstance(exc, ExclusionRule):
                 exclusions.append(exc)
+        exclusion_index = ExclusionIndex(exclusions)
 
         # Set up session with authentication
         session = requests.Session()
@@ -738,7 +1037,44 @@ class StandaloneHyperlinkValidator:
             'Cache-Control': 'no-cache'
         }
 
-        for i, url in enumerate(urls):
+        # Retryable failures are re-enqueued with a not-before time instead
+        # of sleeping; the scheduler waits only when nothing else is runnable.
+        backoff = HostBackoff()
+        scheduler = RetryScheduler(urls, backoff=backoff)
+
+        # Per-host timeouts and fail-fast come from the stored latency model
+        latency_storage = _get_storage() if options.get('adaptive_timeouts', True) else None
+        latency = None
+        if latency_storage is not None:
+            try:
+                latency = latency_storage.get_latency_model()
+            except Exception as e:
+                logger.debug(f"Latency model unavailable: {e}")
+
+        # Saved exclusions apply even when the request does not send them,
+        # and are where matches are counted
+        exclusion_storage = _get_storage() if options.get('stored_exclusions', True) else None
+
+        def find_exclusion(url: str):
+            matched = exclusion_index.match(url)
+            if exclusion_storage is None:
+                return matched
+            try:
+                stored = exclusion_storage.find_matching_exclusion(url)
+            except Exception as e:
+                logger.debug(f"Stored exclusions unavailable: {e}")
+                return matched
+            return matched or stored
+
+        def finish(i: int, url: str, result: ValidationResult):
+            results_by_index[i] = result
+            self._report_result(i, len(urls), url, result, completed=len(results_by_index))
+
+        for i, retry_state in scheduler:
+            if self._is_cancelled():
+                break
+            url = urls[i]
+            host = host_of(url)
             start_time = time.time()
             result = ValidationResult(url=url, auth_used=auth_used)
 
@@ -746,11 +1082,7 @@ class StandaloneHyperlinkValidator:
             result.domain_category = categorize_domain(url)
 
             # Check exclusions first
-            matched_exclusion = None
-            for exc in exclusions:
-                if exc.matches(url):
-                    matched_exclusion = exc
-                    break
+            matched_exclusion = find_exclusion(url)
 
             if matched_exclusion:
                 result.excluded = True
@@ -762,9 +1094,7 @@ class StandaloneHyperlinkValidator:
                     result.status = 'SKIPPED'
                     result.message = f'Excluded: {result.exclusion_reason}'
                 result.response_time_ms = (time.time() - start_time) * 1000
-                results.append(result)
-                if self.progress_callback:
-                    self.progress_callback(i + 1, len(urls), url)
+                finish(i, url, result)
                 continue
 
             # Check for suspicious URL (thorough mode)
@@ -780,23 +1110,40 @@ class StandaloneHyperlinkValidator:
                 result.status = 'INVALID'
                 result.message = error
                 result.response_time_ms = (time.time() - start_time) * 1000
-                results.append(result)
-                if self.progress_callback:
-                    self.progress_callback(i + 1, len(urls), url)
+                finish(i, url, result)
+                continue
+
+            # Skip hosts that were unreachable several times recently
+            if latency is not None and retry_state is None and latency.should_fail_fast(host):
+                result.status = 'TIMEOUT'
+                result.message = (f'Host unreachable in {latency.recent_failures(host)} '
+                                  f'recent checks - skipped')
+                result.response_time_ms = (time.time() - start_time) * 1000
+                finish(i, url, result)
                 continue
 
             # Try to validate with retries
             # Government sites often need more patience - use longer connect timeout
             connect_timeout = min(timeout, 15)  # Connect timeout
             read_timeout = timeout * 2  # Read timeout (gov sites can be slow)
+            if latency is not None:
+                connect_timeout, read_timeout = latency.timeouts_for(
+                    host, connect_timeout, read_timeout)
             last_error = None
-            head_failed = False
-
-            for attempt in range(retries + 1):
+            # Deferred retries resume where the previous pass stopped
+            first_attempt, head_failed = retry_state or (0, False)
+            retry_delay = None
+            # Duration of the request that produced the final status, for the
+            # latency model (excludes failed HEADs, soft-404 GETs, DNS/SSL checks)
+            request_ms = None
+
+            for attempt in range(first_attempt, retries + 1):
+                request_ms = None
                 try:
                     # First try HEAD request (faster, less server load)
                     if not head_failed:
                         try:
+                            request_start = time.time()
                             response = session.head(
                                 url,
                                 timeout=(connect_timeout, read_timeout),
@@ -817,6 +1164,7 @@ class StandaloneHyperlinkValidator:
 
                     # Fall back to GET if HEAD failed or returned error
                     if head_failed:
+                        request_start = time.time()
                         response = session.get(
                             url,
                             timeout=(connect_timeout, read_timeout),
@@ -828,6 +1176,7 @@ class StandaloneHyperlinkValidator:
                         # Close the response body without reading it
                         response.close()
 
+                    request_ms = (time.time() - request_start) * 1000
                     result.status_code = response.status_code
                     result.response_time_ms = (time.time() - start_time) * 1000
                     result.attempts = attempt + 1
@@ -886,7 +1235,12 @@ class StandaloneHyperlinkValidator:
                         result.message = 'HTTP 405 - page exists (HEAD not allowed)'
 
                     elif response.status_code == 429:
-                        # Rate limited - don't mark as broken
+                        # Rate limited - back off this host and retry later
+                        if attempt < retries:
+                            retry_delay = backoff.record_failure(
+                                host, parse_retry_after(response.headers.get('Retry-After')))
+                            break
+                        # Out of retries - don't mark as broken
                         result.status = 'RATE_LIMITED'
                         result.message = 'Rate limited (429) - too many requests'
 
@@ -895,7 +1249,12 @@ class StandaloneHyperlinkValidator:
                         result.message = f'Client error: HTTP {response.status_code}'
 
                     elif response.status_code >= 500:
-                        # Server errors might be temporary - retry
+                        # Server errors might be temporary - retry.
+                        # 503 signals overload: defer and honour Retry-After.
+                        if attempt < retries and response.status_code == 503:
+                            retry_delay = backoff.record_failure(
+                                host, parse_retry_after(response.headers.get('Retry-After')))
+                            break
                         if attempt < retries:
                             continue
                         result.status = 'BROKEN'
@@ -967,22 +1326,49 @@ class StandaloneHyperlinkValidator:
                         result.status = 'BROKEN'
                         result.message = f'Request error: {str(e)[:50]}'
 
-                # Exponential backoff before retry
+                # Retryable error: defer instead of sleeping so the rest
+                # of the run keeps going while this host backs off
                 if attempt < retries:
-                    import random
-                    wait_time = (2 ** attempt) + (random.random() * 0.1)
-                    time.sleep(wait_time)
+                    retry_delay = backoff.record_failure(host)
+                    break
+
+            if retry_delay is not None:
+                scheduler.defer(i, (attempt + 1, head_failed), retry_delay)
+                continue
+
+            if result.status_code is not None:
+                backoff.record_success(host)
 
             result.response_time_ms = (time.time() - start_time) * 1000
             result.attempts = min(attempt + 1, retries + 1) if 'attempt' in dir() else 1
-            results.append(result)
 
-            # Progress callback
-            if self.progress_callback:
-                self.progress_callback(i + 1, len(urls), url)
+            if latency is not None:
+                if request_ms is not None:
+                    latency.record_latency(host, request_ms)
+                elif result.status in ('TIMEOUT', 'DNSFAILED') or (
+                        isinstance(last_error, requests.exceptions.ConnectionError)
+                        and not isinstance(last_error, requests.exceptions.SSLError)):
+                    latency.record_unreachable(host)
+            finish(i, url, result)
+
+        if scheduler.deferred_count:
+            logger.info(f"Deferred {scheduler.deferred_count} retries across {len(urls)} URLs")
+
+        if latency is not None:
+            try:
+                latency_storage.flush_latency_model()
+            except Exception as e:
+                logger.debug(f"Could not save latency history: {e}")
+
+        if exclusion_storage is not None:
+            try:
+                exclusion_storage.flush_exclusion_hits()
+            except Exception as e:
+                logger.debug(f"Could not save exclusion hits: {e}")
 
         session.close()
-        return results
+        # Only a cancelled run leaves URLs without a result
+        return [results_by_index[i] for i in range(len(urls)) if i in results_by_index]
 
     # =========================================================================
     # HISTORY MANAGEMENT
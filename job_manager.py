@@ -14,19 +14,58 @@ Features:
 - Elapsed time and ETA calculation
 - Job cancellation support
 - Thread-safe job storage
+- Bounded worker pool with per-job-type priority queues, queue positions
+  and back-pressure (QueueFullError) when the queue is full
+- Change subscriptions (JobSubscription) for pushing progress over
+  server-sent events, coalesced to a maximum rate per subscriber
 
 Created for Thread 8: Job/Progress System
 """
 
+import os
+import math
 import uuid
+import heapq
 import time
 import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 from datetime import datetime
 
-__version__ = "1.0.0"
+__version__ = "1.2.0"
+
+# Worker pool (overridable with TWR_JOB_WORKERS / TWR_JOB_QUEUE_LIMIT / TWR_JOB_POOL)
+DEFAULT_WORKERS = int(os.environ.get('TWR_JOB_WORKERS', '0')) or max(2, min(4, os.cpu_count() or 2))
+DEFAULT_QUEUE_LIMIT = int(os.environ.get('TWR_JOB_QUEUE_LIMIT', '32'))
+DEFAULT_POOL_MODE = os.environ.get('TWR_JOB_POOL', 'thread')  # 'thread' or 'process'
+
+# Dispatch priority by job type (lower runs first)
+JOB_TYPE_PRIORITIES = {
+    'review': 10,
+    'hyperlink_validation': 20,
+}
+DEFAULT_JOB_PRIORITY = 50
+
+# Assumed job duration for retry hints until real durations are known
+DEFAULT_JOB_SECONDS = 30.0
+MAX_RETRY_AFTER_SECONDS = 300
+
+# Shortest gap between two deliveries to one event subscriber
+EVENT_MIN_INTERVAL_SECONDS = 0.25
+
+
+class QueueFullError(Exception):
+    """Raised by JobManager.submit() when no more jobs can be queued."""
+    
+    def __init__(self, job_type: str, queued: int, limit: int, retry_after: int):
+        super().__init__(f"Job queue is full ({queued}/{limit} queued); retry in {retry_after}s")
+        self.job_type = job_type
+        self.queued = queued
+        self.limit = limit
+        self.retry_after = retry_after
 
 
 class JobPhase(Enum):
@@ -115,6 +154,7 @@ class Job:
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    queue_position: Optional[int] = None  # 1-based while waiting for a worker
     _cancelled: bool = False
     
     @property
@@ -170,6 +210,7 @@ class Job:
     def cancel(self):
         """Mark job as cancelled."""
         self._cancelled = True
+        self.queue_position = None
         self.status = JobStatus.CANCELLED
         self.progress.phase = JobPhase.CANCELLED
         self.completed_at = time.time()
@@ -187,6 +228,7 @@ class Job:
             "elapsed": self.elapsed_formatted,
             "eta": self.eta_formatted,
             "error": self.error,
+            "queue_position": self.queue_position,
             "metadata": self.metadata
         }
         if include_result and self.result is not None:
@@ -194,6 +236,65 @@ class Job:
         return data
 
 
+class JobSubscription:
+    """
+    Change notifications for a set of jobs, feeding a server-sent event stream.
+    
+    Publishing only marks a job as changed; the subscriber reads the job's
+    current state when it wakes, so a burst of updates collapses into one
+    event, and next_changes() returns at most once every min_interval seconds.
+    """
+    
+    def __init__(self, manager: 'JobManager', job_ids: Optional[List[str]] = None,
+                 session_id: Optional[str] = None,
+                 min_interval: float = EVENT_MIN_INTERVAL_SECONDS):
+        self.job_ids = set(job_ids or ())
+        self.session_id = session_id
+        self.min_interval = min_interval
+        self.closed = False
+        self._manager = manager
+        self._changed: Dict[str, None] = {}  # insertion-ordered set
+        self._cond = threading.Condition(threading.Lock())
+        self._next_delivery = 0.0
+    
+    def matches(self, job: 'Job') -> bool:
+        """True if changes to job concern this subscriber."""
+        if job.job_id in self.job_ids:
+            return True
+        return self.session_id is not None and job.metadata.get('session_id') == self.session_id
+    
+    def notify(self, job_id: str):
+        with self._cond:
+            self._changed[job_id] = None
+            self._cond.notify()
+    
+    def next_changes(self, timeout: float) -> List[str]:
+        """
+        Wait for changed jobs.
+        
+        Returns:
+            IDs of jobs changed since the last call (empty on timeout or close)
+        """
+        delay = self._next_delivery - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)  # updates arriving meanwhile are coalesced
+        with self._cond:
+            if not self._changed and not self.closed:
+                self._cond.wait(timeout)
+            changed = list(self._changed)
+            self._changed.clear()
+        if changed:
+            self._next_delivery = time.monotonic() + self.min_interval
+        return changed
+    
+    def close(self):
+        """Stop receiving notifications (idempotent)."""
+        self._manager.unsubscribe(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
 class JobManager:
     """
     Thread-safe job manager for background operations.
@@ -208,28 +309,65 @@ class JobManager:
         manager.update_phase(job_id, JobPhase.EXTRACTING)
         manager.update_checker_progress(job_id, 'grammar', 5, 20)
         manager.complete_job(job_id, result={'issues': [...]})
+    
+    Or let the manager's worker pool run it:
+        manager.submit(job_id, run_review, job_id, filepath)  # may raise QueueFullError
+    
+    Follow changes without polling:
+        subscription = manager.subscribe(job_ids=[job_id])
+        for changed_id in subscription.next_changes(timeout=15): ...
+        subscription.close()
     """
     
-    def __init__(self, max_jobs: int = 100, job_ttl: float = 3600):
+    def __init__(self, max_jobs: int = 100, job_ttl: float = 3600,
+                 workers: int = DEFAULT_WORKERS, queue_limit: int = DEFAULT_QUEUE_LIMIT,
+                 pool_mode: str = DEFAULT_POOL_MODE,
+                 type_limits: Optional[Dict[str, int]] = None):
         """
         Initialize job manager.
         
         Args:
             max_jobs: Maximum jobs to keep in memory
             job_ttl: Time-to-live for completed jobs (seconds)
+            workers: Jobs run at once by submit() (worker threads, started lazily)
+            queue_limit: Jobs that may wait for a worker before submit() refuses more
+            pool_mode: 'thread', or 'process' to run in_process=False jobs in
+                a process pool of the same size
+            type_limits: Optional cap on running jobs per job type, so one
+                type cannot occupy every worker
         """
+        if pool_mode not in ('thread', 'process'):
+            raise ValueError(f"Unknown pool mode: {pool_mode}")
         self._jobs: Dict[str, Job] = {}
         self._lock = threading.RLock()
         self._max_jobs = max_jobs
         self._job_ttl = job_ttl
-    
-    def create_job(self, job_type: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+        
+        self._workers = max(1, workers)
+        self._queue_limit = max(0, queue_limit)
+        self._pool_mode = pool_mode
+        self._type_limits = dict(type_limits or {})
+        # job_type -> heap of (priority, submit sequence, job_id)
+        self._queues: Dict[str, List[tuple]] = {}
+        self._tasks: Dict[str, tuple] = {}
+        self._running: Dict[str, int] = {}
+        self._submit_seq = 0
+        self._durations = deque(maxlen=50)
+        self._work_available = threading.Condition(self._lock)
+        self._workers_threads: List[threading.Thread] = []
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._shutdown = False
+        self._subscribers: List[JobSubscription] = []
+    
+    def create_job(self, job_type: str, metadata: Optional[Dict[str, Any]] = None,
+                   job_id: Optional[str] = None) -> str:
         """
         Create a new job and return its ID.
         
         Args:
             job_type: Type of job ('review', 'export', etc.)
             metadata: Optional metadata (filename, options, etc.)
+            job_id: Reuse an existing ID (e.g. when resuming a checkpointed job)
         
         Returns:
             Unique job ID
@@ -238,7 +376,7 @@ class JobManager:
             # Clean up old jobs if at capacity
             self._cleanup_old_jobs()
             
-            job_id = str(uuid.uuid4())[:8]  # Short ID for readability
+            job_id = job_id or str(uuid.uuid4())[:8]  # Short ID for readability
             job = Job(
                 job_id=job_id,
                 job_type=job_type,
@@ -261,6 +399,7 @@ class JobManager:
             job.status = JobStatus.RUNNING
             job.started_at = time.time()
             job.progress.phase = JobPhase.QUEUED
+            self._publish(job)
             return True
     
     def update_phase(self, job_id: str, phase: JobPhase, log_message: Optional[str] = None) -> bool:
@@ -284,6 +423,7 @@ class JobManager:
             if log_message:
                 job.progress.last_log = log_message
             
+            self._publish(job)
             return True
     
     def update_phase_progress(self, job_id: str, progress: float, log_message: Optional[str] = None) -> bool:
@@ -314,6 +454,7 @@ class JobManager:
             if log_message:
                 job.progress.last_log = log_message
             
+            self._publish(job)
             return True
     
     def update_checker_progress(self, job_id: str, checker_name: str, 
@@ -345,6 +486,7 @@ class JobManager:
                     f"Running {checker_name}..."
                 )
             
+            self._publish(job)
             return True
     
     def complete_job(self, job_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
@@ -368,8 +510,52 @@ class JobManager:
             job.result = result
             job.progress.last_log = "Complete"
             
+            self._publish(job)
+            return True
+    
+    def update_job_result(self, job_id: str, result: Dict[str, Any],
+                          metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Replace the result of a job that already finished, e.g. when a
+        follow-up sub-job merges more data into it.
+        
+        Args:
+            job_id: Job ID
+            result: New result data
+            metadata: Optional metadata keys to merge into the job's metadata
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job:
+                return False
+            
+            job.result = result
+            if metadata:
+                job.metadata.update(metadata)
+            
+            self._publish(job)
             return True
     
+    def release_result(self, result: Dict[str, Any]) -> int:
+        """
+        Drop jobs' references to a result object that is kept elsewhere.
+        
+        Used when the session store moves a review's results out of memory,
+        so finished jobs stop keeping them alive. Each such job's result
+        becomes None and its metadata gets 'result_released' = True.
+        
+        Returns:
+            Number of jobs whose result was released
+        """
+        with self._lock:
+            released = 0
+            for job in self._jobs.values():
+                if job.result is result:
+                    job.result = None
+                    job.metadata['result_released'] = True
+                    released += 1
+            return released
+    
     def fail_job(self, job_id: str, error: str) -> bool:
         """
         Mark job as failed with error message.
@@ -389,6 +575,7 @@ class JobManager:
             job.error = error
             job.progress.last_log = f"Error: {error}"
             
+            self._publish(job)
             return True
     
     def cancel_job(self, job_id: str) -> bool:
@@ -407,11 +594,19 @@ class JobManager:
                 return False
             
             job.cancel()
+            queue = self._queues.get(job.job_type)
+            if job_id in self._tasks and queue:
+                self._queues[job.job_type] = [e for e in queue if e[2] != job_id]
+                heapq.heapify(self._queues[job.job_type])
+                del self._tasks[job_id]
+                self._renumber_queue()
+            self._publish(job)
             return True
     
     def list_jobs(self, status: Optional[JobStatus] = None, 
                    job_type: Optional[str] = None,
-                   limit: int = 20) -> List[Dict[str, Any]]:
+                   limit: int = 20,
+                   session_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List jobs with optional filtering.
         
@@ -419,6 +614,7 @@ class JobManager:
             status: Filter by status
             job_type: Filter by job type
             limit: Maximum results
+            session_id: Filter by the session that started the job
         
         Returns:
             List of job dictionaries
@@ -431,6 +627,8 @@ class JobManager:
                 jobs = [j for j in jobs if j.status == status]
             if job_type:
                 jobs = [j for j in jobs if j.job_type == job_type]
+            if session_id:
+                jobs = [j for j in jobs if j.metadata.get('session_id') == session_id]
             
             # Sort by created_at descending
             jobs.sort(key=lambda j: j.created_at, reverse=True)
@@ -440,6 +638,203 @@ class JobManager:
             
             return [j.to_dict() for j in jobs]
     
+    # -------------------------------------------------------------------------
+    # Subscriptions
+    # -------------------------------------------------------------------------
+    
+    def subscribe(self, job_ids: Optional[List[str]] = None,
+                  session_id: Optional[str] = None,
+                  min_interval: float = EVENT_MIN_INTERVAL_SECONDS) -> JobSubscription:
+        """
+        Subscribe to changes of specific jobs and/or every job of a session.
+        
+        Subscribe before reading the jobs' initial state, so no change is
+        missed in between. Call close() on the subscription when done.
+        """
+        subscription = JobSubscription(self, job_ids, session_id, min_interval)
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription: JobSubscription):
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+    
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+    
+    def _publish(self, job: Job):
+        """Wake the subscribers of a job that just changed (caller holds the lock)."""
+        for subscription in self._subscribers:
+            if subscription.matches(job):
+                subscription.notify(job.job_id)
+    
+    # -------------------------------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------------------------------
+    
+    def submit(self, job_id: str, fn: Callable, *args, priority: Optional[int] = None,
+               in_process: bool = True, bypass_limit: bool = False, **kwargs) -> int:
+        """
+        Queue a created job to run fn(*args, **kwargs) on the worker pool.
+        
+        Jobs are dispatched by priority (lower first; defaults to the job
+        type's JOB_TYPE_PRIORITIES entry), then in submission order. If fn
+        returns without completing or failing the job, it is completed with
+        fn's return value (when a dict); an exception fails it.
+        
+        Args:
+            job_id: A job from create_job()
+            fn: Work to run
+            priority: Override the job type's priority
+            in_process: With a process pool, False runs fn in a worker process
+                (fn and its arguments must be picklable, and it cannot report
+                progress); True always runs it on a worker thread
+            bypass_limit: Admit even when the queue is full (follow-up work of
+                an already admitted job)
+        
+        Returns:
+            1-based queue position
+        
+        Raises:
+            QueueFullError: The queue is at queue_limit; the job is discarded
+            KeyError: Unknown job_id
+        """
+        with self._lock:
+            job = self._jobs[job_id]
+            queued = sum(len(q) for q in self._queues.values())
+            if queued >= self._queue_limit and not bypass_limit:
+                del self._jobs[job_id]
+                raise QueueFullError(job.job_type, queued, self._queue_limit,
+                                     self._retry_after())
+            
+            if priority is None:
+                priority = JOB_TYPE_PRIORITIES.get(job.job_type, DEFAULT_JOB_PRIORITY)
+            self._submit_seq += 1
+            heapq.heappush(self._queues.setdefault(job.job_type, []),
+                           (priority, self._submit_seq, job_id))
+            self._tasks[job_id] = (fn, args, kwargs, in_process)
+            job.metadata['priority'] = priority
+            self._ensure_workers()
+            self._renumber_queue()
+            self._work_available.notify()
+            return job.queue_position
+    
+    def _retry_after(self) -> int:
+        """Seconds until a queue slot is likely to free up (for 429 responses)."""
+        if self._durations:
+            average = sum(self._durations) / len(self._durations)
+        else:
+            average = DEFAULT_JOB_SECONDS
+        return max(1, min(MAX_RETRY_AFTER_SECONDS, int(math.ceil(average / self._workers))))
+    
+    def _renumber_queue(self):
+        """Refresh queue_position (and the queued log line) of every queued job."""
+        entries = sorted(entry for queue in self._queues.values() for entry in queue)
+        for position, (_, _, job_id) in enumerate(entries, start=1):
+            job = self._jobs.get(job_id)
+            if job:
+                if job.queue_position != position:
+                    job.queue_position = position
+                    job.progress.last_log = f"Queued (position {position})"
+                    self._publish(job)
+    
+    def _ensure_workers(self):
+        alive = [t for t in self._workers_threads if t.is_alive()]
+        self._workers_threads = alive
+        while len(self._workers_threads) < self._workers:
+            worker = threading.Thread(target=self._worker_loop, daemon=True,
+                                      name=f"job-worker-{len(self._workers_threads) + 1}")
+            self._workers_threads.append(worker)
+            worker.start()
+    
+    def _next_entry(self) -> Optional[tuple]:
+        """Pop the best queued entry whose job type is under its running limit."""
+        best = None
+        for job_type, queue in self._queues.items():
+            if not queue:
+                continue
+            limit = self._type_limits.get(job_type)
+            if limit is not None and self._running.get(job_type, 0) >= limit:
+                continue
+            if best is None or queue[0] < self._queues[best][0]:
+                best = job_type
+        if best is None:
+            return None
+        return best, heapq.heappop(self._queues[best])
+    
+    def _worker_loop(self):
+        while True:
+            with self._lock:
+                entry = self._next_entry()
+                while entry is None:
+                    if self._shutdown:
+                        return
+                    self._work_available.wait()
+                    entry = self._next_entry()
+                job_type, (_, _, job_id) = entry
+                fn, args, kwargs, in_process = self._tasks.pop(job_id)
+                job = self._jobs.get(job_id)
+                self._renumber_queue()
+                if job is None or job.is_cancelled:
+                    continue
+                job.queue_position = None
+                self._running[job_type] = self._running.get(job_type, 0) + 1
+            
+            started = time.time()
+            self.start_job(job_id)
+            try:
+                if in_process or self._pool_mode != 'process':
+                    result = fn(*args, **kwargs)
+                else:
+                    result = self._get_process_pool().submit(fn, *args, **kwargs).result()
+                with self._lock:
+                    if job.status in (JobStatus.PENDING, JobStatus.RUNNING):
+                        self.complete_job(job_id, result if isinstance(result, dict) else None)
+            except Exception as e:
+                with self._lock:
+                    if job.status in (JobStatus.PENDING, JobStatus.RUNNING):
+                        self.fail_job(job_id, str(e))
+            finally:
+                with self._lock:
+                    self._running[job_type] -= 1
+                    self._durations.append(time.time() - started)
+                    # A type-limited job finishing can unblock a queued one
+                    self._work_available.notify_all()
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self._workers)
+            return self._process_pool
+    
+    def scheduler_stats(self) -> Dict[str, Any]:
+        """Worker pool size and queued/running job counts by job type."""
+        with self._lock:
+            return {
+                'workers': self._workers,
+                'pool_mode': self._pool_mode,
+                'queue_limit': self._queue_limit,
+                'queued': {t: len(q) for t, q in self._queues.items() if q},
+                'running': {t: n for t, n in self._running.items() if n},
+                'retry_after_seconds': self._retry_after(),
+            }
+    
+    def shutdown(self, wait: bool = False):
+        """Stop the workers once the queue is empty (running jobs finish)."""
+        with self._lock:
+            self._shutdown = True
+            self._work_available.notify_all()
+            workers = list(self._workers_threads)
+            pool, self._process_pool = self._process_pool, None
+        if wait:
+            for worker in workers:
+                worker.join()
+        if pool is not None:
+            pool.shutdown(wait=wait)
+    
     def _cleanup_old_jobs(self):
         """Remove old completed jobs."""
         with self._lock:
@@ -474,7 +869,10 @@ def get_job_manager() -> JobManager:
     """Get or create the global job manager instance."""
     global _job_manager
     if _job_manager is None:
-        _job_manager = JobManager()
+        # Hyperlink validation waits on the network: leave workers for reviews
+        _job_manager = JobManager(type_limits={
+            'hyperlink_validation': max(1, DEFAULT_WORKERS // 2)
+        })
     return _job_manager
 
 
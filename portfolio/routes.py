@@ -17,6 +17,9 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from flask import Blueprint, jsonify, request
 
+# Shared pooled WAL connections
+from sqlite_pool import connect as db_connect
+
 # Set up logging
 logger = logging.getLogger('portfolio')
 
@@ -45,7 +48,37 @@ def _get_db_path():
 def _get_db_connection():
     """Get a database connection."""
     db_path = _get_db_path()
-    return sqlite3.connect(db_path)
+    return db_connect(db_path)
+
+
+def _json_column(value, default):
+    """Decode a denormalized JSON summary column from the scans table."""
+    if not value:
+        return default
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _load_text(cursor, text_hash):
+    """Load a scan's stored document text fields."""
+    try:
+        from scan_history import load_scan_text
+        return load_scan_text(cursor, text_hash)
+    except Exception as e:
+        logger.warning(f"Could not load document text {text_hash}: {e}")
+        return {}
+
+
+def _load_issues(cursor, scan_id, limit=None):
+    """Load the first issues of a compact scan from the scan_issues table."""
+    try:
+        from scan_history import load_scan_issues
+        return load_scan_issues(cursor, scan_id, limit)
+    except Exception as e:
+        logger.warning(f"Could not load issues for scan {scan_id}: {e}")
+        return []
 
 
 def _format_timestamp(timestamp_str):
@@ -123,11 +156,12 @@ def get_batches():
         conn = _get_db_connection()
         cursor = conn.cursor()
 
-        # Get all scans with document info, ordered by time
+        # Get all scans with document info, ordered by time. Batch id and
+        # top categories are denormalized onto each scan by record_scan.
         cursor.execute('''
             SELECT
                 s.id, s.document_id, s.scan_time, s.score, s.grade,
-                s.issue_count, s.word_count, s.results_json,
+                s.issue_count, s.word_count, s.top_categories, s.batch_id,
                 d.filename, d.scan_count
             FROM scans s
             JOIN documents d ON s.document_id = d.id
@@ -146,22 +180,20 @@ def get_batches():
                 'stats': {'total_documents': 0, 'total_batches': 0}
             })
 
-        # Group scans into batches (within 5 minute windows)
+        # Group consecutive scans sharing a batch id
         batches = []
         singles = []
         current_batch = []
-        batch_start_time = None
+        current_batch_id = None
 
-        for scan in scans:
-            scan_id, doc_id, scan_time, score, grade, issue_count, word_count, results_json, filename, scan_count = scan
-
-            scan_dt = datetime.fromisoformat(scan_time.replace('Z', '+00:00')) if scan_time else datetime.now()
+        def flush(documents, batch_id):
+            if len(documents) >= 2:
+                batches.append(_create_batch_summary(documents, batch_id))
+            else:
+                singles.extend(documents)
 
-            # Parse results for additional info
-            try:
-                results = json.loads(results_json) if results_json else {}
-            except:
-                results = {}
+        for scan in scans:
+            scan_id, doc_id, scan_time, score, grade, issue_count, word_count, top_categories, batch_id, filename, scan_count = scan
 
             doc_data = {
                 'id': scan_id,
@@ -175,31 +207,20 @@ def get_batches():
                 'issue_count': issue_count or 0,
                 'word_count': word_count or 0,
                 'scan_count': scan_count or 1,
-                'categories': list(results.get('by_category', {}).keys())[:3]
+                'categories': _json_column(top_categories, [])
             }
 
-            if batch_start_time is None:
-                batch_start_time = scan_dt
-                current_batch = [doc_data]
-            elif (batch_start_time - scan_dt).total_seconds() <= 300:  # 5 minutes
+            if current_batch and batch_id and batch_id == current_batch_id:
                 current_batch.append(doc_data)
             else:
-                # Save current batch
-                if len(current_batch) >= 2:
-                    batches.append(_create_batch_summary(current_batch))
-                else:
-                    singles.extend(current_batch)
-
-                # Start new batch
-                batch_start_time = scan_dt
+                if current_batch:
+                    flush(current_batch, current_batch_id)
                 current_batch = [doc_data]
+                current_batch_id = batch_id
 
         # Don't forget the last batch
         if current_batch:
-            if len(current_batch) >= 2:
-                batches.append(_create_batch_summary(current_batch))
-            else:
-                singles.extend(current_batch)
+            flush(current_batch, current_batch_id)
 
         return jsonify({
             'success': True,
@@ -220,8 +241,8 @@ def get_batches():
         }), 500
 
 
-def _create_batch_summary(documents):
-    """Create a batch summary from a list of documents."""
+def _create_batch_summary(documents, batch_id=None):
+    """Create a batch summary from a list of documents (newest first)."""
     if not documents:
         return None
 
@@ -239,10 +260,10 @@ def _create_batch_summary(documents):
     # Get dominant grade
     dominant_grade = max(grades.keys(), key=lambda k: grades[k]) if grades else 'N/A'
 
-    # Create batch ID from first scan time
-    # Handle both "2026-01-31T12:34:18" and "2026-01-31 12:34:18" formats
     first_time = documents[0]['scan_time']
-    batch_id = f"batch_{first_time[:19].replace('-', '').replace(':', '').replace('T', '_').replace(' ', '_')}"
+    if not batch_id:
+        # Handle both "2026-01-31T12:34:18" and "2026-01-31 12:34:18" formats
+        batch_id = f"batch_{first_time[:19].replace('-', '').replace(':', '').replace('T', '_').replace(' ', '_')}"
 
     return {
         'id': batch_id,
@@ -282,29 +303,30 @@ def get_batch_details(batch_id):
         conn = _get_db_connection()
         cursor = conn.cursor()
 
-        # Get scans within 5 minutes of the batch timestamp
-        cursor.execute('''
+        columns = '''
             SELECT
                 s.id, s.document_id, s.scan_time, s.score, s.grade,
-                s.issue_count, s.word_count, s.results_json,
+                s.issue_count, s.word_count, s.severity_counts, s.category_counts,
                 d.filename, d.filepath, d.scan_count
             FROM scans s
             JOIN documents d ON s.document_id = d.id
-            WHERE datetime(s.scan_time) BETWEEN datetime(?, '-5 minutes') AND datetime(?, '+5 minutes')
+        '''
+        cursor.execute(columns + '''
+            WHERE s.batch_id = ?
             ORDER BY s.scan_time DESC
-        ''', (timestamp, timestamp))
-
+        ''', (batch_id,))
         scans = cursor.fetchall()
-        conn.close()
+        if not scans:
+            # Ids not assigned by record_scan: scans within 5 minutes of the timestamp
+            cursor.execute(columns + '''
+                WHERE datetime(s.scan_time) BETWEEN datetime(?, '-5 minutes') AND datetime(?, '+5 minutes')
+                ORDER BY s.scan_time DESC
+            ''', (timestamp, timestamp))
+            scans = cursor.fetchall()
 
         documents = []
         for scan in scans:
-            scan_id, doc_id, scan_time, score, grade, issue_count, word_count, results_json, filename, filepath, scan_count = scan
-
-            try:
-                results = json.loads(results_json) if results_json else {}
-            except:
-                results = {}
+            scan_id, doc_id, scan_time, score, grade, issue_count, word_count, severity_counts, category_counts, filename, filepath, scan_count = scan
 
             documents.append({
                 'id': scan_id,
@@ -319,17 +341,19 @@ def get_batch_details(batch_id):
                 'issue_count': issue_count or 0,
                 'word_count': word_count or 0,
                 'scan_count': scan_count or 1,
-                'by_severity': results.get('by_severity', {}),
-                'by_category': results.get('by_category', {}),
-                'top_issues': results.get('issues', [])[:3]
+                'by_severity': _json_column(severity_counts, {}),
+                'by_category': _json_column(category_counts, {}),
+                'top_issues': _load_issues(cursor, scan_id, limit=3)
             })
 
+        conn.close()
+
         if not documents:
             return jsonify({'success': False, 'error': 'Batch not found'}), 404
 
         return jsonify({
             'success': True,
-            'batch': _create_batch_summary(documents),
+            'batch': _create_batch_summary(documents, batch_id),
             'documents': documents
         })
 
@@ -355,30 +379,27 @@ def get_document_preview(scan_id):
         cursor.execute('''
             SELECT
                 s.id, s.document_id, s.scan_time, s.score, s.grade,
-                s.issue_count, s.word_count, s.results_json,
-                d.filename, d.filepath
+                s.issue_count, s.word_count, s.severity_counts, s.category_counts,
+                s.text_hash, d.filename, d.filepath
             FROM scans s
             JOIN documents d ON s.document_id = d.id
             WHERE s.id = ?
         ''', (scan_id,))
 
         row = cursor.fetchone()
-        conn.close()
-
         if not row:
+            conn.close()
             return jsonify({'success': False, 'error': 'Document not found'}), 404
 
-        scan_id, doc_id, scan_time, score, grade, issue_count, word_count, results_json, filename, filepath = row
+        scan_id, doc_id, scan_time, score, grade, issue_count, word_count, severity_counts, category_counts, text_hash, filename, filepath = row
 
-        try:
-            results = json.loads(results_json) if results_json else {}
-        except:
-            results = {}
+        issues = _load_issues(cursor, scan_id, limit=5)
+        text = _load_text(cursor, text_hash)
+        conn.close()
 
         # Get top issues for preview
-        issues = results.get('issues', [])
         top_issues = []
-        for issue in issues[:5]:
+        for issue in issues:
             top_issues.append({
                 'category': issue.get('category', 'Unknown'),
                 'severity': issue.get('severity', 'Low'),
@@ -396,10 +417,10 @@ def get_document_preview(scan_id):
                 'grade_color': _get_grade_color(grade),
                 'issue_count': issue_count or 0,
                 'word_count': word_count or 0,
-                'by_severity': results.get('by_severity', {}),
-                'by_category': results.get('by_category', {}),
+                'by_severity': _json_column(severity_counts, {}),
+                'by_category': _json_column(category_counts, {}),
                 'top_issues': top_issues,
-                'full_text_preview': (results.get('full_text', '') or '')[:200] + '...'
+                'full_text_preview': (text.get('full_text', '') or '')[:200] + '...'
             }
         })
 
@@ -468,55 +489,26 @@ def get_portfolio_stats():
     Get overall portfolio statistics.
     """
     try:
-        conn = _get_db_connection()
-        cursor = conn.cursor()
-
-        # Total documents
-        cursor.execute('SELECT COUNT(*) FROM documents')
-        total_docs = cursor.fetchone()[0]
+        from scan_history import get_portfolio_summary
 
-        # Total scans
-        cursor.execute('SELECT COUNT(*) FROM scans')
-        total_scans = cursor.fetchone()[0]
-
-        # Average score
-        cursor.execute('SELECT AVG(score) FROM scans WHERE score IS NOT NULL')
-        avg_score = cursor.fetchone()[0] or 0
-
-        # Grade distribution
-        cursor.execute('''
-            SELECT grade, COUNT(*)
-            FROM scans
-            WHERE grade IS NOT NULL
-            GROUP BY grade
-        ''')
-        grade_dist = dict(cursor.fetchall())
-
-        # Recent trend (last 7 days vs previous 7 days)
-        cursor.execute('''
-            SELECT AVG(score) FROM scans
-            WHERE scan_time >= datetime('now', '-7 days')
-        ''')
-        recent_avg = cursor.fetchone()[0] or 0
-
-        cursor.execute('''
-            SELECT AVG(score) FROM scans
-            WHERE scan_time >= datetime('now', '-14 days')
-            AND scan_time < datetime('now', '-7 days')
-        ''')
-        prev_avg = cursor.fetchone()[0] or 0
+        conn = _get_db_connection()
+        try:
+            # Totals are maintained in portfolio_stats by record_scan
+            summary = get_portfolio_summary(conn.cursor())
+        finally:
+            conn.close()
 
+        recent_avg = summary['recent_avg']
+        prev_avg = summary['prev_avg']
         trend = 'up' if recent_avg > prev_avg else ('down' if recent_avg < prev_avg else 'stable')
 
-        conn.close()
-
         return jsonify({
             'success': True,
             'stats': {
-                'total_documents': total_docs,
-                'total_scans': total_scans,
-                'avg_score': round(avg_score, 1),
-                'grade_distribution': grade_dist,
+                'total_documents': summary['total_documents'],
+                'total_scans': summary['total_scans'],
+                'avg_score': round(summary['avg_score'], 1),
+                'grade_distribution': summary['grade_distribution'],
                 'trend': trend,
                 'trend_value': round(recent_avg - prev_avg, 1)
             }
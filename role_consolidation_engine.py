@@ -30,7 +30,7 @@ import math
 try:
     from role_management_studio_v3 import (
         RoleDatabase, StandardRole, RoleResponsibility, 
-        SourceDocument, StudioSettings
+        SourceDocument, StudioSettings, open_role_database
     )
 except ImportError:
     # Will be provided when integrated into another tool
@@ -1067,10 +1067,8 @@ class RoleConsolidationEngine:
                     primary.confidence_avg = (primary.confidence_avg + secondary.confidence_avg) / 2
                     
                     # Update responsibilities to point to primary
-                    for resp_data in self.database._data["responsibilities"].values():
-                        if resp_data.get("role_id") == secondary_id:
-                            resp_data["role_id"] = primary.id
-                            results["responsibilities_updated"] += 1
+                    results["responsibilities_updated"] += self.database.reassign_responsibilities(
+                        secondary_id, primary.id)
                     
                     # Delete secondary role
                     self.database.delete_role(secondary_id)
@@ -1190,7 +1188,7 @@ def main():
         # Load database
         settings = StudioSettings()
         settings.database_path = args.database
-        database = RoleDatabase(settings)
+        database = open_role_database(settings)
         
         engine = RoleConsolidationEngine(database)
         candidates = engine.find_consolidation_candidates(args.min_similarity)
@@ -138,10 +138,10 @@ class RoleIntegration:
         # Try to import database (optional)
         if self.database_path:
             try:
-                from role_management_studio_v3 import RoleDatabase, StudioSettings
+                from role_management_studio_v3 import StudioSettings, open_role_database
                 settings = StudioSettings()
                 settings.database_path = self.database_path
-                self._database = RoleDatabase(settings)
+                self._database = open_role_database(settings)
                 _log(f"Loaded RoleDatabase: {self.database_path}")
             except ImportError as e:
                 _log(f"RoleDatabase not available: {e}", level='debug')
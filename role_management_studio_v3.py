@@ -17,6 +17,8 @@ import sys
 import json
 import hashlib
 import shutil
+import sqlite3
+import threading
 import time
 import uuid
 from datetime import datetime
@@ -54,11 +56,16 @@ except ImportError:
 # CONFIGURATION / SETTINGS
 # =============================================================================
 
+# database_path endings that select the SQLite backend
+SQLITE_EXTENSIONS = (".sqlite", ".sqlite3", ".db")
+
 @dataclass
 class StudioSettings:
     """User-configurable settings."""
     
     database_path: str = "role_database.json"
+    # "json" (one registry file) or "sqlite" (row-level storage, see SQLiteRoleDatabase)
+    storage_backend: str = "json"
     use_shared_drive: bool = False
     shared_drive_path: str = ""
     
@@ -84,11 +91,24 @@ class StudioSettings:
                 setattr(defaults, key, value)
         return defaults
     
-    def get_effective_db_path(self) -> str:
+    def get_json_db_path(self) -> str:
+        """Path of the JSON registry (also the SQLite backend's import/export format)."""
         if self.use_shared_drive and self.shared_drive_path:
             return os.path.join(self.shared_drive_path, "role_database.json")
+        if self.database_path.endswith(SQLITE_EXTENSIONS):
+            return os.path.splitext(self.database_path)[0] + ".json"
         return self.database_path
     
+    def uses_sqlite(self) -> bool:
+        return self.storage_backend == "sqlite" or self.database_path.endswith(SQLITE_EXTENSIONS)
+    
+    def get_effective_db_path(self) -> str:
+        if self.uses_sqlite():
+            if self.database_path.endswith(SQLITE_EXTENSIONS) and not self.use_shared_drive:
+                return self.database_path
+            return os.path.splitext(self.get_json_db_path())[0] + ".sqlite"
+        return self.get_json_db_path()
+    
     def get_lock_file_path(self) -> str:
         return self.get_effective_db_path() + ".lock"
     
@@ -512,6 +532,9 @@ class RoleDatabase:
         self._user_id = f"{self.settings.user_name or os.environ.get('USER', 'user')}_{uuid.uuid4().hex[:6]}"
         self._data = None
         self._last_load_time = 0
+        # (collection, key) of rows changed since the last save; collection is
+        # "documents", "roles", "responsibilities", "relationships" or "meta"
+        self._dirty: Set[Tuple[str, str]] = set()
         
         db_dir = os.path.dirname(self.filepath)
         if db_dir and not os.path.exists(db_dir):
@@ -613,6 +636,7 @@ class RoleDatabase:
             
             shutil.move(temp_path, self.filepath)
             self._last_load_time = time.time()
+            self._dirty.clear()
     
     def _merge_external_changes(self):
         """Merge changes from external modifications."""
@@ -672,6 +696,44 @@ class RoleDatabase:
         if self.settings.auto_save:
             self.save()
     
+    def _touch(self, collection: str, key: str):
+        """Mark a row as changed (or deleted) for the next save."""
+        self._dirty.add((collection, key))
+    
+    @staticmethod
+    def _relationship_key(rel_data: dict) -> str:
+        return "\x1f".join((rel_data["source_role_id"], rel_data["target_role_id"],
+                             rel_data["relationship_type"]))
+    
+    @contextmanager
+    def batch_updates(self):
+        """Save once after a group of mutations instead of after each one."""
+        auto_save = self.settings.auto_save
+        self.settings.auto_save = False
+        try:
+            yield self
+        finally:
+            self.settings.auto_save = auto_save
+        if auto_save:
+            self.save()
+    
+    def export_json(self, filepath: str):
+        """Write the whole registry in the JSON backend's file format."""
+        temp_path = filepath + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, indent=2, ensure_ascii=False)
+        shutil.move(temp_path, filepath)
+    
+    def import_json(self, filepath: str):
+        """Replace the registry with the contents of a JSON registry file."""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        base = self._create_new_database()
+        base.update(data)
+        self._data = base
+        self._migrate_if_needed()
+        self.save(force=True)
+    
     # =========================================================================
     # DOCUMENT REGISTRY OPERATIONS
     # =========================================================================
@@ -683,6 +745,7 @@ class RoleDatabase:
         
         is_new = doc.id not in self._data["documents"]
         self._data["documents"][doc.id] = doc.to_dict()
+        self._touch("documents", doc.id)
         
         self._log_change(
             "add_document" if is_new else "update_document",
@@ -758,6 +821,7 @@ class RoleDatabase:
         
         if notes:
             doc_data["notes"] = (doc_data.get("notes", "") + f"\n[{datetime.now().strftime('%Y-%m-%d')}] Status changed to {new_status}: {notes}").strip()
+        self._touch("documents", doc_id)
         
         # Update responsibility active flags
         self._update_responsibilities_for_document_status(doc_id, new_status == "active")
@@ -774,17 +838,17 @@ class RoleDatabase:
         if doc_id in self._data["documents"]:
             doc_name = self._data["documents"][doc_id].get("filename", "Unknown")
             del self._data["documents"][doc_id]
+            self._touch("documents", doc_id)
             
             # Remove related responsibilities
-            self._data["responsibilities"] = {
-                k: v for k, v in self._data["responsibilities"].items()
-                if v.get("source_document_id") != doc_id
-            }
+            self._data["responsibilities"] = self._without_responsibilities(
+                lambda v: v.get("source_document_id") == doc_id)
             
             # Update roles
-            for role_data in self._data["roles"].values():
+            for role_id, role_data in self._data["roles"].items():
                 if doc_id in role_data.get("source_document_ids", []):
                     role_data["source_document_ids"].remove(doc_id)
+                    self._touch("roles", role_id)
             
             self._recalculate_role_document_counts()
             
@@ -813,9 +877,32 @@ class RoleDatabase:
     def add_responsibility(self, resp: RoleResponsibility) -> bool:
         """Add a responsibility mapping."""
         self._data["responsibilities"][resp.id] = resp.to_dict()
+        self._touch("responsibilities", resp.id)
         self._auto_save()
         return True
     
+    def reassign_responsibilities(self, from_role_id: str, to_role_id: str) -> int:
+        """Point all of a role's responsibilities at another role; returns how many."""
+        moved = 0
+        for resp_id, resp_data in self._data["responsibilities"].items():
+            if resp_data.get("role_id") == from_role_id:
+                resp_data["role_id"] = to_role_id
+                self._touch("responsibilities", resp_id)
+                moved += 1
+        if moved:
+            self._auto_save()
+        return moved
+    
+    def _without_responsibilities(self, predicate) -> dict:
+        """Responsibilities minus those matching predicate (which are marked deleted)."""
+        kept = {}
+        for resp_id, resp_data in self._data["responsibilities"].items():
+            if predicate(resp_data):
+                self._touch("responsibilities", resp_id)
+            else:
+                kept[resp_id] = resp_data
+        return kept
+    
     def get_responsibilities_for_role(self, role_id: str, 
                                       active_only: bool = True) -> List[RoleResponsibility]:
         """Get all responsibilities for a role."""
@@ -842,8 +929,10 @@ class RoleDatabase:
     
     def _update_responsibilities_for_document_status(self, doc_id: str, is_active: bool):
         """Update responsibility active flags when document status changes."""
-        for resp_data in self._data["responsibilities"].values():
+        for resp_id, resp_data in self._data["responsibilities"].items():
             if resp_data.get("source_document_id") == doc_id:
+                if resp_data.get("is_active") != is_active:
+                    self._touch("responsibilities", resp_id)
                 resp_data["is_active"] = is_active
     
     def _recalculate_role_document_counts(self):
@@ -853,9 +942,12 @@ class RoleDatabase:
             if doc_data.get("status") == "active"
         }
         
-        for role_data in self._data["roles"].values():
+        for role_id, role_data in self._data["roles"].items():
             doc_ids = set(role_data.get("source_document_ids", []))
-            role_data["active_document_count"] = len(doc_ids & active_doc_ids)
+            count = len(doc_ids & active_doc_ids)
+            if role_data.get("active_document_count") != count:
+                role_data["active_document_count"] = count
+                self._touch("roles", role_id)
     
     # =========================================================================
     # ROLE OPERATIONS
@@ -868,6 +960,7 @@ class RoleDatabase:
         
         is_new = role.id not in self._data["roles"]
         self._data["roles"][role.id] = role.to_dict()
+        self._touch("roles", role.id)
         
         self._log_change(
             "add_role" if is_new else "update_role",
@@ -931,18 +1024,20 @@ class RoleDatabase:
         if role_id in self._data["roles"]:
             role_name = self._data["roles"][role_id].get("canonical_name", "Unknown")
             del self._data["roles"][role_id]
+            self._touch("roles", role_id)
             
             # Remove related responsibilities
-            self._data["responsibilities"] = {
-                k: v for k, v in self._data["responsibilities"].items()
-                if v.get("role_id") != role_id
-            }
+            self._data["responsibilities"] = self._without_responsibilities(
+                lambda v: v.get("role_id") == role_id)
             
             # Remove relationships
-            self._data["relationships"] = [
-                r for r in self._data["relationships"]
-                if r["source_role_id"] != role_id and r["target_role_id"] != role_id
-            ]
+            kept = []
+            for r in self._data["relationships"]:
+                if r["source_role_id"] != role_id and r["target_role_id"] != role_id:
+                    kept.append(r)
+                else:
+                    self._touch("relationships", self._relationship_key(r))
+            self._data["relationships"] = kept
             
             self._log_change("delete_role", role_id, f"Deleted: {role_name}")
             self._auto_save()
@@ -1090,10 +1185,13 @@ class RoleDatabase:
                     existing["strength"] = rel.strength
                     existing["evidence"].extend(rel.evidence)
                     existing["evidence"] = existing["evidence"][:10]
+                    self._touch("relationships", self._relationship_key(existing))
                 self._auto_save()
                 return True
         
-        self._data["relationships"].append(rel.to_dict())
+        rel_data = rel.to_dict()
+        self._data["relationships"].append(rel_data)
+        self._touch("relationships", self._relationship_key(rel_data))
         self._auto_save()
         return True
     
@@ -1248,6 +1346,244 @@ class RoleDatabase:
                 ])
 
 
+# =============================================================================
+# SQLITE STORAGE
+# =============================================================================
+
+class SQLiteRoleDatabase(RoleDatabase):
+    """
+    RoleDatabase stored row by row in SQLite.
+    
+    Each document, role, responsibility and relationship is one row in
+    `records`, so a save writes only the rows changed since the last save
+    (INSERT ... ON CONFLICT DO UPDATE) inside a single transaction, instead
+    of rewriting the whole registry under a file lock. Deletes are kept as
+    tombstone rows (data NULL).
+    
+    Concurrent users: every save bumps a sequence number and stamps the rows
+    it writes with it. Before writing, a save pulls rows other users stored
+    since this instance last synced; local unsaved changes win for the rows
+    they touch. refresh() pulls the same way when PRAGMA data_version shows
+    another connection committed.
+    
+    On a shared drive the database uses a rollback journal (WAL needs shared
+    memory, which network filesystems do not provide); otherwise WAL.
+    
+    The JSON registry format is kept for exchange: export_json()/import_json()
+    read and write it, and an empty database imports the JSON registry next
+    to it on first open.
+    """
+    
+    # Keys of the "meta" collection (top-level values that are not row sets)
+    META_KEYS = ("metadata", "settings", "extraction_history")
+    ROW_COLLECTIONS = ("documents", "roles", "responsibilities")
+    CHANGE_LOG_LIMIT = 1000
+    
+    def __init__(self, settings: StudioSettings = None):
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._synced_seq = 0
+        self._log_id = 0
+        self._data_version = None
+        self._pending_log: List[dict] = []
+        super().__init__(settings)
+    
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.filepath, timeout=self.settings.lock_timeout,
+                                   isolation_level=None, check_same_thread=False)
+            journal_mode = "DELETE" if self.settings.use_shared_drive else "WAL"
+            try:
+                conn.execute(f"PRAGMA journal_mode={journal_mode}")
+            except sqlite3.DatabaseError:
+                pass
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS records (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    collection TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    data TEXT,
+                    seq INTEGER NOT NULL,
+                    UNIQUE (collection, key)
+                );
+                CREATE INDEX IF NOT EXISTS idx_records_seq ON records(seq);
+                CREATE TABLE IF NOT EXISTS change_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    entry TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO sync_state (key, value) VALUES ('seq', 0);
+            ''')
+            self._conn = conn
+        return self._conn
+    
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def _load(self) -> dict:
+        with self._lock:
+            conn = self._connection()
+            self._data = self._create_new_database()
+            self._dirty.clear()
+            self._pending_log = []
+            self._synced_seq = 0
+            self._log_id = 0
+            self._data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            has_rows = conn.execute("SELECT 1 FROM records LIMIT 1").fetchone()
+            if has_rows:
+                self._pull_changes(conn)
+            else:
+                json_path = self.settings.get_json_db_path()
+                if os.path.exists(json_path):
+                    try:
+                        self.import_json(json_path)
+                        _log(f"Imported role registry {json_path} into {self.filepath}")
+                    except (json.JSONDecodeError, IOError) as e:
+                        _log(f"Could not import {json_path}: {e}", level='warning')
+            self._last_load_time = time.time()
+            return self._data
+    
+    def _apply_row(self, collection: str, key: str, value):
+        if collection in self.ROW_COLLECTIONS:
+            if value is None:
+                self._data[collection].pop(key, None)
+            else:
+                self._data[collection][key] = value
+        elif collection == "relationships":
+            rels = self._data["relationships"]
+            index = next((i for i, r in enumerate(rels) if self._relationship_key(r) == key), None)
+            if index is None:
+                if value is not None:
+                    rels.append(value)
+            elif value is None:
+                del rels[index]
+            else:
+                rels[index] = value
+        elif collection == "meta" and value is not None:
+            self._data[key] = value
+    
+    def _pull_changes(self, conn: sqlite3.Connection) -> int:
+        """Apply rows stored by other connections since the last sync; returns how many."""
+        rows = conn.execute(
+            "SELECT collection, key, data, seq FROM records WHERE seq > ? ORDER BY seq, id",
+            (self._synced_seq,)
+        ).fetchall()
+        for collection, key, data, seq in rows:
+            if (collection, key) not in self._dirty:
+                self._apply_row(collection, key, json.loads(data) if data is not None else None)
+            self._synced_seq = max(self._synced_seq, seq)
+        
+        entries = conn.execute(
+            "SELECT id, entry FROM change_log WHERE id > ? ORDER BY id", (self._log_id,)
+        ).fetchall()
+        if entries:
+            log = self._data.setdefault("change_log", [])
+            log.extend(json.loads(entry) for _, entry in entries)
+            del log[:-self.CHANGE_LOG_LIMIT]
+            self._log_id = entries[-1][0]
+        return len(rows)
+    
+    def refresh(self) -> bool:
+        with self._lock:
+            conn = self._connection()
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._data_version:
+                return False
+            self._data_version = version
+            changed = self._pull_changes(conn) > 0
+            if changed:
+                self._last_load_time = time.time()
+            return changed
+    
+    def _all_keys(self) -> Set[Tuple[str, str]]:
+        keys = {(c, k) for c in self.ROW_COLLECTIONS for k in self._data.get(c, {})}
+        keys.update(("relationships", self._relationship_key(r)) for r in self._data["relationships"])
+        keys.update(("meta", k) for k in self.META_KEYS if k in self._data)
+        return keys
+    
+    def save(self, force: bool = False):
+        """
+        Write changed rows in one transaction.
+        
+        With force, the database is made to match memory exactly: every row is
+        rewritten, rows missing from memory become tombstones and the change
+        log is replaced.
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if force:
+                    self._dirty = self._all_keys()
+                    stored = conn.execute(
+                        "SELECT collection, key FROM records WHERE data IS NOT NULL").fetchall()
+                    self._dirty.update(tuple(row) for row in stored)
+                else:
+                    self._pull_changes(conn)
+                
+                self._data["metadata"]["modified_date"] = datetime.now().isoformat()
+                self._data["metadata"]["last_modified_by"] = self.settings.user_name or os.environ.get("USER", "user")
+                self._touch("meta", "metadata")
+                
+                conn.execute("UPDATE sync_state SET value = value + 1 WHERE key = 'seq'")
+                seq = conn.execute("SELECT value FROM sync_state WHERE key = 'seq'").fetchone()[0]
+                
+                relationships = {self._relationship_key(r): r for r in self._data["relationships"]}
+                rows = []
+                for collection, key in self._dirty:
+                    if collection == "relationships":
+                        value = relationships.get(key)
+                    elif collection == "meta":
+                        value = self._data.get(key)
+                    else:
+                        value = self._data[collection].get(key)
+                    data = json.dumps(value, ensure_ascii=False) if value is not None else None
+                    rows.append((collection, key, data, seq))
+                conn.executemany('''
+                    INSERT INTO records (collection, key, data, seq) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (collection, key) DO UPDATE SET data = excluded.data, seq = excluded.seq
+                ''', rows)
+                
+                if force:
+                    conn.execute("DELETE FROM change_log")
+                    log_entries = self._data.get("change_log", [])[-self.CHANGE_LOG_LIMIT:]
+                else:
+                    log_entries = self._pending_log
+                conn.executemany("INSERT INTO change_log (entry) VALUES (?)",
+                                 [(json.dumps(e, ensure_ascii=False),) for e in log_entries])
+                conn.execute("DELETE FROM change_log WHERE id <= (SELECT MAX(id) FROM change_log) - ?",
+                             (self.CHANGE_LOG_LIMIT,))
+                log_id = conn.execute("SELECT MAX(id) FROM change_log").fetchone()[0]
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            
+            self._synced_seq = seq
+            self._log_id = log_id or 0
+            self._dirty.clear()
+            self._pending_log = []
+            self._last_load_time = time.time()
+    
+    def _log_change(self, action: str, target_id: str, details: str):
+        super()._log_change(action, target_id, details)
+        self._pending_log.append(self._data["change_log"][-1])
+
+
+def open_role_database(settings: StudioSettings = None) -> RoleDatabase:
+    """Open the role database with the storage backend the settings select."""
+    settings = settings or StudioSettings.load()
+    if settings.uses_sqlite():
+        return SQLiteRoleDatabase(settings)
+    return RoleDatabase(settings)
+
+
 # =============================================================================
 # RELATIONSHIP INFERENCE ENGINE
 # =============================================================================
@@ -1317,7 +1653,7 @@ class RoleManagementStudio:
     
     def __init__(self, settings: StudioSettings = None):
         self.settings = settings or StudioSettings.load()
-        self.database = RoleDatabase(self.settings)
+        self.database = open_role_database(self.settings)
         self.extractor = RoleExtractor()
         self.inference_engine = RelationshipInferenceEngine()
     
@@ -1361,72 +1697,74 @@ class RoleManagementStudio:
                 text = f.read()
             roles = self.extractor.extract_from_text(text, os.path.basename(filepath))
         
-        # 3. Process each role
-        roles_new = 0
-        roles_updated = 0
-        responsibilities_added = 0
+        # 3-6 are saved together once all rows are updated
+        with self.database.batch_updates():
+            # 3. Process each role
+            roles_new = 0
+            roles_updated = 0
+            responsibilities_added = 0
         
-        for name, data in roles.items():
-            category = self._categorize_role(name)
-            existing_role = self.database.get_role_by_name(name)
+            for name, data in roles.items():
+                category = self._categorize_role(name)
+                existing_role = self.database.get_role_by_name(name)
             
-            if existing_role:
-                # Update existing role
-                existing_role.usage_count += data.frequency
-                existing_role.confidence_avg = (existing_role.confidence_avg + data.avg_confidence) / 2
+                if existing_role:
+                    # Update existing role
+                    existing_role.usage_count += data.frequency
+                    existing_role.confidence_avg = (existing_role.confidence_avg + data.avg_confidence) / 2
                 
-                if doc.id not in existing_role.source_document_ids:
-                    existing_role.source_document_ids.append(doc.id)
+                    if doc.id not in existing_role.source_document_ids:
+                        existing_role.source_document_ids.append(doc.id)
                 
-                existing_role.last_modified_by = user_name
-                self.database.add_role(existing_role)
-                role_id = existing_role.id
-                roles_updated += 1
-            else:
-                # Create new role
-                standard_role = StandardRole.from_extracted(
-                    name, data, category, user_name, doc.id
-                )
-                self.database.add_role(standard_role)
-                role_id = standard_role.id
-                roles_new += 1
+                    existing_role.last_modified_by = user_name
+                    self.database.add_role(existing_role)
+                    role_id = existing_role.id
+                    roles_updated += 1
+                else:
+                    # Create new role
+                    standard_role = StandardRole.from_extracted(
+                        name, data, category, user_name, doc.id
+                    )
+                    self.database.add_role(standard_role)
+                    role_id = standard_role.id
+                    roles_new += 1
             
-            # 4. Create responsibility entries
-            for resp_text in data.responsibilities:
-                resp = RoleResponsibility(
-                    id=hashlib.md5(f"{role_id}{doc.id}{resp_text}".encode()).hexdigest()[:12],
-                    role_id=role_id,
-                    responsibility_text=resp_text,
-                    action_verb=self._extract_action_verb(resp_text),
-                    source_document_id=doc.id,
-                    source_document_name=doc.filename,
-                    source_location="",
-                    source_context="",
-                    date_added=datetime.now().isoformat(),
-                    added_by=user_name,
-                    is_active=True,
-                    confidence=data.avg_confidence,
-                    responsibility_type=self._classify_responsibility_type(resp_text),
-                    category=self._classify_responsibility_category(resp_text),
-                    notes=""
-                )
-                self.database.add_responsibility(resp)
-                responsibilities_added += 1
-        
-        # 5. Update document with role count
-        doc.roles_found = len(roles)
-        doc.last_processed = datetime.now().isoformat()
-        self.database.add_document(doc)
+                # 4. Create responsibility entries
+                for resp_text in data.responsibilities:
+                    resp = RoleResponsibility(
+                        id=hashlib.md5(f"{role_id}{doc.id}{resp_text}".encode()).hexdigest()[:12],
+                        role_id=role_id,
+                        responsibility_text=resp_text,
+                        action_verb=self._extract_action_verb(resp_text),
+                        source_document_id=doc.id,
+                        source_document_name=doc.filename,
+                        source_location="",
+                        source_context="",
+                        date_added=datetime.now().isoformat(),
+                        added_by=user_name,
+                        is_active=True,
+                        confidence=data.avg_confidence,
+                        responsibility_type=self._classify_responsibility_type(resp_text),
+                        category=self._classify_responsibility_category(resp_text),
+                        notes=""
+                    )
+                    self.database.add_responsibility(resp)
+                    responsibilities_added += 1
+        
+            # 5. Update document with role count
+            doc.roles_found = len(roles)
+            doc.last_processed = datetime.now().isoformat()
+            self.database.add_document(doc)
         
-        # 6. Infer relationships
-        relationships = self.inference_engine.infer_relationships(
-            roles, text, user_name, doc.id
-        )
-        for rel in relationships:
-            self.database.add_relationship(rel)
+            # 6. Infer relationships
+            relationships = self.inference_engine.infer_relationships(
+                roles, text, user_name, doc.id
+            )
+            for rel in relationships:
+                self.database.add_relationship(rel)
         
-        # Recalculate active document counts
-        self.database._recalculate_role_document_counts()
+            # Recalculate active document counts
+            self.database._recalculate_role_document_counts()
         
         return {
             'document_id': doc.id,
@@ -1585,6 +1923,7 @@ def main():
     parser.add_argument('--shared-drive', type=str, help='Shared drive path')
     parser.add_argument('--user', type=str, help='User name')
     parser.add_argument('--org', type=str, help='Organization')
+    parser.add_argument('--storage', choices=['json', 'sqlite'], help='Database storage backend')
     
     parser.add_argument('--list-docs', action='store_true', help='List all documents')
     parser.add_argument('--list-roles', action='store_true', help='List all roles')
@@ -1597,6 +1936,8 @@ def main():
     parser.add_argument('--export-docs', type=str, help='Export documents to CSV')
     parser.add_argument('--export-json', type=str, help='Export full data to JSON')
     parser.add_argument('--export-role', type=str, help='Export single role data (by name)')
+    parser.add_argument('--export-registry', type=str, help='Export the database as a JSON registry file')
+    parser.add_argument('--import-registry', type=str, help='Replace the database with a JSON registry file')
     
     parser.add_argument('--stats', action='store_true', help='Show statistics')
     
@@ -1615,10 +1956,17 @@ def main():
     if args.org:
         settings.organization = args.org
     
+    if args.storage:
+        settings.storage_backend = args.storage
+    
     settings.save()
     
     studio = RoleManagementStudio(settings)
     
+    if args.import_registry:
+        studio.database.import_json(args.import_registry)
+        print(f"Imported registry: {args.import_registry}")
+    
     # Process operations
     if args.process:
         print(f"Processing: {args.process}")
@@ -1706,6 +2054,10 @@ def main():
         studio.database.export_for_external_tool(args.export_json)
         print(f"Exported JSON to: {args.export_json}")
     
+    if args.export_registry:
+        studio.database.export_json(args.export_registry)
+        print(f"Exported registry to: {args.export_registry}")
+    
     if args.export_role:
         role = studio.database.get_role_by_name(args.export_role)
         if role:
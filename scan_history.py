@@ -14,14 +14,24 @@ Features:
 Author: TechWriterReview
 """
 
+import atexit
 import os
 import json
 import sqlite3
 import hashlib
+import queue
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
 from pathlib import Path
 
+from sqlite_pool import connect as db_connect
+from file_hashing import file_hash as shared_file_hash
+
 # Import version from centralized config
 try:
     from config_logging import VERSION, get_logger
@@ -169,6 +179,846 @@ def load_dictionary_from_file(filepath: str) -> Dict:
         return {'success': False, 'error': str(e), 'roles': []}
 
 
+# ============================================================
+# COMPACT SCAN RESULT STORAGE
+# ============================================================
+# A scan's results are split three ways: issues go to the indexed
+# scan_issues table, document text (below) is stored once per distinct
+# content in document_texts, and everything else is a zlib-compressed
+# JSON blob in scans.results_blob. Rows written before this layout keep
+# storage_format 0 (plain scans.results_json) until migrated. Scans past
+# the retention policy (see apply_retention) keep only their summary
+# columns and have storage_format 2.
+
+SCAN_TEXT_KEYS = ('full_text', 'paragraphs', 'headings', 'page_map')
+
+# Issue fields projected into scan_issues columns; other keys go to extra_json
+ISSUE_COLUMNS = ('category', 'severity', 'message', 'paragraph_index', 'flagged_text', 'suggestion')
+
+STORAGE_FORMAT_LEGACY = 0
+STORAGE_FORMAT_COMPACT = 1
+STORAGE_FORMAT_SUMMARY = 2
+
+MIGRATION_BATCH_SIZE = 50
+# Pause between migration batches, so requests get the write lock in between
+MIGRATION_PAUSE_SECONDS = 0.05
+
+
+def _pack_json(data: Any) -> bytes:
+    """Serialize to zlib-compressed JSON."""
+    return zlib.compress(json.dumps(data).encode('utf-8'), 6)
+
+
+def _unpack_json(blob: Optional[bytes]) -> Any:
+    """Inverse of _pack_json; None for an empty blob."""
+    if not blob:
+        return None
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+
+def _split_issue(issue: Dict) -> tuple:
+    """Split an issue into its ISSUE_COLUMNS values and the remaining keys."""
+    columns = []
+    extra = {}
+    for key in ISSUE_COLUMNS:
+        value = issue.get(key)
+        if value is None or (isinstance(value, (str, int, float)) and not isinstance(value, bool)):
+            columns.append(value)
+        else:
+            columns.append(None)
+            extra[key] = value
+    for key, value in issue.items():
+        if key not in ISSUE_COLUMNS:
+            extra[key] = value
+    return columns, (json.dumps(extra) if extra else None)
+
+
+def _join_issue(row: tuple) -> Dict:
+    """Rebuild an issue from (ISSUE_COLUMNS..., extra_json)."""
+    issue = {key: value for key, value in zip(ISSUE_COLUMNS, row) if value is not None}
+    if row[len(ISSUE_COLUMNS)]:
+        issue.update(json.loads(row[len(ISSUE_COLUMNS)]))
+    return issue
+
+
+def decode_scan_blob(results_json: Optional[str], results_blob: Optional[bytes]) -> Dict:
+    """
+    Decode the results stored on a scans row.
+
+    Legacy rows return the full results. Compact rows return everything
+    except issues and document text; use load_scan_results() for those.
+    """
+    if results_blob:
+        return _unpack_json(results_blob) or {}
+    if results_json:
+        try:
+            return json.loads(results_json)
+        except json.JSONDecodeError:
+            return {}
+    return {}
+
+
+def load_scan_issues(cursor, scan_id: int, limit: Optional[int] = None) -> List[Dict]:
+    """Load a compact scan's issues in their original order."""
+    sql = f'''
+        SELECT {", ".join(ISSUE_COLUMNS)}, extra_json FROM scan_issues
+        WHERE scan_id = ? ORDER BY issue_index
+    '''
+    params: tuple = (scan_id,)
+    if limit is not None:
+        sql += ' LIMIT ?'
+        params += (limit,)
+    cursor.execute(sql, params)
+    return [_join_issue(row) for row in cursor.fetchall()]
+
+
+def load_scan_results(cursor, scan_id: int, include_text: bool = True,
+                      include_issues: bool = True) -> Optional[Dict]:
+    """
+    Reassemble the results dict recorded for a scan.
+
+    Works on an open cursor so callers with their own connection (document
+    compare, portfolio) can use it. Returns None if the scan does not exist.
+    """
+    cursor.execute('''
+        SELECT results_json, results_blob, text_hash, storage_format
+        FROM scans WHERE id = ?
+    ''', (scan_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    results_json, results_blob, text_hash, storage_format = row
+
+    if storage_format == STORAGE_FORMAT_SUMMARY:
+        return load_scan_summary(cursor, scan_id)
+
+    results = decode_scan_blob(results_json, results_blob)
+    if (storage_format or STORAGE_FORMAT_LEGACY) == STORAGE_FORMAT_LEGACY:
+        return results
+
+    if include_issues:
+        results['issues'] = load_scan_issues(cursor, scan_id)
+    if include_text and text_hash:
+        results.update(load_scan_text(cursor, text_hash))
+    return results
+
+
+def load_scan_summary(cursor, scan_id: int) -> Dict:
+    """
+    Results for a scan reduced to its summary by the retention policy.
+
+    Holds the scores and counts kept on the scans row, an empty issues list
+    and summary_only=True.
+    """
+    cursor.execute('''
+        SELECT issue_count, score, grade, word_count, paragraph_count,
+               severity_counts, category_counts
+        FROM scans WHERE id = ?
+    ''', (scan_id,))
+    row = cursor.fetchone()
+    return {
+        'summary_only': True,
+        'issue_count': row[0],
+        'score': row[1],
+        'grade': row[2],
+        'word_count': row[3],
+        'paragraph_count': row[4],
+        'by_severity': json.loads(row[5]) if row[5] else {},
+        'by_category': json.loads(row[6]) if row[6] else {},
+        'issues': [],
+    }
+
+
+def load_scan_text(cursor, text_hash: Optional[str]) -> Dict:
+    """Load the document text fields (SCAN_TEXT_KEYS) stored under text_hash."""
+    if not text_hash:
+        return {}
+    cursor.execute('SELECT text_blob FROM document_texts WHERE text_hash = ?', (text_hash,))
+    row = cursor.fetchone()
+    return (_unpack_json(row[0]) or {}) if row else {}
+
+
+def store_scan_results(cursor, scan_id: int, document_id: int, file_hash: str,
+                       results: Dict) -> int:
+    """
+    Write a scan's results in the compact layout and clear results_json.
+
+    Returns the number of compressed bytes written (the results blob plus
+    the text blob, unless that text was already stored).
+    """
+    # scan_info describes this record (or a pending write of it): never stored
+    rest = {k: v for k, v in results.items()
+            if k not in ('issues', 'scan_info') and k not in SCAN_TEXT_KEYS}
+    results_blob = _pack_json(rest)
+    stored = len(results_blob)
+
+    text_hash = None
+    text = {k: results[k] for k in SCAN_TEXT_KEYS if k in results}
+    if text:
+        text_json = json.dumps(text).encode('utf-8')
+        text_hash = hashlib.sha256(text_json).hexdigest()
+        cursor.execute('SELECT 1 FROM document_texts WHERE text_hash = ?', (text_hash,))
+        if cursor.fetchone() is None:
+            text_blob = zlib.compress(text_json, 6)
+            cursor.execute('''
+                INSERT INTO document_texts (text_hash, file_hash, text_blob, raw_size)
+                VALUES (?, ?, ?, ?)
+            ''', (text_hash, file_hash, text_blob, len(text_json)))
+            store_text_paragraphs(cursor, text_hash, text.get('paragraphs'))
+            stored += len(text_blob)
+
+    issues = results.get('issues') or []
+    cursor.execute('DELETE FROM scan_issues WHERE scan_id = ?', (scan_id,))
+    rows = []
+    for index, issue in enumerate(issues):
+        if not isinstance(issue, dict):
+            continue
+        columns, extra_json = _split_issue(issue)
+        rows.append((scan_id, document_id, index, *columns, extra_json))
+    store_scan_fingerprints(cursor, scan_id, issues)
+    if rows:
+        cursor.executemany(f'''
+            INSERT INTO scan_issues (scan_id, document_id, issue_index,
+                                     {", ".join(ISSUE_COLUMNS)}, extra_json)
+            VALUES ({", ".join("?" * (3 + len(ISSUE_COLUMNS) + 1))})
+        ''', rows)
+
+    cursor.execute('''
+        UPDATE scans
+        SET results_json = NULL, results_blob = ?, text_hash = ?, storage_format = ?,
+            top_categories = ?, severity_counts = ?, category_counts = ?
+        WHERE id = ?
+    ''', (results_blob, text_hash, STORAGE_FORMAT_COMPACT,
+          *summarize_scan_results(results), scan_id))
+
+    return stored
+
+
+# ============================================================
+# DENORMALIZED SCAN SUMMARIES
+# ============================================================
+# Each scans row also carries the small summary the portfolio views need
+# (top categories, severity and category counts, batch id), and the
+# portfolio_stats table keeps per-day, per-grade scan totals. Both are
+# written by record_scan so the portfolio endpoints never decode results.
+
+# Scans recorded within this many seconds of a batch's first scan join it
+BATCH_WINDOW_SECONDS = 300
+
+TOP_CATEGORY_COUNT = 3
+
+
+def summarize_scan_results(results: Dict) -> tuple:
+    """
+    Build the summary columns for a scan's results.
+
+    Returns:
+        (top_categories, severity_counts, category_counts) as JSON strings
+    """
+    by_category = results.get('by_category')
+    by_severity = results.get('by_severity')
+    issues = [i for i in (results.get('issues') or []) if isinstance(i, dict)]
+    if not isinstance(by_category, dict):
+        by_category = {}
+        for issue in issues:
+            category = issue.get('category', 'Unknown')
+            by_category[category] = by_category.get(category, 0) + 1
+    if not isinstance(by_severity, dict):
+        by_severity = {}
+        for issue in issues:
+            severity = issue.get('severity', 'Low')
+            by_severity[severity] = by_severity.get(severity, 0) + 1
+
+    def count(item):
+        value = item[1]
+        return value if isinstance(value, (int, float)) else 0
+
+    top = [name for name, _ in sorted(by_category.items(), key=count, reverse=True)]
+    return (json.dumps(top[:TOP_CATEGORY_COUNT]),
+            json.dumps(by_severity),
+            json.dumps(by_category))
+
+
+def _parse_scan_time(scan_time) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(str(scan_time).replace('Z', '+00:00')).replace(tzinfo=None)
+    except (TypeError, ValueError):
+        return None
+
+
+def make_batch_id(scan_time: str) -> str:
+    """Batch id for a batch whose first scan was at scan_time."""
+    # Handle both "2026-01-31T12:34:18" and "2026-01-31 12:34:18" formats
+    stamp = str(scan_time)[:19]
+    return f"batch_{stamp.replace('-', '').replace(':', '').replace('T', '_').replace(' ', '_')}"
+
+
+def batch_start_time(batch_id: str) -> Optional[datetime]:
+    """Time of a batch's first scan, parsed back from its id."""
+    try:
+        return datetime.strptime(batch_id.replace('batch_', '', 1), '%Y%m%d_%H%M%S')
+    except (AttributeError, ValueError):
+        return None
+
+
+def next_batch_id(previous_batch_id: Optional[str], scan_time: str) -> str:
+    """Batch id for a scan, given the batch of the scan recorded before it."""
+    start = batch_start_time(previous_batch_id) if previous_batch_id else None
+    current = _parse_scan_time(scan_time)
+    if start and current and 0 <= (current - start).total_seconds() <= BATCH_WINDOW_SECONDS:
+        return previous_batch_id
+    return make_batch_id(scan_time)
+
+
+def _update_portfolio_stats(cursor, scan_time: str, grade: Optional[str],
+                            score: Optional[float], delta: int):
+    """Add (delta=1) or remove (delta=-1) a scan from the portfolio_stats totals."""
+    grade = grade or ''
+    has_score = score is not None
+    cursor.execute('''
+        INSERT INTO portfolio_stats (day, grade, scan_count, score_sum, score_count)
+        VALUES (COALESCE(date(?), date('now')), ?, ?, ?, ?)
+        ON CONFLICT(day, grade) DO UPDATE SET
+            scan_count = scan_count + excluded.scan_count,
+            score_sum = score_sum + excluded.score_sum,
+            score_count = score_count + excluded.score_count
+    ''', (scan_time, grade, delta, (score * delta) if has_score else 0,
+          delta if has_score else 0))
+    if delta < 0:
+        cursor.execute('''
+            DELETE FROM portfolio_stats
+            WHERE day = COALESCE(date(?), date('now')) AND grade = ? AND scan_count <= 0
+        ''', (scan_time, grade))
+
+
+def get_portfolio_summary(cursor) -> Dict[str, Any]:
+    """
+    Portfolio-wide totals from the maintained portfolio_stats table.
+
+    Trend windows are whole days: the last 7 days against the 7 before.
+    """
+    cursor.execute('''
+        SELECT
+            COALESCE(SUM(scan_count), 0),
+            SUM(score_sum) / NULLIF(SUM(score_count), 0),
+            SUM(CASE WHEN day > date('now', '-7 days') THEN score_sum END)
+                / NULLIF(SUM(CASE WHEN day > date('now', '-7 days') THEN score_count END), 0),
+            SUM(CASE WHEN day > date('now', '-14 days') AND day <= date('now', '-7 days')
+                     THEN score_sum END)
+                / NULLIF(SUM(CASE WHEN day > date('now', '-14 days') AND day <= date('now', '-7 days')
+                                  THEN score_count END), 0)
+        FROM portfolio_stats
+    ''')
+    total_scans, avg_score, recent_avg, prev_avg = cursor.fetchone()
+    cursor.execute('''
+        SELECT grade, SUM(scan_count) FROM portfolio_stats
+        WHERE grade != ''
+        GROUP BY grade
+        HAVING SUM(scan_count) > 0
+    ''')
+    grade_distribution = dict(cursor.fetchall())
+    cursor.execute('SELECT COUNT(*) FROM documents')
+    total_documents = cursor.fetchone()[0]
+    return {
+        'total_documents': total_documents,
+        'total_scans': total_scans,
+        'avg_score': avg_score or 0,
+        'grade_distribution': grade_distribution,
+        'recent_avg': recent_avg or 0,
+        'prev_avg': prev_avg or 0,
+    }
+
+
+# ============================================================
+# ISSUE FINGERPRINTS
+# ============================================================
+# An issue's fingerprint is a 64-bit hash of (category, first 50 chars of
+# the message, paragraph index): the identity used to match issues
+# between two scans. scan_fingerprints holds one row per distinct
+# fingerprint in a scan, so added/removed/unchanged issues are set
+# operations over indexed integers rather than re-parsing both scans.
+
+def issue_fingerprint(issue: Dict) -> int:
+    """
+    Signed 64-bit fingerprint of an issue (fits an SQLite INTEGER).
+
+    Missing and None fields hash alike, since scan_issues drops None values.
+    """
+    key = json.dumps([
+        issue.get('category') or '',
+        (issue.get('message') or '')[:50],
+        issue.get('paragraph_index') or 0,
+    ])
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def store_scan_fingerprints(cursor, scan_id: int, issues: List[Dict]):
+    """
+    Replace a scan's fingerprint rows.
+
+    Each row keeps the issue's category, how many issues share the
+    fingerprint, and the index of the last of them (the one compare shows).
+    """
+    rows: Dict[int, list] = {}
+    for index, issue in enumerate(issues):
+        if not isinstance(issue, dict):
+            continue
+        fp = issue_fingerprint(issue)
+        row = rows.get(fp)
+        if row is None:
+            rows[fp] = [scan_id, fp, issue.get('category') or 'Unknown', 1, index]
+        else:
+            row[3] += 1
+            row[4] = index
+    cursor.execute('DELETE FROM scan_fingerprints WHERE scan_id = ?', (scan_id,))
+    if rows:
+        cursor.executemany('''
+            INSERT INTO scan_fingerprints (scan_id, fingerprint, category, occurrences, issue_index)
+            VALUES (?, ?, ?, ?, ?)
+        ''', list(rows.values()))
+
+
+# Fingerprint rows of scan f that are (EXISTS) or are not (NOT EXISTS) in scan ?
+_FINGERPRINT_MATCH = '''
+    {negate} EXISTS (
+        SELECT 1 FROM scan_fingerprints o
+        WHERE o.scan_id = ? AND o.fingerprint = f.fingerprint
+    )
+'''
+
+
+def diff_scan_fingerprints(cursor, old_scan_id: int, new_scan_id: int) -> Dict:
+    """
+    Count issues added, removed and unchanged between two scans.
+
+    Counts are distinct fingerprints; the category breakdowns count every
+    added (or removed) issue, duplicates included.
+    """
+    def grouped(scan_id, other_scan_id, negate):
+        cursor.execute(f'''
+            SELECT category, COUNT(*), SUM(occurrences)
+            FROM scan_fingerprints f
+            WHERE f.scan_id = ? AND {_FINGERPRINT_MATCH.format(negate=negate)}
+            GROUP BY category
+        ''', (scan_id, other_scan_id))
+        return cursor.fetchall()
+
+    added = grouped(new_scan_id, old_scan_id, 'NOT')
+    removed = grouped(old_scan_id, new_scan_id, 'NOT')
+    unchanged = grouped(new_scan_id, old_scan_id, '')
+    return {
+        'added': sum(row[1] for row in added),
+        'removed': sum(row[1] for row in removed),
+        'unchanged': sum(row[1] for row in unchanged),
+        'added_categories': {row[0]: row[2] for row in added},
+        'removed_categories': {row[0]: row[2] for row in removed},
+    }
+
+
+def load_issues_by_fingerprint(cursor, scan_id: int, other_scan_id: int,
+                               shared: bool) -> List[Dict]:
+    """
+    Load a scan's issues whose fingerprint is (shared=True) or is not in
+    another scan, one issue per fingerprint, in document order.
+    """
+    cursor.execute(f'''
+        SELECT {", ".join("i." + c for c in ISSUE_COLUMNS)}, i.extra_json
+        FROM scan_fingerprints f
+        JOIN scan_issues i ON i.scan_id = f.scan_id AND i.issue_index = f.issue_index
+        WHERE f.scan_id = ? AND {_FINGERPRINT_MATCH.format(negate='' if shared else 'NOT')}
+        ORDER BY f.issue_index
+    ''', (scan_id, other_scan_id))
+    return [_join_issue(row) for row in cursor.fetchall()]
+
+
+# ============================================================
+# FULL-TEXT SEARCH
+# ============================================================
+# issue_search indexes scan_issues (message, flagged text, suggestion) as
+# an external-content FTS5 table; paragraph_search does the same for
+# scan_paragraphs, one row per paragraph of each distinct document text.
+# Triggers keep both in step with their content tables, so record_scan,
+# delete_scan and the retention policy maintain the index incrementally in
+# their own transactions. SQLite builds without FTS5 keep the content
+# tables but have no search (ScanHistoryDB.search_available).
+
+SEARCH_DEFAULT_LIMIT = 50
+SEARCH_MAX_LIMIT = 500
+# Markers around matched terms in snippets (plain text: not HTML-escaped)
+SNIPPET_MARKERS = ('[', ']')
+SNIPPET_TOKENS = 16
+
+_FTS_TERM = re.compile(r'"([^"]*)"|(\S+)')
+
+
+class SearchUnavailableError(RuntimeError):
+    """Full-text search was requested but SQLite has no FTS5."""
+
+
+def build_fts_query(text: str) -> str:
+    """
+    Turn user search text into an FTS5 MATCH expression.
+
+    "Quoted text" is a phrase, other words are separate terms (all must
+    match) and a trailing * makes a word a prefix. FTS5 operators and
+    punctuation in the input are matched literally instead of parsed.
+    """
+    terms = []
+    for phrase, word in _FTS_TERM.findall(text or ''):
+        prefix = not phrase and len(word) > 1 and word.endswith('*')
+        value = (phrase or word.rstrip('*')).strip()
+        if value:
+            terms.append('"' + value.replace('"', '""') + '"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+
+def _paragraph_texts(paragraphs: Any) -> List[tuple]:
+    """(paragraph_index, text) pairs from stored paragraphs ((idx, text) or plain text)."""
+    rows = []
+    for position, paragraph in enumerate(paragraphs or []):
+        if isinstance(paragraph, (list, tuple)) and len(paragraph) >= 2:
+            index, text = paragraph[0], paragraph[1]
+        elif isinstance(paragraph, dict):
+            index, text = paragraph.get('index', position), paragraph.get('text')
+        else:
+            index, text = position, paragraph
+        if isinstance(text, str) and text.strip():
+            rows.append((index if isinstance(index, int) else position, text))
+    return rows
+
+
+def store_text_paragraphs(cursor, text_hash: str, paragraphs: Any):
+    """Add a document text's paragraphs to scan_paragraphs (and so to paragraph_search)."""
+    cursor.executemany('''
+        INSERT INTO scan_paragraphs (text_hash, paragraph_index, text) VALUES (?, ?, ?)
+    ''', [(text_hash, index, text) for index, text in _paragraph_texts(paragraphs)])
+
+
+def _fts5_available(cursor) -> bool:
+    try:
+        cursor.execute('CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)')
+        cursor.execute('DROP TABLE temp.fts5_probe')
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _create_search_index(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS scan_paragraphs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            text_hash TEXT NOT NULL,
+            paragraph_index INTEGER,
+            text TEXT NOT NULL
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_scan_paragraphs_text ON scan_paragraphs(text_hash)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_scans_text_hash ON scans(text_hash, scan_time)')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS document_texts_paragraphs_ad AFTER DELETE ON document_texts
+        BEGIN
+            DELETE FROM scan_paragraphs WHERE text_hash = old.text_hash;
+        END
+    ''')
+
+    # Paragraphs of texts stored before this migration
+    for text_hash, text_blob in cursor.execute(
+            'SELECT text_hash, text_blob FROM document_texts').fetchall():
+        try:
+            text = _unpack_json(text_blob) or {}
+        except (zlib.error, ValueError):
+            continue
+        store_text_paragraphs(cursor, text_hash, text.get('paragraphs'))
+
+    if _fts5_available(cursor):
+        _create_fts_tables(cursor)
+
+
+def _create_fts_tables(cursor):
+    for table, content, columns in (
+            ('issue_search', 'scan_issues', ('message', 'flagged_text', 'suggestion')),
+            ('paragraph_search', 'scan_paragraphs', ('text',))):
+        cols = ', '.join(columns)
+        new_cols = ', '.join(f'new.{c}' for c in columns)
+        old_cols = ', '.join(f'old.{c}' for c in columns)
+        cursor.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5(
+                {cols}, content='{content}', content_rowid='id'
+            )
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {content}_search_ai AFTER INSERT ON {content}
+            BEGIN
+                INSERT INTO {table} (rowid, {cols}) VALUES (new.id, {new_cols});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {content}_search_ad AFTER DELETE ON {content}
+            BEGIN
+                INSERT INTO {table} ({table}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {content}_search_au AFTER UPDATE ON {content}
+            BEGIN
+                INSERT INTO {table} ({table}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+                INSERT INTO {table} (rowid, {cols}) VALUES (new.id, {new_cols});
+            END
+        ''')
+        cursor.execute(f"INSERT INTO {table} ({table}) VALUES ('rebuild')")
+
+
+def _as_list(value) -> List:
+    if value is None or value == '':
+        return []
+    if isinstance(value, str):
+        return [v.strip() for v in value.split(',') if v.strip()]
+    return list(value)
+
+
+def _scan_filters(alias: str, document_id: Optional[int], filename: Optional[str],
+                  since: Optional[str], until: Optional[str]) -> tuple:
+    """SQL conditions and params restricting scans (alias) by document and date."""
+    conditions, params = [], []
+    if document_id is not None:
+        conditions.append(f'{alias}.document_id = ?')
+        params.append(int(document_id))
+    if filename:
+        conditions.append(f'{alias}.document_id IN (SELECT id FROM documents WHERE filename = ?)')
+        params.append(filename)
+    if since:
+        conditions.append(f'datetime({alias}.scan_time) >= datetime(?)')
+        params.append(str(since).replace('T', ' '))
+    if until:
+        # A bare date includes that whole day
+        conditions.append(f'datetime({alias}.scan_time) < datetime(?, ?)')
+        until = str(until).replace('T', ' ')
+        params += [until, '+1 day' if len(until) == 10 else '+0 seconds']
+    return conditions, params
+
+
+def search_issues(cursor, query: str, document_id: Optional[int] = None,
+                  filename: Optional[str] = None, since: Optional[str] = None,
+                  until: Optional[str] = None, category=None, severity=None,
+                  latest_only: bool = False, limit: int = SEARCH_DEFAULT_LIMIT,
+                  offset: int = 0) -> List[Dict]:
+    """
+    Search recorded issues' message, flagged text and suggestion, best match first.
+
+    category and severity take one value, a list or a comma-separated
+    string. latest_only restricts hits to each document's latest scan.
+    """
+    conditions, params = _scan_filters('s', document_id, filename, since, until)
+    for column, values in (('category', _as_list(category)), ('severity', _as_list(severity))):
+        if values:
+            conditions.append(f'i.{column} IN ({",".join("?" * len(values))})')
+            params += values
+    if latest_only:
+        conditions.append('''s.id = (SELECT l.id FROM scans l WHERE l.document_id = s.document_id
+                                     ORDER BY l.scan_time DESC, l.id DESC LIMIT 1)''')
+    where = ''.join(f' AND {c}' for c in conditions)
+    cursor.execute(f'''
+        SELECT i.scan_id, s.document_id, d.filename, s.scan_time, i.issue_index,
+               i.category, i.severity, i.message, i.flagged_text, i.suggestion,
+               i.paragraph_index,
+               snippet(issue_search, -1, ?, ?, '...', ?), bm25(issue_search) AS score
+        FROM issue_search
+        JOIN scan_issues i ON i.id = issue_search.rowid
+        JOIN scans s ON s.id = i.scan_id
+        LEFT JOIN documents d ON d.id = s.document_id
+        WHERE issue_search MATCH ?{where}
+        ORDER BY score, s.scan_time DESC, i.id
+        LIMIT ? OFFSET ?
+    ''', (*SNIPPET_MARKERS, SNIPPET_TOKENS, query, *params, limit, offset))
+    return [{
+        'scan_id': row[0],
+        'document_id': row[1],
+        'filename': row[2],
+        'scan_time': row[3],
+        'issue_index': row[4],
+        'category': row[5],
+        'severity': row[6],
+        'message': row[7],
+        'flagged_text': row[8],
+        'suggestion': row[9],
+        'paragraph_index': row[10],
+        'snippet': row[11],
+        'score': round(-row[12], 4),
+    } for row in cursor.fetchall()]
+
+
+def search_paragraphs(cursor, query: str, document_id: Optional[int] = None,
+                      filename: Optional[str] = None, since: Optional[str] = None,
+                      until: Optional[str] = None, limit: int = SEARCH_DEFAULT_LIMIT,
+                      offset: int = 0) -> List[Dict]:
+    """
+    Search document paragraphs, best match first.
+
+    Paragraphs are stored once per distinct document text; each hit is
+    reported against the latest scan (within the filters) that has it.
+    """
+    conditions, params = _scan_filters('l', document_id, filename, since, until)
+    where = ''.join(f' AND {c}' for c in conditions)
+    cursor.execute(f'''
+        SELECT s.id, s.document_id, d.filename, s.scan_time, p.paragraph_index,
+               snippet(paragraph_search, 0, ?, ?, '...', ?), bm25(paragraph_search) AS score
+        FROM paragraph_search
+        JOIN scan_paragraphs p ON p.id = paragraph_search.rowid
+        JOIN scans s ON s.id = (
+            SELECT l.id FROM scans l WHERE l.text_hash = p.text_hash{where}
+            ORDER BY l.scan_time DESC, l.id DESC LIMIT 1
+        )
+        LEFT JOIN documents d ON d.id = s.document_id
+        WHERE paragraph_search MATCH ?
+        ORDER BY score, s.scan_time DESC, p.id
+        LIMIT ? OFFSET ?
+    ''', (*SNIPPET_MARKERS, SNIPPET_TOKENS, *params, query, limit, offset))
+    return [{
+        'scan_id': row[0],
+        'document_id': row[1],
+        'filename': row[2],
+        'scan_time': row[3],
+        'paragraph_index': row[4],
+        'snippet': row[5],
+        'score': round(-row[6], 4),
+    } for row in cursor.fetchall()]
+
+
+# ============================================================
+# RETENTION POLICY
+# ============================================================
+# ScanHistoryDB.apply_retention reduces old scans to their summary row
+# (scores, counts, batch id stay; issues, fingerprints, text and the
+# results blob go) and drops orphaned rows; reclaim_space then returns the
+# freed pages with incremental vacuum. ScanHistoryMaintenance runs both
+# periodically in the background.
+
+# Most recent scans per document that keep their full results
+RETENTION_KEEP_FULL_SCANS = 5
+# Scans older than this keep only their summary (None: no age limit)
+RETENTION_SUMMARY_AFTER_DAYS = 180
+# Scans reduced per transaction, and the pause between transactions and
+# between incremental vacuum steps
+RETENTION_BATCH_SIZE = 50
+RETENTION_PAUSE_SECONDS = 0.05
+RETENTION_VACUUM_STEP_PAGES = 256
+RETENTION_INTERVAL_SECONDS = 24 * 3600
+# Delay before the first run, so maintenance does not compete with startup
+RETENTION_INITIAL_DELAY_SECONDS = 600
+
+
+# ============================================================
+# VERSIONED SCHEMA MIGRATIONS
+# ============================================================
+# Applied in order by ScanHistoryDB._apply_schema_migrations; the highest
+# applied version is kept in PRAGMA user_version. Each step is SQL or a
+# callable taking the cursor. Append new migrations, never edit old ones.
+
+def _add_document_role_count(cursor):
+    columns = {row[1] for row in cursor.execute('PRAGMA table_info(documents)')}
+    if 'role_count' not in columns:
+        cursor.execute('ALTER TABLE documents ADD COLUMN role_count INTEGER DEFAULT 0')
+    cursor.execute('''
+        UPDATE documents SET role_count = (
+            SELECT COUNT(*) FROM document_roles dr WHERE dr.document_id = documents.id
+        )
+    ''')
+
+def _add_scan_summaries(cursor):
+    columns = {row[1] for row in cursor.execute('PRAGMA table_info(scans)')}
+    for column in ('top_categories', 'severity_counts', 'category_counts', 'batch_id'):
+        if column not in columns:
+            cursor.execute(f'ALTER TABLE scans ADD COLUMN {column} TEXT')
+
+    # One pass in time order: summaries from the stored results, batch ids
+    # from the previous scan's batch
+    scans = cursor.execute('SELECT id, scan_time FROM scans ORDER BY scan_time, id').fetchall()
+    batch_id = None
+    for scan_id, scan_time in scans:
+        batch_id = next_batch_id(batch_id, scan_time)
+        row = cursor.execute('SELECT results_json, results_blob FROM scans WHERE id = ?',
+                             (scan_id,)).fetchone()
+        results = decode_scan_blob(*row)
+        if 'issues' not in results and not (isinstance(results.get('by_category'), dict)
+                                            and isinstance(results.get('by_severity'), dict)):
+            results['issues'] = load_scan_issues(cursor, scan_id)
+        summary = summarize_scan_results(results)
+        cursor.execute('''
+            UPDATE scans
+            SET top_categories = ?, severity_counts = ?, category_counts = ?, batch_id = ?
+            WHERE id = ?
+        ''', (*summary, batch_id, scan_id))
+
+    cursor.execute('DELETE FROM portfolio_stats')
+    cursor.execute('''
+        INSERT INTO portfolio_stats (day, grade, scan_count, score_sum, score_count)
+        SELECT COALESCE(date(scan_time), date('now')), COALESCE(grade, ''),
+               COUNT(*), COALESCE(SUM(score), 0), COUNT(score)
+        FROM scans
+        GROUP BY 1, 2
+    ''')
+
+def _backfill_scan_fingerprints(cursor):
+    scan_ids = [row[0] for row in cursor.execute('SELECT id FROM scans').fetchall()]
+    for scan_id in scan_ids:
+        store_scan_fingerprints(cursor, scan_id, load_scan_issues(cursor, scan_id))
+
+
+SCHEMA_MIGRATIONS = (
+    # document_roles(document_id) is already covered by the leading column
+    # of its UNIQUE(document_id, role_id) index.
+    (1, 'History query indexes and maintained documents.role_count', (
+        'CREATE INDEX IF NOT EXISTS idx_scans_document_time ON scans(document_id, scan_time)',
+        'CREATE INDEX IF NOT EXISTS idx_scans_time ON scans(scan_time)',
+        'CREATE INDEX IF NOT EXISTS idx_documents_filename ON documents(filename)',
+        'CREATE INDEX IF NOT EXISTS idx_issue_changes_scan ON issue_changes(scan_id)',
+        _add_document_role_count,
+    )),
+    (2, 'Denormalized scan summaries, batch ids and portfolio_stats', (
+        '''
+        CREATE TABLE IF NOT EXISTS portfolio_stats (
+            day TEXT NOT NULL,
+            grade TEXT NOT NULL,
+            scan_count INTEGER DEFAULT 0,
+            score_sum REAL DEFAULT 0,
+            score_count INTEGER DEFAULT 0,
+            PRIMARY KEY (day, grade)
+        )
+        ''',
+        _add_scan_summaries,
+        'CREATE INDEX IF NOT EXISTS idx_scans_batch ON scans(batch_id, scan_time)',
+    )),
+    (3, 'Per-scan issue fingerprints', (
+        '''
+        CREATE TABLE IF NOT EXISTS scan_fingerprints (
+            scan_id INTEGER NOT NULL,
+            fingerprint INTEGER NOT NULL,
+            category TEXT,
+            occurrences INTEGER DEFAULT 1,
+            issue_index INTEGER,
+            PRIMARY KEY (scan_id, fingerprint)
+        ) WITHOUT ROWID
+        ''',
+        _backfill_scan_fingerprints,
+    )),
+    # Every row is a new role-graph generation (see RoleGraphCache);
+    # document_id is NULL for changes not tied to one document
+    (4, 'Role graph change log', (
+        '''
+        CREATE TABLE IF NOT EXISTS graph_changes (
+            generation INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_id INTEGER,
+            changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+    )),
+    (5, 'Full-text search over issues and paragraphs', (
+        _create_search_index,
+    )),
+)
+
+
 class ScanHistoryDB:
     """Database for tracking document scans and roles."""
     
@@ -180,11 +1030,14 @@ class ScanHistoryDB:
             db_path = str(app_dir / "scan_history.db")
         
         self.db_path = db_path
+        self._migration_lock = threading.Lock()
+        self._migration_thread: Optional[threading.Thread] = None
         self._init_database()
     
     def _init_database(self):
         """Initialize database tables."""
-        conn = sqlite3.connect(self.db_path)
+        self._create_incremental_vacuum_file()
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         # Documents table - tracks each unique document
@@ -311,29 +1164,286 @@ class ScanHistoryDB:
             )
         ''')
         
+        # Compact result storage (see store_scan_results)
+        existing_columns = {row[1] for row in cursor.execute('PRAGMA table_info(scans)')}
+        for column, ddl in (('results_blob', 'BLOB'),
+                            ('text_hash', 'TEXT'),
+                            ('storage_format', 'INTEGER DEFAULT 0')):
+            if column not in existing_columns:
+                cursor.execute(f'ALTER TABLE scans ADD COLUMN {column} {ddl}')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scan_issues (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                scan_id INTEGER NOT NULL,
+                document_id INTEGER,
+                issue_index INTEGER NOT NULL,
+                category TEXT,
+                severity TEXT,
+                message TEXT,
+                paragraph_index INTEGER,
+                flagged_text TEXT,
+                suggestion TEXT,
+                extra_json TEXT,
+                FOREIGN KEY (scan_id) REFERENCES scans(id)
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_scan_issues_scan
+            ON scan_issues(scan_id, issue_index)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_scan_issues_category
+            ON scan_issues(category, severity)
+        ''')
+        
+        # Document text, stored once per distinct content
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS document_texts (
+                text_hash TEXT PRIMARY KEY,
+                file_hash TEXT,
+                text_blob BLOB NOT NULL,
+                raw_size INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_document_texts_file
+            ON document_texts(file_hash)
+        ''')
+        
         conn.commit()
+        self._apply_schema_migrations(conn)
+        self.search_available = self._prepare_search_index(conn)
         conn.close()
+        self._start_storage_migration()
         _log("Database initialized")
     
-    def _get_file_hash(self, filepath: str) -> str:
-        """Get MD5 hash of file for change detection."""
+    def _create_incremental_vacuum_file(self):
+        """
+        Create a new database file with auto_vacuum=INCREMENTAL.
+        
+        The mode can only be chosen before the file header is written, and
+        pooled connections write it when they switch to WAL, so it is set on
+        a plain connection first. Existing files are converted later by the
+        background maintenance (see reclaim_space).
+        """
+        if self.db_path == ':memory:' or (
+                os.path.exists(self.db_path) and os.path.getsize(self.db_path) > 0):
+            return
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            conn.execute('VACUUM')  # writes the header of the empty file
+        finally:
+            conn.close()
+    
+    def _apply_schema_migrations(self, conn) -> int:
+        """
+        Apply pending SCHEMA_MIGRATIONS, one transaction per version.
+        
+        Returns:
+            The schema version after migrating
+        """
+        cursor = conn.cursor()
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+        for target, description, steps in SCHEMA_MIGRATIONS:
+            if target <= version:
+                continue
+            try:
+                cursor.execute('BEGIN')
+                for step in steps:
+                    if callable(step):
+                        step(cursor)
+                    else:
+                        cursor.execute(step)
+                # PRAGMA cannot take parameters; target is an int from the table above
+                cursor.execute(f'PRAGMA user_version = {int(target)}')
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                _log(f"Schema migration {target} ({description}) failed: {e}", 'error')
+                break
+            version = target
+            _log(f"Applied schema migration {target}: {description}")
+        return version
+    
+    def _prepare_search_index(self, conn) -> bool:
+        """
+        Check once whether full-text search works on this SQLite build.
+        
+        The FTS5 tables are created here if the search migration ran on a
+        build without FTS5 and this one has it.
+        
+        Returns:
+            True if the search tables exist and can be queried
+        """
+        cursor = conn.cursor()
+        if not _fts5_available(cursor):
+            _log("SQLite was built without FTS5: scan history search is unavailable", 'warning')
+            return False
+        tables = {row[0] for row in cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name IN ('scan_paragraphs', 'issue_search')")}
+        if 'issue_search' in tables:
+            return True
+        if 'scan_paragraphs' not in tables:
+            return False  # search migration failed; logged there
+        try:
+            cursor.execute('BEGIN')
+            _create_fts_tables(cursor)
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            _log(f"Could not create the scan history search index: {e}", 'error')
+            return False
+        return True
+    
+    def _start_storage_migration(self):
+        """Run migrate_scan_storage on a background thread if legacy scans remain."""
+        conn = db_connect(self.db_path)
+        try:
+            pending = conn.execute(
+                'SELECT 1 FROM scans WHERE results_json IS NOT NULL LIMIT 1').fetchone()
+        finally:
+            conn.close()
+        if pending is None:
+            return
+        self._migration_thread = threading.Thread(
+            target=self.migrate_scan_storage, daemon=True, name='scan-history-migration')
+        self._migration_thread.start()
+    
+    def wait_for_storage_migration(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the background storage migration; False if still running."""
+        thread = self._migration_thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+    
+    def migrate_scan_storage(self, batch_size: int = MIGRATION_BATCH_SIZE,
+                             pause_seconds: float = MIGRATION_PAUSE_SECONDS) -> Dict[str, int]:
+        """
+        Convert scans still holding a plain results_json to the compact layout.
+        
+        Started in the background when the database is opened. Rows are
+        converted in batches (one transaction each, with a pause between
+        them); legacy rows read normally until converted. The freed pages are
+        returned to the OS by the maintenance task's incremental vacuum.
+        
+        Returns:
+            Dict with migrated scan count and bytes_before/bytes_after
+            (results_json size vs. compressed blobs written)
+        """
+        stats = {'migrated': 0, 'bytes_before': 0, 'bytes_after': 0}
+        with self._migration_lock:
+            self._migrate_scan_storage(stats, batch_size, pause_seconds)
+        if stats['migrated']:
+            _log(f"Migrated {stats['migrated']} scans to compact storage "
+                 f"({stats['bytes_before']} -> {stats['bytes_after']} bytes)")
+        return stats
+    
+    def _migrate_scan_storage(self, stats: Dict[str, int], batch_size: int,
+                              pause_seconds: float):
+        """migrate_scan_storage's batches (_migration_lock held)."""
+        conn = db_connect(self.db_path)
+        cursor = conn.cursor()
+        try:
+            while True:
+                cursor.execute('''
+                    SELECT s.id, s.document_id, s.results_json, d.file_hash
+                    FROM scans s
+                    LEFT JOIN documents d ON s.document_id = d.id
+                    WHERE s.results_json IS NOT NULL
+                    LIMIT ?
+                ''', (batch_size,))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                for scan_id, document_id, results_json, file_hash in rows:
+                    try:
+                        results = json.loads(results_json)
+                    except json.JSONDecodeError:
+                        results = {}
+                    if not isinstance(results, dict):
+                        results = {}
+                    stats['bytes_before'] += len(results_json)
+                    stats['bytes_after'] += store_scan_results(
+                        cursor, scan_id, document_id, file_hash or '', results)
+                    stats['migrated'] += 1
+                conn.commit()
+                if pause_seconds:
+                    time.sleep(pause_seconds)
+        except Exception as e:
+            conn.rollback()
+            _log(f"Scan storage migration stopped: {e}", 'error')
+        finally:
+            conn.close()
+    
+    def _get_file_hash(self, filepath: str, algorithm: str = 'sha256') -> str:
+        """Get the (shared, memoized) content hash of a file for change detection."""
         try:
-            with open(filepath, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+            return shared_file_hash(filepath, algorithm)
         except Exception:
             return ""
     
-    def record_scan(self, filename: str, filepath: str, results: Dict, options: Dict) -> Dict:
+    def _file_changed(self, filepath: str, file_hash: str, old_hash: Optional[str]) -> bool:
+        """Compare against a stored hash, which may be a legacy MD5 digest."""
+        if old_hash and file_hash and len(old_hash) != len(file_hash):
+            return self._get_file_hash(filepath, 'md5') != old_hash
+        return file_hash != old_hash
+    
+    def record_scan(self, filename: str, filepath: str, results: Dict, options: Dict,
+                    file_hash: Optional[str] = None) -> Dict:
         """
         Record a document scan and detect changes from previous scans.
         
+        Args:
+            file_hash: SHA-256 of the file if already known (e.g. from upload)
+        
         Returns:
             Dict with scan_id, document_id, is_rescan, changes (if rescan)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
-        file_hash = self._get_file_hash(filepath)
+        scan_info = self._record_scan(cursor, filename, filepath, results, options, file_hash)
+        
+        # v2.9.4.1: Fix BUG-L01 - Optimized commit with verification using same connection
+        try:
+            conn.commit()
+            
+            # Verify the scan was recorded (same connection, no overhead)
+            cursor.execute('SELECT id FROM scans WHERE id = ?', (scan_info['scan_id'],))
+            if cursor.fetchone() is None:
+                import logging
+                logging.getLogger('scan_history').warning(
+                    f"Scan {scan_info['scan_id']} not found after commit")
+                
+        except Exception as commit_err:
+            import logging
+            logging.getLogger('scan_history').error(f"Commit error: {commit_err}")
+        finally:
+            conn.close()
+        
+        return scan_info
+    
+    def record_scan_async(self, filename: str, filepath: str, results: Dict, options: Dict,
+                          file_hash: Optional[str] = None,
+                          callback: Optional[Callable[[Optional[Dict], Optional[str]], None]] = None
+                          ) -> 'ScanWrite':
+        """
+        Queue record_scan on the background scan history writer.
+        
+        Returns a ScanWrite whose wait() gives the scan_info record_scan would
+        have returned; callback(scan_info, error) is called once it is written.
+        """
+        return get_scan_history_writer().submit(self, filename, filepath, results, options,
+                                                file_hash, callback)
+    
+    def _record_scan(self, cursor, filename: str, filepath: str, results: Dict,
+                     options: Dict, file_hash: Optional[str] = None) -> Dict:
+        """record_scan's writes, in the caller's transaction (no commit)."""
+        file_hash = file_hash or self._get_file_hash(filepath)
         
         # Check if document exists
         cursor.execute('''
@@ -352,6 +1462,7 @@ class ScanHistoryDB:
         is_rescan = False
         changes = None
         document_id = None
+        prev_scan_id = None
         
         if existing:
             document_id = existing[0]
@@ -371,23 +1482,13 @@ class ScanHistoryDB:
             
             # Get previous scan for comparison
             cursor.execute('''
-                SELECT id, issue_count, results_json FROM scans
+                SELECT id FROM scans
                 WHERE document_id = ?
                 ORDER BY scan_time DESC LIMIT 1
             ''', (document_id,))
             prev_scan = cursor.fetchone()
-            
             if prev_scan:
                 prev_scan_id = prev_scan[0]
-                prev_issue_count = prev_scan[1]
-                prev_results = json.loads(prev_scan[2]) if prev_scan[2] else {}
-                
-                # Calculate changes
-                changes = self._calculate_changes(
-                    prev_results.get('issues', []),
-                    results.get('issues', [])
-                )
-                changes['file_changed'] = (file_hash != old_hash)
         else:
             # Insert new document
             cursor.execute('''
@@ -396,11 +1497,11 @@ class ScanHistoryDB:
             ''', (filename, filepath, file_hash, word_count, paragraph_count))
             document_id = cursor.lastrowid
         
-        # Record the scan
+        # Record the scan; results go to the compact tables
         cursor.execute('''
             INSERT INTO scans (document_id, options_json, issue_count, score, grade, 
-                              word_count, paragraph_count, results_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                              word_count, paragraph_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
         ''', (
             document_id, 
             json.dumps(options),
@@ -408,10 +1509,28 @@ class ScanHistoryDB:
             score,
             grade,
             word_count,
-            paragraph_count,
-            json.dumps(results)
+            paragraph_count
         ))
         scan_id = cursor.lastrowid
+        store_scan_results(cursor, scan_id, document_id, file_hash, results)
+        
+        # Denormalized batch membership and portfolio totals
+        cursor.execute('SELECT scan_time FROM scans WHERE id = ?', (scan_id,))
+        scan_time = cursor.fetchone()[0]
+        cursor.execute('''
+            SELECT batch_id FROM scans
+            WHERE id != ? AND batch_id IS NOT NULL
+            ORDER BY scan_time DESC, id DESC LIMIT 1
+        ''', (scan_id,))
+        prev_batch = cursor.fetchone()
+        cursor.execute('UPDATE scans SET batch_id = ? WHERE id = ?',
+                       (next_batch_id(prev_batch[0] if prev_batch else None, scan_time), scan_id))
+        _update_portfolio_stats(cursor, scan_time, grade, score, 1)
+        
+        # Compare against the previous scan's stored fingerprints
+        if prev_scan_id is not None:
+            changes = self._calculate_changes(cursor, prev_scan_id, scan_id)
+            changes['file_changed'] = self._file_changed(filepath, file_hash, old_hash)
         
         # Record changes if rescan
         if is_rescan and changes:
@@ -421,7 +1540,7 @@ class ScanHistoryDB:
                                           change_summary_json)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (
-                document_id, scan_id, prev_scan_id if prev_scan else None,
+                document_id, scan_id, prev_scan_id,
                 changes['added'], changes['removed'], changes['unchanged'],
                 json.dumps(changes)
             ))
@@ -429,22 +1548,7 @@ class ScanHistoryDB:
         # Process roles from results
         if results.get('roles'):
             self._process_roles(cursor, document_id, results['roles'])
-        
-        # v2.9.4.1: Fix BUG-L01 - Optimized commit with verification using same connection
-        try:
-            conn.commit()
-            
-            # Verify the scan was recorded (same connection, no overhead)
-            cursor.execute('SELECT id FROM scans WHERE id = ?', (scan_id,))
-            if cursor.fetchone() is None:
-                import logging
-                logging.getLogger('scan_history').warning(f"Scan {scan_id} not found after commit")
-                
-        except Exception as commit_err:
-            import logging
-            logging.getLogger('scan_history').error(f"Commit error: {commit_err}")
-        finally:
-            conn.close()
+        bump_graph_generation(cursor, document_id)
         
         return {
             'scan_id': scan_id,
@@ -454,47 +1558,94 @@ class ScanHistoryDB:
             'changes': changes
         }
     
-    def _calculate_changes(self, old_issues: List[Dict], new_issues: List[Dict]) -> Dict:
-        """Calculate differences between two issue lists."""
-        # Create fingerprints for comparison
-        def fingerprint(issue):
-            return (
-                issue.get('category', ''),
-                issue.get('message', '')[:50],
-                issue.get('paragraph_index', 0)
-            )
-        
-        old_fps = set(fingerprint(i) for i in old_issues)
-        new_fps = set(fingerprint(i) for i in new_issues)
+    def get_scan_results(self, scan_id: int, include_text: bool = True,
+                         include_issues: bool = True) -> Optional[Dict]:
+        """
+        Get the full results recorded for a scan.
         
-        added = new_fps - old_fps
-        removed = old_fps - new_fps
-        unchanged = old_fps & new_fps
+        Args:
+            scan_id: Scan ID
+            include_text: Include full_text, paragraphs, headings and page_map
+            include_issues: Include the issues list
         
-        return {
-            'added': len(added),
-            'removed': len(removed),
-            'unchanged': len(unchanged),
-            'added_categories': self._categorize_changes(new_issues, added),
-            'removed_categories': self._categorize_changes(old_issues, removed)
-        }
+        Returns:
+            Results dict, or None if the scan does not exist
+        """
+        conn = db_connect(self.db_path)
+        try:
+            return load_scan_results(conn.cursor(), scan_id, include_text, include_issues)
+        finally:
+            conn.close()
     
-    def _categorize_changes(self, issues: List[Dict], fingerprints: set) -> Dict[str, int]:
-        """Group changes by category."""
-        def fingerprint(issue):
-            return (
-                issue.get('category', ''),
-                issue.get('message', '')[:50],
-                issue.get('paragraph_index', 0)
-            )
+    def get_scan_issues(self, scan_id: int, limit: Optional[int] = None) -> List[Dict]:
+        """Get a scan's issues in their original order (optionally only the first `limit`)."""
+        conn = db_connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute('SELECT storage_format, results_json FROM scans WHERE id = ?', (scan_id,))
+            row = cursor.fetchone()
+            if row is None:
+                return []
+            if (row[0] or STORAGE_FORMAT_LEGACY) == STORAGE_FORMAT_LEGACY:
+                issues = decode_scan_blob(row[1], None).get('issues', [])
+                return issues[:limit] if limit is not None else issues
+            return load_scan_issues(cursor, scan_id, limit)
+        finally:
+            conn.close()
+    
+    def search(self, text: str, kind: str = 'all', document_id: Optional[int] = None,
+               filename: Optional[str] = None, since: Optional[str] = None,
+               until: Optional[str] = None, category=None, severity=None,
+               latest_only: bool = False, limit: int = SEARCH_DEFAULT_LIMIT,
+               offset: int = 0) -> Dict[str, Any]:
+        """
+        Full-text search over recorded issues and document paragraphs.
         
-        categories = {}
-        for issue in issues:
-            if fingerprint(issue) in fingerprints:
-                cat = issue.get('category', 'Unknown')
-                categories[cat] = categories.get(cat, 0) + 1
+        Args:
+            text: Search text ("quoted phrases", words, prefix*)
+            kind: 'issues', 'paragraphs' or 'all'
+            document_id / filename: Only this document's scans
+            since / until: Scan time bounds (ISO date or datetime, inclusive)
+            category / severity: Issue filters (value, list or comma-separated)
+            latest_only: Only issues from each document's latest scan
+            limit / offset: Page of results per kind, best match first
         
-        return categories
+        Returns:
+            Dict with query and, per requested kind, a ranked result list
+        
+        Raises:
+            ValueError: If the search text or kind is empty/unknown
+            SearchUnavailableError: If SQLite was built without FTS5
+        """
+        query = build_fts_query(text)
+        if not query:
+            raise ValueError("Search text is empty")
+        if kind not in ('all', 'issues', 'paragraphs'):
+            raise ValueError(f"Unknown search kind: {kind}")
+        if not self.search_available:
+            raise SearchUnavailableError(
+                "Scan history search is unavailable: SQLite was built without FTS5")
+        limit = max(1, min(int(limit), SEARCH_MAX_LIMIT))
+        offset = max(0, int(offset))
+        
+        response: Dict[str, Any] = {'query': query}
+        conn = db_connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            if kind in ('all', 'issues'):
+                response['issues'] = search_issues(
+                    cursor, query, document_id, filename, since, until,
+                    category, severity, latest_only, limit, offset)
+            if kind in ('all', 'paragraphs'):
+                response['paragraphs'] = search_paragraphs(
+                    cursor, query, document_id, filename, since, until, limit, offset)
+        finally:
+            conn.close()
+        return response
+    
+    def _calculate_changes(self, cursor, old_scan_id: int, new_scan_id: int) -> Dict:
+        """Calculate differences between two recorded scans from their fingerprints."""
+        return diff_scan_fingerprints(cursor, old_scan_id, new_scan_id)
     
     def _process_roles(self, cursor, document_id: int, roles_data: Dict):
         """Process and store role data from scan results."""
@@ -571,21 +1722,30 @@ class ScanHistoryDB:
                     responsibilities_json = excluded.responsibilities_json,
                     last_updated = CURRENT_TIMESTAMP
             ''', (document_id, role_id, mention_count, json.dumps(responsibilities)))
+        
+        # Keep the per-document role count current for history listings
+        cursor.execute('''
+            UPDATE documents SET role_count = (
+                SELECT COUNT(*) FROM document_roles WHERE document_id = ?
+            ) WHERE id = ?
+        ''', (document_id, document_id))
     
     def get_scan_history(self, filename: str = None, limit: int = 50) -> List[Dict]:
         """Get scan history, optionally filtered by filename.
 
         v3.0.76: Added role_count to results for Document Log display.
         v3.0.110: Added document_id for document comparison feature.
+        role_count is read from documents.role_count (kept current by
+        _process_roles) rather than counted per row.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
 
         if filename:
             cursor.execute('''
                 SELECT s.id, d.filename, s.scan_time, s.issue_count, s.score, s.grade,
                        s.word_count, ic.issues_added, ic.issues_removed,
-                       (SELECT COUNT(*) FROM document_roles dr WHERE dr.document_id = d.id) as role_count,
+                       d.role_count,
                        d.id as document_id
                 FROM scans s
                 JOIN documents d ON s.document_id = d.id
@@ -597,7 +1757,7 @@ class ScanHistoryDB:
             cursor.execute('''
                 SELECT s.id, d.filename, s.scan_time, s.issue_count, s.score, s.grade,
                        s.word_count, ic.issues_added, ic.issues_removed,
-                       (SELECT COUNT(*) FROM document_roles dr WHERE dr.document_id = d.id) as role_count,
+                       d.role_count,
                        d.id as document_id
                 FROM scans s
                 JOIN documents d ON s.document_id = d.id
@@ -637,7 +1797,7 @@ class ScanHistoryDB:
             List of dicts with scan_time, score, grade, issue_count
             Ordered oldest to newest for sparkline display
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -676,7 +1836,7 @@ class ScanHistoryDB:
             List of dicts with scan_time, score, grade, issue_count
             Ordered oldest to newest for sparkline display
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -708,7 +1868,7 @@ class ScanHistoryDB:
         - responsibility_count: Total responsibilities extracted for this role
         - unique_document_count: Count of unique documents (not re-scans)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         query = '''
@@ -773,7 +1933,7 @@ class ScanHistoryDB:
         Returns:
             List of role dictionaries with name, category, mentions, responsibilities
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -809,7 +1969,7 @@ class ScanHistoryDB:
     
     def get_role_document_matrix(self) -> Dict:
         """Get a matrix of roles vs documents for visualization."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         # Get all documents
@@ -846,7 +2006,7 @@ class ScanHistoryDB:
     def save_scan_profile(self, name: str, options: Dict, description: str = "", 
                           set_default: bool = False) -> int:
         """Save a scan profile (check configuration)."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         if set_default:
@@ -870,7 +2030,7 @@ class ScanHistoryDB:
     
     def get_scan_profiles(self) -> List[Dict]:
         """Get all saved scan profiles."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -895,7 +2055,7 @@ class ScanHistoryDB:
     
     def get_default_profile(self) -> Optional[Dict]:
         """Get the default scan profile."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -915,7 +2075,7 @@ class ScanHistoryDB:
     
     def delete_scan_profile(self, profile_id: int) -> bool:
         """Delete a scan profile."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute('DELETE FROM scan_profiles WHERE id = ?', (profile_id,))
         deleted = cursor.rowcount > 0
@@ -933,12 +2093,13 @@ class ScanHistoryDB:
         Returns:
             Dict with success status and message
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
             # First, get the document_id for this scan
-            cursor.execute('SELECT document_id FROM scans WHERE id = ?', (scan_id,))
+            cursor.execute('SELECT document_id, scan_time, grade, score FROM scans WHERE id = ?',
+                           (scan_id,))
             row = cursor.fetchone()
             
             if not row:
@@ -946,14 +2107,23 @@ class ScanHistoryDB:
                 return {'success': False, 'message': 'Scan not found'}
             
             document_id = row[0]
+            _update_portfolio_stats(cursor, row[1], row[2], row[3], -1)
             
-            # Delete issue_changes for this scan
+            # Delete issue_changes and stored issues for this scan
             cursor.execute('DELETE FROM issue_changes WHERE scan_id = ?', (scan_id,))
+            cursor.execute('DELETE FROM scan_issues WHERE scan_id = ?', (scan_id,))
+            cursor.execute('DELETE FROM scan_fingerprints WHERE scan_id = ?', (scan_id,))
             
             # Delete the scan itself
             cursor.execute('DELETE FROM scans WHERE id = ?', (scan_id,))
             scan_deleted = cursor.rowcount > 0
             
+            # Drop document text no other scan refers to
+            cursor.execute('''
+                DELETE FROM document_texts
+                WHERE text_hash NOT IN (SELECT text_hash FROM scans WHERE text_hash IS NOT NULL)
+            ''')
+            
             # Check if document has any remaining scans
             cursor.execute('SELECT COUNT(*) FROM scans WHERE document_id = ?', (document_id,))
             remaining_scans = cursor.fetchone()[0]
@@ -966,6 +2136,7 @@ class ScanHistoryDB:
                 document_deleted = True
                 _log(f"Deleted document {document_id} (no remaining scans)")
             
+            bump_graph_generation(cursor, document_id)
             conn.commit()
             conn.close()
             
@@ -981,9 +2152,147 @@ class ScanHistoryDB:
             _log(f"Error deleting scan {scan_id}: {e}", 'error')
             return {'success': False, 'message': str(e)}
     
+    def apply_retention(self, keep_full_scans: int = RETENTION_KEEP_FULL_SCANS,
+                        summary_after_days: Optional[int] = RETENTION_SUMMARY_AFTER_DAYS,
+                        batch_size: int = RETENTION_BATCH_SIZE,
+                        pause_seconds: float = RETENTION_PAUSE_SECONDS,
+                        stop_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Reduce old scans to their summary rows and drop orphaned data.
+        
+        A scan keeps its full results (issues, fingerprints, text and results
+        blob) while it is one of its document's keep_full_scans most recent
+        scans and no older than summary_after_days (None: no age limit). A
+        document's latest scan always stays full, since the next rescan is
+        diffed against it. Scans are reduced batch_size per transaction with
+        a pause in between, so the write lock is only held briefly.
+        
+        Afterwards document text no scan refers to, rows of deleted scans and
+        documents, and roles no document mentions any more are deleted.
+        
+        Returns:
+            Dict with scans_summarized, issues_deleted, texts_deleted,
+            roles_deleted and interrupted (stop_event was set)
+        """
+        stats = {'scans_summarized': 0, 'issues_deleted': 0, 'texts_deleted': 0,
+                 'roles_deleted': 0, 'interrupted': False}
+        keep_full_scans = max(1, int(keep_full_scans))
+        
+        conn = db_connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            sql = '''
+                SELECT id FROM (
+                    SELECT id, scan_time, storage_format,
+                           ROW_NUMBER() OVER (PARTITION BY document_id
+                                              ORDER BY scan_time DESC, id DESC) AS scan_rank
+                    FROM scans
+                )
+                WHERE COALESCE(storage_format, 0) != ? AND scan_rank > 1
+                  AND (scan_rank > ?
+            '''
+            params: list = [STORAGE_FORMAT_SUMMARY, keep_full_scans]
+            if summary_after_days is not None:
+                sql += " OR scan_time < datetime('now', ?)"
+                params.append(f'-{int(summary_after_days)} days')
+            sql += ') ORDER BY id'
+            scan_ids = [row[0] for row in cursor.execute(sql, params).fetchall()]
+            
+            for start in range(0, len(scan_ids), batch_size):
+                if stop_event is not None and stop_event.is_set():
+                    stats['interrupted'] = True
+                    break
+                chunk = scan_ids[start:start + batch_size]
+                marks = ','.join('?' * len(chunk))
+                cursor.execute(f'DELETE FROM scan_issues WHERE scan_id IN ({marks})', chunk)
+                stats['issues_deleted'] += cursor.rowcount
+                cursor.execute(f'DELETE FROM scan_fingerprints WHERE scan_id IN ({marks})', chunk)
+                cursor.execute(f'''
+                    UPDATE scans
+                    SET results_json = NULL, results_blob = NULL, text_hash = NULL,
+                        storage_format = ?
+                    WHERE id IN ({marks})
+                ''', (STORAGE_FORMAT_SUMMARY, *chunk))
+                stats['scans_summarized'] += cursor.rowcount
+                conn.commit()
+                if pause_seconds:
+                    time.sleep(pause_seconds)
+            
+            # Orphans: text of reduced or deleted scans, rows of deleted
+            # scans and documents, roles no document mentions any more
+            cursor.execute('''
+                DELETE FROM document_texts
+                WHERE text_hash NOT IN (SELECT text_hash FROM scans WHERE text_hash IS NOT NULL)
+            ''')
+            stats['texts_deleted'] = cursor.rowcount
+            for table in ('scan_issues', 'scan_fingerprints', 'issue_changes'):
+                cursor.execute(f'DELETE FROM {table} WHERE scan_id NOT IN (SELECT id FROM scans)')
+            cursor.execute('''
+                DELETE FROM document_roles
+                WHERE document_id NOT IN (SELECT id FROM documents)
+            ''')
+            cursor.execute('''
+                DELETE FROM roles
+                WHERE NOT EXISTS (SELECT 1 FROM document_roles dr WHERE dr.role_id = roles.id)
+            ''')
+            stats['roles_deleted'] = cursor.rowcount
+            if stats['roles_deleted']:
+                bump_graph_generation(cursor)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return stats
+    
+    def reclaim_space(self, step_pages: int = RETENTION_VACUUM_STEP_PAGES,
+                      pause_seconds: float = RETENTION_PAUSE_SECONDS,
+                      stop_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Return free pages to the OS with incremental vacuum.
+        
+        New databases are created with auto_vacuum=INCREMENTAL; older ones
+        are converted with one full VACUUM first, so this is only called from
+        the background maintenance task. Free pages are then released
+        step_pages at a time with a pause in between, and the WAL is truncated.
+        
+        Returns:
+            Dict with bytes_reclaimed, size_before, size_after, pages_freed
+            and full_vacuum
+        """
+        def file_size() -> int:
+            return sum(os.path.getsize(path) for path in (self.db_path, self.db_path + '-wal')
+                       if os.path.exists(path))
+        
+        stats = {'bytes_reclaimed': 0, 'size_before': file_size(), 'size_after': 0,
+                 'pages_freed': 0, 'full_vacuum': False}
+        conn = db_connect(self.db_path)
+        try:
+            if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+                conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+                conn.execute('VACUUM')
+                stats['full_vacuum'] = True
+            free = conn.execute('PRAGMA freelist_count').fetchone()[0]
+            while free and not (stop_event is not None and stop_event.is_set()):
+                conn.execute(f'PRAGMA incremental_vacuum({int(step_pages)})').fetchall()
+                remaining = conn.execute('PRAGMA freelist_count').fetchone()[0]
+                if remaining >= free:
+                    break
+                stats['pages_freed'] += free - remaining
+                free = remaining
+                if free and pause_seconds:
+                    time.sleep(pause_seconds)
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchall()
+        finally:
+            conn.close()
+        stats['size_after'] = file_size()
+        stats['bytes_reclaimed'] = max(0, stats['size_before'] - stats['size_after'])
+        return stats
+    
     def use_profile(self, profile_id: int):
         """Mark a profile as used (update last_used timestamp)."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE scan_profiles SET last_used = CURRENT_TIMESTAMP
@@ -992,6 +2301,14 @@ class ScanHistoryDB:
         conn.commit()
         conn.close()
     
+    def get_graph_generation(self) -> int:
+        """Current role-graph generation (bumped by every graph-affecting write)."""
+        conn = db_connect(self.db_path)
+        try:
+            return conn.execute('SELECT COALESCE(MAX(generation), 0) FROM graph_changes').fetchone()[0]
+        finally:
+            conn.close()
+    
     def get_role_graph_data(self, max_nodes: int = 100, min_weight: int = 1) -> Dict:
         """
         Get graph data for D3.js visualization of role-document relationships.
@@ -1008,7 +2325,7 @@ class ScanHistoryDB:
         Returns:
             Dict with nodes, links, role_counts, doc_counts
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         # Get documents with their stats
@@ -1018,7 +2335,7 @@ class ScanHistoryDB:
             FROM documents d
             LEFT JOIN document_roles dr ON d.id = dr.document_id
             GROUP BY d.id
-            ORDER BY role_count DESC
+            ORDER BY role_count DESC, d.id
             LIMIT ?
         ''', (max_nodes // 2,))
         
@@ -1042,7 +2359,7 @@ class ScanHistoryDB:
                    r.document_count, r.total_mentions
             FROM roles r
             WHERE r.is_deliverable = 0
-            ORDER BY r.document_count DESC, r.total_mentions DESC
+            ORDER BY r.document_count DESC, r.total_mentions DESC, r.id
             LIMIT ?
         ''', (max_nodes // 2,))
         
@@ -1076,7 +2393,7 @@ class ScanHistoryDB:
                 WHERE document_id IN ({placeholders_docs})
                   AND role_id IN ({placeholders_roles})
                   AND mention_count >= ?
-                ORDER BY mention_count DESC
+                ORDER BY mention_count DESC, document_id, role_id
             ''', doc_ids + role_ids + [min_weight])
             
             links = []
@@ -1084,26 +2401,11 @@ class ScanHistoryDB:
                 doc_stable_id = doc_id_map.get(row[0])
                 role_stable_id = role_id_map.get(row[1])
                 if doc_stable_id and role_stable_id:
-                    # Parse responsibilities for top terms
-                    top_terms = []
-                    if row[3]:
-                        try:
-                            resp_data = json.loads(row[3])
-                            if isinstance(resp_data, list):
-                                for r in resp_data[:3]:
-                                    if isinstance(r, dict) and 'verb' in r:
-                                        top_terms.append(r['verb'])
-                                    elif isinstance(r, str):
-                                        words = r.split()[:2]
-                                        top_terms.append(' '.join(words))
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                    
                     links.append({
                         'source': role_stable_id,
                         'target': doc_stable_id,
                         'weight': row[2],
-                        'top_terms': top_terms[:3],
+                        'top_terms': _top_terms(row[3]),
                         'link_type': 'role-document'
                     })
         else:
@@ -1122,7 +2424,7 @@ class ScanHistoryDB:
                   AND dr2.role_id IN ({placeholders_roles})
                 GROUP BY dr1.role_id, dr2.role_id
                 HAVING shared_docs >= ?
-                ORDER BY shared_docs DESC
+                ORDER BY shared_docs DESC, dr1.role_id, dr2.role_id
                 LIMIT 50
             ''', role_ids + role_ids + [min_weight])
             
@@ -1140,44 +2442,7 @@ class ScanHistoryDB:
         
         conn.close()
         
-        # Combine nodes
-        nodes = roles + documents
-        
-        # Create aggregates
-        role_counts = {
-            r['id']: {
-                'mentions': r['total_mentions'],
-                'docs': r['document_count'],
-                'category': r['category']
-            } for r in roles
-        }
-        
-        doc_counts = {
-            d['id']: {
-                'roles_count': d['role_count'],
-                'mentions_total': d['total_mentions']
-            } for d in documents
-        }
-        
-        # Count link types
-        role_doc_links = sum(1 for l in links if l.get('link_type') == 'role-document')
-        role_role_links = sum(1 for l in links if l.get('link_type') == 'role-role')
-        
-        return {
-            'nodes': nodes,
-            'links': links,
-            'role_counts': role_counts,
-            'doc_counts': doc_counts,
-            'meta': {
-                'total_roles': len(roles),
-                'total_documents': len(documents),
-                'total_links': len(links),
-                'role_doc_links': role_doc_links,
-                'role_role_links': role_role_links,
-                'max_nodes': max_nodes,
-                'min_weight': min_weight
-            }
-        }
+        return _assemble_graph(roles, documents, links, max_nodes, min_weight)
     
     # ================================================================
     # ROLE DICTIONARY MANAGEMENT
@@ -1185,7 +2450,7 @@ class ScanHistoryDB:
     
     def get_role_dictionary(self, include_inactive: bool = False) -> List[Dict]:
         """Get all roles from the role dictionary."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         query = '''
@@ -1242,7 +2507,7 @@ class ScanHistoryDB:
         Returns:
             Dict with success status and role data or error
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         normalized = role_name.lower().strip()
@@ -1271,8 +2536,9 @@ class ScanHistoryDB:
                 kwargs.get('created_by', 'user'),
                 kwargs.get('notes')
             ))
-            conn.commit()
             role_id = cursor.lastrowid
+            bump_graph_generation(conn)
+            conn.commit()
             
             conn.close()
             return {
@@ -1296,7 +2562,7 @@ class ScanHistoryDB:
     
     def update_role_in_dictionary(self, role_id: int, updated_by: str = 'user', **kwargs) -> Dict:
         """Update an existing role in the dictionary."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         # Build update query dynamically based on provided fields
@@ -1332,6 +2598,7 @@ class ScanHistoryDB:
                 SET {', '.join(updates)}
                 WHERE id = ?
             ''', values)
+            bump_graph_generation(conn)
             conn.commit()
             
             success = cursor.rowcount > 0
@@ -1350,7 +2617,7 @@ class ScanHistoryDB:
     
     def delete_role_from_dictionary(self, role_id: int, soft_delete: bool = True) -> Dict:
         """Delete or deactivate a role from the dictionary."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -1363,6 +2630,7 @@ class ScanHistoryDB:
             else:
                 cursor.execute('DELETE FROM role_dictionary WHERE id = ?', (role_id,))
             
+            bump_graph_generation(conn)
             conn.commit()
             success = cursor.rowcount > 0
             conn.close()
@@ -1424,7 +2692,7 @@ class ScanHistoryDB:
     
     def get_active_role_names(self) -> List[str]:
         """Get list of active role names for use in extraction."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_connect(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -2759,9 +4027,10 @@ class ScanHistoryDB:
         
         if merge_mode == 'replace_all':
             # Clear existing and import all
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute('DELETE FROM role_dictionary')
+            bump_graph_generation(cursor)
             conn.commit()
             conn.close()
             
@@ -2784,7 +4053,7 @@ class ScanHistoryDB:
                 normalized = role_name.lower().strip()
                 
                 # Check if exists
-                conn = sqlite3.connect(self.db_path)
+                conn = db_connect(self.db_path)
                 cursor = conn.cursor()
                 cursor.execute(
                     'SELECT id FROM role_dictionary WHERE normalized_name = ?',
@@ -2919,7 +4188,7 @@ class ScanHistoryDB:
         }
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = db_connect(self.db_path)
             cursor = conn.cursor()
             
             # Get all roles from role_occurrences with their counts
@@ -2982,33 +4251,645 @@ class ScanHistoryDB:
         return results
 
 
-# Graph cache for performance
-_graph_cache = {}
-_graph_cache_max_age = 300  # 5 minutes
+# ============================================================
+# ROLE GRAPH CACHE
+# ============================================================
+# Graphs are cached per (database, generation, max_nodes, min_weight).
+# The generation is the newest graph_changes row, written in the same
+# transaction as every change that can alter the graph, so a cached graph
+# is never served after a scan or dictionary edit. The cache also keeps
+# the document/role rows the graph is built from; when only a few
+# documents changed, just those rows are reloaded.
 
-def get_cached_graph(session_id: str, file_hash: str, db: 'ScanHistoryDB', 
-                     max_nodes: int = 100, min_weight: int = 1) -> Dict:
-    """Get graph data with caching based on session and file hash."""
-    import time
-    
-    cache_key = f"{session_id}:{file_hash}:{max_nodes}:{min_weight}"
-    now = time.time()
-    
-    if cache_key in _graph_cache:
-        cached_time, cached_data = _graph_cache[cache_key]
-        if now - cached_time < _graph_cache_max_age:
-            return cached_data
-    
-    # Generate fresh data
-    data = db.get_role_graph_data(max_nodes, min_weight)
-    _graph_cache[cache_key] = (now, data)
-    
-    # Cleanup old cache entries
-    expired_keys = [k for k, (t, _) in _graph_cache.items() if now - t > _graph_cache_max_age * 2]
-    for k in expired_keys:
-        del _graph_cache[k]
-    
-    return data
+GRAPH_CACHE_MAX_ENTRIES = 32
+# More document changes than this since the cached state: reload everything
+GRAPH_INCREMENTAL_MAX_CHANGES = 50
+# graph_changes rows kept (older generations only matter to stale states)
+GRAPH_CHANGES_KEEP = 1000
+
+
+def _top_terms(responsibilities_json: Optional[str]) -> List[str]:
+    """First three responsibility verbs/phrases of a document-role link."""
+    top_terms = []
+    if responsibilities_json:
+        try:
+            resp_data = json.loads(responsibilities_json)
+            if isinstance(resp_data, list):
+                for r in resp_data[:3]:
+                    if isinstance(r, dict) and 'verb' in r:
+                        top_terms.append(r['verb'])
+                    elif isinstance(r, str):
+                        words = r.split()[:2]
+                        top_terms.append(' '.join(words))
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return top_terms[:3]
+
+
+def bump_graph_generation(cursor, document_id: Optional[int] = None) -> int:
+    """
+    Start a new role-graph generation, in the caller's transaction.
+
+    Pass the document whose roles changed, or None when the change is not
+    limited to one document. Takes a cursor or connection.
+    """
+    generation = cursor.execute('INSERT INTO graph_changes (document_id) VALUES (?)',
+                                (document_id,)).lastrowid
+    cursor.execute('DELETE FROM graph_changes WHERE generation <= ?',
+                   (generation - GRAPH_CHANGES_KEEP,))
+    return generation
+
+
+class RoleGraphState:
+    """In-memory copy of the rows get_role_graph_data reads, at one generation."""
+
+    def __init__(self, generation: int = 0):
+        self.generation = generation
+        self.documents: Dict[int, str] = {}
+        # document_id -> {role_id: (mention_count, top_terms)}
+        self.doc_roles: Dict[int, Dict[int, tuple]] = {}
+        # role_id -> (role_name, normalized_name, category, document_count,
+        #             total_mentions, is_deliverable)
+        self.roles: Dict[int, tuple] = {}
+
+    def _load_roles(self, cursor, role_ids: Optional[List[int]] = None):
+        sql = '''
+            SELECT id, role_name, normalized_name, category, document_count,
+                   total_mentions, is_deliverable
+            FROM roles
+        '''
+        if role_ids is None:
+            rows = cursor.execute(sql).fetchall()
+        else:
+            rows = []
+            for start in range(0, len(role_ids), 500):
+                chunk = role_ids[start:start + 500]
+                rows += cursor.execute(sql + f' WHERE id IN ({",".join("?" * len(chunk))})',
+                                       chunk).fetchall()
+            for role_id in role_ids:
+                self.roles.pop(role_id, None)
+        for row in rows:
+            self.roles[row[0]] = tuple(row[1:])
+
+    def load(self, cursor, generation: int):
+        """Load every document, document-role link and role."""
+        self.generation = generation
+        self.documents = dict(cursor.execute('SELECT id, filename FROM documents').fetchall())
+        self.doc_roles = {doc_id: {} for doc_id in self.documents}
+        for doc_id, role_id, mentions, resp in cursor.execute('''
+            SELECT document_id, role_id, mention_count, responsibilities_json
+            FROM document_roles
+        '''):
+            if doc_id in self.doc_roles:
+                self.doc_roles[doc_id][role_id] = (mentions, _top_terms(resp))
+        self.roles = {}
+        self._load_roles(cursor)
+
+    def reload_documents(self, cursor, document_ids: List[int], generation: int):
+        """Refresh only the given documents, their links and the roles they touch."""
+        touched_roles = set()
+        for doc_id in document_ids:
+            touched_roles.update(self.doc_roles.pop(doc_id, {}))
+            self.documents.pop(doc_id, None)
+            row = cursor.execute('SELECT filename FROM documents WHERE id = ?',
+                                 (doc_id,)).fetchone()
+            if row is None:
+                continue
+            self.documents[doc_id] = row[0]
+            links = {}
+            for role_id, mentions, resp in cursor.execute('''
+                SELECT role_id, mention_count, responsibilities_json
+                FROM document_roles WHERE document_id = ?
+            ''', (doc_id,)):
+                links[role_id] = (mentions, _top_terms(resp))
+            self.doc_roles[doc_id] = links
+            touched_roles.update(links)
+        self._load_roles(cursor, sorted(touched_roles))
+        self.generation = generation
+
+    def build_graph(self, max_nodes: int, min_weight: int) -> Dict:
+        """Same graph as ScanHistoryDB.get_role_graph_data, built without SQL."""
+        limit = max_nodes // 2
+
+        doc_stats = []
+        for doc_id, filename in self.documents.items():
+            links = self.doc_roles.get(doc_id, {})
+            doc_stats.append((doc_id, filename, len(links),
+                              sum(m for m, _ in links.values())))
+        doc_stats.sort(key=lambda d: (-d[2], d[0]))
+        documents = [{
+            'id': f"doc_{doc_id}",
+            'db_id': doc_id,
+            'label': filename,
+            'type': 'document',
+            'role_count': role_count,
+            'total_mentions': total_mentions
+        } for doc_id, filename, role_count, total_mentions in doc_stats[:limit]]
+
+        role_rows = sorted(
+            ((role_id, row) for role_id, row in self.roles.items() if row[5] == 0),
+            key=lambda r: (-(r[1][3] or 0), -(r[1][4] or 0), r[0]))[:limit]
+        roles = [{
+            'id': f"role_{role_id}",
+            'db_id': role_id,
+            'label': normalized or name,  # Prefer normalized name
+            'original_name': name,
+            'type': 'role',
+            'category': category or 'Unknown',
+            'document_count': document_count,
+            'total_mentions': total_mentions
+        } for role_id, (name, normalized, category, document_count,
+                        total_mentions, _) in role_rows]
+
+        doc_ids = {d['db_id'] for d in documents}
+        role_ids = {r['db_id'] for r in roles}
+
+        links = []
+        doc_links = []
+        for doc_id in doc_ids:
+            for role_id, (mentions, top_terms) in self.doc_roles.get(doc_id, {}).items():
+                if role_id in role_ids and mentions >= min_weight:
+                    doc_links.append((mentions, doc_id, role_id, top_terms))
+        doc_links.sort(key=lambda l: (-l[0], l[1], l[2]))
+        for mentions, doc_id, role_id, top_terms in doc_links:
+            links.append({
+                'source': f"role_{role_id}",
+                'target': f"doc_{doc_id}",
+                'weight': mentions,
+                'top_terms': list(top_terms),
+                'link_type': 'role-document'
+            })
+
+        # Role-to-role co-occurrence across all documents
+        if len(role_ids) >= 2:
+            shared: Dict[tuple, int] = {}
+            for links_by_role in self.doc_roles.values():
+                present = sorted(r for r in links_by_role if r in role_ids)
+                for i, first in enumerate(present):
+                    for second in present[i + 1:]:
+                        shared[(first, second)] = shared.get((first, second), 0) + 1
+            pairs = sorted(((count, pair) for pair, count in shared.items()
+                            if count >= min_weight),
+                           key=lambda p: (-p[0], p[1]))[:50]
+            for count, (first, second) in pairs:
+                links.append({
+                    'source': f"role_{first}",
+                    'target': f"role_{second}",
+                    'weight': count,
+                    'link_type': 'role-role',
+                    'shared_documents': count
+                })
+
+        return _assemble_graph(roles, documents, links, max_nodes, min_weight)
+
+
+def _assemble_graph(roles: List[Dict], documents: List[Dict], links: List[Dict],
+                    max_nodes: int, min_weight: int) -> Dict:
+    """Add the aggregate and meta sections to a role graph."""
+    role_counts = {
+        r['id']: {
+            'mentions': r['total_mentions'],
+            'docs': r['document_count'],
+            'category': r['category']
+        } for r in roles
+    }
+    doc_counts = {
+        d['id']: {
+            'roles_count': d['role_count'],
+            'mentions_total': d['total_mentions']
+        } for d in documents
+    }
+    role_doc_links = sum(1 for l in links if l.get('link_type') == 'role-document')
+    role_role_links = sum(1 for l in links if l.get('link_type') == 'role-role')
+    return {
+        'nodes': roles + documents,
+        'links': links,
+        'role_counts': role_counts,
+        'doc_counts': doc_counts,
+        'meta': {
+            'total_roles': len(roles),
+            'total_documents': len(documents),
+            'total_links': len(links),
+            'role_doc_links': role_doc_links,
+            'role_role_links': role_role_links,
+            'max_nodes': max_nodes,
+            'min_weight': min_weight
+        }
+    }
+
+
+class RoleGraphCache:
+    """
+    Generation-keyed, LRU-bounded cache of role graphs.
+
+    One RoleGraphState is kept per database and brought up to the current
+    generation (incrementally when possible) before a missing graph is built.
+    """
+
+    def __init__(self, max_entries: int = GRAPH_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._graphs: 'OrderedDict[tuple, Dict]' = OrderedDict()
+        self._states: Dict[str, RoleGraphState] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.full_loads = 0
+        self.incremental_loads = 0
+
+    def _sync_state(self, db: 'ScanHistoryDB', generation: int) -> RoleGraphState:
+        state = self._states.get(db.db_path)
+        if state is not None and state.generation == generation:
+            return state
+
+        conn = db_connect(db.db_path)
+        try:
+            cursor = conn.cursor()
+            changes = None
+            if state is not None and state.generation < generation:
+                changes = cursor.execute('''
+                    SELECT generation, document_id FROM graph_changes
+                    WHERE generation > ? ORDER BY generation
+                    LIMIT ?
+                ''', (state.generation, GRAPH_INCREMENTAL_MAX_CHANGES + 1)).fetchall()
+            incremental = (
+                changes
+                and len(changes) <= GRAPH_INCREMENTAL_MAX_CHANGES
+                and changes[0][0] == state.generation + 1   # log not pruned past us
+                and changes[-1][0] == generation
+                and all(doc_id is not None for _, doc_id in changes)
+            )
+            if incremental:
+                state.reload_documents(cursor, sorted({doc_id for _, doc_id in changes}),
+                                       generation)
+                self.incremental_loads += 1
+            else:
+                state = RoleGraphState()
+                state.load(cursor, generation)
+                self.full_loads += 1
+        finally:
+            conn.close()
+        self._states[db.db_path] = state
+        return state
+
+    def get(self, db: 'ScanHistoryDB', max_nodes: int = 100, min_weight: int = 1) -> Dict:
+        """Get the role graph for db's current generation."""
+        generation = db.get_graph_generation()
+        key = (db.db_path, generation, max_nodes, min_weight)
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self._graphs.move_to_end(key)
+                self.hits += 1
+                return graph
+            self.misses += 1
+
+            state = self._sync_state(db, generation)
+            graph = state.build_graph(max_nodes, min_weight)
+
+            # Graphs of older generations can never be served again
+            for stale in [k for k in self._graphs if k[0] == db.db_path and k[1] != generation]:
+                del self._graphs[stale]
+            self._graphs[key] = graph
+            while len(self._graphs) > self.max_entries:
+                self._graphs.popitem(last=False)
+            return graph
+
+    def clear(self):
+        with self._lock:
+            self._graphs.clear()
+            self._states.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'entries': len(self._graphs),
+                'hits': self.hits,
+                'misses': self.misses,
+                'full_loads': self.full_loads,
+                'incremental_loads': self.incremental_loads,
+            }
+
+
+_role_graph_cache = RoleGraphCache()
+
+
+def get_role_graph_cache() -> RoleGraphCache:
+    """Get the process-wide role graph cache."""
+    return _role_graph_cache
+
+
+def get_cached_graph(db: 'ScanHistoryDB', max_nodes: int = 100, min_weight: int = 1) -> Dict:
+    """Get role graph data, served from the generation-keyed cache."""
+    return _role_graph_cache.get(db, max_nodes, min_weight)
+
+
+# ============================================================
+# ASYNC SCAN HISTORY WRITER
+# ============================================================
+# Review jobs hand their results to a single background thread instead of
+# recording scan history themselves, so a job can complete as soon as its
+# results exist. The writer drains a bounded queue and records up to
+# WRITER_BATCH_SIZE scans per transaction, each in its own savepoint so one
+# bad scan does not undo the others. When the queue is full, submit()
+# blocks until there is room: history is never dropped and a stalled
+# database cannot grow the backlog without bound.
+
+WRITER_QUEUE_SIZE = 64
+WRITER_BATCH_SIZE = 16
+# Seconds the process waits at exit for queued scans to be written
+WRITER_EXIT_FLUSH_SECONDS = 10
+
+
+class ScanWrite:
+    """
+    A queued record_scan call.
+
+    wait() blocks until it is written; callback(scan_info, error) is called
+    on the writer thread once the transaction holding it has committed (or
+    failed, with scan_info None).
+    """
+
+    def __init__(self, db: 'ScanHistoryDB', filename: str, filepath: str, results: Dict,
+                 options: Dict, file_hash: Optional[str] = None,
+                 callback: Optional[Callable[[Optional[Dict], Optional[str]], None]] = None):
+        self.db = db
+        self.filename = filename
+        self.filepath = filepath
+        # Shallow copy: callers may add keys (e.g. scan_info) to their dict
+        # while this write is still queued
+        self.results = dict(results)
+        self.options = options
+        self.file_hash = file_hash
+        self.callback = callback
+        self.scan_info: Optional[Dict] = None
+        self.error: Optional[str] = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Wait for the write; returns scan_info (None on failure or timeout)."""
+        self._done.wait(timeout)
+        return self.scan_info
+
+    def _finish(self, scan_info: Optional[Dict], error: Optional[str] = None):
+        self.scan_info = scan_info
+        self.error = error
+        self._done.set()
+        if self.callback:
+            try:
+                self.callback(scan_info, error)
+            except Exception as e:
+                _log(f"Scan history callback failed for {self.filename}: {e}", 'error')
+
+
+class ScanHistoryWriter:
+    """Single background thread that records queued scans in batched transactions."""
+
+    def __init__(self, queue_size: int = WRITER_QUEUE_SIZE,
+                 batch_size: int = WRITER_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name='scan-history-writer')
+                self._thread.start()
+
+    def submit(self, db: 'ScanHistoryDB', filename: str, filepath: str, results: Dict,
+               options: Dict, file_hash: Optional[str] = None,
+               callback: Optional[Callable[[Optional[Dict], Optional[str]], None]] = None
+               ) -> ScanWrite:
+        """Queue a record_scan call (blocks only while the queue is full)."""
+        write = ScanWrite(db, filename, filepath, results, options, file_hash, callback)
+        with self._lock:
+            self.submitted += 1
+        self._ensure_thread()
+        self._queue.put(write)
+        return write
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far is written; False on timeout."""
+        barrier = threading.Event()
+        self._ensure_thread()
+        try:
+            self._queue.put(barrier, timeout=timeout)
+        except queue.Full:
+            return False
+        return barrier.wait(timeout)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            writes = [item for item in batch if isinstance(item, ScanWrite)]
+            try:
+                by_db: Dict[str, List[ScanWrite]] = {}
+                for write in writes:
+                    by_db.setdefault(write.db.db_path, []).append(write)
+                for db_writes in by_db.values():
+                    self._write_batch(db_writes)
+            except Exception as e:
+                _log(f"Scan history writer error: {e}", 'error')
+                for write in writes:
+                    if not write.done:
+                        write._finish(None, str(e))
+            finally:
+                # Barriers queued behind these writes are released once they are done
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()
+
+    def _write_batch(self, writes: List[ScanWrite]):
+        """Record writes (all for one database) in a single transaction."""
+        db = writes[0].db
+        recorded = []
+        conn = db_connect(db.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            for write in writes:
+                cursor.execute('SAVEPOINT scan_write')
+                try:
+                    scan_info = db._record_scan(cursor, write.filename, write.filepath,
+                                                write.results, write.options, write.file_hash)
+                except Exception as e:
+                    cursor.execute('ROLLBACK TO scan_write')
+                    cursor.execute('RELEASE scan_write')
+                    _log(f"Scan history write failed for {write.filename}: {e}", 'error')
+                    write._finish(None, str(e))
+                    continue
+                cursor.execute('RELEASE scan_write')
+                recorded.append((write, scan_info))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            for write, _ in recorded:
+                write._finish(None, str(e))
+            with self._lock:
+                self.batches += 1
+                self.failed += len(writes)
+            raise
+        finally:
+            conn.close()
+
+        with self._lock:
+            self.batches += 1
+            self.written += len(recorded)
+            self.failed += len(writes) - len(recorded)
+        for write, scan_info in recorded:
+            write._finish(scan_info)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'submitted': self.submitted,
+                'written': self.written,
+                'failed': self.failed,
+                'batches': self.batches,
+                'queued': self._queue.qsize(),
+            }
+
+
+_scan_history_writer: Optional[ScanHistoryWriter] = None
+_scan_history_writer_lock = threading.Lock()
+
+
+def get_scan_history_writer() -> ScanHistoryWriter:
+    """Get the process-wide scan history writer."""
+    global _scan_history_writer
+    if _scan_history_writer is None:
+        with _scan_history_writer_lock:
+            if _scan_history_writer is None:
+                _scan_history_writer = ScanHistoryWriter()
+                atexit.register(_scan_history_writer.flush, WRITER_EXIT_FLUSH_SECONDS)
+    return _scan_history_writer
+
+
+# ============================================================
+# HISTORY MAINTENANCE
+# ============================================================
+
+class ScanHistoryMaintenance:
+    """
+    Background task applying the retention policy to a scan history database.
+
+    Each run calls ScanHistoryDB.apply_retention then reclaim_space (both
+    throttled) and keeps the combined report, including bytes reclaimed.
+    """
+
+    def __init__(self, db: 'ScanHistoryDB',
+                 keep_full_scans: int = RETENTION_KEEP_FULL_SCANS,
+                 summary_after_days: Optional[int] = RETENTION_SUMMARY_AFTER_DAYS,
+                 interval_seconds: float = RETENTION_INTERVAL_SECONDS):
+        self.db = db
+        self.keep_full_scans = keep_full_scans
+        self.summary_after_days = summary_after_days
+        self.interval_seconds = interval_seconds
+        self.last_report: Optional[Dict[str, Any]] = None
+        self._stop = threading.Event()
+        self._run_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> Dict[str, Any]:
+        """Apply the retention policy and reclaim space now."""
+        with self._run_lock:
+            return self._run()
+
+    def _run(self) -> Dict[str, Any]:
+        """One maintenance run (_run_lock held)."""
+        started = time.time()
+        report = self.db.apply_retention(self.keep_full_scans, self.summary_after_days,
+                                         stop_event=self._stop)
+        report.update(self.db.reclaim_space(stop_event=self._stop))
+        report['finished_at'] = datetime.now().isoformat()
+        report['duration_seconds'] = round(time.time() - started, 2)
+        self.last_report = report
+        _log(f"Scan history maintenance: {report['scans_summarized']} scans summarized, "
+             f"{report['roles_deleted']} orphaned roles dropped, "
+             f"{report['bytes_reclaimed']} bytes reclaimed")
+        return report
+
+    def run_in_background(self) -> bool:
+        """
+        Start run_once on a daemon thread, for callers that must not wait.
+
+        Returns:
+            False if a run is already in progress (nothing is started)
+        """
+        if not self._run_lock.acquire(blocking=False):
+            return False
+
+        def run():
+            try:
+                self._run()
+            except Exception as e:
+                _log(f"Scan history maintenance failed: {e}", 'error')
+            finally:
+                self._run_lock.release()
+
+        threading.Thread(target=run, daemon=True, name='scan-history-maintenance-run').start()
+        return True
+
+    def start(self, initial_delay: float = RETENTION_INITIAL_DELAY_SECONDS):
+        """Run periodically on a daemon thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+
+        def loop():
+            delay = initial_delay
+            while not self._stop.wait(delay):
+                try:
+                    self.run_once()
+                except Exception as e:
+                    _log(f"Scan history maintenance failed: {e}", 'error')
+                delay = self.interval_seconds
+
+        self._thread = threading.Thread(target=loop, daemon=True, name='scan-history-maintenance')
+        self._thread.start()
+
+    def stop(self):
+        """Stop the periodic task, interrupting a run between batches."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'running': self._thread is not None and self._thread.is_alive(),
+            'in_progress': self._run_lock.locked(),
+            'keep_full_scans': self.keep_full_scans,
+            'summary_after_days': self.summary_after_days,
+            'interval_seconds': self.interval_seconds,
+            'last_report': self.last_report,
+        }
+
+
+_maintenance: Optional[ScanHistoryMaintenance] = None
+
+
+def get_scan_history_maintenance() -> ScanHistoryMaintenance:
+    """Get the maintenance task for the default scan history database."""
+    global _maintenance
+    if _maintenance is None:
+        _maintenance = ScanHistoryMaintenance(get_scan_history_db())
+    return _maintenance
 
 
 # Singleton instance
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+TechWriterReview - Session Result Store
+=======================================
+Memory-budgeted home for the large per-session values (review_results and
+filtered_issues) that SessionManager used to keep in process memory for up
+to a day.
+
+A session's stored values form one entry. The store keeps an estimate of
+each resident entry's size (its pickled length) and a global byte budget:
+when the budget is exceeded, the least recently used entries are written to
+zlib-compressed files in the spill directory and dropped from memory. The
+next read loads an entry back transparently (spilling others if needed).
+Reads return the stored objects themselves, so in-place changes are kept,
+including by the next spill.
+
+SessionData is the dict SessionManager hands out; its STORED_KEYS are read
+from and written to the store, so callers keep using session_data['...'].
+
+Spill files are pickles written and read only by this process under a
+private directory, which is emptied when a store is created.
+
+Usage:
+    from session_store import SessionResultStore, SessionData
+
+    store = SessionResultStore(budget_bytes=64 * 1024 * 1024, spill_dir=temp_dir)
+    session = SessionData(store, session_id, created=...)
+    session['review_results'] = results      # stored, may spill older sessions
+    session['review_results']                # rehydrated if it was spilled
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+__version__ = "1.0.0"
+
+# Global budget for resident session results (overridable with TWR_SESSION_MEMORY_MB)
+DEFAULT_BUDGET_BYTES = int(os.environ.get('TWR_SESSION_MEMORY_MB', '256')) * 1024 * 1024
+# Spills happen on the request path: favour speed over ratio
+SPILL_COMPRESSION_LEVEL = 1
+SPILL_SUFFIX = '.pkl.z'
+
+# Session keys held in the store, with their value when nothing is stored
+STORED_KEYS: Dict[str, Callable[[], Any]] = {
+    'review_results': lambda: None,
+    'filtered_issues': list,
+}
+
+
+def _dumps(values: Dict[str, Any]) -> bytes:
+    return pickle.dumps(values, pickle.HIGHEST_PROTOCOL)
+
+
+def _measure(values: Dict[str, Any]) -> int:
+    """Pickled size of an entry (0 if it cannot be pickled, and so never spills)."""
+    try:
+        return len(_dumps(values))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return 0
+
+
+class SessionResultStore:
+    """
+    Byte-budgeted LRU of per-session values that spills to compressed files.
+
+    Entries are pickled as a whole, so objects shared between an entry's
+    values (filtered_issues is usually review_results['issues'] or a
+    selection from it) are counted and written once. The entry being read or
+    written is never spilled, even if it alone exceeds the budget.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES,
+                 spill_dir: Optional[Path] = None):
+        self.budget_bytes = max(0, budget_bytes)
+        self.spill_dir = Path(spill_dir) if spill_dir else (
+            Path(tempfile.gettempdir()) / 'twr_session_store')
+        self._resident: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._spilled: Dict[str, int] = {}  # key -> compressed bytes on disk
+        self._resident_bytes = 0
+        self._lock = threading.RLock()
+        self._release_listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+        self.spills = 0
+        self.rehydrations = 0
+        self.spill_errors = 0
+        self._purge_spill_dir()
+
+    def _purge_spill_dir(self):
+        """Remove spill files left by a previous process."""
+        if not self.spill_dir.is_dir():
+            return
+        for path in self.spill_dir.glob(f'*{SPILL_SUFFIX}'):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _spill_path(self, key: str) -> Path:
+        # Keys are session IDs from cookies: never use them as file names
+        return self.spill_dir / (hashlib.sha256(key.encode('utf-8')).hexdigest() + SPILL_SUFFIX)
+
+    def add_release_listener(self, listener: Callable[[str, Dict[str, Any]], None]):
+        """
+        Register listener(key, values) for values that leave memory.
+
+        Called (outside the store's lock) with the values of an entry that
+        was spilled to disk, and with the previous values of fields that
+        were replaced or discarded - so holders of extra references to them
+        (e.g. finished jobs) can let go.
+        """
+        self._release_listeners.append(listener)
+
+    def _notify_released(self, released: List[tuple]):
+        for key, values in released:
+            if not values:
+                continue
+            for listener in self._release_listeners:
+                try:
+                    listener(key, values)
+                except Exception:
+                    pass
+
+    # -------------------------------------------------------------------------
+    # Access
+    # -------------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an entry's values (loading them from disk if spilled).
+
+        Returns:
+            The stored dict itself, or None if nothing is stored for key
+        """
+        with self._lock:
+            values, released = self._load(key)
+        self._notify_released(released)
+        return values
+
+    def update(self, key: str, **fields) -> None:
+        """
+        Set fields of an entry, creating it if needed.
+
+        The entry is re-measured when review_results changes; other fields
+        (filtered_issues) only select from it and keep the current estimate.
+        """
+        with self._lock:
+            current, released = self._load(key)
+            current = current or {}
+            replaced = {name: current[name] for name in fields
+                        if name in current and current[name] is not fields[name]}
+            values = dict(current)
+            values.update(fields)
+            remeasure = key not in self._sizes or (
+                'review_results' in fields
+                and current.get('review_results') is not fields['review_results'])
+            size = _measure(values) if remeasure else self._sizes[key]
+            self._forget(key)
+            self._resident[key] = values
+            self._sizes[key] = size
+            self._resident_bytes += size
+            released += [(key, replaced)] + self._enforce_budget(keep=key)
+        self._notify_released(released)
+
+    def _load(self, key: str) -> tuple:
+        """Resident values for key, rehydrating if spilled (lock held)."""
+        values = self._resident.get(key)
+        if values is not None:
+            self._resident.move_to_end(key)
+            return values, []
+        if key not in self._spilled:
+            return None, []
+        values = self._rehydrate(key)
+        if values is None:
+            return None, []
+        return values, self._enforce_budget(keep=key)
+
+    def discard(self, key: str) -> None:
+        """Remove an entry from memory and disk."""
+        with self._lock:
+            values = self._resident.get(key)
+            self._forget(key)
+        self._notify_released([(key, values)])
+
+    def clear(self) -> None:
+        """Remove every entry (without notifying listeners)."""
+        with self._lock:
+            for key in list(self._resident) + list(self._spilled):
+                self._forget(key)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._resident or key in self._spilled
+
+    # -------------------------------------------------------------------------
+    # Spilling
+    # -------------------------------------------------------------------------
+
+    def _forget(self, key: str):
+        if self._resident.pop(key, None) is not None:
+            self._resident_bytes -= self._sizes.get(key, 0)
+        self._sizes.pop(key, None)
+        if self._spilled.pop(key, None) is not None:
+            try:
+                self._spill_path(key).unlink()
+            except OSError:
+                pass
+
+    def _enforce_budget(self, keep: Optional[str] = None) -> List[tuple]:
+        """Spill least recently used entries until within budget (lock held)."""
+        released = []
+        for victim in list(self._resident):
+            if self._resident_bytes <= self.budget_bytes:
+                break
+            if victim == keep or not self._sizes.get(victim):
+                continue
+            values = self._resident[victim]
+            if self._spill(victim, values):
+                released.append((victim, values))
+        return released
+
+    def _spill(self, key: str, values: Dict[str, Any]) -> bool:
+        try:
+            blob = zlib.compress(_dumps(values), SPILL_COMPRESSION_LEVEL)
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            path = self._spill_path(key)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_bytes(blob)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            self.spill_errors += 1
+            return False  # keep it in memory rather than lose it
+        del self._resident[key]
+        self._resident_bytes -= self._sizes.get(key, 0)
+        self._spilled[key] = len(blob)
+        self.spills += 1
+        return True
+
+    def _rehydrate(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._spill_path(key)
+        try:
+            raw = zlib.decompress(path.read_bytes())
+            values = pickle.loads(raw)
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError):
+            self._spilled.pop(key, None)
+            return None
+        del self._spilled[key]
+        try:
+            path.unlink()  # rewritten on the next spill, with any changes
+        except OSError:
+            pass
+        self._resident[key] = values
+        self._sizes[key] = len(raw)
+        self._resident_bytes += len(raw)
+        self.rehydrations += 1
+        return values
+
+    def stats(self) -> Dict[str, Any]:
+        """Budget and usage in bytes (resident sizes are pickled-size estimates)."""
+        with self._lock:
+            return {
+                'budget_bytes': self.budget_bytes,
+                'resident_bytes': self._resident_bytes,
+                'resident_entries': len(self._resident),
+                'spilled_entries': len(self._spilled),
+                'spilled_bytes': sum(self._spilled.values()),
+                'spills': self.spills,
+                'rehydrations': self.rehydrations,
+                'spill_errors': self.spill_errors,
+            }
+
+
+class SessionData(dict):
+    """
+    A session's data, with STORED_KEYS kept in a SessionResultStore.
+
+    Reading a stored key (data[key], data.get(key)) loads it from the
+    store; assigning one (data[key] = v, data.update(...)) stores it. The
+    plain dict only holds the small per-session fields.
+    """
+
+    def __init__(self, store: SessionResultStore, store_key: str, **fields):
+        super().__init__()
+        self.store = store
+        self.store_key = store_key
+        self.update(**fields)
+
+    def _stored(self, name: str) -> Any:
+        values = self.store.get(self.store_key)
+        if values is None or name not in values:
+            return STORED_KEYS[name]()
+        return values[name]
+
+    def __getitem__(self, name):
+        if name in STORED_KEYS:
+            return self._stored(name)
+        return super().__getitem__(name)
+
+    def get(self, name, default=None):
+        if name in STORED_KEYS:
+            return self._stored(name)
+        return super().get(name, default)
+
+    def __contains__(self, name) -> bool:
+        return name in STORED_KEYS or super().__contains__(name)
+
+    def __setitem__(self, name, value):
+        if name in STORED_KEYS:
+            self.store.update(self.store_key, **{name: value})
+        else:
+            super().__setitem__(name, value)
+
+    def update(self, *args, **kwargs):
+        fields = dict(*args, **kwargs)
+        stored = {name: fields.pop(name) for name in list(fields) if name in STORED_KEYS}
+        if stored:
+            self.store.update(self.store_key, **stored)
+        super().update(fields)
+
+    def discard_stored(self):
+        """Drop this session's stored values (when the session ends)."""
+        self.store.discard(self.store_key)
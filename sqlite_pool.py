@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+TechWriterReview - SQLite Connection Pool
+=========================================
+Shared access layer for the SQLite stores (scan history, document compare,
+portfolio, hyperlink validator).
+
+connect(db_path) is a drop-in replacement for sqlite3.connect(db_path).
+The returned connection behaves the same, except close() hands it back to
+a per-database pool instead of closing it, so the next caller skips
+connection setup and keeps the connection's prepared-statement cache.
+
+Every pooled connection is opened with:
+- journal_mode=WAL: readers no longer block the writer (and vice versa),
+  which removes most "database is locked" errors between concurrent jobs
+- synchronous=NORMAL (safe with WAL), a larger page cache, mmap I/O and
+  in-memory temp tables
+- a busy timeout, plus a short retry on commit and on the first statement
+  of a transaction when SQLite still reports the database as locked
+
+Usage:
+    from sqlite_pool import connect
+
+    conn = connect(db_path)
+    try:
+        conn.execute(...)
+        conn.commit()
+    finally:
+        conn.close()   # returns the connection to the pool
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+__version__ = "1.0.0"
+
+BUSY_TIMEOUT_MS = 5000
+CACHE_SIZE_KB = 16384
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+# Per-connection prepared statement cache (sqlite3 reuses statements by SQL text)
+STATEMENT_CACHE_SIZE = 256
+# Idle connections kept per database file
+MAX_IDLE_CONNECTIONS = 8
+
+LOCK_RETRIES = 3
+LOCK_RETRY_DELAY = 0.05
+
+PRAGMAS: Tuple[str, ...] = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    f'PRAGMA cache_size=-{CACHE_SIZE_KB}',
+    f'PRAGMA mmap_size={MMAP_SIZE_BYTES}',
+    'PRAGMA temp_store=MEMORY',
+    f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}',
+)
+
+
+def _is_lock_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return 'locked' in message or 'busy' in message
+
+
+def _with_lock_retry(fn: Callable, *args):
+    """Call fn, retrying briefly while SQLite reports the database locked."""
+    for attempt in range(LOCK_RETRIES + 1):
+        try:
+            return fn(*args)
+        except sqlite3.OperationalError as e:
+            if attempt == LOCK_RETRIES or not _is_lock_error(e):
+                raise
+            time.sleep(LOCK_RETRY_DELAY * (2 ** attempt))
+
+
+class _PooledCursor(sqlite3.Cursor):
+    """Cursor that retries a locked statement when no transaction is open yet."""
+
+    def execute(self, sql: str, *args):
+        if self.connection.in_transaction:
+            return super().execute(sql, *args)
+        return _with_lock_retry(super().execute, sql, *args)
+
+    def executemany(self, sql: str, *args):
+        if self.connection.in_transaction:
+            return super().executemany(sql, *args)
+        return _with_lock_retry(super().executemany, sql, *args)
+
+
+class PooledConnection:
+    """
+    sqlite3.Connection stand-in whose close() returns it to its pool.
+
+    Attribute access not defined here is forwarded to the real connection.
+    """
+
+    def __init__(self, pool: 'SQLitePool', conn: sqlite3.Connection):
+        self._pool = pool
+        self._conn: Optional[sqlite3.Connection] = conn
+
+    @property
+    def raw(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise sqlite3.ProgrammingError('Cannot operate on a closed database.')
+        return self._conn
+
+    # row_factory is commonly assigned, so it needs an explicit setter
+    @property
+    def row_factory(self):
+        return self.raw.row_factory
+
+    @row_factory.setter
+    def row_factory(self, factory):
+        self.raw.row_factory = factory
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.raw, name)
+
+    def execute(self, sql: str, *args):
+        conn = self.raw
+        if conn.in_transaction:
+            return conn.execute(sql, *args)
+        # Nothing to lose yet: safe to retry a statement that could not start
+        return _with_lock_retry(conn.execute, sql, *args)
+
+    def executemany(self, sql: str, *args):
+        conn = self.raw
+        if conn.in_transaction:
+            return conn.executemany(sql, *args)
+        return _with_lock_retry(conn.executemany, sql, *args)
+
+    def commit(self):
+        _with_lock_retry(self.raw.commit)
+
+    def rollback(self):
+        self.raw.rollback()
+
+    def cursor(self, factory=_PooledCursor) -> sqlite3.Cursor:
+        return self.raw.cursor(factory)
+
+    def close(self):
+        """Return the connection to the pool (rolling back anything uncommitted)."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool.release(conn)
+
+    def __enter__(self) -> 'PooledConnection':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Same as sqlite3: commit or roll back, but do not close
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class SQLitePool:
+    """
+    Idle-connection pool for one database file.
+
+    There is no upper bound on connections in use (nested callers in one
+    thread must never wait on each other); at most max_idle are kept open
+    between uses. If the file is deleted or replaced, idle connections to
+    the old file are discarded.
+    """
+
+    def __init__(self, db_path: str, max_idle: int = MAX_IDLE_CONNECTIONS):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._file_id: Optional[Tuple[int, int]] = None
+        self.created = 0
+        self.reused = 0
+
+    def _current_file_id(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.db_path)
+            return st.st_dev, st.st_ino
+        except OSError:
+            return None
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=BUSY_TIMEOUT_MS / 1000.0,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        for pragma in PRAGMAS:
+            try:
+                _with_lock_retry(conn.execute, pragma)
+            except sqlite3.DatabaseError:
+                pass  # e.g. WAL unsupported on this filesystem: keep defaults
+        return conn
+
+    def acquire(self) -> PooledConnection:
+        file_id = self._current_file_id()
+        with self._lock:
+            if file_id != self._file_id:
+                stale, self._idle = self._idle, []
+                self._file_id = file_id
+            else:
+                stale = []
+            conn = self._idle.pop() if self._idle else None
+            if conn is not None:
+                self.reused += 1
+        for old in stale:
+            old.close()
+
+        if conn is None:
+            conn = self._open()
+            with self._lock:
+                self.created += 1
+                if self._file_id is None:
+                    self._file_id = self._current_file_id()
+        return PooledConnection(self, conn)
+
+    def release(self, conn: sqlite3.Connection):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+        except sqlite3.Error:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle and self._current_file_id() == self._file_id:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close_idle(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'db_path': self.db_path, 'idle': len(self._idle),
+                    'created': self.created, 'reused': self.reused}
+
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> SQLitePool:
+    """Get the shared pool for a database file."""
+    key = os.path.abspath(str(db_path))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SQLitePool(key)
+        return pool
+
+
+def connect(db_path) -> PooledConnection:
+    """
+    Get a pooled connection to db_path (drop-in for sqlite3.connect).
+
+    In-memory and URI databases are not pooled.
+    """
+    db_path = str(db_path)
+    if db_path == ':memory:' or db_path.startswith('file:'):
+        return sqlite3.connect(db_path)
+    return get_pool(db_path).acquire()
+
+
+def close_pool(db_path) -> None:
+    """Close idle connections to a database (e.g. before deleting the file)."""
+    key = os.path.abspath(str(db_path))
+    with _pools_lock:
+        pool = _pools.pop(key, None)
+    if pool is not None:
+        pool.close_idle()
+
+
+def close_all_pools() -> None:
+    """Close every idle pooled connection."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_idle()
+
+
+def pool_stats() -> List[Dict[str, Any]]:
+    """Connection reuse counters for each pooled database."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.stats() for pool in pools]
@@ -1030,22 +1030,8 @@ async function runReviewWithJobs() {
     // Store job ID for potential external cancellation
     State.currentJobId = jobId;
     
-    // Poll for job progress
-    let pollCount = 0;
-    const maxPolls = 600; // 5 minutes at 500ms intervals
-    
-    while (pollCount < maxPolls) {
-        await new Promise(resolve => setTimeout(resolve, 500)); // 500ms polling interval
-        pollCount++;
-        
-        const jobResult = await api(`/job/${jobId}`, 'GET');
-        
-        if (!jobResult.success) {
-            console.error(`[TWR] Job poll error:`, jobResult.error);
-            continue; // Keep trying
-        }
-        
-        const job = jobResult.job;
+    // Follow job progress (event stream, polling as fallback)
+    const job = await followJob(jobId, job => {
         const progress = job.progress;
         
         // Map phase to loading steps and update UI
@@ -1083,25 +1069,23 @@ async function runReviewWithJobs() {
         }
         
         console.log(`[TWR] Job ${jobId}: ${progress.phase} @ ${progress.overall_progress.toFixed(1)}% - ${message}`);
-        
-        // Check for completion states
-        if (job.status === 'complete') {
-            console.log(`[TWR] Job ${jobId} complete`);
-            break;
-        } else if (job.status === 'failed') {
-            console.error(`[TWR] Job ${jobId} failed:`, job.error);
-            LoadingTracker.reset();
-            setLoading(false);
-            toast('error', job.error || 'Review failed');
-            State.currentJobId = null;
-            return;
-        } else if (job.status === 'cancelled') {
-            console.log(`[TWR] Job ${jobId} cancelled`);
-            LoadingTracker.reset();
-            setLoading(false);
-            State.currentJobId = null;
-            return;
-        }
+    });
+    
+    if (job && job.status === 'complete') {
+        console.log(`[TWR] Job ${jobId} complete`);
+    } else if (job && job.status === 'failed') {
+        console.error(`[TWR] Job ${jobId} failed:`, job.error);
+        LoadingTracker.reset();
+        setLoading(false);
+        toast('error', job.error || 'Review failed');
+        State.currentJobId = null;
+        return;
+    } else if (job && job.status === 'cancelled') {
+        console.log(`[TWR] Job ${jobId} cancelled`);
+        LoadingTracker.reset();
+        setLoading(false);
+        State.currentJobId = null;
+        return;
     }
     
     // Get final results
@@ -1121,6 +1105,144 @@ async function runReviewWithJobs() {
     
     processReviewResults(result, duration);
     State.currentJobId = null;
+
+    // Live hyperlink checks run as a sub-job after the review returns
+    const hyperlinkValidation = resultResponse.data.hyperlink_validation;
+    if (hyperlinkValidation && hyperlinkValidation.status === 'pending' && hyperlinkValidation.job_id) {
+        watchDeferredHyperlinkValidation(jobId, hyperlinkValidation.job_id);
+    }
+
+    // Scan history is recorded in the background after the job completes
+    if (resultResponse.data.scan_info && resultResponse.data.scan_info.pending) {
+        watchPendingScanInfo(jobId);
+    }
+}
+
+/**
+ * Poll a review job's metadata until its scan history record is written,
+ * then store scan_info and offer the re-scan comparison as
+ * processReviewResults would have.
+ */
+async function watchPendingScanInfo(reviewJobId) {
+    const maxPolls = 60; // 1 minute at 1s intervals
+    const filename = State.filename;
+
+    for (let pollCount = 0; pollCount < maxPolls; pollCount++) {
+        await new Promise(resolve => setTimeout(resolve, 1000));
+
+        // Stop if another document was loaded or scan_info already arrived
+        if (State.filename !== filename || !State.reviewResults?.scan_info?.pending) return;
+
+        const jobResult = await api(`/job/${reviewJobId}`, 'GET');
+        if (!jobResult.success) continue;
+
+        const metadata = jobResult.job.metadata || {};
+        if (metadata.scan_history === 'pending') continue;
+
+        const scanInfo = metadata.scan_info;
+        if (!scanInfo) return;
+        if (State.reviewResults) State.reviewResults.scan_info = scanInfo;
+        saveSessionState();
+
+        if (scanInfo.is_rescan && scanInfo.scan_count >= 2 && window.showComparePromptAfterScan) {
+            window.showComparePromptAfterScan(scanInfo.document_id, State.filename, scanInfo.scan_count);
+        }
+        return;
+    }
+}
+
+/**
+ * Follow the hyperlink validation sub-job split off from a review job and,
+ * once its results are merged server-side, refresh issues and the
+ * hyperlink panel in place.
+ */
+async function watchDeferredHyperlinkValidation(reviewJobId, hyperlinkJobId) {
+    // Up to 10 minutes at 1s intervals when polling
+    const job = await followJob(hyperlinkJobId, () => {}, { pollInterval: 1000, maxPolls: 600 });
+
+    // Stop if a newer review has replaced this one
+    if (State.reviewResults?.hyperlink_validation?.job_id !== hyperlinkJobId) return;
+    if (!job || job.status !== 'complete') {
+        if (job) console.warn(`[TWR] Hyperlink validation ${job.status}:`, job.error);
+        return;
+    }
+
+    const resultResponse = await api(`/review/result/${reviewJobId}`, 'GET');
+    if (!resultResponse.success) return;
+
+    const data = resultResponse.data;
+    State.reviewResults = data;
+    State.issues = data.issues || [];
+    State.filteredIssues = [...State.issues];
+
+    updateResultsUI(data);
+    updateSeverityCounts(data.by_severity || {});
+    updateValidationCounts();
+    updateCategoryFilters(data.by_category || {});
+    renderIssuesList();
+    saveSessionState();
+
+    const added = data.hyperlink_validation?.new_issues || 0;
+    toast('info', `Hyperlink validation complete: ${added} link issue(s) added`);
+}
+
+/**
+ * Follow a job until it finishes, calling onUpdate(job) with each snapshot.
+ * Listens on the job's server-sent event stream and falls back to polling
+ * /job/<id> when EventSource is unavailable or the stream is refused/drops.
+ * Resolves with the last snapshot seen (null if none arrived).
+ */
+function followJob(jobId, onUpdate, { pollInterval = 500, maxPolls = 600 } = {}) {
+    const finished = job => ['complete', 'failed', 'cancelled'].includes(job.status);
+
+    return new Promise(resolve => {
+        let last = null;
+        let done = false;
+        const finish = () => {
+            if (!done) {
+                done = true;
+                resolve(last);
+            }
+        };
+        const update = job => {
+            last = job;
+            onUpdate(job);
+            if (finished(job)) finish();
+        };
+
+        const poll = async () => {
+            for (let pollCount = 0; pollCount < maxPolls && !done; pollCount++) {
+                await new Promise(r => setTimeout(r, pollInterval));
+                const jobResult = await api(`/job/${jobId}`, 'GET');
+                if (!jobResult.success) {
+                    console.error(`[TWR] Job poll error:`, jobResult.error);
+                    continue; // Keep trying
+                }
+                update(jobResult.job);
+            }
+            finish();
+        };
+
+        if (typeof EventSource === 'undefined') {
+            poll();
+            return;
+        }
+
+        const source = new EventSource(`/api/job/${encodeURIComponent(jobId)}/events`);
+        const onEvent = event => {
+            update(JSON.parse(event.data));
+            if (done) source.close();
+        };
+        ['progress', 'complete', 'failed', 'cancelled'].forEach(name => source.addEventListener(name, onEvent));
+        source.onerror = () => {
+            // Don't let EventSource retry indefinitely: poll instead
+            source.close();
+            if (!done) {
+                console.warn(`[TWR] Job ${jobId} event stream unavailable, polling`);
+                poll();
+            }
+        };
+    });
 }
 
 /**
@@ -3750,6 +3872,15 @@ async function api(endpoint, method = 'GET', body = null) {
         }
 
         if (response.status === 429) {
+            // Full job queue sends Retry-After (seconds)
+            const retryAfter = parseInt(response.headers.get('Retry-After'), 10);
+            if (retryAfter > 0) {
+                return {
+                    success: false,
+                    error: `The server is busy. Please try again in ${retryAfter}s.`,
+                    retry_after: retryAfter
+                };
+            }
             return { success: false, error: 'Too many requests. Please wait a moment.' };
         }
 
@@ -75,6 +75,19 @@ const LearnerClient = (function() {
         return result?.success === true;
     }
 
+    /**
+     * Record several decisions in one request
+     * @param {Array<Object>} decisions - Objects with fix, decision, note, document_id
+     * @returns {Promise<number>} Number of decisions recorded
+     */
+    async function recordDecisions(decisions) {
+        const result = await apiRequest('/record', {
+            method: 'POST',
+            body: JSON.stringify({ decisions })
+        });
+        return result?.recorded || 0;
+    }
+
     /**
      * Get prediction for a fix based on learned patterns
      * @param {Object} fix - Fix object with flagged_text, suggestion, category
@@ -93,16 +106,16 @@ const LearnerClient = (function() {
      * @returns {Promise<Array<Object>>} Array of predictions
      */
     async function getPredictions(fixes) {
-        const predictions = [];
-        for (const fix of fixes) {
-            const pred = await getPrediction(fix);
-            predictions.push(pred || {
-                prediction: null,
-                confidence: 0,
-                reason: 'Error getting prediction'
-            });
-        }
-        return predictions;
+        const result = await apiRequest('/predict', {
+            method: 'POST',
+            body: JSON.stringify({ fixes })
+        });
+        const predictions = result?.predictions || [];
+        return fixes.map((fix, i) => predictions[i] || {
+            prediction: null,
+            confidence: 0,
+            reason: 'Error getting prediction'
+        });
     }
 
     /**
@@ -224,6 +237,7 @@ const LearnerClient = (function() {
     return {
         // Core operations
         recordDecision,
+        recordDecisions,
         getPrediction,
         getPredictions,
         getPatterns,
@@ -16,6 +16,8 @@ import os
 import sys
 import json
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -3057,6 +3059,2641 @@ class TestSessionCleanup(unittest.TestCase):
             "SessionManager should have cleanup_old or cleanup_old_sessions method")
 
 
+class TestExclusionIndex(unittest.TestCase):
+    """
+    Tests for the compiled hyperlink exclusion index.
+
+    Validates:
+    - ExclusionIndex matches exactly like a linear ExclusionRule scan
+    - Storage index is invalidated when exclusions change
+    - Exclusion hit counts are buffered and flushed in batches
+    - Validator applies saved exclusions and records their hits
+    """
+
+    def test_index_matches_linear_scan(self):
+        """
+        Test ExclusionIndex returns the same rule as ExclusionRule.matches().
+
+        Expects: First matching rule in list order for every URL, None otherwise.
+        """
+        from hyperlink_validator.models import ExclusionRule, ExclusionIndex
+
+        rules = [
+            ExclusionRule(pattern='https://intranet.example.com/', match_type='prefix'),
+            ExclusionRule(pattern='.PDF', match_type='suffix'),
+            ExclusionRule(pattern='https://example.com/exact', match_type='exact'),
+            ExclusionRule(pattern='sharepoint', match_type='contains'),
+            ExclusionRule(pattern=r'^https?://[^/]+\.mil/', match_type='regex'),
+            ExclusionRule(pattern=r'(a)\1', match_type='regex'),
+            ExclusionRule(pattern='[unclosed', match_type='regex'),
+            ExclusionRule(pattern='https://', match_type='prefix'),
+        ]
+        index = ExclusionIndex(rules)
+        urls = [
+            'https://intranet.example.com/docs/file.pdf',
+            'http://other.org/report.pdf',
+            'https://EXAMPLE.com/exact',
+            'http://corp.SharePoint.com/site',
+            'http://www.army.mil/page',
+            'http://caab.org',
+            'http://plain.org',
+            'https://plain.org',
+            'ftp://nothing',
+        ]
+        for url in urls:
+            expected = next((r for r in rules if r.matches(url)), None)
+            self.assertIs(index.match(url), expected, url)
+
+    def test_storage_index_invalidated_on_change(self):
+        """
+        Test the storage exclusion index is rebuilt after add/update/delete.
+
+        Expects: Generation counter moves and lookups reflect the change.
+        """
+        from hyperlink_validator.storage import HyperlinkValidatorStorage
+
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = HyperlinkValidatorStorage(os.path.join(tmp, 'test.db'))
+            url = 'https://intranet.example.com/page'
+            self.assertIsNone(storage.find_matching_exclusion(url))
+
+            gen = storage.exclusion_generation
+            exc_id = storage.add_exclusion('intranet', match_type='contains')
+            self.assertGreater(storage.exclusion_generation, gen)
+            self.assertEqual(storage.find_matching_exclusion(url).id, exc_id)
+
+            storage.update_exclusion(exc_id, is_active=False)
+            self.assertIsNone(storage.find_matching_exclusion(url))
+
+            storage.update_exclusion(exc_id, is_active=True)
+            self.assertIsNotNone(storage.find_matching_exclusion(url))
+
+            storage.delete_exclusion(exc_id)
+            self.assertIsNone(storage.find_matching_exclusion(url))
+
+    def test_hit_counts_flushed_in_batches(self):
+        """
+        Test exclusion hits are buffered and visible after a flush.
+
+        Expects: Buffered hits written on read, hit_count equals match count.
+        """
+        from hyperlink_validator.storage import HyperlinkValidatorStorage
+
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = HyperlinkValidatorStorage(os.path.join(tmp, 'test.db'))
+            exc_id = storage.add_exclusion('example.com', match_type='contains')
+            for _ in range(5):
+                storage.find_matching_exclusion('https://example.com/a')
+
+            self.assertEqual(storage.get_exclusion(exc_id).hit_count, 5)
+            self.assertEqual(storage.flush_exclusion_hits(), 0)
+            self.assertEqual(storage.get_exclusion_stats()['total_hits'], 5)
+
+    def test_validator_applies_stored_exclusions(self):
+        """
+        Test _validate_with_requests checks saved exclusions and counts hits.
+
+        Expects: Saved rule excludes a URL the request did not list; one hit
+        per matched URL, even when the request sends the same rule.
+        """
+        try:
+            import requests  # noqa: F401
+        except ImportError:
+            self.skipTest("requests not available")
+        from hyperlink_validator.storage import HyperlinkValidatorStorage
+        from hyperlink_validator.validator import StandaloneHyperlinkValidator
+
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = HyperlinkValidatorStorage(os.path.join(tmp, 'test.db'))
+            exc_id = storage.add_exclusion('intranet.example', match_type='contains',
+                                           reason='Internal', treat_as_valid=False)
+            urls = ['https://intranet.example/a', 'https://intranet.example/b']
+            options = {
+                'adaptive_timeouts': False,
+                'exclusions': [{'pattern': 'intranet.example/b', 'match_type': 'contains'}],
+            }
+            validator = StandaloneHyperlinkValidator(timeout=5, retries=0)
+            with patch('hyperlink_validator.validator._get_storage', return_value=storage):
+                results = validator._validate_with_requests(urls, options)
+
+            self.assertEqual(results[0].status, 'SKIPPED')
+            self.assertEqual(results[0].exclusion_reason, 'Internal')
+            self.assertEqual(results[1].status, 'WORKING')
+            self.assertEqual(storage.get_exclusion(exc_id).hit_count, 2)
+
+
+class TestResumableValidationJobs(unittest.TestCase):
+    """
+    Tests for checkpointed hyperlink validation jobs.
+
+    Validates:
+    - Job results are persisted while the job runs
+    - Interrupted jobs resume without re-validating checkpointed URLs
+    - Partial results endpoint returns results incrementally
+    - Cancelled jobs stop validating and stay cancelled
+    """
+
+    def setUp(self):
+        """Use an isolated storage database for checkpoints."""
+        from hyperlink_validator import storage as hv_storage
+        self.tmp = tempfile.TemporaryDirectory()
+        self.storage = hv_storage.HyperlinkValidatorStorage(
+            os.path.join(self.tmp.name, 'test.db'))
+        self.patcher = patch.object(hv_storage, '_storage_instance', self.storage)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.tmp.cleanup()
+
+    def _wait_for(self, validator, job_id, timeout=10):
+        import time
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            status = validator.get_job_status(job_id)
+            if status and status['status'] in ('complete', 'failed'):
+                return status
+            time.sleep(0.05)
+        self.fail(f"Job {job_id} did not finish")
+
+    def test_job_results_checkpointed(self):
+        """
+        Test an offline validation job writes every result to its checkpoint.
+
+        Expects: Checkpoint marked complete with one stored result per URL.
+        """
+        from hyperlink_validator.validator import StandaloneHyperlinkValidator
+
+        validator = StandaloneHyperlinkValidator()
+        urls = ['https://example.com/a', 'https://example.com/b', 'not a url']
+        job_id = validator.start_validation_job(urls, mode='offline')
+        self._wait_for(validator, job_id)
+
+        checkpoint = self.storage.get_checkpoint(job_id)
+        self.assertEqual(checkpoint['status'], 'complete')
+        self.assertEqual(checkpoint['completed_urls'], 3)
+        positions = [pos for pos, _ in self.storage.get_checkpoint_results(job_id)]
+        self.assertEqual(sorted(positions), [0, 1, 2])
+
+    def test_interrupted_job_resumes_from_checkpoint(self):
+        """
+        Test resume_interrupted_jobs skips URLs that already have results.
+
+        Expects: Same job ID, restored result kept as-is, remaining URLs validated.
+        """
+        from hyperlink_validator.validator import StandaloneHyperlinkValidator
+
+        urls = ['https://example.com/done', 'https://example.com/next', 'https://example.com/last']
+        self.storage.create_checkpoint('resume01', 'run01', 'offline', urls, {})
+        self.storage.save_checkpoint_results('resume01', [
+            (0, {'url': urls[0], 'status': 'WORKING', 'message': 'from checkpoint'})
+        ])
+
+        resumed = StandaloneHyperlinkValidator.resume_interrupted_jobs()
+        self.assertIn('resume01', resumed)
+
+        validator = StandaloneHyperlinkValidator()
+        self._wait_for(validator, 'resume01')
+        run = validator.get_job_results('resume01')
+        self.assertEqual([r.url for r in run.results], urls)
+        self.assertEqual(run.results[0].message, 'from checkpoint')
+        self.assertEqual(self.storage.get_checkpoint('resume01')['status'], 'complete')
+
+        partial = validator.get_partial_results('resume01', offset=1)
+        self.assertEqual(partial['completed_count'], 3)
+        self.assertEqual(len(partial['results']), 2)
+
+    def test_cancelled_job_stops_and_stays_cancelled(self):
+        """
+        Test cancel_job stops the worker and its 'cancelled' status is kept.
+
+        Expects: No URLs validated after the cancel; run and checkpoint stay
+        'cancelled' with the results checked before it.
+        """
+        from hyperlink_validator.models import ValidationRequest, ValidationRun
+        from hyperlink_validator.validator import StandaloneHyperlinkValidator
+
+        validator = StandaloneHyperlinkValidator()
+        job_id = 'cancel01'
+        urls = [f'https://example.com/{i}' for i in range(20)]
+        self.storage.create_checkpoint(job_id, 'run01', 'offline', urls, {})
+        run = ValidationRun(run_id='run01', job_id=job_id, mode='offline', status='pending',
+                            request=ValidationRequest(urls=urls, mode='offline'))
+        StandaloneHyperlinkValidator._validation_runs[job_id] = run
+        self.addCleanup(StandaloneHyperlinkValidator._validation_runs.pop, job_id, None)
+
+        report_result = validator._report_result
+
+        def cancel_after_five(index, total, url, result, completed=None):
+            report_result(index, total, url, result, completed)
+            if index == 4:
+                validator.cancel_job(job_id)
+
+        with patch.object(validator, '_report_result', cancel_after_five):
+            validator._run_validation_job(job_id, urls, 'offline', {})
+
+        self.assertEqual(run.status, 'cancelled')
+        self.assertEqual(len(run.results), 5)
+        checkpoint = self.storage.get_checkpoint(job_id)
+        self.assertEqual(checkpoint['status'], 'cancelled')
+        self.assertEqual(checkpoint['completed_urls'], 5)
+
+
+class TestDeferredRetryScheduler(unittest.TestCase):
+    """
+    Tests for the non-blocking hyperlink retry scheduler.
+
+    Validates:
+    - Retry-After parsing and per-host backoff state
+    - Deferred URLs do not hold up other URLs
+    - 503 responses are retried after the host's Retry-After
+    """
+
+    def test_parse_retry_after(self):
+        """
+        Test Retry-After header parsing.
+
+        Expects: Seconds for delta values, None for missing or garbage values.
+        """
+        from hyperlink_validator.retry_scheduler import parse_retry_after
+
+        self.assertEqual(parse_retry_after('5'), 5.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0.0)
+
+    def test_deferred_url_does_not_block_others(self):
+        """
+        Test a deferred URL is retried after the remaining URLs are processed.
+
+        Expects: Fresh URLs yielded before the deferred retry, host backoff set.
+        """
+        from hyperlink_validator.retry_scheduler import RetryScheduler, HostBackoff
+
+        urls = ['http://slow.example/a', 'http://fast.example/b', 'http://fast.example/c']
+        backoff = HostBackoff(base_delay=0.05)
+        scheduler = RetryScheduler(urls, backoff=backoff)
+        order = []
+        for index, state in scheduler:
+            order.append((index, state))
+            if index == 0 and state is None:
+                scheduler.defer(index, 'retry', backoff.record_failure('slow.example'))
+        self.assertEqual(order, [(0, None), (1, None), (2, None), (0, 'retry')])
+        self.assertEqual(backoff.failures('slow.example'), 1)
+
+    def test_503_retried_via_scheduler(self):
+        """
+        Test _validate_with_requests retries a 503 instead of failing it.
+
+        Expects: Flaky URL ends WORKING after 2 attempts, results keep input order.
+        """
+        try:
+            import requests  # noqa: F401
+        except ImportError:
+            self.skipTest("requests not available")
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from hyperlink_validator.validator import StandaloneHyperlinkValidator
+
+        hits = {'/flaky': 0}
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self):
+                if self.path == '/flaky':
+                    hits['/flaky'] += 1
+                    if hits['/flaky'] == 1:
+                        self.send_response(503)
+                        self.send_header('Retry-After', '0')
+                        self.end_headers()
+                        return
+                self.send_response(200)
+                self.end_headers()
+
+            do_HEAD = _respond
+            do_GET = _respond
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base = f'http://127.0.0.1:{server.server_port}'
+            urls = [f'{base}/flaky', f'{base}/ok']
+            validator = StandaloneHyperlinkValidator(timeout=5, retries=2)
+            with patch.dict(os.environ, {'NO_PROXY': '127.0.0.1', 'no_proxy': '127.0.0.1'}):
+                results = validator._validate_with_requests(urls, {'retries': 2})
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual([r.url for r in results], urls)
+        self.assertEqual(results[0].status, 'WORKING')
+        self.assertEqual(results[0].attempts, 2)
+        self.assertEqual(results[1].status, 'WORKING')
+
+
+class TestHighlightedExportIndex(unittest.TestCase):
+    """
+    Tests for indexed result lookup in highlighted hyperlink exports.
+
+    Validates:
+    - Broken URL matching via the compiled result index
+    - Streaming Excel export highlights the same cells as the in-memory path
+    """
+
+    def test_result_index_lookup(self):
+        """
+        Test canonical lookup and substring search in the result index.
+
+        Expects: Trailing-slash variants resolve, longest broken URL found in text.
+        """
+        from hyperlink_validator.export import _ResultIndex
+        from hyperlink_validator.models import ValidationResult
+
+        index = _ResultIndex([
+            ValidationResult(url='https://example.com/a', status='BROKEN'),
+            ValidationResult(url='https://example.com/a/b', status='BROKEN'),
+            ValidationResult(url='https://example.com/ok', status='WORKING'),
+        ])
+
+        self.assertTrue(index.is_broken('https://example.com/a/'))
+        self.assertFalse(index.is_broken('https://example.com/ok'))
+        self.assertEqual(index.get('https://example.com/ok/').status, 'WORKING')
+        self.assertEqual(index.find_broken_in('see https://example.com/a/b here'),
+                         'https://example.com/a/b')
+        self.assertIsNone(index.find_broken_in('see https://example.com/ok'))
+
+    def test_streaming_excel_matches_in_memory(self):
+        """
+        Test streaming and in-memory Excel exports highlight the same cells.
+
+        Expects: Identical fills, hyperlinks and comments in both outputs.
+        """
+        try:
+            from openpyxl import Workbook, load_workbook
+        except ImportError:
+            self.skipTest("openpyxl not installed")
+        import tempfile
+        from hyperlink_validator.export import export_highlighted_excel
+        from hyperlink_validator.models import ValidationResult
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        tmpdir = tmp.name
+        source = os.path.join(tmpdir, 'links.xlsx')
+        wb = Workbook()
+        ws = wb.active
+        ws.append(['Name', 'Link'])
+        ws.append(['good', 'https://good.example.com'])
+        ws.append(['bad', 'https://bad.example.com/page'])
+        ws.append(['linked', 'click here'])
+        ws['B4'].hyperlink = 'https://gone.example.com/'
+        wb.save(source)
+
+        results = [
+            ValidationResult(url='https://good.example.com', status='WORKING'),
+            ValidationResult(url='https://bad.example.com/page', status='BROKEN', status_code=404),
+            ValidationResult(url='https://gone.example.com', status='BROKEN'),
+        ]
+
+        def snapshot(data):
+            path = os.path.join(tmpdir, 'out.xlsx')
+            with open(path, 'wb') as f:
+                f.write(data)
+            sheet = load_workbook(path).active
+            return [(c.coordinate, c.fill.fgColor.rgb,
+                     c.hyperlink.target if c.hyperlink else None, c.comment is not None)
+                    for row in sheet.iter_rows() for c in row]
+
+        ok, _, in_memory = export_highlighted_excel(source, results, streaming=False)
+        self.assertTrue(ok)
+        ok, message, streamed = export_highlighted_excel(source, results, streaming=True)
+        self.assertTrue(ok)
+        self.assertIn('2 row', message)
+        self.assertEqual(snapshot(streamed), snapshot(in_memory))
+
+
+class TestStreamingExcelExtractor(unittest.TestCase):
+    """
+    Tests for streaming (read-only) Excel hyperlink extraction.
+
+    Validates:
+    - Streaming and in-memory extraction return the same links
+    - Parallel sheet processing keeps workbook sheet order
+    - Unbounded or oversized range hyperlinks do not expand per cell
+    """
+
+    def test_streaming_matches_in_memory(self):
+        """
+        Test streaming extraction against the full-load path.
+
+        Expects: Identical link lists, including hyperlink objects and context.
+        """
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            self.skipTest("openpyxl not installed")
+        import tempfile
+        from hyperlink_validator.excel_extractor import ExcelExtractor
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'tracker.xlsx')
+        wb = Workbook()
+        ws = wb.active
+        ws.title = 'Main'
+        ws.append(['Name', 'Link', 'Note'])
+        ws.append(['a', 'https://a.example.com', 'plain'])
+        ws.append(['b', 'click here', 'owner bob@example.com'])
+        ws['B3'].hyperlink = 'https://b.example.com'
+        ws.append(['c', '=HYPERLINK("https://c.example.com","C")', 'see www.d.com'])
+        wb.create_sheet('Second').append(['https://second.example.com'])
+        wb.save(path)
+
+        expected = ExcelExtractor(streaming=False).extract(path).to_dict()
+        streamed = ExcelExtractor(streaming=True).extract(path).to_dict()
+        parallel = ExcelExtractor(streaming=True, parallel_sheets=2).extract(path).to_dict()
+
+        self.assertEqual(expected['total_links'], 6)
+        self.assertEqual(streamed, expected)
+        self.assertEqual(parallel, expected)
+        hyperlink = [l for l in streamed['links'] if l['source'] == 'hyperlink'][0]
+        self.assertEqual(hyperlink['display_text'], 'click here')
+        self.assertEqual(hyperlink['context'], 'b | owner bob@example.com')
+
+    def test_unbounded_range_hyperlinks_kept_on_anchor(self):
+        """
+        Test whole-column and sheet-sized hyperlink refs in streaming mode.
+
+        Expects: No error, each link recorded once on its top-left cell.
+        """
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            self.skipTest("openpyxl not installed")
+        import zipfile
+        from hyperlink_validator.excel_extractor import read_xlsx_hyperlinks
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'ranges.xlsx')
+        wb = Workbook()
+        ws = wb.active
+        ws.title = 'Main'
+        ws['B2'].hyperlink = 'https://column.example.com'
+        ws['C3'].hyperlink = 'https://sheet.example.com'
+        ws['D4'].hyperlink = 'https://box.example.com'
+        wb.save(path)
+
+        sheet_part = 'xl/worksheets/sheet1.xml'
+        with zipfile.ZipFile(path) as zf:
+            parts = {name: zf.read(name) for name in zf.namelist()}
+        parts[sheet_part] = (parts[sheet_part]
+                             .replace(b'ref="B2"', b'ref="B:B"')
+                             .replace(b'ref="C3"', b'ref="C1:XFD1048576"')
+                             .replace(b'ref="D4"', b'ref="D4:E5"'))
+        with zipfile.ZipFile(path, 'w') as zf:
+            for name, data in parts.items():
+                zf.writestr(name, data)
+
+        links = read_xlsx_hyperlinks(path)['Main']
+        self.assertEqual(links['B1'][0], 'https://column.example.com')
+        self.assertEqual(links['C1'][0], 'https://sheet.example.com')
+        self.assertEqual(sorted(k for k, v in links.items() if v[0] == 'https://box.example.com'),
+                         ['D4', 'D5', 'E4', 'E5'])
+        self.assertEqual(len(links), 6)
+
+
+class TestConcurrentLinkValidation(unittest.TestCase):
+    """
+    Tests for concurrent HyperlinkHealthValidator.validate_batch.
+
+    Validates:
+    - Results keep input order and ids; duplicate targets share an outcome
+    - UNC share roots are probed once and slow shares are bounded by timeout
+    """
+
+    def test_batch_preserves_order_and_duplicates(self):
+        """
+        Test batch results come back in input order with sequential ids.
+
+        Expects: link_1..link_N in order, duplicate file path validated alike.
+        """
+        try:
+            from hyperlink_health import HyperlinkHealthValidator, HealthMode, LinkStatus
+        except ImportError:
+            self.skipTest("hyperlink_health module not available")
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        tmpdir = tmp.name
+        existing = os.path.join(tmpdir, 'spec.docx')
+        open(existing, 'w').close()
+
+        validator = HyperlinkHealthValidator(mode=HealthMode.OFFLINE)
+        results = validator.validate_batch([
+            {'target': existing, 'display_text': 'Spec'},
+            {'target': 'https://example.com'},
+            {'target': os.path.join(tmpdir, 'missing.docx')},
+            {'target': existing, 'display_text': 'Spec again'},
+            {'target': '#bookmark1'},
+        ])
+
+        self.assertEqual([r.id for r in results], [f'link_{i}' for i in range(1, 6)])
+        self.assertEqual([r.id for r in validator.generate_report().links],
+                         [r.id for r in results])
+        self.assertEqual(results[0].status, LinkStatus.VALID.value)
+        self.assertEqual(results[2].status, LinkStatus.NOT_FOUND.value)
+        self.assertEqual(results[3].status, LinkStatus.VALID.value)
+        self.assertEqual(results[3].display_text, 'Spec again')
+
+    def test_share_roots_probed_once_with_timeout(self):
+        """
+        Test UNC links are checked per share root, with slow shares bounded.
+
+        Expects: One probe per share root, slow share fails within the timeout.
+        """
+        try:
+            from hyperlink_health import HyperlinkHealthValidator, HealthMode, LinkStatus
+        except ImportError:
+            self.skipTest("hyperlink_health module not available")
+        import time
+
+        probed = []
+
+        def fake_exists(path):
+            probed.append(path)
+            if path.startswith('\\\\slow'):
+                time.sleep(1.0)
+            return path.startswith('\\\\files')
+
+        validator = HyperlinkHealthValidator(mode=HealthMode.VALIDATOR,
+                                             network_path_timeout=0.2)
+        with patch('hyperlink_health.os.path.exists', side_effect=fake_exists):
+            start = time.time()
+            results = validator.validate_batch([
+                {'target': '\\\\down\\share\\a.docx'},
+                {'target': '\\\\down\\share\\b.docx'},
+                {'target': '\\\\files\\share\\c.docx'},
+                {'target': '\\\\slow\\share\\d.docx'},
+            ])
+            elapsed = time.time() - start
+
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual(probed.count('\\\\down\\share'), 1)
+        self.assertNotIn('\\\\down\\share\\a.docx', probed)
+        self.assertEqual([r.status for r in results], [
+            LinkStatus.NOT_FOUND.value, LinkStatus.NOT_FOUND.value,
+            LinkStatus.VALID.value, LinkStatus.NOT_FOUND.value,
+        ])
+
+
+class TestDeferredHyperlinkValidation(unittest.TestCase):
+    """
+    Tests for splitting live hyperlink validation off the review.
+
+    Validates:
+    - review_document returns with hyperlink probes pending
+    - Deferred results are merged into a copy of the review result
+    - The sub-job worker updates the session and parent job
+    - Deferred reviews are recorded in scan history after the merge
+    """
+
+    def _make_docx(self, url):
+        """Create a DOCX with one external hyperlink."""
+        try:
+            from docx import Document
+            from docx.oxml import OxmlElement
+            from docx.oxml.ns import qn
+        except ImportError:
+            self.skipTest("python-docx not installed")
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'links.docx')
+        doc = Document()
+        para = doc.add_paragraph('See the portal: ')
+        r_id = para.part.relate_to(
+            url,
+            'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink',
+            is_external=True
+        )
+        link = OxmlElement('w:hyperlink')
+        link.set(qn('r:id'), r_id)
+        run = OxmlElement('w:r')
+        text = OxmlElement('w:t')
+        text.text = 'portal'
+        run.append(text)
+        link.append(run)
+        para._p.append(link)
+        doc.add_paragraph('The system shall be tested.')
+        doc.save(path)
+        return path
+
+    def test_review_defers_and_merges_link_issues(self):
+        """
+        Test deferred link probes run only when requested, then merge.
+
+        Expects: No probe during review, one merged issue afterwards, with
+        context enhancement and recalculated enhanced_stats.
+        """
+        try:
+            from core import TechWriterReviewEngine
+            from comprehensive_hyperlink_checker import ComprehensiveHyperlinkChecker
+        except ImportError:
+            self.skipTest("core module not available")
+
+        path = self._make_docx('https://broken.example.com/page')
+        probed = []
+
+        def fake_advanced(checker, link_info):
+            probed.append(link_info.target)
+            return [checker.create_issue(
+                severity='High',
+                message='Page not found (404)',
+                context=link_info.context,
+                paragraph_index=link_info.paragraph_index,
+                rule_id='HL071',
+                flagged_text=link_info.target[:40]
+            )]
+
+        engine = TechWriterReviewEngine()
+        with patch.object(ComprehensiveHyperlinkChecker, '_validate_url_advanced', fake_advanced):
+            results = engine.review_document(path, {'defer_hyperlink_validation': True})
+            self.assertEqual(probed, [])
+            self.assertEqual(results['hyperlink_validation']['status'], 'pending')
+
+            merged = engine.complete_deferred_hyperlink_validation(results)
+
+        self.assertEqual(probed, ['https://broken.example.com/page'])
+        self.assertEqual(merged['hyperlink_validation']['status'], 'complete')
+        self.assertEqual(merged['issue_count'], results['issue_count'] + 1)
+        self.assertIn('Page not found (404)', [i['message'] for i in merged['issues']])
+        self.assertNotIn('Page not found (404)', [i['message'] for i in results['issues']])
+        link_issue = next(i for i in merged['issues'] if i['message'] == 'Page not found (404)')
+        self.assertIn('rich_context', link_issue)
+        self.assertGreater(merged['enhanced_stats']['severity_weighted_total'],
+                           results['enhanced_stats']['severity_weighted_total'])
+        self.assertEqual(merged['enhanced_stats']['critical_count'],
+                         merged['by_severity'].get('Critical', 0))
+
+    def test_subjob_updates_session_and_parent_job(self):
+        """
+        Test the hyperlink sub-job worker publishes merged results.
+
+        Expects: Session and parent job hold merged results, revision bumped.
+        """
+        try:
+            import app as app_module
+            from job_manager import JobStatus
+        except ImportError:
+            self.skipTest("app module not available")
+
+        results = {'issues': [], 'issue_count': 0,
+                   'hyperlink_validation': {'status': 'pending', 'job_id': None}}
+        merged = dict(results, issue_count=1,
+                      hyperlink_validation={'status': 'complete', 'new_issues': 1})
+        engine = MagicMock()
+        engine.complete_deferred_hyperlink_validation.return_value = merged
+
+        manager = app_module.get_job_manager()
+        parent_id = manager.create_job('review')
+        manager.complete_job(parent_id, result=results)
+        sub_id = manager.create_job('hyperlink_validation', metadata={'parent_job_id': parent_id})
+        session_id = app_module.SessionManager.create()
+        app_module.SessionManager.update(session_id, review_results=results,
+                                         review_job_id=parent_id)
+        try:
+            app_module._run_hyperlink_subjob(sub_id, parent_id, session_id, engine, results)
+
+            self.assertIs(app_module.SessionManager.get(session_id)['review_results'], merged)
+            parent = manager.get_job(parent_id)
+            self.assertIs(parent.result, merged)
+            self.assertEqual(parent.metadata['hyperlink_validation'], 'complete')
+            self.assertEqual(parent.metadata['result_revision'], 1)
+            self.assertEqual(manager.get_job(sub_id).status, JobStatus.COMPLETE)
+        finally:
+            app_module.SessionManager.delete(session_id)
+
+    def test_subjob_records_merged_scan(self):
+        """
+        Test a deferred review is recorded in scan history after the merge.
+
+        Expects: The stored scan has the merged issue count and link issue,
+        and its scan_info is published into the parent job.
+        """
+        try:
+            import app as app_module
+        except ImportError:
+            self.skipTest("app module not available")
+        import sqlite_pool
+        from scan_history import ScanHistoryDB, get_scan_history_writer
+
+        link_issue = {'category': 'Hyperlinks', 'severity': 'High',
+                      'message': 'Page not found (404)', 'paragraph_index': 0}
+        results = {'issues': [], 'issue_count': 0, 'score': 100, 'scan_info': {'pending': True},
+                   'hyperlink_validation': {'status': 'pending', 'job_id': None}}
+        merged = dict(results, issues=[link_issue], issue_count=1, score=95,
+                      hyperlink_validation={'status': 'complete', 'new_issues': 1})
+        engine = MagicMock()
+        engine.complete_deferred_hyperlink_validation.return_value = merged
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        db_path = os.path.join(tmp.name, 'history.db')
+        self.addCleanup(sqlite_pool.close_pool, db_path)
+        doc_path = os.path.join(tmp.name, 'doc.docx')
+        with open(doc_path, 'wb') as f:
+            f.write(b'doc')
+        db = ScanHistoryDB(db_path)
+
+        manager = app_module.get_job_manager()
+        parent_id = manager.create_job('review')
+        manager.complete_job(parent_id, result=results)
+        sub_id = manager.create_job('hyperlink_validation')
+        session_id = app_module.SessionManager.create()
+        app_module.SessionManager.update(session_id, review_results=results,
+                                         review_job_id=parent_id)
+        scan_history = {'filename': 'doc.docx', 'filepath': doc_path,
+                        'options': {}, 'file_hash': None}
+        try:
+            with patch.object(app_module, 'get_scan_history_db', return_value=db):
+                app_module._run_hyperlink_subjob(sub_id, parent_id, session_id, engine,
+                                                 results, scan_history)
+                self.assertTrue(get_scan_history_writer().flush(10))
+        finally:
+            app_module.SessionManager.delete(session_id)
+
+        parent = manager.get_job(parent_id)
+        self.assertEqual(parent.metadata['scan_history'], 'recorded')
+        scan_id = parent.metadata['scan_info']['scan_id']
+        stored = db.get_scan_results(scan_id)
+        self.assertEqual(stored['issue_count'], 1)
+        self.assertEqual(stored['score'], 95)
+        self.assertEqual([i['message'] for i in stored['issues']], ['Page not found (404)'])
+
+    def test_subjob_does_not_repin_released_or_superseded_results(self):
+        """
+        Test the sub-job only updates metadata of jobs whose result moved on.
+
+        Expects: Released parent keeps result None; a parent whose session now
+        holds another review keeps its old result; failures do the same.
+        """
+        try:
+            import app as app_module
+        except ImportError:
+            self.skipTest("app module not available")
+
+        results = {'issues': [], 'issue_count': 0,
+                   'hyperlink_validation': {'status': 'pending', 'job_id': None}}
+        merged = dict(results, issue_count=1,
+                      hyperlink_validation={'status': 'complete', 'new_issues': 1})
+        engine = MagicMock()
+        engine.complete_deferred_hyperlink_validation.return_value = merged
+
+        manager = app_module.get_job_manager()
+        session_id = app_module.SessionManager.create()
+        try:
+            released_id = manager.create_job('review')
+            manager.complete_job(released_id, result=results)
+            app_module.SessionManager.update(session_id, review_results=results,
+                                             review_job_id=released_id)
+            manager.release_result(results)
+            sub_id = manager.create_job('hyperlink_validation')
+            app_module._run_hyperlink_subjob(sub_id, released_id, session_id, engine, results)
+            released = manager.get_job(released_id)
+            self.assertIsNone(released.result)
+            self.assertEqual(released.metadata['hyperlink_validation'], 'complete')
+
+            old_id = manager.create_job('review')
+            manager.complete_job(old_id, result=results)
+            app_module.SessionManager.update(session_id, review_job_id='newer-review')
+            sub_id = manager.create_job('hyperlink_validation')
+            app_module._run_hyperlink_subjob(sub_id, old_id, session_id, engine, results)
+            self.assertIs(manager.get_job(old_id).result, results)
+
+            engine.complete_deferred_hyperlink_validation.side_effect = RuntimeError('boom')
+            failed_id = manager.create_job('review')
+            manager.complete_job(failed_id, result=results)
+            manager.release_result(results)
+            sub_id = manager.create_job('hyperlink_validation')
+            app_module._run_hyperlink_subjob(sub_id, failed_id, session_id, engine, results)
+            failed = manager.get_job(failed_id)
+            self.assertIsNone(failed.result)
+            self.assertEqual(failed.metadata['hyperlink_validation'], 'failed')
+        finally:
+            app_module.SessionManager.delete(session_id)
+
+
+class TestAdaptiveHostTimeouts(unittest.TestCase):
+    """
+    Tests for the per-host latency model behind hyperlink timeouts.
+
+    Validates:
+    - Timeouts follow a host's rolling p95 once enough samples exist
+    - Repeatedly unreachable hosts are failed fast, a response clears them
+    - Latency history round-trips through storage
+    - Validation skips a fail-fast host without contacting it
+    - Only the request that produced the final status is sampled
+    """
+
+    def setUp(self):
+        """Use an isolated storage database for latency history."""
+        from hyperlink_validator import storage as hv_storage
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'test.db')
+        self.storage = hv_storage.HyperlinkValidatorStorage(self.db_path)
+        self.patcher = patch.object(hv_storage, '_storage_instance', self.storage)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.tmp.cleanup()
+
+    def test_timeouts_follow_percentiles(self):
+        """
+        Test per-host timeouts adapt to observed latency.
+
+        Expects: Defaults with too few samples, tighter for fast hosts,
+        longer (but bounded) for slow hosts.
+        """
+        from hyperlink_validator.storage import (
+            DomainLatencyModel, MIN_ADAPTIVE_READ_TIMEOUT, MAX_ADAPTIVE_READ_TIMEOUT)
+
+        model = DomainLatencyModel(min_samples=5)
+        model.record_latency('fast.example', 100)
+        self.assertEqual(model.timeouts_for('fast.example', 15, 20), (15, 20))
+
+        for ms in (80, 90, 120, 150, 200):
+            model.record_latency('fast.example', ms)
+        for ms in (9000, 11000, 12000, 14000, 15000):
+            model.record_latency('slow.example', ms)
+
+        self.assertEqual(model.percentile('fast.example', 95), 200)
+        connect, read = model.timeouts_for('fast.example', 15, 20)
+        self.assertEqual(read, MIN_ADAPTIVE_READ_TIMEOUT)
+        self.assertLess(connect, 15)
+
+        connect, read = model.timeouts_for('slow.example', 15, 20)
+        self.assertEqual(read, 60.0)
+        self.assertLessEqual(read, MAX_ADAPTIVE_READ_TIMEOUT)
+
+    def test_fail_fast_and_persistence(self):
+        """
+        Test unreachable streaks trigger fail-fast and survive a reload.
+
+        Expects: Fail-fast after the threshold, cleared by a response,
+        samples and streaks reloaded from the database.
+        """
+        from hyperlink_validator.storage import HyperlinkValidatorStorage, FAIL_FAST_THRESHOLD
+
+        model = self.storage.get_latency_model()
+        for _ in range(FAIL_FAST_THRESHOLD - 1):
+            model.record_unreachable('down.example')
+        self.assertFalse(model.should_fail_fast('down.example'))
+        model.record_unreachable('down.example')
+        self.assertTrue(model.should_fail_fast('down.example'))
+
+        model.record_unreachable('flaky.example')
+        model.record_latency('flaky.example', 250)
+        self.assertEqual(model.recent_failures('flaky.example'), 0)
+
+        self.assertEqual(self.storage.flush_latency_model(), 2)
+        self.assertEqual(self.storage.flush_latency_model(), 0)
+
+        reloaded = HyperlinkValidatorStorage(self.db_path).get_latency_model()
+        self.assertTrue(reloaded.should_fail_fast('down.example'))
+        self.assertEqual(reloaded.percentile('flaky.example', 50), 250)
+
+    def test_fail_fast_host_skipped(self):
+        """
+        Test _validate_with_requests skips a host in its fail-fast cooldown.
+
+        Expects: TIMEOUT result without a request; other hosts still checked
+        and their latency recorded.
+        """
+        try:
+            import requests  # noqa: F401
+        except ImportError:
+            self.skipTest("requests not available")
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from hyperlink_validator.storage import FAIL_FAST_THRESHOLD
+        from hyperlink_validator.validator import StandaloneHyperlinkValidator
+
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self):
+                hits.append(self.path)
+                self.send_response(200)
+                self.end_headers()
+
+            do_HEAD = _respond
+            do_GET = _respond
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            good = f'127.0.0.1:{server.server_port}'
+            down = f'localhost:{server.server_port}'
+            model = self.storage.get_latency_model()
+            for _ in range(FAIL_FAST_THRESHOLD):
+                model.record_unreachable(down)
+
+            urls = [f'http://{down}/skipped', f'http://{good}/ok']
+            validator = StandaloneHyperlinkValidator(timeout=5, retries=0)
+            with patch.dict(os.environ, {'NO_PROXY': '127.0.0.1,localhost',
+                                         'no_proxy': '127.0.0.1,localhost'}):
+                results = validator._validate_with_requests(urls, {})
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(results[0].status, 'TIMEOUT')
+        self.assertIn('skipped', results[0].message)
+        self.assertEqual(results[1].status, 'WORKING')
+        self.assertEqual(hits, ['/ok'])
+        self.assertEqual(model.sample_count(good), 1)
+
+    def test_latency_sample_is_final_request_only(self):
+        """
+        Test a slow failed HEAD is not counted in the host's latency sample.
+
+        Expects: One sample, well under the HEAD's delay, from the GET fallback.
+        """
+        try:
+            import requests  # noqa: F401
+        except ImportError:
+            self.skipTest("requests not available")
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from hyperlink_validator.validator import StandaloneHyperlinkValidator
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                time.sleep(0.5)
+                self.send_response(405)
+                self.end_headers()
+
+            def do_GET(self):
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            host = f'127.0.0.1:{server.server_port}'
+            validator = StandaloneHyperlinkValidator(timeout=5, retries=1)
+            with patch.dict(os.environ, {'NO_PROXY': '127.0.0.1', 'no_proxy': '127.0.0.1'}):
+                results = validator._validate_with_requests([f'http://{host}/page'], {})
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        model = self.storage.get_latency_model()
+        self.assertEqual(results[0].status, 'WORKING')
+        self.assertGreaterEqual(results[0].response_time_ms, 500)
+        self.assertEqual(model.sample_count(host), 1)
+        self.assertLess(model.percentile(host, 50), 500)
+
+
+class TestLinkBenchmarkHarness(unittest.TestCase):
+    """
+    Tests for the local hyperlink validator benchmark harness.
+
+    Validates:
+    - Stand-in server outcomes are deterministic per URL
+    - Per-host rate limits answer 429 with Retry-After
+    - Benchmark reports throughput, tail latency and amplification per mode
+    """
+
+    def test_mock_server_behaviour(self):
+        """
+        Test MockLinkServer outcome selection and rate limiting.
+
+        Expects: Same status for the same URL, 429 once a host exceeds its limit.
+        """
+        from hyperlink_validator.benchmark import MockLinkServer, MockServerConfig, parse_status_mix
+
+        self.assertEqual(parse_status_mix('200=9, 0=1'), {200: 9.0, 0: 1.0})
+        config = MockServerConfig(status_mix={200: 1, 404: 1}, redirect_ratio=0,
+                                  soft_404_ratio=0, rate_limit_per_host=2)
+        server = MockLinkServer(config)
+        first = server.respond('a.example', '/page')[0]
+        self.assertIn(first, (200, 404))
+        self.assertEqual(server.respond('a.example', '/page')[0], first)
+        status, _, headers = server.respond('a.example', '/page')
+        self.assertEqual(status, 429)
+        self.assertEqual(headers['Retry-After'], '1')
+        self.assertIn(server.respond('b.example', '/page')[0], (200, 404))
+
+    def test_run_benchmark_report(self):
+        """
+        Test run_benchmark replays URLs through the proxy-routed stand-in.
+
+        Expects: Every URL answered locally, redirects and HEAD->GET fallbacks
+        counted as amplification, validator storage restored afterwards.
+        """
+        try:
+            import requests  # noqa: F401
+        except ImportError:
+            self.skipTest("requests not available")
+        from hyperlink_validator import storage as hv_storage
+        from hyperlink_validator.benchmark import MockServerConfig, run_benchmark
+
+        urls = [f'https://site{i}.example/page{i}' for i in range(12)]
+        config = MockServerConfig(latency_ms=1, latency_jitter_ms=0, slow_host_ratio=0,
+                                  status_mix={200: 3, 404: 1}, redirect_ratio=0.25)
+        saved_storage = hv_storage._storage_instance
+
+        report = run_benchmark(urls, modes=['offline', 'standard'], config=config,
+                               timeout=5, retries=0)
+
+        self.assertIs(hv_storage._storage_instance, saved_storage)
+        self.assertEqual(report['https_downgraded'], 12)
+        offline, standard = report['modes']
+        self.assertEqual(offline['server_requests'], 0)
+        self.assertEqual(standard['urls'], 12)
+        self.assertNotIn('DNSFAILED', standard['statuses'])
+        self.assertNotIn('TIMEOUT', standard['statuses'])
+        self.assertGreater(standard['amplification'], 1.0)
+        self.assertIsNotNone(standard['latency_ms']['p99'])
+        self.assertGreater(standard['urls_per_second'], 0)
+
+
+class TestCompactScanStorage(unittest.TestCase):
+    """
+    Tests for compact, normalized scan result storage in ScanHistoryDB.
+
+    Validates:
+    - Recorded results round-trip through scan_issues, document_texts and the blob
+    - Document text is stored once for repeated scans of the same content
+    - Legacy results_json rows are migrated in the background after open
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'history.db')
+        self.doc_path = os.path.join(self.tmp.name, 'doc.docx')
+        with open(self.doc_path, 'wb') as f:
+            f.write(b'fake document bytes')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _results(self, issues):
+        return {
+            'score': 88, 'grade': 'B', 'issue_count': len(issues), 'word_count': 120,
+            'by_category': {'Grammar': len(issues)},
+            'issues': issues,
+            'full_text': 'The quick brown fox. ' * 200,
+            'paragraphs': [[0, 'The quick brown fox.'], [1, 'Second paragraph.']],
+            'headings': [{'text': 'Intro', 'level': 1}],
+            'page_map': {'0': 1},
+        }
+
+    def test_round_trip_and_text_dedup(self):
+        """
+        Test record_scan stores results compactly and get_scan_results rebuilds them.
+
+        Expects: Identical results back, results_json empty, one text row for two scans.
+        """
+        import sqlite3
+        from scan_history import ScanHistoryDB
+
+        issues = [
+            {'category': 'Grammar', 'severity': 'High', 'message': 'Fix this',
+             'paragraph_index': 0, 'flagged_text': 'fox', 'rule_id': 'G1',
+             'context': {'before': 'quick'}},
+            {'category': 'Style', 'severity': 'Low', 'message': 'Consider', 'paragraph_index': 1},
+        ]
+        db = ScanHistoryDB(self.db_path)
+        first = db.record_scan('doc.docx', self.doc_path, self._results(issues), {})
+        second = db.record_scan('doc.docx', self.doc_path, self._results(issues[:1]), {})
+
+        self.assertEqual(db.get_scan_results(first['scan_id']), self._results(issues))
+        self.assertEqual(db.get_scan_issues(first['scan_id'], limit=1), issues[:1])
+        self.assertEqual(second['changes']['removed'], 1)
+        without_text = db.get_scan_results(second['scan_id'], include_text=False)
+        self.assertNotIn('full_text', without_text)
+        self.assertEqual(without_text['issues'], issues[:1])
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(conn.execute(
+                'SELECT COUNT(*) FROM scans WHERE results_json IS NOT NULL').fetchone()[0], 0)
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM document_texts').fetchone()[0], 1)
+        finally:
+            conn.close()
+
+        db.delete_scan(first['scan_id'])
+        db.delete_scan(second['scan_id'])
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM document_texts').fetchone()[0], 0)
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM scan_issues').fetchone()[0], 0)
+        finally:
+            conn.close()
+
+    def test_legacy_rows_migrated(self):
+        """
+        Test scans written with a plain results_json are converted in the background.
+
+        Expects: Same results returned before and after, results_json cleared,
+        smaller stored size.
+        """
+        import sqlite3
+        from scan_history import ScanHistoryDB
+
+        legacy = self._results([{'category': 'Grammar', 'severity': 'High', 'message': 'Old issue'}])
+        ScanHistoryDB(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("INSERT INTO documents (id, filename, file_hash) VALUES (1, 'old.docx', 'abc')")
+        conn.execute('INSERT INTO scans (id, document_id, results_json) VALUES (1, 1, ?)',
+                     (json.dumps(legacy),))
+        conn.commit()
+        conn.close()
+
+        db = ScanHistoryDB(self.db_path)
+        self.assertEqual(db.get_scan_results(1), legacy)
+        self.assertTrue(db.wait_for_storage_migration(10))
+        self.assertEqual(db.get_scan_results(1), legacy)
+        self.assertEqual(db.migrate_scan_storage()['migrated'], 0)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                'SELECT results_json, LENGTH(results_blob), storage_format FROM scans WHERE id = 1'
+            ).fetchone()
+        finally:
+            conn.close()
+        self.assertIsNone(row[0])
+        self.assertEqual(row[2], 1)
+        self.assertLess(row[1], len(json.dumps(legacy)))
+
+
+class TestSQLitePool(unittest.TestCase):
+    """
+    Tests for the shared pooled SQLite access layer.
+
+    Validates:
+    - Connections are reused and opened in WAL mode
+    - Released connections are reset (no open transaction, default row_factory)
+    - A deleted/replaced database file is not served from stale connections
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'pool.db')
+
+    def tearDown(self):
+        import sqlite_pool
+        sqlite_pool.close_pool(self.db_path)
+        self.tmp.cleanup()
+
+    def test_reuse_and_reset(self):
+        """
+        Test close() returns a clean connection to the pool.
+
+        Expects: WAL journal, one physical connection reused, uncommitted
+        writes rolled back, row_factory cleared.
+        """
+        import sqlite3
+        import sqlite_pool
+
+        conn = sqlite_pool.connect(self.db_path)
+        self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        conn.execute('CREATE TABLE t (v INTEGER)')
+        conn.commit()
+        conn.row_factory = sqlite3.Row
+        conn.execute('INSERT INTO t VALUES (1)')
+        conn.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
+
+        conn = sqlite_pool.connect(self.db_path)
+        self.assertIsNone(conn.row_factory)
+        self.assertEqual(conn.cursor().execute('SELECT COUNT(*) FROM t').fetchone()[0], 0)
+        conn.close()
+
+        stats = sqlite_pool.get_pool(self.db_path).stats()
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(stats['reused'], 1)
+
+    def test_replaced_file_not_reused(self):
+        """
+        Test idle connections are dropped when the database file is deleted.
+
+        Expects: New connection sees the fresh (empty) database.
+        """
+        import sqlite_pool
+
+        conn = sqlite_pool.connect(self.db_path)
+        conn.execute('CREATE TABLE old_table (v INTEGER)')
+        conn.commit()
+        conn.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+        conn = sqlite_pool.connect(self.db_path)
+        tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        conn.close()
+        self.assertEqual(tables, [])
+
+
+class ScanHistoryTestCase(unittest.TestCase):
+    """
+    Base for scan history tests: a temporary history.db and document file,
+    with the database's connection pool closed afterwards.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'history.db')
+        self.doc_path = os.path.join(self.tmp.name, 'doc.docx')
+        with open(self.doc_path, 'wb') as f:
+            f.write(b'doc')
+
+    def tearDown(self):
+        import sqlite_pool
+        sqlite_pool.close_pool(self.db_path)
+        self.tmp.cleanup()
+
+    def _results(self, n, **fields):
+        """Results with n distinct Grammar issues, plus any extra fields."""
+        results = {'issues': [{'category': 'Grammar', 'severity': 'Low', 'message': f'm{i}'}
+                              for i in range(n)], 'issue_count': n}
+        results.update(fields)
+        return results
+
+
+class TestScanHistoryQueryPlans(ScanHistoryTestCase):
+    """
+    Tests for the indexed scan-history queries.
+
+    Validates:
+    - Schema migrations are recorded in PRAGMA user_version
+    - documents.role_count is maintained by record_scan
+    - Hot history queries use indexes (no full-table scans)
+    """
+
+    def test_role_count_and_no_full_scans(self):
+        """
+        Test history queries run against indexes and report maintained role counts.
+
+        Expects: Latest schema version, correct role_count, no plain "SCAN <table>"
+        step in any captured history query plan.
+        """
+        import re
+        import sqlite3
+        import scan_history
+        from scan_history import ScanHistoryDB, SCHEMA_MIGRATIONS
+
+        db = ScanHistoryDB(self.db_path)
+        roles = {'Project Manager': {'mentions': ['a']}, 'Engineer': {'mentions': ['b', 'c']}}
+        for name in ('a.docx', 'b.docx', 'a.docx'):
+            info = db.record_scan(name, self.doc_path, {'issues': [], 'roles': roles}, {})
+
+        # Capture the SQL each history method really runs
+        statements = []
+
+        def traced_connect(path):
+            conn = sqlite3.connect(path)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        with patch.object(scan_history, 'db_connect', traced_connect):
+            history = db.get_scan_history()
+            db.get_scan_history(filename='a.docx')
+            db.get_score_trend('a.docx')
+            db.get_score_trend_by_id(info['document_id'])
+            db.get_document_roles(info['document_id'])
+
+        self.assertEqual(history[0]['role_count'], 2)
+        self.assertEqual(len(history), 3)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(conn.execute('PRAGMA user_version').fetchone()[0],
+                             SCHEMA_MIGRATIONS[-1][0])
+            selects = [sql for sql in statements if sql.lstrip().upper().startswith('SELECT')]
+            self.assertGreaterEqual(len(selects), 5)
+            for sql in selects:
+                plan = [row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql)]
+                full_scans = [step for step in plan if re.match(r'SCAN (TABLE )?\w+( AS \w+)?$', step)]
+                self.assertEqual(full_scans, [], f"{sql.strip()[:80]}... -> {plan}")
+        finally:
+            conn.close()
+
+
+class TestPortfolioSummaries(ScanHistoryTestCase):
+    """
+    Tests for the denormalized portfolio summaries.
+
+    Validates:
+    - record_scan writes top categories, severity counts and a batch id
+    - portfolio_stats follows recorded and deleted scans
+    - Portfolio endpoints never read result blobs
+    """
+
+    def test_batch_ids(self):
+        """
+        Test scans join a batch only within the window after its first scan.
+
+        Expects: Same id within BATCH_WINDOW_SECONDS, a new id after it.
+        """
+        from scan_history import next_batch_id, BATCH_WINDOW_SECONDS
+
+        first = next_batch_id(None, '2026-01-31 12:00:00')
+        self.assertEqual(first, 'batch_20260131_120000')
+        self.assertEqual(next_batch_id(first, '2026-01-31T12:04:59'), first)
+        late = f'2026-01-31 12:{BATCH_WINDOW_SECONDS // 60:02d}:01'
+        self.assertEqual(next_batch_id(first, late), 'batch_' + late.replace('-', '')
+                         .replace(':', '').replace(' ', '_'))
+
+    def test_endpoints_use_summaries(self):
+        """
+        Test portfolio endpoints are served from the summary columns and stats table.
+
+        Expects: Correct categories, counts and totals, and no captured SQL
+        statement touching results_json or results_blob.
+        """
+        import sqlite3
+        from flask import Flask
+        import portfolio.routes as routes
+        from scan_history import ScanHistoryDB
+
+        db = ScanHistoryDB(self.db_path)
+        issues = [{'category': 'Grammar', 'severity': 'High', 'message': 'm1'},
+                  {'category': 'Spelling', 'severity': 'Low', 'message': 'm2'},
+                  {'category': 'Spelling', 'severity': 'Low', 'message': 'm3'}]
+        results = {'issues': issues, 'score': 80, 'grade': 'B', 'issue_count': 3,
+                   'by_severity': {'High': 1, 'Low': 2},
+                   'by_category': {'Grammar': 1, 'Spelling': 2},
+                   'full_text': 'Hello world'}
+        scans = [db.record_scan(name, self.doc_path, results, {})['scan_id']
+                 for name in ('a.docx', 'b.docx', 'c.docx')]
+
+        statements = []
+
+        def traced_connect(path):
+            conn = sqlite3.connect(path)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        app = Flask(__name__)
+        app.register_blueprint(routes.portfolio_blueprint, url_prefix='/api/portfolio')
+        client = app.test_client()
+        with patch.object(routes, '_get_db_path', return_value=self.db_path), \
+                patch.object(routes, 'db_connect', traced_connect):
+            batches = client.get('/api/portfolio/batches').get_json()
+            batch = batches['batches'][0]
+            details = client.get(f"/api/portfolio/batch/{batch['id']}").get_json()
+            preview = client.get(f'/api/portfolio/document/{scans[0]}/preview').get_json()
+            stats = client.get('/api/portfolio/stats').get_json()['stats']
+
+        self.assertEqual(len(batches['batches']), 1)
+        self.assertEqual(batch['document_count'], 3)
+        self.assertEqual(batch['documents'][0]['categories'], ['Spelling', 'Grammar'])
+        self.assertEqual(len(details['documents']), 3)
+        self.assertEqual(details['documents'][0]['by_severity'], {'High': 1, 'Low': 2})
+        self.assertEqual(len(details['documents'][0]['top_issues']), 3)
+        self.assertTrue(preview['preview']['full_text_preview'].startswith('Hello world'))
+        self.assertEqual(stats['total_scans'], 3)
+        self.assertEqual(stats['avg_score'], 80)
+        self.assertEqual(stats['grade_distribution'], {'B': 3})
+        self.assertFalse([sql for sql in statements if 'results_' in sql])
+
+        db.delete_scan(scans[0])
+        with patch.object(routes, '_get_db_path', return_value=self.db_path):
+            stats = client.get('/api/portfolio/stats').get_json()['stats']
+        self.assertEqual(stats['total_scans'], 2)
+        self.assertEqual(stats['total_documents'], 2)
+        self.assertEqual(stats['grade_distribution'], {'B': 2})
+
+
+class TestIssueFingerprints(ScanHistoryTestCase):
+    """
+    Tests for stored issue fingerprints.
+
+    Validates:
+    - record_scan reports rescan changes from stored fingerprints
+    - Duplicate issues count once per fingerprint, per issue by category
+    - Issue comparison endpoint matches issues through fingerprints
+    - None issue fields hash like their stored (dropped) values
+    """
+
+    def test_rescan_changes_and_compare(self):
+        """
+        Test rescans and scan comparison use fingerprint set operations.
+
+        Expects: Correct added/removed/unchanged counts and categories, and
+        fixed/new/unchanged issue lists from the compare endpoint.
+        """
+        from flask import Flask
+        import document_compare.routes as routes
+        from scan_history import ScanHistoryDB
+
+        def issue(category, message, paragraph):
+            return {'category': category, 'message': message, 'paragraph_index': paragraph,
+                    'severity': 'Low'}
+
+        kept = issue('Grammar', 'Subject-verb agreement', 1)
+        fixed = issue('Spelling', 'Misspelled word', 2)
+        new = issue('Passive Voice', 'Passive construction', 3)
+
+        db = ScanHistoryDB(self.db_path)
+        first = db.record_scan('a.docx', self.doc_path,
+                               {'issues': [kept, fixed, fixed], 'score': 70}, {})
+        second = db.record_scan('a.docx', self.doc_path,
+                                {'issues': [kept, new], 'score': 90}, {})
+
+        changes = second['changes']
+        self.assertEqual((changes['added'], changes['removed'], changes['unchanged']), (1, 1, 1))
+        self.assertEqual(changes['added_categories'], {'Passive Voice': 1})
+        self.assertEqual(changes['removed_categories'], {'Spelling': 2})
+
+        app = Flask(__name__)
+        app.register_blueprint(routes.dc_blueprint, url_prefix='/api/compare')
+        with patch.object(routes, '_get_db_path', return_value=self.db_path):
+            response = app.test_client().get(
+                f"/api/compare/issues/{first['scan_id']}/{second['scan_id']}")
+        comparison = response.get_json()['comparison']
+
+        self.assertEqual([i['message'] for i in comparison['fixed']], ['Misspelled word'])
+        self.assertEqual([i['message'] for i in comparison['new_issues']], ['Passive construction'])
+        self.assertEqual([i['message'] for i in comparison['unchanged']], ['Subject-verb agreement'])
+        self.assertEqual(comparison['old_issue_count'], 3)
+        self.assertEqual(comparison['new_issue_count'], 2)
+
+    def test_none_fields_match_stored_issues(self):
+        """
+        Test issues with None fields fingerprint like their stored copies.
+
+        Expects: Same fingerprint before and after a scan_issues round-trip,
+        so a rescan of the same issues reports no changes.
+        """
+        from scan_history import ScanHistoryDB, issue_fingerprint
+
+        raw = {'category': None, 'message': 'Check this', 'paragraph_index': None,
+               'severity': 'Low'}
+        db = ScanHistoryDB(self.db_path)
+        first = db.record_scan('a.docx', self.doc_path, {'issues': [raw], 'score': 90}, {})
+        stored = db.get_scan_issues(first['scan_id'])
+
+        self.assertEqual(issue_fingerprint(stored[0]), issue_fingerprint(raw))
+        second = db.record_scan('a.docx', self.doc_path, {'issues': stored, 'score': 90}, {})
+        changes = second['changes']
+        self.assertEqual((changes['added'], changes['removed'], changes['unchanged']), (0, 0, 1))
+
+
+class TestFileHashService(unittest.TestCase):
+    """
+    Tests for the shared file hashing service.
+
+    Validates:
+    - Digests are memoized by (path, size, mtime) and refreshed on change
+    - save_stream writes and hashes in one pass, enforcing max_size
+    - Scan history reuses a passed-in hash and recognizes legacy MD5 hashes
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'doc.docx')
+
+    def tearDown(self):
+        import sqlite_pool
+        sqlite_pool.close_pool(os.path.join(self.tmp.name, 'history.db'))
+        self.tmp.cleanup()
+
+    def test_memoized_and_refreshed(self):
+        """
+        Test repeated hashing is served from the memo until the file changes.
+
+        Expects: One miss then hits; a new digest after the file is rewritten.
+        """
+        import hashlib
+        from file_hashing import FileHashService
+
+        service = FileHashService(chunk_size=4)
+        with open(self.path, 'wb') as f:
+            f.write(b'first version')
+        digest = service.hash_file(self.path)
+        self.assertEqual(digest, hashlib.sha256(b'first version').hexdigest())
+        self.assertEqual(service.hash_file(self.path), digest)
+        self.assertEqual((service.misses, service.hits), (1, 1))
+
+        with open(self.path, 'wb') as f:
+            f.write(b'second, longer version')
+        self.assertEqual(service.hash_file(self.path),
+                         hashlib.sha256(b'second, longer version').hexdigest())
+        self.assertEqual(service.hash_file(self.path, 'md5'),
+                         hashlib.md5(b'second, longer version').hexdigest())
+
+    def test_save_stream(self):
+        """
+        Test uploads are hashed while written and the digest is memoized.
+
+        Expects: Correct digest and size, a cache hit afterwards, and the
+        partial file removed when max_size is exceeded.
+        """
+        import io
+        import hashlib
+        from file_hashing import FileHashService
+
+        service = FileHashService(chunk_size=3)
+        digest, size = service.save_stream(io.BytesIO(b'uploaded bytes'), self.path)
+        self.assertEqual(digest, hashlib.sha256(b'uploaded bytes').hexdigest())
+        self.assertEqual(size, 14)
+        self.assertEqual(service.hash_file(self.path), digest)
+        self.assertEqual(service.hits, 1)
+
+        with self.assertRaises(ValueError):
+            service.save_stream(io.BytesIO(b'x' * 10), self.path, max_size=5)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_scan_history_hashes(self):
+        """
+        Test record_scan uses a given hash and compares legacy MD5 hashes correctly.
+
+        Expects: Stored hash equals the passed hash; an unchanged file with an
+        MD5 hash on record is not reported as changed.
+        """
+        import hashlib
+        import sqlite3
+        from scan_history import ScanHistoryDB
+
+        with open(self.path, 'wb') as f:
+            f.write(b'content')
+        db_path = os.path.join(self.tmp.name, 'history.db')
+        db = ScanHistoryDB(db_path)
+        db.record_scan('doc.docx', self.path, {'issues': []}, {}, file_hash='given-hash')
+
+        conn = sqlite3.connect(db_path)
+        try:
+            self.assertEqual(conn.execute('SELECT file_hash FROM documents').fetchone()[0],
+                             'given-hash')
+            conn.execute('UPDATE documents SET file_hash = ?',
+                         (hashlib.md5(b'content').hexdigest(),))
+            conn.commit()
+        finally:
+            conn.close()
+
+        info = db.record_scan('doc.docx', self.path, {'issues': []}, {})
+        self.assertFalse(info['changes']['file_changed'])
+
+
+class TestRoleGraphCache(ScanHistoryTestCase):
+    """
+    Tests for the generation-keyed role graph cache.
+
+    Validates:
+    - Cached graphs match get_role_graph_data
+    - record_scan and dictionary edits bump the generation
+    - Single-document changes are applied incrementally
+    - The cache is LRU-bounded
+    """
+
+    def _roles(self, *names):
+        return {name: {'mentions': ['m'] * (i + 1), 'responsibilities': ['Approves the plan']}
+                for i, name in enumerate(names)}
+
+    def test_generation_invalidation_and_incremental_updates(self):
+        """
+        Test the cache serves hits until a write bumps the generation.
+
+        Expects: Hits for repeated requests, an incremental reload after a
+        scan, a full reload after a dictionary edit, and graphs identical to
+        the uncached query throughout.
+        """
+        from scan_history import ScanHistoryDB, RoleGraphCache
+
+        db = ScanHistoryDB(self.db_path)
+        db.record_scan('a.docx', self.doc_path,
+                       {'issues': [], 'roles': self._roles('Project Manager', 'Engineer')}, {})
+        db.record_scan('b.docx', self.doc_path,
+                       {'issues': [], 'roles': self._roles('Engineer', 'Quality Lead')}, {})
+
+        cache = RoleGraphCache()
+        graph = cache.get(db, 100, 1)
+        self.assertEqual(graph, db.get_role_graph_data(100, 1))
+        self.assertIs(cache.get(db, 100, 1), graph)
+        self.assertEqual((cache.hits, cache.misses, cache.full_loads), (1, 1, 1))
+
+        generation = db.get_graph_generation()
+        db.record_scan('c.docx', self.doc_path,
+                       {'issues': [], 'roles': self._roles('Quality Lead', 'Test Engineer')}, {})
+        self.assertGreater(db.get_graph_generation(), generation)
+        graph = cache.get(db, 100, 1)
+        self.assertEqual(cache.incremental_loads, 1)
+        self.assertEqual(graph, db.get_role_graph_data(100, 1))
+        self.assertEqual(cache.get(db, 4, 2), db.get_role_graph_data(4, 2))
+
+        db.add_role_to_dictionary('Safety Officer', 'manual')
+        cache.get(db, 100, 1)
+        self.assertEqual(cache.full_loads, 2)
+
+    def test_lru_bound(self):
+        """
+        Test the cache holds at most max_entries graphs.
+
+        Expects: Entry count capped; evicted graphs are rebuilt on request.
+        """
+        from scan_history import ScanHistoryDB, RoleGraphCache
+
+        db = ScanHistoryDB(self.db_path)
+        db.record_scan('a.docx', self.doc_path,
+                       {'issues': [], 'roles': self._roles('Engineer')}, {})
+        cache = RoleGraphCache(max_entries=2)
+        for max_nodes in (10, 20, 30):
+            cache.get(db, max_nodes, 1)
+        self.assertEqual(cache.stats()['entries'], 2)
+        cache.get(db, 10, 1)
+        self.assertEqual(cache.misses, 4)
+        self.assertEqual(cache.full_loads, 1)
+
+
+class TestScanHistoryWriter(ScanHistoryTestCase):
+    """
+    Tests for the background scan history writer.
+
+    Validates:
+    - Queued scans are recorded and their scan_info delivered to callbacks
+    - flush() waits for everything queued before it
+    - One failing scan does not roll back the rest of its batch
+    - Batch reviews respond with recorded scan ids
+    - A pending scan_info marker is not stored with the scan
+    """
+
+    def test_queued_scans_are_recorded(self):
+        """
+        Test scans submitted to the writer end up in scan history.
+
+        Expects: Callbacks get the same scan_info as wait(), in submission
+        order, with rescans detected against the previous queued scan.
+        """
+        from scan_history import ScanHistoryDB, ScanHistoryWriter
+
+        db = ScanHistoryDB(self.db_path)
+        writer = ScanHistoryWriter(batch_size=4)
+        delivered = []
+        writes = [writer.submit(db, 'a.docx', self.doc_path, self._results(i), {},
+                                callback=lambda info, error: delivered.append((info, error)))
+                  for i in range(6)]
+        self.assertTrue(writer.flush(10))
+
+        self.assertTrue(all(w.done for w in writes))
+        self.assertEqual([info for info, _ in delivered], [w.wait(0) for w in writes])
+        self.assertTrue(all(error is None for _, error in delivered))
+        self.assertFalse(writes[0].scan_info['is_rescan'])
+        self.assertTrue(writes[-1].scan_info['is_rescan'])
+        self.assertEqual(writes[-1].scan_info['changes']['added'], 1)
+        self.assertEqual(len(db.get_scan_history(filename='a.docx', limit=10)), 6)
+
+        stats = writer.stats()
+        self.assertEqual((stats['submitted'], stats['written'], stats['failed']), (6, 6, 0))
+        self.assertLessEqual(stats['batches'], 6)
+        self.assertEqual(stats['queued'], 0)
+
+    def test_failed_scan_keeps_rest_of_batch(self):
+        """
+        Test a scan that fails mid-batch is rolled back on its own.
+
+        Expects: The failing write reports an error, the others commit.
+        """
+        from scan_history import ScanHistoryDB, ScanHistoryWriter, ScanWrite
+
+        db = ScanHistoryDB(self.db_path)
+        writer = ScanHistoryWriter()
+        writes = [
+            ScanWrite(db, 'a.docx', self.doc_path, self._results(1), {}),
+            ScanWrite(db, 'b.docx', self.doc_path, self._results(2), {'bad': object()}),
+            ScanWrite(db, 'c.docx', self.doc_path, self._results(3), {}),
+        ]
+        writer._write_batch(writes)
+
+        self.assertIsNotNone(writes[0].scan_info)
+        self.assertIsNone(writes[1].scan_info)
+        self.assertIsNotNone(writes[1].error)
+        self.assertIsNotNone(writes[2].scan_info)
+        filenames = {s['filename'] for s in db.get_scan_history(limit=10)}
+        self.assertEqual(filenames, {'a.docx', 'c.docx'})
+        self.assertEqual((writer.written, writer.failed, writer.batches), (2, 1, 1))
+
+    def test_batch_review_reports_scan_ids(self):
+        """
+        Test the batch endpoint answers with the scans its writes recorded.
+
+        Expects: Every document has a scan_id and 'recorded' status.
+        """
+        import app as app_module
+        from scan_history import ScanHistoryDB
+
+        db = ScanHistoryDB(self.db_path)
+        engine = MagicMock()
+        engine.review_document.side_effect = lambda path, options: self._results(2)
+        with patch.object(app_module, 'TechWriterReviewEngine', return_value=engine), \
+                patch.object(app_module, 'get_scan_history_db', return_value=db), \
+                patch.object(app_module, 'SCAN_HISTORY_AVAILABLE', True), \
+                patch.object(app_module.config, 'csrf_enabled', False):
+            response = app_module.app.test_client().post(
+                '/api/review/batch', json={'filepaths': [self.doc_path, self.doc_path]})
+
+        documents = response.get_json()['data']['documents']
+        self.assertEqual([d['scan_history'] for d in documents], ['recorded', 'recorded'])
+        self.assertEqual(len({d['scan_id'] for d in documents}), 2)
+        self.assertNotIn(None, [d['scan_id'] for d in documents])
+
+    def test_pending_scan_info_not_stored(self):
+        """
+        Test a results dict's scan_info marker is not written with the scan.
+
+        Expects: Recalled results have no scan_info.
+        """
+        from scan_history import ScanHistoryDB
+
+        db = ScanHistoryDB(self.db_path)
+        info = db.record_scan('a.docx', self.doc_path,
+                              self._results(1, scan_info={'pending': True}), {})
+        self.assertNotIn('scan_info', db.get_scan_results(info['scan_id']))
+
+
+class TestScanHistoryRetention(ScanHistoryTestCase):
+    """
+    Tests for the scan history retention policy.
+
+    Validates:
+    - Scans beyond the last N per document are reduced to summaries
+    - Scans older than the age limit are reduced, except a document's latest
+    - Orphaned document text and roles are dropped
+    - Incremental vacuum reports the reclaimed bytes
+    - New files use incremental auto_vacuum; older ones convert in a background run
+    """
+
+    def _record(self, db, filename, n, roles=None):
+        results = self._results(n, score=90 - n, grade='A',
+                                full_text=f'{filename} revision {n} ' + 'text ' * 2000,
+                                roles=roles or {})
+        return db.record_scan(filename, self.doc_path, results, {})['scan_id']
+
+    def _count(self, db, sql):
+        import sqlite3
+        conn = sqlite3.connect(db.db_path)
+        try:
+            return conn.execute(sql).fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_retention_keeps_recent_full_results(self):
+        """
+        Test apply_retention reduces only scans outside the policy.
+
+        Expects: The two newest scans of a.docx stay full, older ones become
+        summaries that still report their counts; b.docx's only scan stays
+        full despite its age.
+        """
+        import sqlite3
+        from scan_history import ScanHistoryDB
+
+        db = ScanHistoryDB(self.db_path)
+        a_scans = [self._record(db, 'a.docx', n) for n in range(1, 5)]
+        b_scan = self._record(db, 'b.docx', 3)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE scans SET scan_time = datetime('now', '-400 days') WHERE id = ?",
+                     (b_scan,))
+        conn.commit()
+        conn.close()
+
+        stats = db.apply_retention(keep_full_scans=2, summary_after_days=365, pause_seconds=0)
+        self.assertEqual(stats['scans_summarized'], 2)
+        self.assertEqual(stats['issues_deleted'], 1 + 2)
+        self.assertEqual(stats['texts_deleted'], 2)
+
+        old = db.get_scan_results(a_scans[0])
+        self.assertTrue(old['summary_only'])
+        self.assertEqual((old['issue_count'], old['issues']), (1, []))
+        self.assertEqual(old['by_severity'], {'Low': 1})
+        recent = db.get_scan_results(a_scans[-1])
+        self.assertNotIn('summary_only', recent)
+        self.assertEqual(len(recent['issues']), 4)
+        self.assertEqual(len(db.get_scan_results(b_scan)['issues']), 3)
+        self.assertEqual(self._count(db, 'SELECT COUNT(*) FROM document_texts'), 3)
+
+        # Rescans still diff against the (full) latest scan
+        self._record(db, 'a.docx', 5)
+        self.assertEqual(db.apply_retention(2, None, pause_seconds=0)['scans_summarized'], 1)
+
+    def test_orphaned_roles_and_reclaimed_space(self):
+        """
+        Test orphaned roles are dropped and freed pages are reclaimed.
+
+        Expects: A role whose only document was deleted is removed, the
+        database is created with incremental auto_vacuum and shrinks
+        without a full VACUUM.
+        """
+        from scan_history import ScanHistoryDB, ScanHistoryMaintenance
+
+        db = ScanHistoryDB(self.db_path)
+        roles = {'Project Manager': {'count': 2}}
+        scan_ids = [self._record(db, 'a.docx', n) for n in range(1, 8)]
+        orphan_scan = self._record(db, 'b.docx', 1, roles={'Safety Officer': {'count': 1}})
+        self._record(db, 'c.docx', 1, roles=roles)
+        db.delete_scan(orphan_scan)
+        self.assertEqual(self._count(db, 'SELECT COUNT(*) FROM roles'), 2)
+        self.assertEqual(self._count(db, 'PRAGMA auto_vacuum'), 2)
+
+        maintenance = ScanHistoryMaintenance(db, keep_full_scans=1, summary_after_days=None)
+        report = maintenance.run_once()
+        self.assertFalse(report['full_vacuum'])
+        self.assertEqual(report['scans_summarized'], len(scan_ids) - 1)
+        self.assertEqual(report['roles_deleted'], 1)
+        self.assertEqual(self._count(db, 'SELECT role_name FROM roles'), 'Project Manager')
+        self.assertEqual(self._count(db, 'PRAGMA auto_vacuum'), 2)
+        self.assertEqual(self._count(db, 'PRAGMA freelist_count'), 0)
+        self.assertGreater(report['bytes_reclaimed'], 0)
+        self.assertEqual(report['size_before'] - report['size_after'], report['bytes_reclaimed'])
+        self.assertIs(maintenance.status()['last_report'], report)
+
+    def test_legacy_file_converted_in_background_run(self):
+        """
+        Test a pre-existing non-incremental file is converted off the caller's thread.
+
+        Expects: run_in_background returns at once, refuses a second start
+        while running, and its report records the one-time full VACUUM.
+        """
+        import sqlite3
+        from scan_history import ScanHistoryDB, ScanHistoryMaintenance
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('CREATE TABLE legacy (x)')
+        conn.commit()
+        conn.close()
+        db = ScanHistoryDB(self.db_path)
+        self.assertEqual(self._count(db, 'PRAGMA auto_vacuum'), 0)
+
+        maintenance = ScanHistoryMaintenance(db, keep_full_scans=1, summary_after_days=None)
+        with maintenance._run_lock:
+            self.assertFalse(maintenance.run_in_background())
+        self.assertTrue(maintenance.run_in_background())
+        deadline = time.time() + 10
+        while maintenance.last_report is None and time.time() < deadline:
+            time.sleep(0.05)
+
+        self.assertTrue(maintenance.last_report['full_vacuum'])
+        self.assertEqual(self._count(db, 'PRAGMA auto_vacuum'), 2)
+
+
+class TestScanHistorySearch(ScanHistoryTestCase):
+    """
+    Tests for full-text search over scan history.
+
+    Validates:
+    - record_scan indexes issues and paragraphs incrementally
+    - Phrase search with document, date, category and severity filters
+    - Deleted scans drop out of the index
+    - Without FTS5, search reports itself unavailable instead of failing
+    """
+
+    def _record(self, db, filename, paragraphs, issues):
+        return db.record_scan(filename, self.doc_path, {
+            'paragraphs': [[i, text] for i, text in enumerate(paragraphs)],
+            'full_text': '\n'.join(paragraphs),
+            'issues': issues,
+        }, {})['scan_id']
+
+    def test_search_issues_and_paragraphs(self):
+        """
+        Test ranked search with filters over recorded scans.
+
+        Expects: Phrase hits from the right documents with snippets, filters
+        narrowing the issue hits, and nothing left of a deleted scan.
+        """
+        from scan_history import ScanHistoryDB, build_fts_query
+
+        db = ScanHistoryDB(self.db_path)
+        vague = {'category': 'Requirements', 'severity': 'High',
+                 'message': 'Vague requirement', 'flagged_text': 'shall be capable of'}
+        spec_scan = self._record(db, 'spec.docx', [
+            '1 Scope', 'The system shall be capable of logging. Details are TBD.'
+        ], [vague, {'category': 'Grammar', 'severity': 'Low', 'message': 'Passive voice'}])
+        plan_scan = self._record(db, 'plan.docx', ['3 Schedule', 'Dates are TBD.'], [
+            dict(vague, severity='Medium'),
+        ])
+
+        hits = db.search('"shall be capable of"')
+        self.assertEqual({h['filename'] for h in hits['issues']}, {'spec.docx', 'plan.docx'})
+        self.assertEqual([h['scan_id'] for h in hits['paragraphs']], [spec_scan])
+        self.assertIn('[shall be capable of]', hits['paragraphs'][0]['snippet'])
+        self.assertEqual(hits['paragraphs'][0]['paragraph_index'], 1)
+
+        issues = db.search('capable', kind='issues', severity='High,Critical')['issues']
+        self.assertEqual([(h['scan_id'], h['issue_index']) for h in issues], [(spec_scan, 0)])
+        self.assertEqual(db.search('passive', kind='issues', category='Requirements')['issues'], [])
+        self.assertEqual(len(db.search('TBD', kind='paragraphs', filename='plan.docx')['paragraphs']), 1)
+        self.assertEqual(db.search('TBD', until='2000-01-01')['paragraphs'], [])
+        self.assertEqual(len(db.search('TB*', since='2000-01-01')['paragraphs']), 2)
+
+        db.delete_scan(plan_scan)
+        hits = db.search('capable', kind='issues')
+        self.assertEqual([h['filename'] for h in hits['issues']], ['spec.docx'])
+        self.assertEqual([h['scan_id'] for h in db.search('TBD')['paragraphs']], [spec_scan])
+
+        self.assertEqual(build_fts_query('a "b c" d* NEAR('), '"a" "b c" "d"* "NEAR("')
+        with self.assertRaises(ValueError):
+            db.search('  ')
+
+    def test_search_unavailable_without_fts5(self):
+        """
+        Test search on a SQLite build without FTS5, then on one with it.
+
+        Expects: SearchUnavailableError and a 503 SEARCH_UNAVAILABLE response,
+        then working search once FTS5 is present and the index is created.
+        """
+        import sqlite_pool
+        import app as app_module
+        from scan_history import ScanHistoryDB, SearchUnavailableError
+
+        with patch('scan_history._fts5_available', return_value=False):
+            db = ScanHistoryDB(self.db_path)
+        self.assertFalse(db.search_available)
+        self._record(db, 'spec.docx', ['Dates are TBD.'], [])
+        with self.assertRaises(SearchUnavailableError):
+            db.search('TBD')
+        with patch.object(app_module, 'get_scan_history_db', return_value=db), \
+                patch.object(app_module, 'SCAN_HISTORY_AVAILABLE', True):
+            response = app_module.app.test_client().get('/api/scan-history/search?q=TBD')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.get_json()['error']['code'], 'SEARCH_UNAVAILABLE')
+
+        sqlite_pool.close_pool(self.db_path)
+        db = ScanHistoryDB(self.db_path)
+        self.assertTrue(db.search_available)
+        self.assertEqual(len(db.search('TBD')['paragraphs']), 1)
+
+
+class TestRoleDatabaseSQLite(unittest.TestCase):
+    """
+    Tests for the SQLite role database backend.
+
+    Validates:
+    - Saves upsert only the rows that changed
+    - Two users on one database see each other's changes and deletes
+    - The JSON registry round-trips through import/export
+    - batch_updates() saves once
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'roles.sqlite')
+
+    def tearDown(self):
+        for db in getattr(self, '_open', []):
+            db.close()
+        self.tmp.cleanup()
+
+    def _open_db(self, path=None, user='alice'):
+        from role_management_studio_v3 import StudioSettings, open_role_database
+        settings = StudioSettings(database_path=path or self.db_path, user_name=user)
+        db = open_role_database(settings)
+        self._open = getattr(self, '_open', []) + [db]
+        return db
+
+    def _role(self, role_id, name):
+        from role_management_studio_v3 import StandardRole
+        now = '2026-01-01T00:00:00'
+        return StandardRole(
+            id=role_id, canonical_name=name, category='Engineering', subcategory='',
+            description='', typical_responsibilities=[], typical_actions=[], aliases=[],
+            reports_to=[], coordinates_with=[], supervises=[], required_skills=[],
+            certifications=[], created_date=now, modified_date=now, usage_count=1,
+            confidence_avg=0.9, is_approved=False, approved_by='', notes='',
+            last_modified_by='', source_document_ids=[], active_document_count=0)
+
+    def _seqs(self, db):
+        rows = db._connection().execute('SELECT collection, key, seq FROM records').fetchall()
+        return {(c, k): seq for c, k, seq in rows}
+
+    def test_row_upserts_and_concurrent_users(self):
+        """
+        Test two database instances sharing one SQLite file.
+
+        Expects: A save rewrites only the changed role, and each instance picks
+        up the other's additions, updates and deletes on refresh or save.
+        """
+        from role_management_studio_v3 import SQLiteRoleDatabase
+
+        alice = self._open_db()
+        self.assertIsInstance(alice, SQLiteRoleDatabase)
+        alice.add_role(self._role('r1', 'Systems Engineer'))
+        alice.add_role(self._role('r2', 'Project Manager'))
+        before = self._seqs(alice)
+
+        role = alice.get_role('r1')
+        role.notes = 'updated'
+        alice.add_role(role)
+        after = self._seqs(alice)
+        self.assertGreater(after[('roles', 'r1')], before[('roles', 'r1')])
+        self.assertEqual(after[('roles', 'r2')], before[('roles', 'r2')])
+
+        bob = self._open_db(user='bob')
+        self.assertEqual(bob.get_role('r1').notes, 'updated')
+        self.assertFalse(bob.refresh())
+
+        bob.add_role(self._role('r3', 'Test Lead'))
+        alice.delete_role('r2')
+        self.assertTrue(bob.refresh())
+        self.assertIsNone(bob.get_role('r2'))
+
+        # Alice's save pulls Bob's role instead of overwriting it
+        self.assertIsNotNone(alice.get_role('r3'))
+        self.assertEqual({r.id for r in alice.get_all_roles()}, {'r1', 'r3'})
+        log = [(e['action'], e['target_id']) for e in self._open_db()._data['change_log']]
+        self.assertEqual(len(log), 5)
+        self.assertEqual(log[-1], ('delete_role', 'r2'))
+
+    def test_json_import_export_and_batch(self):
+        """
+        Test moving a JSON registry into SQLite and back.
+
+        Expects: An empty SQLite database imports the JSON registry beside it,
+        export_json() writes a file the JSON backend loads unchanged, and
+        batch_updates() stores its changes with a single save.
+        """
+        import json
+        from role_management_studio_v3 import RoleDatabase, StudioSettings
+
+        json_path = os.path.join(self.tmp.name, 'roles.json')
+        legacy = RoleDatabase(StudioSettings(database_path=json_path, backup_on_save=False))
+        legacy.add_role(self._role('r1', 'Systems Engineer'))
+
+        db = self._open_db()
+        self.assertEqual([r.canonical_name for r in db.get_all_roles()], ['Systems Engineer'])
+
+        saves = []
+        original_save = db.save
+        db.save = lambda force=False: (saves.append(force), original_save(force))
+        with db.batch_updates():
+            db.add_role(self._role('r2', 'Project Manager'))
+            db.add_role(self._role('r3', 'Test Lead'))
+        self.assertEqual(saves, [False])
+        self.assertEqual(len(self._open_db()._data['roles']), 3)
+
+        export_path = os.path.join(self.tmp.name, 'export.json')
+        db.export_json(export_path)
+        with open(export_path, encoding='utf-8') as f:
+            exported = json.load(f)
+        self.assertEqual(set(exported['roles']), {'r1', 'r2', 'r3'})
+        reloaded = RoleDatabase(StudioSettings(database_path=export_path))
+        self.assertEqual(reloaded._data['roles'], db._data['roles'])
+
+        # Importing replaces the contents, deleting rows the file lacks
+        fresh = self._open_db(os.path.join(self.tmp.name, 'other.sqlite'))
+        fresh.add_role(self._role('r9', 'Auditor'))
+        fresh.import_json(json_path)
+        self.assertEqual(set(self._open_db(fresh.filepath)._data['roles']), {'r1'})
+
+
+class TestDecisionLearnerBatch(unittest.TestCase):
+    """
+    Tests for bulk decision recording and cached predictions.
+
+    Validates:
+    - record_decisions() aggregates per pattern in one call
+    - get_predictions() matches get_prediction() for each fix
+    - The cached map follows writes, dictionary changes and clears
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'decisions.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_bulk_record_and_predict(self):
+        """
+        Test recording a batch of decisions and predicting a batch of fixes.
+
+        Expects: Per-pattern counts and stored predictions, the same answers from
+        a fresh instance, and cache updates visible without reloading.
+        """
+        from decision_learner import DecisionLearner
+
+        learner = DecisionLearner(self.db_path)
+        receive = {'category': 'Spelling', 'flagged_text': 'recieve', 'suggestion': 'receive'}
+        utilize = {'category': 'Style', 'flagged_text': 'utilize', 'suggestion': 'use'}
+        unknown = {'category': 'Style', 'flagged_text': 'leverage', 'suggestion': 'use'}
+
+        recorded = learner.record_decisions(
+            [{'fix': receive, 'decision': 'accepted'}] * 3 +
+            [{'fix': utilize, 'decision': 'rejected'}] * 2 +
+            [{'fix': utilize, 'decision': 'maybe'}]
+        )
+        self.assertEqual(recorded, 5)
+
+        predictions = learner.get_predictions([receive, utilize, unknown])
+        self.assertEqual([p['prediction'] for p in predictions], ['accept', 'reject', None])
+        self.assertEqual(predictions[0]['history'], {'accepted': 3, 'rejected': 0, 'total': 3})
+        self.assertEqual(DecisionLearner(self.db_path).get_predictions([receive, utilize, unknown]),
+                         predictions)
+        stored = {p['pattern_key']: p['predicted_action'] for p in learner.get_all_patterns()}
+        self.assertEqual(set(stored.values()), {'accept', 'reject'})
+
+        self.assertTrue(learner.record_decision(receive, 'rejected'))
+        self.assertEqual(learner.get_prediction(receive)['history']['total'], 4)
+
+        learner.add_to_dictionary('Leverage')
+        self.assertEqual(learner.get_prediction(unknown)['prediction'], 'reject')
+        learner.remove_from_dictionary('Leverage')
+        self.assertIsNone(learner.get_prediction(unknown)['prediction'])
+
+        learner.clear_patterns()
+        self.assertIsNone(learner.get_prediction(receive)['history'])
+        self.assertEqual(learner.get_statistics()['unique_patterns'], 0)
+
+
+class TestAnalysisRepositoryQueries(unittest.TestCase):
+    """
+    Tests for the SQL-side baseline filtering, trends and comparisons.
+
+    Validates:
+    - Existing issue rows get an issue hash on upgrade
+    - filter_baselined() matches by hash for the given document only
+    - compare_analyses() groups issues by hash, with counts-only mode
+    - get_trends() returns daily points with window aggregates
+    """
+
+    def setUp(self):
+        import database
+        from pathlib import Path
+        self.tmp = tempfile.TemporaryDirectory()
+        self._saved = (database.DATABASE_PATH, getattr(database._local, 'connection', None))
+        database.DATABASE_PATH = Path(self.tmp.name) / 'techwriter.db'
+        database._local.connection = None
+
+    def tearDown(self):
+        import database
+        if database._local.connection is not None:
+            database._local.connection.close()
+        database.DATABASE_PATH, database._local.connection = self._saved
+        self.tmp.cleanup()
+
+    def _issue(self, n):
+        return {'category': 'Grammar', 'severity': 'Low', 'message': f'message {n}',
+                'flagged_text': f'text {n}'}
+
+    def test_issue_hash_migration(self):
+        """
+        Test upgrading an issues table without the issue_hash column.
+
+        Expects: The column is added and filled with stored_issue_hash values.
+        """
+        import sqlite3
+        import database
+
+        conn = sqlite3.connect(str(database.DATABASE_PATH))
+        conn.execute("CREATE TABLE issues (id INTEGER PRIMARY KEY, analysis_id INTEGER, "
+                     "category TEXT, message TEXT, flagged_text TEXT)")
+        conn.execute("INSERT INTO issues (analysis_id, category, message, flagged_text) "
+                     "VALUES (1, 'Grammar', 'message 1', 'text 1')")
+        conn.commit()
+        conn.close()
+
+        database.init_database()
+        row = database.get_connection().execute("SELECT issue_hash FROM issues").fetchone()
+        self.assertEqual(row['issue_hash'], database.compute_issue_hash(self._issue(1)))
+
+    def test_baselines_comparisons_and_trends(self):
+        """
+        Test the repository queries over two saved analyses.
+
+        Expects: Baselined issues removed per document, new/resolved/unchanged
+        issues and counts, and one trend point with its window columns.
+        """
+        import database
+        from database import AnalysisRepository, BaselineRepository, DocumentRepository
+
+        database.init_database()
+        path = os.path.join(self.tmp.name, 'doc.txt')
+        with open(path, 'w') as f:
+            f.write('doc')
+        doc_id = DocumentRepository.get_or_create('doc.txt', path)
+        other_id = DocumentRepository.get_or_create('other.txt', path, file_hash='other')
+
+        first = AnalysisRepository.save_analysis(
+            doc_id, {'issues': [self._issue(1), self._issue(2), self._issue(2)],
+                     'issue_count': 3, 'score': 80})
+        second = AnalysisRepository.save_analysis(
+            doc_id, {'issues': [self._issue(2), self._issue(3)], 'issue_count': 2, 'score': 90})
+
+        BaselineRepository.add_baseline(doc_id, self._issue(2))
+        issues = [self._issue(n) for n in (1, 2, 3, 2)]
+        self.assertEqual(BaselineRepository.filter_baselined(doc_id, issues),
+                         [self._issue(1), self._issue(3)])
+        self.assertEqual(BaselineRepository.filter_baselined(other_id, issues), issues)
+        self.assertEqual(BaselineRepository.filter_baselined(doc_id, []), [])
+
+        comparison = AnalysisRepository.compare_analyses(first, second)
+        self.assertEqual(comparison['new_issues'], [('Grammar', 'message 3', 'text 3')])
+        self.assertEqual(comparison['resolved_issues'], [('Grammar', 'message 1', 'text 1')])
+        self.assertEqual(comparison['unchanged_issues'], [('Grammar', 'message 2', 'text 2')])
+        self.assertEqual(comparison['score_change'], 10)
+        counts = AnalysisRepository.compare_analyses(first, second, include_issues=False)
+        self.assertNotIn('new_issues', counts)
+        self.assertEqual((counts['new_count'], counts['resolved_count'], counts['unchanged_count']),
+                         (1, 1, 1))
+        self.assertEqual(AnalysisRepository.compare_analyses(first, 9999), {})
+
+        trends = AnalysisRepository.get_trends(doc_id)
+        self.assertEqual(trends['counts'], [2])
+        self.assertEqual(trends['scores'], [85.0])
+        self.assertEqual(trends['rolling_scores'], [85.0])
+        self.assertEqual(trends['score_changes'], [None])
+
+    def test_hashes_match_stored_columns_across_migration(self):
+        """
+        Test issue hashes follow the stored columns, before and after upgrade.
+
+        Expects: An issue backfilled by the migration (NULL message) matches
+        the same issue saved afterwards; 'text'-only issues compare by text.
+        """
+        import database
+        from database import AnalysisRepository, DocumentRepository
+
+        database.init_database()
+        path = os.path.join(self.tmp.name, 'doc.txt')
+        with open(path, 'w') as f:
+            f.write('doc')
+        doc_id = DocumentRepository.get_or_create('doc.txt', path)
+
+        issue = {'category': 'C', 'flagged_text': 'x'}
+        before = AnalysisRepository.save_analysis(doc_id, {'issues': [issue]})
+        conn = database.get_connection()
+        conn.execute("UPDATE issues SET issue_hash = NULL")
+        conn.execute("UPDATE configurations SET value = '1' WHERE key = 'db_version'")
+        conn.commit()
+        database.init_database()
+        after = AnalysisRepository.save_analysis(doc_id, {'issues': [issue]})
+
+        counts = AnalysisRepository.compare_analyses(before, after, include_issues=False)
+        self.assertEqual((counts['new_count'], counts['resolved_count'], counts['unchanged_count']),
+                         (0, 0, 1))
+
+        foo = AnalysisRepository.save_analysis(
+            doc_id, {'issues': [{'category': 'C', 'message': 'm', 'text': 'foo'}]})
+        bar = AnalysisRepository.save_analysis(
+            doc_id, {'issues': [{'category': 'C', 'message': 'm', 'text': 'bar'}]})
+        counts = AnalysisRepository.compare_analyses(foo, bar, include_issues=False)
+        self.assertEqual((counts['new_count'], counts['resolved_count'], counts['unchanged_count']),
+                         (1, 1, 0))
+
+
+class TestJobScheduler(unittest.TestCase):
+    """
+    Tests for the JobManager worker pool.
+
+    Validates:
+    - Queued jobs run by job-type priority, then submission order
+    - Queue positions are reported in Job.to_dict and kept current
+    - A full queue refuses jobs with a retry hint
+    - Per-type running limits, cancellation of queued jobs and
+      completion from return values / failure from exceptions
+    """
+
+    def _manager(self, **kwargs):
+        from job_manager import JobManager
+        manager = JobManager(**kwargs)
+        self.addCleanup(manager.shutdown)
+        return manager
+
+    def _wait(self, manager, job_id, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if manager.get_job(job_id).status.value in ('complete', 'failed', 'cancelled'):
+                return manager.get_job(job_id)
+            time.sleep(0.01)
+        self.fail(f"Job {job_id} did not finish")
+
+    def test_priority_positions_and_back_pressure(self):
+        """
+        Test a single worker with a blocked job and a short queue.
+
+        Expects: Positions ordered by type priority, 429-style QueueFullError
+        when full (the refused job discarded), and run order matching positions.
+        """
+        from job_manager import QueueFullError
+
+        manager = self._manager(workers=1, queue_limit=3)
+        gate = threading.Event()
+        order = []
+
+        blocker = manager.create_job('review')
+        manager.submit(blocker, gate.wait, 5)
+        deadline = time.time() + 5
+        while manager.get_job(blocker).status.value != 'running' and time.time() < deadline:
+            time.sleep(0.01)
+
+        export = manager.create_job('export')
+        review_1 = manager.create_job('review')
+        review_2 = manager.create_job('review')
+        self.assertEqual(manager.submit(export, order.append, 'export'), 1)
+        self.assertEqual(manager.submit(review_1, order.append, 'review_1'), 1)
+        self.assertEqual(manager.submit(review_2, order.append, 'review_2'), 2)
+        self.assertEqual(manager.get_job(export).to_dict()['queue_position'], 3)
+        self.assertIsNone(manager.get_job(blocker).to_dict()['queue_position'])
+
+        extra = manager.create_job('review')
+        with self.assertRaises(QueueFullError) as ctx:
+            manager.submit(extra, order.append, 'extra')
+        self.assertGreaterEqual(ctx.exception.retry_after, 1)
+        self.assertIsNone(manager.get_job(extra))
+        follow_up = manager.create_job('hyperlink_validation')
+        manager.submit(follow_up, order.append, 'follow_up', bypass_limit=True)
+
+        self.assertTrue(manager.cancel_job(review_2))
+        self.assertEqual(manager.get_job(export).queue_position, 3)
+        self.assertEqual(manager.scheduler_stats()['queued'],
+                         {'export': 1, 'review': 1, 'hyperlink_validation': 1})
+
+        gate.set()
+        self._wait(manager, export)
+        self.assertEqual(order, ['review_1', 'follow_up', 'export'])
+        self.assertEqual(manager.get_job(review_2).status.value, 'cancelled')
+
+    def test_results_failures_and_type_limits(self):
+        """
+        Test job outcomes and a per-type running cap.
+
+        Expects: A returned dict becomes the result, an exception fails the job,
+        and at most one 'slow' job runs at a time while others proceed.
+        """
+        manager = self._manager(workers=3, type_limits={'slow': 1})
+
+        done = manager.create_job('report')
+        manager.submit(done, lambda: {'rows': 3})
+        self.assertEqual(self._wait(manager, done).result, {'rows': 3})
+
+        def explode():
+            raise RuntimeError('boom')
+        failed = manager.create_job('report')
+        manager.submit(failed, explode)
+        self.assertEqual(self._wait(manager, failed).error, 'boom')
+
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+        slow_jobs = [manager.create_job('slow') for _ in range(3)]
+        for job_id in slow_jobs:
+            manager.submit(job_id, slow)
+        quick = manager.create_job('report')
+        manager.submit(quick, lambda: {'quick': True})
+        self.assertEqual(self._wait(manager, quick).result, {'quick': True})
+        for job_id in slow_jobs:
+            self._wait(manager, job_id)
+        self.assertEqual(max(peak), 1)
+
+
+class TestJobEvents(unittest.TestCase):
+    """
+    Tests for pushed job progress (subscriptions and the SSE endpoints).
+
+    Validates:
+    - Bursts of updates are coalesced per subscriber
+    - Session subscriptions see every job of that session only
+    - /api/job/<id>/events streams snapshots and closes after the final one
+    - Unknown jobs give 404; a full stream pool gives 503 (poll instead)
+    """
+
+    def setUp(self):
+        app.config['TESTING'] = True
+        self.client = app.test_client()
+
+    def test_subscription_coalesces_and_filters(self):
+        """
+        Test subscription notifications directly on a JobManager.
+
+        Expects: 50 updates collapse into one change, other sessions' jobs are
+        ignored, and a closed subscription is dropped from the manager.
+        """
+        from job_manager import JobManager
+
+        manager = JobManager()
+        mine = manager.create_job('review', metadata={'session_id': 's1'})
+        other = manager.create_job('review', metadata={'session_id': 's2'})
+        subscription = manager.subscribe(session_id='s1', min_interval=0.05)
+
+        for i in range(50):
+            manager.update_phase_progress(mine, i)
+            manager.update_phase_progress(other, i)
+        self.assertEqual(subscription.next_changes(timeout=1), [mine])
+
+        manager.complete_job(mine, {'ok': True})
+        started = time.monotonic()
+        self.assertEqual(subscription.next_changes(timeout=1), [mine])
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+        self.assertEqual(subscription.next_changes(timeout=0.01), [])
+
+        subscription.close()
+        self.assertEqual(manager.subscriber_count(), 0)
+
+    def test_job_event_stream(self):
+        """
+        Test the per-job stream while a worker updates the job.
+
+        Expects: text/event-stream with progress events and a final 'complete'
+        event, fewer events than updates, and the stream slot released.
+        """
+        import app as app_module
+        from job_manager import get_job_manager
+
+        manager = get_job_manager()
+        job_id = manager.create_job('review')
+
+        def work():
+            time.sleep(0.05)
+            for i in range(60):
+                manager.update_phase_progress(job_id, i)
+                time.sleep(0.005)
+            manager.complete_job(job_id, {'ok': True})
+
+        worker = threading.Thread(target=work)
+        worker.start()
+        response = self.client.get(f'/api/job/{job_id}/events')
+        body = response.get_data(as_text=True)
+        response.close()
+        worker.join()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        events = [line for line in body.splitlines() if line.startswith('event: ')]
+        self.assertEqual(events[-1], 'event: complete')
+        self.assertLess(len(events), 30)
+        final = json.loads(body.rstrip().splitlines()[-1][len('data: '):])
+        self.assertEqual(final['status'], 'complete')
+        self.assertEqual(app_module._event_stream_slots._value,
+                         app_module.EVENT_STREAM_MAX_CLIENTS)
+
+    def test_session_stream_unknown_job_and_busy(self):
+        """
+        Test the session stream, a missing job and an exhausted stream pool.
+
+        Expects: The session stream starts with this session's active jobs,
+        404 for an unknown job, 503 with Retry-After when no slot is free.
+        """
+        import app as app_module
+        from job_manager import get_job_manager
+
+        manager = get_job_manager()
+        self.client.set_cookie('twr_session', 'events-session')
+        mine = manager.create_job('review', metadata={'session_id': 'events-session'})
+        manager.create_job('review', metadata={'session_id': 'someone-else'})
+
+        with patch.object(app_module, 'EVENT_STREAM_MAX_SECONDS', 0):
+            response = self.client.get('/api/job/events')
+            body = response.get_data(as_text=True)
+            response.close()
+        self.assertEqual(body.count('event: progress'), 1)
+        self.assertIn(f'"job_id": "{mine}"', body)
+
+        self.assertEqual(self.client.get('/api/job/missing/events').status_code, 404)
+
+        with patch.object(app_module, '_event_stream_slots', threading.BoundedSemaphore(1)) as slots:
+            slots.acquire()
+            response = self.client.get(f'/api/job/{mine}/events')
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('Retry-After', response.headers)
+        manager.cancel_job(mine)
+
+
+class TestSessionResultStore(unittest.TestCase):
+    """
+    Tests for the memory-budgeted session result store.
+
+    Validates:
+    - Least recently used entries spill to compressed files over budget
+    - Spilled entries rehydrate transparently, keeping shared objects shared
+    - Release listeners hear about spilled and replaced values
+    - SessionManager sessions, review jobs and /api/health use the store
+    """
+
+    def setUp(self):
+        from session_store import SessionResultStore
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SessionResultStore(budget_bytes=100_000, spill_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.store.clear()
+        self.tmp.cleanup()
+
+    def _results(self, n):
+        issues = [{'issue_id': f'{n}-{i}', 'message': 'x' * 60} for i in range(100)]
+        return {'full_text': f'document {n} ' * 5000, 'issues': issues}
+
+    def test_spill_and_rehydrate(self):
+        """
+        Test eviction order, rehydration and release notifications.
+
+        Expects: Older sessions spill to disk, reading one brings it back with
+        filtered_issues still sharing review_results' issue dicts, replacing
+        review_results reports the old value, discard removes the file.
+        """
+        from session_store import SessionData
+
+        released = []
+        self.store.add_release_listener(lambda key, values: released.append((key, sorted(values))))
+        sessions = []
+        for n in range(3):
+            data = SessionData(self.store, f's{n}', current_file=None)
+            results = self._results(n)
+            data.update(review_results=results, filtered_issues=results['issues'])
+            sessions.append(data)
+
+        stats = self.store.stats()
+        self.assertLessEqual(stats['resident_bytes'], 100_000)
+        self.assertEqual(stats['spilled_entries'], 2)
+        self.assertEqual(len(os.listdir(self.tmp.name)), 2)
+        self.assertEqual([key for key, _ in released], ['s0', 's1'])
+
+        first = sessions[0]['review_results']
+        self.assertTrue(first['full_text'].startswith('document 0'))
+        self.assertIs(sessions[0].get('filtered_issues')[5], first['issues'][5])
+        self.assertEqual(self.store.stats()['rehydrations'], 1)
+        self.assertIsNone(sessions[0]['current_file'])
+
+        released.clear()
+        sessions[0]['review_results'] = self._results(9)
+        self.assertIn(('s0', ['review_results']), released)
+
+        sessions[2].discard_stored()
+        self.assertNotIn('s2', self.store)
+        self.assertIsNone(sessions[2]['review_results'])
+        self.assertEqual(sessions[2]['filtered_issues'], [])
+
+    def test_session_manager_releases_job_results(self):
+        """
+        Test spilled review results are served back for their review job.
+
+        Expects: A spilled session no longer pins its job's result, the review
+        result endpoint reads it from the store, and /api/health reports usage.
+        """
+        import app as app_module
+
+        self.store.add_release_listener(app_module._release_job_results)
+        manager = app_module.get_job_manager()
+        client = app.test_client()
+        with patch.object(SessionManager, '_store', self.store):
+            first = SessionManager.create()
+            job_id = manager.create_job('review', metadata={'session_id': first})
+            results = self._results(0)
+            SessionManager.update(first, review_results=results, review_job_id=job_id,
+                                  filtered_issues=results['issues'])
+            manager.complete_job(job_id, result=results)
+
+            others = [SessionManager.create() for _ in range(2)]
+            for n, session_id in enumerate(others, start=1):
+                SessionManager.update(session_id, review_results=self._results(n))
+            try:
+                job = manager.get_job(job_id)
+                self.assertIsNone(job.result)
+                self.assertTrue(job.metadata['result_released'])
+
+                response = client.get(f'/api/review/result/{job_id}')
+                self.assertEqual(response.status_code, 200)
+                data = response.get_json()['data']
+                self.assertEqual(len(data['issues']), 100)
+                self.assertTrue(data['full_text'].startswith('document 0'))
+
+                memory = client.get('/api/health').get_json()['memory']
+                self.assertEqual(memory['budget_bytes'], 100_000)
+                self.assertGreaterEqual(memory['spilled_entries'], 1)
+                self.assertIn('resident_bytes', memory)
+            finally:
+                for session_id in [first] + others:
+                    SessionManager.delete(session_id)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
 def run_tests():
     """Run all tests and return results."""
     loader = unittest.TestLoader()
@@ -3092,6 +5729,31 @@ def run_tests():
         TestFixAssistantV2API,  # v3.0.103: Fix Assistant v2 API tests
         TestBatchLimits,  # v3.0.103: Batch upload limit tests
         TestSessionCleanup,  # v3.0.103: Session cleanup tests
+        TestExclusionIndex,  # Compiled hyperlink exclusion index tests
+        TestResumableValidationJobs,  # Checkpointed hyperlink validation jobs
+        TestDeferredRetryScheduler,  # Non-blocking hyperlink retry scheduler
+        TestHighlightedExportIndex,  # Indexed/streaming highlighted exports
+        TestStreamingExcelExtractor,  # Read-only Excel hyperlink extraction
+        TestConcurrentLinkValidation,  # Concurrent hyperlink health batches
+        TestDeferredHyperlinkValidation,  # Hyperlink probes as a review sub-job
+        TestAdaptiveHostTimeouts,  # Per-host latency model for hyperlink timeouts
+        TestLinkBenchmarkHarness,  # Local mock-server validator benchmark
+        TestCompactScanStorage,  # Normalized/compressed scan result storage
+        TestSQLitePool,  # Pooled WAL SQLite access layer
+        TestScanHistoryQueryPlans,  # Indexed scan-history queries
+        TestPortfolioSummaries,  # Denormalized portfolio summaries
+        TestIssueFingerprints,  # Stored issue fingerprints
+        TestFileHashService,  # Shared file hashing
+        TestRoleGraphCache,  # Generation-keyed role graph cache
+        TestScanHistoryWriter,  # Background batched scan history writer
+        TestScanHistoryRetention,  # Scan history retention and vacuum
+        TestScanHistorySearch,  # FTS5 search over issues and paragraphs
+        TestRoleDatabaseSQLite,  # Row-level SQLite role database
+        TestDecisionLearnerBatch,  # Bulk decisions and cached predictions
+        TestAnalysisRepositoryQueries,  # SQL baseline filtering, trends, comparisons
+        TestJobScheduler,  # Worker pool, priority queues, back-pressure
+        TestJobEvents,  # Server-sent job progress events
+        TestSessionResultStore,  # Memory-budgeted session results with spill-to-disk
     ]
     
     for test_class in test_classes:
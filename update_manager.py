@@ -94,7 +94,6 @@ import os
 import sys
 import json
 import shutil
-import hashlib
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -102,6 +101,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from file_hashing import file_hash
+
 # Setup logging
 logger = logging.getLogger('update_manager')
 
@@ -707,13 +708,14 @@ class UpdateManager:
             'total_size': total_size
         }
     
-    def _calculate_hash(self, file_path: Path) -> str:
-        """Calculate MD5 hash of a file."""
-        hash_md5 = hashlib.md5()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+    def _calculate_hash(self, file_path: Path, use_cache: bool = True) -> str:
+        """
+        Calculate MD5 hash of a file via the shared hashing service.
+
+        MD5 is kept so existing backup manifests still verify. Pass
+        use_cache=False to re-read the file (verifying a fresh copy).
+        """
+        return file_hash(file_path, 'md5', use_cache=use_cache)
     
     # --------------------------------------------------------
     # CREATE BACKUP
@@ -861,7 +863,7 @@ class UpdateManager:
             raise IOError(f"Failed to copy file to {dest}")
         
         # Verify hash
-        new_hash = self._calculate_hash(dest)
+        new_hash = self._calculate_hash(dest, use_cache=False)
         if new_hash != update.hash:
             raise IOError("Hash mismatch after copy")
         
@@ -976,7 +978,7 @@ class UpdateManager:
                 shutil.copy2(src, dest)
                 
                 # Verify hash
-                new_hash = self._calculate_hash(dest)
+                new_hash = self._calculate_hash(dest, use_cache=False)
                 if new_hash != entry['hash']:
                     raise IOError("Hash mismatch after restore")
                 